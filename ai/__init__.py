@@ -7,6 +7,7 @@ video generation system, using clean, professional code.
 ACTIVE MODULES:
     - clean_script_generator: Professional script generation (1 function replaces 80+ bloated ones)
     - heygen_client: HeyGen API integration for AI avatar video creation  
+    - heygen_predictor: Render time and video duration predictions fitted from job logs
     - script_validator: Essential validation functions
     - prompt_templates: Reusable prompt templates and configurations
 
@@ -17,11 +18,11 @@ REMOVED BLOATED MODULES:
     - robust_script_generator: ✅ DELETED (replaced by clean version)
 """
 
-# Import streamlined modules
-from .clean_script_generator import generate_video_scripts
-from .heygen_client import *
-from .script_validator import *
-from .prompt_templates import *
+# Submodules load on first attribute access, so importing one ai module
+# (or a quick CLI path) no longer imports every dependency of the package
+from utils.lazy_imports import lazy_package
+
+_SUBMODULES = ('heygen_client', 'heygen_predictor', 'script_validator', 'prompt_templates')
 
 __all__ = [
     # STREAMLINED Script Generation (from robust_script_generator)
@@ -54,4 +55,23 @@ __all__ = [
 # 'process_script_text',       # ❌ Use clean_script_text instead
 # 'save_scripts_to_files',     # ❌ Handled internally by generate_video_scripts
 # 'load_scripts_from_files',   # ❌ Not needed in streamlined workflow
-# 'combine_scripts',           # ❌ Handled internally by generate_video_scripts
\ No newline at end of file
+# 'combine_scripts',           # ❌ Handled internally by generate_video_scripts
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'generate_video_scripts': 'clean_script_generator',
+    'create_heygen_video': 'heygen_client',
+    'create_heygen_videos_batch': 'heygen_client',
+    'check_video_status': 'heygen_client',
+    'wait_for_completion': 'heygen_client',
+    'get_video_urls': 'heygen_client',
+    'validate_script_content': 'script_validator',
+    'clean_script_text': 'script_validator',
+    'get_script_word_count': 'script_validator',
+    'get_hook_prompt_template': 'prompt_templates',
+    'get_intro_prompt_template': 'prompt_templates',
+    'build_context_prompt': 'prompt_templates',
+    'customize_prompt_for_genre': 'prompt_templates'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
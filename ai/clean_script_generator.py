@@ -21,10 +21,16 @@ import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-from openai import OpenAI
 
 # Import centralized settings for API configuration
 from config.settings import get_api_config
+from utils.tracing import traced_call
+from ai.prompt_templates import get_prompt_template, estimate_script_generation_tokens
+from ai.script_validator import select_script_candidate
+
+# Accepted spoken duration for movie2/movie3 hooks (seconds)
+TIMED_HOOK_MIN_SECONDS = 8
+TIMED_HOOK_MAX_SECONDS = 11
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +97,7 @@ def generate_clean_video_scripts(raw_movies: List[Dict],
         raise ValueError("OpenAI API key required - you have paid access, no fallbacks needed!")
     else:
         try:
+            from openai import OpenAI  # Loaded on first script generation, not on import
             client = OpenAI(api_key=api_key)
             api_config = get_api_config('openai')
             use_openai = True
@@ -101,30 +108,26 @@ def generate_clean_video_scripts(raw_movies: List[Dict],
             logger.error("   💰 You have PAID OpenAI - check your API key and connection!")
             raise ValueError(f"OpenAI initialization failed: {e}")
     
+    # Pre-flight cost check from cached template estimates (retries not included)
+    hook_candidates = max(1, int(api_config.get('hook_candidates', 1)))
+    hook_adjust_words = api_config.get('hook_adjust_words', 0)
+    preflight = estimate_script_generation_tokens(raw_movies, genre, platform, content_type,
+                                                  max_tokens={'script_intro': api_config.get('intro_max_tokens', 50)},
+                                                  hook_candidates=hook_candidates)
+    logger.info(f"💰 Pre-flight token estimate: ~{preflight['prompt_tokens']} prompt + "
+                f"{preflight['completion_tokens']} completion = ~{preflight['total_tokens']} tokens "
+                f"({len(preflight['requests'])} requests)")
+    
     # =========================================================================
     # STEP 3: GENERATE INTRO SCRIPT (10-12 words for 12-14 seconds)
     # =========================================================================
     logger.info("📝 Generating intro script...")
     
-    intro_prompt = f"""Generate a powerful, concise intro script for a video showcasing the top 3 {genre.lower()} {content_type.lower() if content_type else 'movies'} on {platform}.
-
-Requirements:
-- EXACTLY 10-12 words total (very important for timing)
-- US English, TikTok/YouTube optimized
-- Create excitement and anticipation
-- Don't mention specific movie titles
-- Focus on the genre and platform
-
-Examples for {genre} on {platform}:
-- "Get ready for the most terrifying {genre.lower()} hits streaming on {platform}"
-- "These spine-chilling {genre.lower()} masterpieces will leave you breathless"
-- "Prepare yourself for {platform}'s most intense {genre.lower()} experiences"
-
-Generate ONE intro script (10-12 words):"""
+    intro_prompt = get_prompt_template('script_intro', genre, platform, content_type).render()
 
     if use_openai:
         try:
-            intro_response = client.chat.completions.create(
+            intro_response = traced_call('openai.chat.completions', client.chat.completions.create, category='openai',
                 model=api_config.get('model', 'gpt-3.5-turbo'),
                 messages=[{"role": "user", "content": intro_prompt}],
                 max_tokens=api_config.get('intro_max_tokens', 50),
@@ -162,64 +165,36 @@ Generate ONE intro script (10-12 words):"""
         logger.info(f"   🎭 Generating hook for {title}...")
         
         # TOKEN-OPTIMIZED PROMPTS - Get perfect timing FIRST TRY (save tokens!)
-        if i == 1:
-            # Movie 1: Standard prompt (no timing restrictions)
-            hook_prompt = f"""Create a powerful movie hook for this {genre} movie: {title}
-
-Requirements:
-- ONE impactful sentence (10-18 words)
-- Focus on excitement and tension
-- No quotation marks, clean text only
-- Professional trailer-style language
-
-Movie: {title}
-Genre: {genre}
-Create the hook:"""
-        else:
-            # Movie 2 & 3: PRECISION PROMPTS for exact 8-10 second timing
-            hook_prompt = f"""Create a movie hook script that is EXACTLY 8-10 seconds when spoken aloud.
-
-PRECISE REQUIREMENTS FOR 8-10 SECONDS:
-✅ Must be exactly 24-30 words (this equals 8-10 seconds at normal speaking pace)
-✅ Write 1-2 sentences that total 24-30 words
-✅ Count each word carefully before responding
-✅ Focus on tension, thrills, excitement
-
-PERFECT EXAMPLES (exactly 8-10 seconds):
-Example 1 (26 words = 8.7s): "This spine-chilling horror masterpiece delivers relentless terror and shocking plot twists that will leave you gripping your seat throughout every terrifying moment."
-
-Example 2 (28 words = 9.3s): "An action-packed thriller featuring explosive sequences, heart-stopping suspense, and mind-bending plot twists that will keep audiences completely captivated from start to finish."
-
-Example 3 (25 words = 8.3s): "This gripping drama unfolds shocking secrets and emotional revelations that will leave viewers absolutely stunned and emotionally invested until the final scene."
-
-YOUR TASK:
-Movie: {title}
-Genre: {genre}
-Write a {genre.lower()} hook with exactly 24-30 words (8-10 seconds):"""
+        # Movie 1: standard prompt (no timing restrictions)
+        # Movie 2 & 3: PRECISION PROMPTS for exact 8-10 second timing
+        hook_template = get_prompt_template('script_hook' if i == 1 else 'script_hook_timed', genre, platform)
+        hook_prompt = hook_template.render(title=title)
 
         if use_openai:
             try:
                 # OPTIMIZED API CALL - precise settings for each movie type
                 if i == 1:
                     # Movie 1: Standard settings
-                    hook_response = client.chat.completions.create(
+                    hook_response = traced_call('openai.chat.completions', client.chat.completions.create, category='openai',
                         model=api_config.get('model', 'gpt-3.5-turbo'),
                         messages=[{"role": "user", "content": hook_prompt}],
-                        max_tokens=50,  # Reduced for efficiency
+                        max_tokens=hook_template.max_tokens,  # Reduced for efficiency (50)
                         temperature=0.8  # Creative but controlled
                     )
                 else:
                     # Movie 2 & 3: PRECISION SETTINGS for exact timing
-                    hook_response = client.chat.completions.create(
+                    # Several candidates per request - timing is checked locally instead of by retrying
+                    hook_response = traced_call('openai.chat.completions', client.chat.completions.create, category='openai',
                         model=api_config.get('model', 'gpt-3.5-turbo'),
                         messages=[{"role": "user", "content": hook_prompt}],
-                        max_tokens=70,  # Just enough for 24-30 words
-                        temperature=0.4  # Low temp for consistent word count
+                        max_tokens=hook_template.max_tokens,  # Just enough for 24-30 words (70)
+                        temperature=0.4,  # Low temp for consistent word count
+                        n=hook_candidates
                     )
-                hook_script = hook_response.choices[0].message.content.strip()
                 
-                # Clean and validate hook script
-                hook_script = _clean_script_text(hook_script)
+                # Clean and validate hook script(s)
+                candidates = [_clean_script_text(choice.message.content.strip()) for choice in hook_response.choices]
+                hook_script = candidates[0]
                 hook_word_count = len(hook_script.split())
                 
                 # TIMING VALIDATION for movie2 and movie3 (8-10 seconds requirement)
@@ -227,11 +202,17 @@ Write a {genre.lower()} hook with exactly 24-30 words (8-10 seconds):"""
                     # Calculate speaking duration (180 WPM = 3 words per second)
                     duration_seconds = hook_word_count / 3.0  # 180 WPM = 3 words/second
                     
-                    if 8 <= duration_seconds <= 11:  # Allow up to 11 seconds (more forgiving)
-                        # ✅ Perfect timing - use OpenAI script
-                        individual_scripts[movie_name] = hook_script
-                        logger.info(f"   ✅ {movie_name} hook generated ({hook_word_count} words = {duration_seconds:.1f}s) - TIMING PERFECT")
-                        logger.info(f"   🎯 TARGET MET: {hook_word_count} words fits 8-11s requirement")
+                    # First candidate within 8-11s, else the closest near miss trimmed/padded
+                    picked = select_script_candidate(candidates, TIMED_HOOK_MIN_SECONDS, TIMED_HOOK_MAX_SECONDS,
+                                                     max_adjust_words=hook_adjust_words)
+                    
+                    if picked:
+                        # ✅ Timing fits - no retry round trip needed
+                        individual_scripts[movie_name] = picked['script']
+                        logger.info(f"   ✅ {movie_name} hook generated ({picked['words']} words = {picked['duration']:.1f}s) - TIMING PERFECT")
+                        logger.info(f"   🎯 TARGET MET: candidate {picked['index'] + 1}/{len(candidates)} fits 8-11s requirement")
+                        if picked['adjustment']:
+                            logger.info(f"   ✂️ Near miss {picked['adjustment']}: {picked['original_words']} → {picked['words']} words")
                     else:
                         # 🔄 RETRY with OpenAI (no fallbacks - you have PAID OpenAI!)
                         logger.warning(f"   ⚠️ OpenAI {movie_name} timing wrong ({hook_word_count} words = {duration_seconds:.1f}s, need 8-11s)")
@@ -254,7 +235,7 @@ EXACT TARGET: Write exactly {24 + (retry_attempt * 2)} words
 
 Write exactly {24 + (retry_attempt * 2)} words:"""
                             try:
-                                retry_response = client.chat.completions.create(
+                                retry_response = traced_call('openai.chat.completions', client.chat.completions.create, category='openai',
                                     model=api_config.get('model', 'gpt-3.5-turbo'),
                                     messages=[{"role": "user", "content": retry_prompt}],
                                     max_tokens=80,  # Reduced tokens for efficiency
@@ -263,10 +244,13 @@ Write exactly {24 + (retry_attempt * 2)} words:"""
                                 retry_script = _clean_script_text(retry_response.choices[0].message.content.strip())
                                 retry_words = len(retry_script.split())
                                 retry_duration = retry_words / 3.0  # Fix: Use correct formula
+                                retry_picked = select_script_candidate([retry_script], TIMED_HOOK_MIN_SECONDS,
+                                                                       TIMED_HOOK_MAX_SECONDS,
+                                                                       max_adjust_words=hook_adjust_words)
                                 
-                                if 8 <= retry_duration <= 11:  # Fix: Use updated range
-                                    individual_scripts[movie_name] = retry_script
-                                    logger.info(f"   ✅ RETRY SUCCESS! {movie_name} ({retry_words} words = {retry_duration:.1f}s) - Attempt {retry_attempt + 1}")
+                                if retry_picked:
+                                    individual_scripts[movie_name] = retry_picked['script']
+                                    logger.info(f"   ✅ RETRY SUCCESS! {movie_name} ({retry_picked['words']} words = {retry_picked['duration']:.1f}s) - Attempt {retry_attempt + 1}")
                                     retry_success = True
                                     break
                                 else:
@@ -513,7 +497,7 @@ Examples for {genre} on {platform}:
 Generate ONE outro sentence for {genre} genre (without website URL):"""
 
         # Use EXACT same API call as clean_script_generator.py
-        outro_response = client.chat.completions.create(
+        outro_response = traced_call('openai.chat.completions', client.chat.completions.create, category='openai',
             model=api_config.get('model', 'gpt-3.5-turbo'),
             messages=[{"role": "user", "content": outro_prompt}],
             max_tokens=api_config.get('intro_max_tokens', 50),
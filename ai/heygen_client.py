@@ -8,19 +8,27 @@ Features:
 - Template-based video generation using genre-specific templates
 - Custom video creation with avatar and voice selection
 - Batch video processing for multiple scripts
+- Concurrent generate requests under a shared HeyGen rate limit
 - Video status monitoring and completion tracking
+- Status polling scheduled from predicted render times (ai/heygen_predictor.py)
 - Retry logic and error handling
 """
 
 import os
 import time
 import logging
+import threading
+import contextvars
+import concurrent.futures
 from typing import Dict, List, Optional, Any, Tuple
 import requests
 
 from config.templates import get_heygen_template_id
 from config.settings import get_api_config
 from utils.validators import validate_environment_variables
+from utils.http_session import get_http_session, parse_retry_after
+from utils.rate_limiter import get_rate_limiter
+from utils.tracing import record_retry
 from ai.script_validator import validate_script_content
 
 logger = logging.getLogger(__name__)
@@ -60,7 +68,9 @@ def _get_heygen_config() -> Dict[str, Any]:
             'base_url': api_config.get('base_url', 'https://api.heygen.com/v2'),
             'poll_interval': api_config.get('poll_interval', 15),
             'max_wait_time': api_config.get('max_wait_time', 300),
-            'retry_attempts': api_config.get('retry_attempts', 3)
+            'retry_attempts': api_config.get('retry_attempts', 3),
+            'timeout': api_config.get('timeout', 60),
+            'generate_concurrency': api_config.get('generate_concurrency', 4)
         }
     except Exception as e:
         logger.error(f"Error getting HeyGen config: {str(e)}")
@@ -73,7 +83,8 @@ def _get_heygen_config() -> Dict[str, Any]:
 def create_heygen_video(script_data: Any, 
                        use_template: bool = True, 
                        template_id: Optional[str] = None,
-                       genre: Optional[str] = None) -> Optional[Dict[str, str]]:
+                       genre: Optional[str] = None,
+                       submitted_at: Optional[Dict[str, float]] = None) -> Optional[Dict[str, str]]:
     """
     Create videos with HeyGen API using scripts.
     
@@ -82,6 +93,7 @@ def create_heygen_video(script_data: Any,
         use_template (bool): Whether to use template-based approach
         template_id (str): Specific HeyGen template ID (overrides genre selection)
         genre (str): Genre for automatic template selection
+        submitted_at (Dict): Optional dict filled with each video's submission time (key -> epoch seconds)
         
     Returns:
         Dict[str, str]: Dictionary mapping script keys to video IDs
@@ -104,44 +116,15 @@ def create_heygen_video(script_data: Any,
             logger.error("❌ No script data provided")
             return None
         
-        # Handle different input formats
-        if isinstance(script_data, str):
-            script_data = {
-                "single_video": {
-                    "text": script_data,
-                    "path": "direct_input"
-                }
-            }
+        template_id = _resolve_template_id(use_template, template_id, genre)
         
-        # Determine template ID
-        if use_template:
-            if not template_id and genre:
-                template_id = get_heygen_template_id(genre)
-                logger.info(f"🎭 Using genre-specific template for {genre}: {template_id}")
-            elif not template_id:
-                template_id = get_heygen_template_id(None)  # Default template
-                logger.info(f"🎭 Using default template: {template_id}")
+        jobs = [(key, key, script_text) for key, script_text in _extract_script_jobs(script_data)]
+        created = _create_videos_concurrently(jobs, use_template, template_id, headers, submitted_at)
         
         videos = {}
-        
-        # Process each script
-        for key, script_info in script_data.items():
-            logger.info(f"   🎯 Creating video for {key}")
-            
-            # Extract script text
-            if isinstance(script_info, dict) and "text" in script_info:
-                script_text = script_info["text"]
-            else:
-                script_text = str(script_info)
-            
-            # Validate script content
-            if not validate_script_content(script_text):
-                logger.warning(f"⚠️ Script validation failed for {key}, proceeding anyway")
-            
-            # Create video
-            video_id = _create_single_video(script_text, key, use_template, template_id, headers)
-            if video_id:
-                videos[key] = video_id
+        for key, _, _ in jobs:
+            if key in created:
+                videos[key] = created[key]
             else:
                 logger.error(f"❌ Failed to create video for {key}")
         
@@ -158,6 +141,9 @@ def create_heygen_videos_batch(script_batches: List[Dict[str, Any]],
     """
     Create HeyGen videos for multiple script batches.
     
+    Scripts from all batches are submitted together through the concurrent,
+    rate-limited generate path.
+    
     Args:
         script_batches (List): List of script batch dictionaries
         config (Dict): Configuration parameters
@@ -176,18 +162,45 @@ def create_heygen_videos_batch(script_batches: List[Dict[str, Any]],
     try:
         logger.info(f"📦 BATCH HEYGEN VIDEO CREATION: {len(script_batches)} batches")
         
+        from utils.test_data_cache import is_local_mode
+        use_template = config.get('use_template', True)
+        headers = None if is_local_mode() else _get_heygen_headers()
+        
+        # Flatten every batch into one submission so all renders queue at HeyGen together
+        batch_jobs = {}
+        for i, script_batch in enumerate(script_batches):
+            batch_id = f"batch_{i+1}"
+            logger.info(f"🎯 Preparing {batch_id}: {len(script_batch)} scripts")
+            try:
+                batch_jobs[batch_id] = [] if headers is None else [
+                    ((batch_id, key), key, script_text) for key, script_text in _extract_script_jobs(script_batch)
+                ]
+            except Exception as e:
+                batch_jobs[batch_id] = e
+        
+        created = {}
+        if headers is not None:
+            template_id = _resolve_template_id(use_template, config.get('template_id'), config.get('genre'))
+            jobs = [job for batch in batch_jobs.values() if isinstance(batch, list) for job in batch]
+            created = _create_videos_concurrently(jobs, use_template, template_id, headers)
+        
         for i, script_batch in enumerate(script_batches):
             batch_id = f"batch_{i+1}"
-            logger.info(f"🎯 Processing {batch_id}: {len(script_batch)} scripts")
             
             try:
-                # Create videos for this batch
-                video_ids = create_heygen_video(
-                    script_batch,
-                    use_template=config.get('use_template', True),
-                    template_id=config.get('template_id'),
-                    genre=config.get('genre')
-                )
+                if isinstance(batch_jobs[batch_id], Exception):
+                    raise batch_jobs[batch_id]
+                
+                if headers is None:
+                    # Local mode (hardcoded URLs) or missing API key - handled per batch as before
+                    video_ids = create_heygen_video(
+                        script_batch,
+                        use_template=use_template,
+                        template_id=config.get('template_id'),
+                        genre=config.get('genre')
+                    )
+                else:
+                    video_ids = {key: created[job_key] for job_key, key, _ in batch_jobs[batch_id] if job_key in created}
                 
                 if video_ids:
                     results['batch_results'][batch_id] = {
@@ -260,7 +273,7 @@ def check_video_status(video_id: str, silent: bool = False) -> Dict[str, Any]:
         if not silent:
             logger.debug(f"🔍 Checking video status: {video_id}")
         
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_http_session().get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -427,15 +440,23 @@ def wait_for_completion(video_ids: Dict[str, str],
         return {}
 
 
-def get_heygen_videos_for_creatomate(heygen_video_ids: dict, scripts: dict = None) -> dict:
+def get_heygen_videos_for_creatomate(heygen_video_ids: dict, scripts: dict = None, durations: dict = None,
+                                     submitted_at: dict = None) -> dict:
     """
     Get HeyGen video URLs for direct use with Creatomate - STRICT MODE
     
     MODULAR VERSION - Replaces legacy function from automated_video_generator.py
     
+    All videos are polled at the same time, each on the schedule predicted
+    from its own script. Renders that were watched finishing are logged as
+    observations for future predictions; videos without a known submission
+    time, or already complete at the first check (e.g. on resume), are not.
+    
     Args:
         heygen_video_ids: Dictionary of HeyGen video IDs (no placeholders allowed)
         scripts: Dictionary of script data for time estimation
+        durations: Optional dict filled with the video durations HeyGen reports (key -> seconds)
+        submitted_at: Submission time of each video from step 4 (key -> epoch seconds)
         
     Returns:
         Dictionary with video URLs ready for Creatomate, or None if any video fails
@@ -456,45 +477,79 @@ def get_heygen_videos_for_creatomate(heygen_video_ids: dict, scripts: dict = Non
         logger.info("🏠 LOCAL MODE: Returning hardcoded HeyGen URLs for Creatomate")
         return _get_local_heygen_urls_for_creatomate(heygen_video_ids)
     
-    video_urls = {}
+    from ai.heygen_predictor import get_heygen_predictor, heygen_script_texts
+    from utils.media_executor import get_media_job
     
     for key, video_id in heygen_video_ids.items():
         if not video_id or video_id.startswith('placeholder'):
             logger.error(f"❌ Invalid or placeholder ID for {key}: {video_id}")
             logger.error("❌ STRICT MODE - No placeholder IDs allowed")
             return None
-        
-        # Extract script length for estimation
-        script_length = None
-        if scripts and key in scripts:
-            script_data = scripts[key]
-            if isinstance(script_data, dict) and 'text' in script_data:
-                script_text = script_data['text']
-            elif isinstance(script_data, str):
-                script_text = script_data
-            else:
-                script_text = str(script_data)
-            script_length = len(script_text) if script_text else None
-        
+    
+    video_urls = {}
+    predictor = get_heygen_predictor()
+    script_texts = heygen_script_texts(scripts)
+    submitted_at = submitted_at or {}
+    job_id = get_media_job()
+    
+    # One failed video fails the whole set - the other waits stop early
+    stop_waiting = threading.Event()
+    
+    def wait_for_key(key: str, video_id: str) -> dict:
+        # Script text for render time prediction (movie1 includes the intro)
+        script_text = script_texts.get(key) or None
+        script_length = len(script_text) if script_text else None
         logger.info(f"   Processing {key}: {video_id} ({script_length or 'unknown'} chars)")
         
-        # Wait for video completion
-        status_result = wait_for_heygen_video(
+        return wait_for_heygen_video(
             video_id, 
             script_length=script_length,
-            max_wait_minutes=45  # Increased from 30 to 45 minutes for production reliability
+            max_wait_minutes=45,  # Increased from 30 to 45 minutes for production reliability
+            script_text=script_text,
+            started_at=submitted_at.get(key),
+            show_progress=len(heygen_video_ids) == 1,  # Concurrent progress bars would overwrite each other
+            stop_event=stop_waiting
         )
+    
+    workers = max(1, len(heygen_video_ids))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='heygen-wait') as executor:
+        futures = {
+            executor.submit(contextvars.copy_context().run, wait_for_key, key, video_id): key
+            for key, video_id in heygen_video_ids.items()
+        }
         
-        if status_result['success'] and status_result['video_url']:
-            video_url = status_result['video_url']
-            video_urls[key] = video_url
-            logger.info(f"✅ Got URL for {key}: {video_url[:50]}...")
-        else:
-            # STRICT MODE - No fallbacks allowed
-            logger.error(f"❌ HeyGen video failed for {key}: {video_id}")
-            logger.error(f"   Status: {status_result}")
-            logger.error("❌ STRICT MODE - No fallback URLs allowed")
-            return None
+        failed = False
+        for future in concurrent.futures.as_completed(futures):
+            key = futures[future]
+            video_id = heygen_video_ids[key]
+            try:
+                status_result = future.result()
+            except Exception as e:
+                status_result = {'success': False, 'status': 'error', 'error': str(e)}
+            
+            if status_result['success'] and status_result['video_url']:
+                video_url = status_result['video_url']
+                video_urls[key] = video_url
+                logger.info(f"✅ Got URL for {key}: {video_url[:50]}...")
+                
+                if durations is not None and status_result.get('duration'):
+                    durations[key] = status_result['duration']
+                
+                script_text = script_texts.get(key)
+                if (script_text and status_result.get('render_seconds') and key in submitted_at
+                        and not status_result.get('completed_on_first_check')):
+                    predictor.record_observation(job_id, key, video_id, script_text,
+                                                 status_result['render_seconds'], status_result.get('duration'))
+            elif not failed:
+                # STRICT MODE - No fallbacks allowed
+                failed = True
+                stop_waiting.set()
+                logger.error(f"❌ HeyGen video failed for {key}: {video_id}")
+                logger.error(f"   Status: {status_result}")
+                logger.error("❌ STRICT MODE - No fallback URLs allowed")
+    
+    if failed:
+        return None
     
     # CRITICAL DEBUG: Log final result with expected keys
     logger.info(f"🔍 DEBUG: Final result - Got {len(video_urls)} video URLs")
@@ -510,46 +565,82 @@ def get_heygen_videos_for_creatomate(heygen_video_ids: dict, scripts: dict = Non
     return video_urls
 
 
-def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_minutes: int = 45) -> dict:
+def _no_progress(*args, **kwargs) -> None:
+    """Progress output sink for waits that run alongside others."""
+
+
+def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_minutes: int = 45,
+                          script_text: str = None, started_at: float = None, show_progress: bool = True,
+                          stop_event: threading.Event = None) -> dict:
     """
     Wait for HeyGen video completion with progress feedback.
     
     MODULAR VERSION - Replaces legacy function from automated_video_generator.py
     
+    Status checks are scheduled from the predicted render time: one early
+    check for immediate failures, sparse checks until the render is close to
+    done, frequent checks around the predicted finish, then back-off.
+    
     Args:
         video_id: HeyGen video ID
         script_length: Script length for time estimation
         max_wait_minutes: Maximum wait time in minutes (increased to 30 min due to HeyGen processing delays)
+        script_text: Script text for the fitted render time prediction (preferred over script_length)
+        started_at: When the video was submitted (default: now) - predictions count from here
+        show_progress: Print the console progress bar (off when several videos are polled together)
+        stop_event: Set by the caller to abandon the wait (another video of the set failed)
         
     Returns:
-        Dictionary with status information
+        Dictionary with status information (render_seconds, duration and
+        completed_on_first_check on success)
     """
-    # Estimate processing time - SIGNIFICANTLY INCREASED BUFFER for production reliability
-    estimated_minutes = estimate_heygen_processing_time(script_length)
+    from ai.heygen_predictor import get_heygen_predictor, next_poll_delay
+    
+    # Predict render time from the script (fitted model, or the fixed heuristic without history)
+    if script_text:
+        prediction = get_heygen_predictor().predict(script_text)
+        estimated_seconds = prediction['render_seconds']
+        estimate_source = prediction['source']
+    else:
+        estimated_seconds = estimate_heygen_processing_time(script_length) * 60
+        estimate_source = 'heuristic'
+    estimated_minutes = estimated_seconds / 60
+    
     # PRODUCTION FIX: Much larger buffer - +15 minutes instead of +8, minimum 20 minutes instead of 12
-    timeout_minutes = min(max(estimated_minutes + 15, 20), max_wait_minutes)
+    timeout_minutes = min(max(int(estimated_minutes + 0.999) + 15, 20), max_wait_minutes)
     max_total_seconds = timeout_minutes * 60
     
-    logger.info(f"⏳ Waiting for HeyGen video {video_id[:8]}... (estimated: ~{estimated_minutes} min, max timeout: {timeout_minutes} min)")
+    logger.info(f"⏳ Waiting for HeyGen video {video_id[:8]}... (estimated: ~{estimated_minutes:.1f} min [{estimate_source}], max timeout: {timeout_minutes} min)")
     logger.info(f"   📝 Note: HeyGen processing times may vary. System will wait up to {timeout_minutes} minutes for completion.")
     
     start_time = time.time()
+    submitted_at = min(started_at or start_time, start_time)
     attempt = 0
     next_check_time = start_time
     
     # Spinner frames
     spinner_frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+    display = print if show_progress else _no_progress
     
     while True:
         current_time = time.time()
         elapsed_seconds = current_time - start_time
         
+        if stop_event is not None and stop_event.is_set():
+            logger.info(f"⏹️ Stopped waiting for HeyGen video {video_id[:8]}...")
+            return {
+                'success': False,
+                'status': 'cancelled',
+                'video_url': '',
+                'data': {}
+            }
+        
         # Check timeout
         if elapsed_seconds > max_total_seconds:
             elapsed_time = int(elapsed_seconds)
             minutes, seconds = divmod(elapsed_time, 60)
             time_str = f"{minutes:02d}:{seconds:02d}"
-            print(f"\r⏰ HeyGen video timeout    [{'░' * 30}] ----  │ {time_str} │ Max time reached ({timeout_minutes} min){' ' * 10}")
+            display(f"\r⏰ HeyGen video timeout    [{'░' * 30}] ----  │ {time_str} │ Max time reached ({timeout_minutes} min){' ' * 10}")
             logger.warning(f"HeyGen video {video_id[:8]}... exceeded max wait time of {timeout_minutes} minutes")
             logger.warning(f"   💡 HeyGen processing took longer than expected. This may be due to:")
             logger.warning(f"   • High API load on HeyGen servers")
@@ -571,14 +662,15 @@ def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_min
             attempt += 1
             
             # Calculate progress - IMPROVED for longer processing times
-            time_progress = min(elapsed_seconds / (estimated_minutes * 60) * 100, 90)
+            render_elapsed = current_time - submitted_at
+            time_progress = min(render_elapsed / estimated_seconds * 100, 90)
             attempt_progress = min(elapsed_seconds / max_total_seconds * 100, 90)
             progress = max(time_progress, attempt_progress)
             
             # For videos taking longer than estimated time, show more realistic progress
-            if elapsed_seconds > estimated_minutes * 60:
+            if render_elapsed > estimated_seconds:
                 # After estimated time, gradually approach 95% based on timeout
-                overtime_progress = 90 + (min(elapsed_seconds - estimated_minutes * 60, max_total_seconds * 0.3) / (max_total_seconds * 0.3)) * 5
+                overtime_progress = 90 + (min(render_elapsed - estimated_seconds, max_total_seconds * 0.3) / (max_total_seconds * 0.3)) * 5
                 progress = min(overtime_progress, 95)
             
             elapsed_time = int(elapsed_seconds)
@@ -587,7 +679,7 @@ def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_min
             
             # ETA calculation - IMPROVED for longer processing times
             if progress < 85:
-                remaining_seconds = max(0, (estimated_minutes * 60) - elapsed_seconds)
+                remaining_seconds = max(0, estimated_seconds - render_elapsed)
                 if remaining_seconds > 0:
                     remaining_minutes, remaining_secs = divmod(int(remaining_seconds), 60)
                     eta_str = f"ETA ~{remaining_minutes:02d}:{remaining_secs:02d}"
@@ -605,7 +697,7 @@ def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_min
             bar = f"[{'█' * filled_length}{'░' * (bar_length - filled_length)}]"
             
             progress_line = f"\r{spinner} Processing HeyGen video {bar} {progress:5.1f}% │ {time_str} │ {eta_str}"
-            print(progress_line, end='', flush=True)
+            display(progress_line, end='', flush=True)
             
             # Check status
             status_info = check_heygen_video_status(video_id, silent=True)
@@ -613,26 +705,31 @@ def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_min
             video_url = status_info.get('video_url', '')
             
             if status == "completed":
-                print(f"\r✅ HeyGen video completed! [{'█' * bar_length}] 100.0% │ {time_str} │ Verifying URL...{' ' * 5}")
+                display(f"\r✅ HeyGen video completed! [{'█' * bar_length}] 100.0% │ {time_str} │ Verifying URL...{' ' * 5}")
                 logger.info(f"🎬 Video completed in {minutes}:{seconds:02d}")
                 
                 # CRITICAL FIX: Check if video URL exists (function _verify_video_url_ready doesn't exist)
                 if video_url:
-                    print(f"\r✅ HeyGen video ready!     [{'█' * bar_length}] 100.0% │ {time_str} │ URL obtained!{' ' * 10}")
+                    display(f"\r✅ HeyGen video ready!     [{'█' * bar_length}] 100.0% │ {time_str} │ URL obtained!{' ' * 10}")
                     logger.info(f"🔗 Video URL obtained: {video_url[:50]}...")
                     
+                    reported_duration = status_info.get('data', {}).get('duration')
                     return {
                         'success': True,
                         'status': status,
                         'video_url': video_url,
-                        'data': status_info.get('data', {})
+                        'data': status_info.get('data', {}),
+                        'render_seconds': round(current_time - submitted_at, 1),
+                        'predicted_render_seconds': estimated_seconds,
+                        'completed_on_first_check': attempt == 1,
+                        'duration': float(reported_duration) if isinstance(reported_duration, (int, float)) and reported_duration > 0 else None
                     }
                 else:
                     logger.warning(f"⚠️ Video marked completed but no URL provided: {video_url}")
                     # Continue waiting - sometimes there's a delay between completion and URL accessibility
                 
             elif status in ["failed", "error"]:
-                print(f"\r❌ HeyGen video failed!   [{'X' * bar_length}] ERROR │ {time_str} │ Processing failed{' ' * 10}")
+                display(f"\r❌ HeyGen video failed!   [{'X' * bar_length}] ERROR │ {time_str} │ Processing failed{' ' * 10}")
                 logger.error(f"HeyGen video {video_id[:8]}... processing failed")
                 
                 return {
@@ -642,17 +739,8 @@ def wait_for_heygen_video(video_id: str, script_length: int = None, max_wait_min
                     'data': status_info.get('data', {})
                 }
             
-            # Set next check interval
-            if elapsed_seconds < 120:
-                current_interval = 10
-            elif elapsed_seconds < 300:
-                current_interval = 15
-            elif elapsed_seconds < 600:
-                current_interval = 20
-            else:
-                current_interval = 30
-                
-            next_check_time = current_time + current_interval
+            # Schedule the next check around the predicted finish
+            next_check_time = current_time + next_poll_delay(render_elapsed, estimated_seconds)
         
         time.sleep(1)
 
@@ -749,7 +837,7 @@ def check_heygen_video_status(video_id: str, silent: bool = False) -> dict:
     }
     
     try:
-        response = requests.get(status_url, headers=headers, timeout=30)
+        response = get_http_session().get(status_url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -793,7 +881,7 @@ def _try_fallback_status_endpoints(video_id: str, headers: dict, silent: bool =
     
     for endpoint in fallback_endpoints:
         try:
-            response = requests.get(endpoint, headers=headers, timeout=15)
+            response = get_http_session().get(endpoint, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -954,6 +1042,96 @@ def _get_local_heygen_urls_for_creatomate(heygen_video_ids: dict) -> dict:
 # PRIVATE HELPER FUNCTIONS
 # =============================================================================
 
+def _resolve_template_id(use_template: bool, template_id: Optional[str], genre: Optional[str]) -> Optional[str]:
+    """Pick the HeyGen template (explicit ID, then genre template, then default)."""
+    if use_template:
+        if not template_id and genre:
+            template_id = get_heygen_template_id(genre)
+            logger.info(f"🎭 Using genre-specific template for {genre}: {template_id}")
+        elif not template_id:
+            template_id = get_heygen_template_id(None)  # Default template
+            logger.info(f"🎭 Using default template: {template_id}")
+    return template_id
+
+
+def _extract_script_jobs(script_data: Any) -> List[Tuple[str, str]]:
+    """Normalize script input into (key, script_text) pairs."""
+    # Handle different input formats
+    if isinstance(script_data, str):
+        script_data = {
+            "single_video": {
+                "text": script_data,
+                "path": "direct_input"
+            }
+        }
+    
+    jobs = []
+    for key, script_info in script_data.items():
+        # Extract script text
+        if isinstance(script_info, dict) and "text" in script_info:
+            script_text = script_info["text"]
+        else:
+            script_text = str(script_info)
+        
+        # Validate script content
+        if not validate_script_content(script_text):
+            logger.warning(f"⚠️ Script validation failed for {key}, proceeding anyway")
+        
+        jobs.append((key, script_text))
+    return jobs
+
+
+def _create_videos_concurrently(jobs: List[Tuple[Any, str, str]],
+                                use_template: bool,
+                                template_id: Optional[str],
+                                headers: Dict[str, str],
+                                submitted_at: Optional[Dict[Any, float]] = None) -> Dict[Any, str]:
+    """
+    Submit HeyGen generate requests in parallel.
+    
+    Requests share the pooled HTTP session and the HeyGen rate limiter; each one
+    retries on its own, so a failing script never delays the others.
+    
+    Args:
+        jobs (List): (result_key, script_key, script_text) tuples
+        use_template (bool): Whether to use template-based approach
+        template_id (str): HeyGen template ID
+        headers (Dict): HeyGen API headers
+        submitted_at (Dict): Optional dict filled with result_key -> time HeyGen accepted the video
+        
+    Returns:
+        Dict[Any, str]: result_key -> video_id for every successful submission
+    """
+    if not jobs:
+        return {}
+    
+    workers = max(1, min(_get_heygen_config().get('generate_concurrency', 4), len(jobs)))
+    logger.info(f"🚀 Submitting {len(jobs)} HeyGen videos ({workers} concurrent requests)")
+    
+    created = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='heygen-generate') as executor:
+        futures = {
+            executor.submit(contextvars.copy_context().run, _create_single_video,
+                            script_text, script_key, use_template, template_id, headers): (result_key, script_key)
+            for result_key, script_key, script_text in jobs
+        }
+        
+        for future in concurrent.futures.as_completed(futures):
+            result_key, script_key = futures[future]
+            try:
+                video_id = future.result()
+            except Exception as e:
+                logger.error(f"❌ Error creating video for {script_key}: {str(e)}")
+                continue
+            if video_id:
+                logger.info(f"   🎯 {script_key}: {video_id}")
+                created[result_key] = video_id
+                if submitted_at is not None:
+                    submitted_at[result_key] = time.time()
+    
+    return created
+
+
 def _create_single_video(script_text: str, 
                         key: str,
                         use_template: bool,
@@ -973,8 +1151,11 @@ def _create_single_video(script_text: str,
         # print(payload)
         # Send request with retry logic
         for attempt in range(config.get('retry_attempts', 3)):
+            if attempt > 0:
+                record_retry()
             try:
-                response = requests.post(url, headers=headers, json=payload, timeout=60)
+                get_rate_limiter('heygen').acquire()
+                response = get_http_session().post(url, headers=headers, json=payload, timeout=config.get('timeout', 60))
                 
                 if response.status_code in [200, 201]:
                     data = response.json()
@@ -986,6 +1167,10 @@ def _create_single_video(script_text: str,
                     else:
                         logger.error(f"❌ No video_id in response: {data}")
                         return None
+                elif response.status_code == 429 and attempt < config.get('retry_attempts', 3) - 1:  # Rate limit
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'), 2 ** (attempt + 1))
+                    logger.warning(f"⏳ HeyGen rate limit hit for {key}, waiting {retry_after:g}s...")
+                    time.sleep(retry_after)
                 else:
                     logger.error(f"❌ HeyGen API error: {response.status_code} - {response.text}")
                     if attempt < config.get('retry_attempts', 3) - 1:
@@ -1107,7 +1292,7 @@ def _try_fallback_endpoint(video_id: str) -> Optional[Dict[str, Any]]:
         
         for url in fallback_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=20)
+                response = get_http_session().get(url, headers=headers, timeout=20)
                 if response.status_code == 200:
                     data = response.json()
                     if 'data' in data:
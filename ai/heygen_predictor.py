@@ -0,0 +1,460 @@
+"""
+StreamGank HeyGen Render Predictor
+
+Predicts how long HeyGen takes to render an avatar video and how long the
+finished video will be, from the script text alone. The model is a small
+least-squares fit over past renders recorded in the job logs
+(docker_volumes/logs), so polling can be scheduled around the expected
+finish and the Creatomate composition can be prepared before the videos exist.
+
+Features:
+- Render observations logged as `heygen_render_observed` job events
+- Pure-Python linear fit (words, sentences) for render time and video duration
+- Fixed heuristics (estimate_heygen_processing_time / estimate_video_duration) until enough samples exist
+- Periodic refit from the indexed job log store, shared by all jobs in the process
+- Poll schedule: early failure check, sparse checks, frequent checks near the predicted finish, back-off when overdue
+
+Usage:
+    predictor = get_heygen_predictor()
+    prediction = predictor.predict(script_text)      # {'render_seconds': ..., 'duration_seconds': ...}
+    delay = next_poll_delay(elapsed, prediction['render_seconds'])
+
+Author: StreamGank Development Team
+Version: 1.0.0 - HeyGen Render Predictor
+"""
+
+import re
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from config.settings import get_heygen_prediction_settings
+
+logger = logging.getLogger(__name__)
+
+# Job log event carrying one finished render
+HEYGEN_RENDER_EVENT = 'heygen_render_observed'
+
+# Predictions never go below these (HeyGen queues even the shortest script)
+MIN_RENDER_SECONDS = 30.0
+MIN_DURATION_SECONDS = 1.0
+
+# Small ridge term keeps the fit stable when words and sentences move together
+_RIDGE = 1e-3
+
+_SENTENCE_PATTERN = re.compile(r'[.!?]+')
+
+
+# =============================================================================
+# SCRIPT FEATURES
+# =============================================================================
+
+def script_text(script_data: Any) -> str:
+    """
+    Get the spoken text from a script entry.
+
+    Args:
+        script_data: Script string or dict with a 'text' key
+
+    Returns:
+        str: Script text ('' when missing)
+    """
+    if isinstance(script_data, dict):
+        script_data = script_data.get('text', '')
+    return str(script_data or '').strip()
+
+
+def heygen_script_texts(scripts: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Get the text of each HeyGen video, keyed like the HeyGen video IDs.
+
+    The first HeyGen video speaks the intro followed by movie1, so a separate
+    'intro' entry is merged into movie1 the same way video creation does.
+
+    Args:
+        scripts (Dict): Individual scripts (intro, movie1-3, outro)
+
+    Returns:
+        Dict[str, str]: Video key -> spoken text
+    """
+    texts = {key: script_text(value) for key, value in (scripts or {}).items()}
+    if 'intro' in texts and 'movie1' in texts:
+        texts['movie1'] = f"{texts.pop('intro')} {texts['movie1']}".strip()
+    return texts
+
+
+def script_features(text: str) -> Dict[str, int]:
+    """
+    Count the script features the model uses.
+
+    Args:
+        text (str): Script text
+
+    Returns:
+        Dict[str, int]: words, sentences and characters
+    """
+    text = text or ''
+    return {
+        'words': len(text.split()),
+        'sentences': len([part for part in _SENTENCE_PATTERN.split(text) if part.strip()]),
+        'chars': len(text)
+    }
+
+
+def _feature_row(words: float, sentences: float) -> List[float]:
+    return [1.0, float(words), float(sentences)]
+
+
+# =============================================================================
+# LEAST-SQUARES FIT
+# =============================================================================
+
+def fit_linear(rows: Sequence[Sequence[float]], targets: Sequence[float], ridge: float = _RIDGE) -> List[float]:
+    """
+    Fit coefficients minimizing squared error (normal equations, ridge on slopes).
+
+    Args:
+        rows (Sequence): Feature rows, first column the constant 1
+        targets (Sequence): Observed values
+        ridge (float): Regularization added to the slope diagonal
+
+    Returns:
+        List[float]: Coefficients, one per feature column
+    """
+    size = len(rows[0])
+    matrix = [[0.0] * (size + 1) for _ in range(size)]
+    for row, target in zip(rows, targets):
+        for i in range(size):
+            for j in range(size):
+                matrix[i][j] += row[i] * row[j]
+            matrix[i][size] += row[i] * target
+    for i in range(1, size):
+        matrix[i][i] += ridge
+
+    # Gaussian elimination with partial pivoting
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(matrix[r][col]))
+        if abs(matrix[pivot][col]) < 1e-12:
+            continue
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        for r in range(size):
+            if r != col and matrix[r][col]:
+                factor = matrix[r][col] / matrix[col][col]
+                for c in range(col, size + 1):
+                    matrix[r][c] -= factor * matrix[col][c]
+
+    return [matrix[i][size] / matrix[i][i] if abs(matrix[i][i]) >= 1e-12 else 0.0 for i in range(size)]
+
+
+def _predict_linear(coefficients: Sequence[float], row: Sequence[float]) -> float:
+    return sum(c * x for c, x in zip(coefficients, row))
+
+
+def _rmse(coefficients: Sequence[float], rows: Sequence[Sequence[float]], targets: Sequence[float]) -> float:
+    errors = [(_predict_linear(coefficients, row) - target) ** 2 for row, target in zip(rows, targets)]
+    return (sum(errors) / len(errors)) ** 0.5 if errors else 0.0
+
+
+# =============================================================================
+# RENDER MODEL
+# =============================================================================
+
+class HeyGenRenderModel:
+    """
+    Render time and video duration predictions fitted from past renders.
+
+    With fewer than min_samples observations the model uses the fixed
+    heuristics from heygen_client, so a fresh install behaves as before.
+    """
+
+    def __init__(self, min_samples: int = None):
+        """
+        Initialize an unfitted model.
+
+        Args:
+            min_samples (int): Observations needed before fitted predictions are used
+        """
+        settings = get_heygen_prediction_settings()
+        self.min_samples = min_samples if min_samples is not None else settings.get('min_samples', 8)
+        self.sample_count = 0
+        self.render_coefficients: Optional[List[float]] = None
+        self.duration_coefficients: Optional[List[float]] = None
+        self.render_rmse = 0.0
+        self.duration_rmse = 0.0
+
+    @property
+    def fitted(self) -> bool:
+        """True when predictions come from the fitted model."""
+        return self.render_coefficients is not None
+
+    def fit(self, observations: Iterable[Dict[str, Any]]) -> 'HeyGenRenderModel':
+        """
+        Fit both predictions from render observations.
+
+        Args:
+            observations (Iterable): Dicts with script_words, script_sentences,
+                render_seconds and duration_seconds (missing values are skipped)
+
+        Returns:
+            HeyGenRenderModel: self
+        """
+        render_rows, render_targets = [], []
+        duration_rows, duration_targets = [], []
+        for observation in observations:
+            try:
+                row = _feature_row(observation['script_words'], observation.get('script_sentences', 1))
+            except (KeyError, TypeError, ValueError):
+                continue
+            render_seconds = observation.get('render_seconds')
+            duration_seconds = observation.get('duration_seconds')
+            if isinstance(render_seconds, (int, float)) and render_seconds > 0:
+                render_rows.append(row)
+                render_targets.append(float(render_seconds))
+            if isinstance(duration_seconds, (int, float)) and duration_seconds > 0:
+                duration_rows.append(row)
+                duration_targets.append(float(duration_seconds))
+
+        self.sample_count = len(render_rows)
+        self.render_coefficients = None
+        self.duration_coefficients = None
+        if len(render_rows) >= self.min_samples:
+            self.render_coefficients = fit_linear(render_rows, render_targets)
+            self.render_rmse = _rmse(self.render_coefficients, render_rows, render_targets)
+        if len(duration_rows) >= self.min_samples:
+            self.duration_coefficients = fit_linear(duration_rows, duration_targets)
+            self.duration_rmse = _rmse(self.duration_coefficients, duration_rows, duration_targets)
+        return self
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        """
+        Predict render time and video duration for a script.
+
+        Args:
+            text (str): Script text
+
+        Returns:
+            Dict[str, Any]: render_seconds, duration_seconds and source ('model' or 'heuristic')
+        """
+        features = script_features(text)
+        row = _feature_row(features['words'], features['sentences'])
+
+        if self.render_coefficients is not None:
+            render_seconds = _predict_linear(self.render_coefficients, row)
+        else:
+            from ai.heygen_client import estimate_heygen_processing_time
+            render_seconds = estimate_heygen_processing_time(features['chars'] or None) * 60
+
+        if self.duration_coefficients is not None:
+            duration_seconds = _predict_linear(self.duration_coefficients, row)
+        else:
+            from ai.heygen_client import estimate_video_duration
+            duration_seconds = estimate_video_duration(text) if text else 0.0
+
+        return {
+            'render_seconds': round(max(render_seconds, MIN_RENDER_SECONDS), 1),
+            'duration_seconds': round(max(duration_seconds, MIN_DURATION_SECONDS), 2),
+            'source': 'model' if self.fitted else 'heuristic',
+            'words': features['words']
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Get fit quality for logging."""
+        return {
+            'fitted': self.fitted,
+            'samples': self.sample_count,
+            'min_samples': self.min_samples,
+            'render_rmse': round(self.render_rmse, 1),
+            'duration_rmse': round(self.duration_rmse, 2)
+        }
+
+
+# =============================================================================
+# JOB LOG OBSERVATIONS
+# =============================================================================
+
+def load_render_observations(log_store=None, limit: int = None) -> List[Dict[str, Any]]:
+    """
+    Read the most recent render observations from the job logs.
+
+    Args:
+        log_store: JobLogStore to read (default: the global job logger's store)
+        limit (int): Maximum observations (default: max_samples setting)
+
+    Returns:
+        List[Dict]: Observation details, newest first
+    """
+    limit = limit or get_heygen_prediction_settings().get('max_samples', 500)
+    try:
+        if log_store is None:
+            from utils.job_logger import get_job_logger
+            entries = get_job_logger().search_logs(event_type=HEYGEN_RENDER_EVENT, limit=limit)
+        else:
+            entries = log_store.query(limit=limit, event_type=HEYGEN_RENDER_EVENT)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read HeyGen render observations: {str(e)}")
+        return []
+    return [entry.get('details') or {} for entry in entries]
+
+
+class HeyGenPredictor:
+    """Process-wide render model, refitted from the job logs periodically."""
+
+    def __init__(self, log_store=None, settings: Dict[str, Any] = None):
+        """
+        Initialize the predictor (fitted lazily on first use).
+
+        Args:
+            log_store: JobLogStore to read observations from (default: global job logger)
+            settings (Dict): Prediction settings (default: HEYGEN_PREDICTION_SETTINGS)
+        """
+        self.settings = settings or get_heygen_prediction_settings()
+        self.log_store = log_store
+        self.model = HeyGenRenderModel(self.settings.get('min_samples', 8))
+        self._fitted_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> HeyGenRenderModel:
+        """
+        Refit the model when it is older than refresh_seconds.
+
+        Args:
+            force (bool): Refit now
+
+        Returns:
+            HeyGenRenderModel: Current model
+        """
+        with self._lock:
+            stale = self._fitted_at is None or time.time() - self._fitted_at >= self.settings.get('refresh_seconds', 600)
+            if not (force or stale):
+                return self.model
+            model = HeyGenRenderModel(self.settings.get('min_samples', 8))
+            if self.settings.get('enabled', True):
+                model.fit(load_render_observations(self.log_store, self.settings.get('max_samples', 500)))
+            self.model = model
+            self._fitted_at = time.time()
+            logger.debug(f"📈 HeyGen render model refitted: {model.stats()}")
+            return model
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        """
+        Predict render time and video duration for a script.
+
+        Args:
+            text (str): Script text
+
+        Returns:
+            Dict[str, Any]: render_seconds, duration_seconds, source and words
+        """
+        return self.refresh().predict(text)
+
+    def predict_scripts(self, scripts: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Predict every HeyGen video of a job.
+
+        Args:
+            scripts (Dict): Individual scripts (intro is merged into movie1)
+
+        Returns:
+            Dict[str, Dict]: Video key -> prediction
+        """
+        model = self.refresh()
+        return {key: model.predict(text) for key, text in heygen_script_texts(scripts).items()}
+
+    def record_observation(self, job_id: Optional[str], key: str, video_id: str, text: str,
+                           render_seconds: float, duration_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Log a finished render so future fits can learn from it.
+
+        Args:
+            job_id (str): Job the render belongs to (None = not logged)
+            key (str): Video key (movie1, ..., outro)
+            video_id (str): HeyGen video ID
+            text (str): Script text
+            render_seconds (float): Seconds from submission to completion
+            duration_seconds (float): Video duration reported by HeyGen
+
+        Returns:
+            Dict: Logged observation details, None when not logged
+        """
+        if not job_id:
+            return None
+        features = script_features(text)
+        prediction = self.refresh().predict(text)
+        details = {
+            'key': key,
+            'video_id': video_id,
+            'script_words': features['words'],
+            'script_sentences': features['sentences'],
+            'script_chars': features['chars'],
+            'render_seconds': round(render_seconds, 1),
+            'duration_seconds': round(duration_seconds, 2) if duration_seconds else None,
+            'predicted_render_seconds': prediction['render_seconds'],
+            'predicted_duration_seconds': prediction['duration_seconds'],
+            'prediction_source': prediction['source']
+        }
+        try:
+            from utils.job_logger import get_job_logger
+            get_job_logger().log_job_event(
+                job_id, HEYGEN_RENDER_EVENT,
+                f"HeyGen {key} rendered in {render_seconds:.0f}s (predicted {prediction['render_seconds']:.0f}s)",
+                details
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not record HeyGen render observation: {str(e)}")
+            return None
+        return details
+
+
+# =============================================================================
+# POLL SCHEDULE
+# =============================================================================
+
+def next_poll_delay(elapsed_seconds: float, predicted_seconds: float, settings: Dict[str, Any] = None) -> float:
+    """
+    Get the delay until the next status check of a render.
+
+    One early check catches immediate failures, then checks stay sparse until
+    the render is close to its predicted finish, frequent around it, and back
+    off once the render is overdue.
+
+    Args:
+        elapsed_seconds (float): Seconds since the video was submitted
+        predicted_seconds (float): Predicted render time
+        settings (Dict): Prediction settings (default: HEYGEN_PREDICTION_SETTINGS)
+
+    Returns:
+        float: Seconds to wait before the next check
+    """
+    settings = settings or get_heygen_prediction_settings()
+    first_check = settings.get('first_check_seconds', 10)
+    early_at = predicted_seconds * settings.get('early_fraction', 0.8)
+    late_at = predicted_seconds * settings.get('late_fraction', 1.5)
+
+    if elapsed_seconds < first_check:
+        delay = first_check - elapsed_seconds
+    elif elapsed_seconds < early_at:
+        delay = min(early_at - elapsed_seconds, settings.get('idle_check_seconds', 60))
+    elif elapsed_seconds < late_at:
+        delay = settings.get('near_interval', 5)
+    else:
+        delay = settings.get('late_interval', 30)
+    return max(float(delay), 1.0)
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_predictor = None
+_predictor_lock = threading.Lock()
+
+
+def get_heygen_predictor() -> HeyGenPredictor:
+    """Get the global HeyGen render predictor instance."""
+    global _predictor
+    if _predictor is None:
+        with _predictor_lock:
+            if _predictor is None:
+                _predictor = HeyGenPredictor()
+    return _predictor
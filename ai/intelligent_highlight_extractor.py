@@ -26,16 +26,20 @@ import time
 import random
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
-import numpy as np
-import cv2
-import librosa
-import yt_dlp
-from moviepy.editor import VideoFileClip
-import requests
 
-from config.settings import get_video_settings
+from config.settings import get_video_settings, get_encoding_args
 from utils.validators import is_valid_url
 from utils.file_utils import ensure_directory, cleanup_temp_files
+from utils.lazy_imports import lazy_import
+from utils.media_executor import MediaJobCancelled, run_media_command
+from utils.scratch_workspace import get_scratch_dir
+
+# Analysis/download stack (~1s to import) - loaded on first use, not on module import
+np = lazy_import('numpy')
+cv2 = lazy_import('cv2')
+librosa = lazy_import('librosa')
+yt_dlp = lazy_import('yt_dlp')
+VideoFileClip = lazy_import('moviepy.editor', 'VideoFileClip')
 # Note: OpenAI integration can be added for advanced keyword generation
 
 logger = logging.getLogger(__name__)
@@ -59,7 +63,7 @@ class IntelligentHighlightExtractor:
         self.target_duration = 90  # 1:30 seconds as requested
         self.analysis_window = 10   # Analyze in 10-second windows
         self.download_quality = "1080p"  # High quality as requested
-        self.temp_dir = "temp_intelligent_highlights"
+        self.temp_dir = get_scratch_dir("temp_intelligent_highlights")  # Job workspace when run inside a workflow
         
         # Algorithm weights for scoring
         self.weights = {
@@ -426,7 +430,7 @@ class IntelligentHighlightExtractor:
                 video_path
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = run_media_command(cmd, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0 and result.stdout.strip():
                 resolution = result.stdout.strip()
@@ -435,6 +439,8 @@ class IntelligentHighlightExtractor:
                 logger.debug(f"Could not get resolution for {video_path}")
                 return "unknown"
                 
+        except MediaJobCancelled:
+            raise
         except Exception as e:
             logger.debug(f"Error getting video resolution: {str(e)}")
             return "unknown"
@@ -883,27 +889,22 @@ class IntelligentHighlightExtractor:
             # Get source video resolution for quality preservation
             source_resolution = self._get_video_resolution(video_path)
             
-            # Use FFmpeg for high-quality extraction with resolution preservation
+            # Use FFmpeg for high-quality extraction with resolution preservation.
+            # The segment is re-cut and re-encoded by Vizard.ai, so it uses the fast
+            # intermediate profile (CRF 18 keeps it visually lossless)
             ffmpeg_cmd = [
                 'ffmpeg',
                 '-i', video_path,                    # Input file
                 '-ss', str(start_time),              # Start time
                 '-t', str(end_time - start_time),    # Duration
-                '-c:v', 'libx264',                   # Video codec
-                '-c:a', 'aac',                       # Audio codec
-                '-crf', '18',                        # High quality (lower = better)
-                '-preset', 'medium',                 # Encoding speed vs compression
-                '-profile:v', 'high',                # H.264 high profile
-                '-level:v', '4.1',                   # H.264 level for 1080p
-                '-movflags', '+faststart',           # Optimize for web streaming
-                '-pix_fmt', 'yuv420p',              # Ensure compatibility
                 '-vf', 'scale=-2:ih',               # Preserve original resolution and aspect ratio
-                '-maxrate', '8000k',                 # Higher max bitrate for quality
-                '-bufsize', '16000k',               # Larger buffer size
-                '-g', '30',                          # GOP size for better quality
-                '-keyint_min', '30',                # Minimum GOP size
-                '-sc_threshold', '0',               # Disable scene cut detection
-                '-b:a', '192k',                     # Higher audio bitrate
+                *get_encoding_args(
+                    'intermediate',
+                    video_profile='high', level='4.1',  # H.264 high profile, level for 1080p
+                    maxrate='8000k', bufsize='16000k',
+                    gop=30, keyint_min=30,           # Fixed GOP so Vizard.ai can cut anywhere
+                    sc_threshold=0                   # Disable scene cut detection
+                ),
                 '-y',                                # Overwrite output file
                 output_path
             ]
@@ -913,8 +914,9 @@ class IntelligentHighlightExtractor:
             
             # Execute FFmpeg command
             logger.info("   🎬 Starting FFmpeg extraction...")
-            result = subprocess.run(
+            result = run_media_command(
                 ffmpeg_cmd,
+                priority='intermediate',
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
@@ -980,6 +982,8 @@ class IntelligentHighlightExtractor:
                 logger.error(f"   Error: {result.stderr}")
                 return None
                 
+        except MediaJobCancelled:
+            raise
         except subprocess.TimeoutExpired:
             logger.error(f"❌ FFmpeg extraction timeout for {movie_title}")
             return None
@@ -1340,7 +1344,7 @@ def validate_intelligent_processing_requirements() -> Dict[str, Any]:
     
     try:
         # Check FFmpeg availability
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, timeout=5)
+        result = run_media_command(['ffmpeg', '-version'], capture_output=True, timeout=5)
         if result.returncode != 0:
             validation['ready'] = False
             validation['missing_requirements'].append('FFmpeg not available - required for video processing')
@@ -1363,6 +1367,8 @@ def validate_intelligent_processing_requirements() -> Dict[str, Any]:
         
         return validation
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         validation['ready'] = False
         validation['missing_requirements'].append(f'Validation error: {str(e)}')
@@ -10,10 +10,14 @@ Features:
 - Dynamic context building
 - Viral content optimization prompts
 - Customizable template parameters
+- Memoized templates per (template id, genre, platform) with cached token estimates
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import math
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 
 from config.constants import get_supported_genres, get_supported_platforms
 
@@ -55,10 +59,12 @@ VIRAL_ELEMENTS = {
 }
 
 # DYNAMIC GENRE CUSTOMIZATIONS - AUTO-GENERATED FROM SUPPORTED GENRES
+@lru_cache(maxsize=1)
 def _generate_dynamic_genre_customizations() -> Dict[str, Dict[str, List[str]]]:
     """
     Dynamically generate genre customizations for ALL supported genres.
     This replaces the static hardcoded approach with a scalable system.
+    Computed once - repeated calls return the table built at import.
     """
     # Base templates for different genre families
     base_customizations = {
@@ -221,90 +227,167 @@ PLATFORM_OPTIMIZATIONS = {
 }
 
 # =============================================================================
-# HOOK PROMPT TEMPLATES
+# MEMOIZED TEMPLATES AND TOKEN ESTIMATES
 # =============================================================================
 
-def get_hook_prompt_template(movie_data: Dict, 
-                           genre: Optional[str] = None,
-                           platform: Optional[str] = None) -> Tuple[str, str]:
+# Rough OpenAI tokenizer ratio for English prompts (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
+# Default completion budget (max_tokens) per template id
+TEMPLATE_MAX_TOKENS = {
+    'hook': 40,
+    'intro': 30,
+    'script_intro': 50,
+    'script_hook': 50,
+    'script_hook_timed': 70
+}
+
+# Hook starters used when the genre has no customization
+DEFAULT_HOOK_STARTERS = '"This movie", "You won\'t believe", "Everyone\'s talking about", "This is why", "Get ready for", "The moment when"'
+
+
+def estimate_tokens(text: Optional[str]) -> int:
     """
-    Generate hook prompt template for a specific movie.
-    
+    Estimate the OpenAI token count of a text.
+
     Args:
-        movie_data (Dict): Movie information
-        genre (str): Genre for customization
-        platform (str): Target platform
-        
+        text (str): Prompt or completion text
+
     Returns:
-        Tuple[str, str]: (system_prompt, user_prompt)
+        int: Estimated token count
     """
-    try:
-        # Build system prompt
-        system_prompt = BASE_SYSTEM_PROMPTS['hook']
-        
-        # Add genre-specific instructions
-        if genre and genre in GENRE_CUSTOMIZATIONS:
-            genre_info = GENRE_CUSTOMIZATIONS[genre]
-            system_prompt += f"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class PromptTemplate(NamedTuple):
+    """A rendered prompt template - only per-movie ``$fields`` are left to substitute."""
+
+    template_id: str
+    genre: Optional[str]
+    platform: Optional[str]
+    content_type: Optional[str]
+    system_prompt: str
+    user_template: str
+    system_tokens: int
+    template_tokens: int  # User template without its per-movie fields
+    max_tokens: int
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Prompt tokens before per-movie fields are substituted."""
+        return self.system_tokens + self.template_tokens
+
+    def render(self, **fields: Any) -> str:
+        """
+        Substitute per-movie fields into the user template.
+
+        Args:
+            **fields: Slot values (title, movie_context, ...)
+
+        Returns:
+            str: User prompt
+        """
+        return Template(self.user_template).safe_substitute({key: str(value) for key, value in fields.items()})
+
+    def estimate_tokens(self, **fields: Any) -> int:
+        """
+        Estimate prompt tokens for one rendering without building the prompt.
+
+        Args:
+            **fields: Slot values that will be substituted
+
+        Returns:
+            int: Estimated prompt tokens (system + user)
+        """
+        return self.prompt_tokens + sum(estimate_tokens(str(value)) * self.user_template.count(f'${key}')
+                                        for key, value in fields.items())
+
+
+def _escape_template(text: str, *slots: str) -> str:
+    """Escape literal '$' so only the named slots are substituted."""
+    escaped = text.replace('$', '$$')
+    for slot in slots:
+        escaped = escaped.replace(f'$${slot}', f'${slot}')
+    return escaped
+
+
+def _genre_list(genre: Optional[str], key: str) -> Optional[str]:
+    """Join one genre customization list, None if the genre has no customization."""
+    if genre and genre in GENRE_CUSTOMIZATIONS:
+        return ', '.join(GENRE_CUSTOMIZATIONS[genre][key])
+    return None
+
+
+def _build_hook_template(genre: Optional[str], platform: Optional[str],
+                         content_type: Optional[str]) -> Tuple[str, str]:
+    """Hook prompt for one movie - slot: $movie_context."""
+    system_prompt = BASE_SYSTEM_PROMPTS['hook']
+
+    # Add genre-specific instructions
+    if _genre_list(genre, 'mood_words') is not None:
+        system_prompt += f"""
 
 GENRE SPECIALIZATION - {genre.upper()}:
-- Use mood words: {', '.join(genre_info['mood_words'])}
-- Focus on: {', '.join(genre_info['viral_angles'])}
-- Engagement style: {', '.join(genre_info['engagement_hooks'])}"""
-        
-        # Add platform-specific instructions
-        if platform and platform in PLATFORM_OPTIMIZATIONS:
-            platform_info = PLATFORM_OPTIMIZATIONS[platform]
-            system_prompt += f"""
+- Use mood words: {_genre_list(genre, 'mood_words')}
+- Focus on: {_genre_list(genre, 'viral_angles')}
+- Engagement style: {_genre_list(genre, 'engagement_hooks')}"""
+
+    # Add platform-specific instructions
+    if platform and platform in PLATFORM_OPTIMIZATIONS:
+        platform_info = PLATFORM_OPTIMIZATIONS[platform]
+        system_prompt += f"""
 
 PLATFORM OPTIMIZATION - {platform.upper()}:
 - Maximum words: {platform_info['max_words']}
 - Style: {platform_info['style']}
 - Pace: {platform_info['pace']}
 - Platform hooks: {', '.join(platform_info['hooks'])}"""
-        
-        # Build user prompt with movie context
-        user_prompt = _build_movie_context_prompt(movie_data, genre, platform)
-        
-        return system_prompt, user_prompt
-        
-    except Exception as e:
-        logger.error(f"Error building hook prompt template: {str(e)}")
-        return BASE_SYSTEM_PROMPTS['hook'], f"Create a hook for: {movie_data.get('title', 'Unknown Movie')}"
 
+    # Add genre-specific hook starters if available
+    if genre and genre in GENRE_CUSTOMIZATIONS and 'hook_starters' in GENRE_CUSTOMIZATIONS[genre]:
+        hook_starters = ', '.join([f'"{starter}"' for starter in GENRE_CUSTOMIZATIONS[genre]['hook_starters']])
+    else:
+        hook_starters = DEFAULT_HOOK_STARTERS
 
-def get_intro_prompt_template(genre: Optional[str] = None,
-                            platform: Optional[str] = None,
-                            content_type: Optional[str] = None) -> Tuple[str, str]:
-    """
-    Generate intro prompt template for video collection.
-    
-    Args:
-        genre (str): Genre for customization
-        platform (str): Target platform
-        content_type (str): Content type
-        
-    Returns:
-        Tuple[str, str]: (system_prompt, user_prompt)
-    """
-    try:
-        # Build system prompt
-        system_prompt = BASE_SYSTEM_PROMPTS['intro']
-        
-        # Add genre-specific instructions
-        if genre and genre in GENRE_CUSTOMIZATIONS:
-            genre_info = GENRE_CUSTOMIZATIONS[genre]
-            system_prompt += f"""
+    user_template = f"""Create a viral hook sentence for this movie:
+
+$movie_context
+
+Hook Requirements:
+- EXACTLY 1 sentence only
+- 10-18 words maximum  
+- Use varied viral starters: {hook_starters}
+- AVOID overusing "What happens when" - be more creative and varied
+- Create instant curiosity and urgency
+- Make viewers think "I MUST see this!"
+- Use viral TikTok language that makes people want to watch immediately
+- Focus on the movie's unique selling point or most shocking element
+
+Respond with ONLY the hook sentence."""
+
+    return system_prompt, _escape_template(user_template, 'movie_context')
+
+
+def _build_intro_template(genre: Optional[str], platform: Optional[str],
+                          content_type: Optional[str]) -> Tuple[str, str]:
+    """Intro prompt for a video collection - no per-movie slots."""
+    system_prompt = BASE_SYSTEM_PROMPTS['intro']
+
+    # Add genre-specific instructions
+    if genre and genre in GENRE_CUSTOMIZATIONS:
+        system_prompt += f"""
 
 GENRE FOCUS - {genre.upper()}:
 Create an intro that captures the essence of {genre.lower()} content.
 Use tone and language that appeals to {genre.lower()} fans."""
-        
-        # Build user prompt
-        content_desc = content_type if content_type else "movies"
-        platform_name = platform if platform else "streaming"
-        
-        user_prompt = f"""Create a short, engaging introduction for a video showcasing top {genre or 'trending'} {content_desc} from {platform_name}.
+
+    # Build user prompt
+    content_desc = content_type if content_type else "movies"
+    platform_name = platform if platform else "streaming"
+
+    user_template = f"""Create a short, engaging introduction for a video showcasing top {genre or 'trending'} {content_desc} from {platform_name}.
 
 Requirements:
 - 10-12 words maximum (total video duration 12-14 seconds)
@@ -325,8 +408,242 @@ PREFERRED STYLES (choose one):
 - "These 3 {genre or 'trending'} {content_desc} from StreamGank are breaking the internet!"
 
 Create something similar but more engaging and viral."""
+
+    return system_prompt, _escape_template(user_template)
+
+
+def _build_genre_requirements_template(genre: Optional[str], platform: Optional[str],
+                                       content_type: Optional[str]) -> Tuple[str, str]:
+    """Genre requirements block appended by customize_prompt_for_genre - no slots."""
+    if _genre_list(genre, 'mood_words') is None:
+        return '', ''
+
+    return '', _escape_template(f"""
+
+GENRE-SPECIFIC REQUIREMENTS:
+- Tone: {genre.lower()}-focused
+- Mood words to consider: {_genre_list(genre, 'mood_words')}
+- Viral angles: {_genre_list(genre, 'viral_angles')}
+- Engagement style: {_genre_list(genre, 'engagement_hooks')}""")
+
+
+def _build_script_intro_template(genre: Optional[str], platform: Optional[str],
+                                 content_type: Optional[str]) -> Tuple[str, str]:
+    """Intro prompt used by clean_script_generator - no slots."""
+    genre_name = genre or 'trending'
+    user_template = f"""Generate a powerful, concise intro script for a video showcasing the top 3 {genre_name.lower()} {content_type.lower() if content_type else 'movies'} on {platform}.
+
+Requirements:
+- EXACTLY 10-12 words total (very important for timing)
+- US English, TikTok/YouTube optimized
+- Create excitement and anticipation
+- Don't mention specific movie titles
+- Focus on the genre and platform
+
+Examples for {genre_name} on {platform}:
+- "Get ready for the most terrifying {genre_name.lower()} hits streaming on {platform}"
+- "These spine-chilling {genre_name.lower()} masterpieces will leave you breathless"
+- "Prepare yourself for {platform}'s most intense {genre_name.lower()} experiences"
+
+Generate ONE intro script (10-12 words):"""
+
+    return '', _escape_template(user_template)
+
+
+def _build_script_hook_template(genre: Optional[str], platform: Optional[str],
+                                content_type: Optional[str]) -> Tuple[str, str]:
+    """Movie 1 hook prompt used by clean_script_generator - slot: $title."""
+    return '', _escape_template(f"""Create a powerful movie hook for this {genre} movie: $title
+
+Requirements:
+- ONE impactful sentence (10-18 words)
+- Focus on excitement and tension
+- No quotation marks, clean text only
+- Professional trailer-style language
+
+Movie: $title
+Genre: {genre}
+Create the hook:""", 'title')
+
+
+def _build_script_hook_timed_template(genre: Optional[str], platform: Optional[str],
+                                      content_type: Optional[str]) -> Tuple[str, str]:
+    """Movie 2/3 hook prompt (8-10 seconds) used by clean_script_generator - slot: $title."""
+    genre_name = genre or 'movie'
+    return '', _escape_template(f"""Create a movie hook script that is EXACTLY 8-10 seconds when spoken aloud.
+
+PRECISE REQUIREMENTS FOR 8-10 SECONDS:
+✅ Must be exactly 24-30 words (this equals 8-10 seconds at normal speaking pace)
+✅ Write 1-2 sentences that total 24-30 words
+✅ Count each word carefully before responding
+✅ Focus on tension, thrills, excitement
+
+PERFECT EXAMPLES (exactly 8-10 seconds):
+Example 1 (26 words = 8.7s): "This spine-chilling horror masterpiece delivers relentless terror and shocking plot twists that will leave you gripping your seat throughout every terrifying moment."
+
+Example 2 (28 words = 9.3s): "An action-packed thriller featuring explosive sequences, heart-stopping suspense, and mind-bending plot twists that will keep audiences completely captivated from start to finish."
+
+Example 3 (25 words = 8.3s): "This gripping drama unfolds shocking secrets and emotional revelations that will leave viewers absolutely stunned and emotionally invested until the final scene."
+
+YOUR TASK:
+Movie: $title
+Genre: {genre}
+Write a {genre_name.lower()} hook with exactly 24-30 words (8-10 seconds):""", 'title')
+
+
+# Template id -> builder(genre, platform, content_type) -> (system_prompt, user_template)
+_TEMPLATE_BUILDERS = {
+    'hook': _build_hook_template,
+    'intro': _build_intro_template,
+    'genre_requirements': _build_genre_requirements_template,
+    'script_intro': _build_script_intro_template,
+    'script_hook': _build_script_hook_template,
+    'script_hook_timed': _build_script_hook_timed_template
+}
+
+
+@lru_cache(maxsize=512)
+def get_prompt_template(template_id: str,
+                        genre: Optional[str] = None,
+                        platform: Optional[str] = None,
+                        content_type: Optional[str] = None) -> PromptTemplate:
+    """
+    Get a rendered prompt template, built once per (template id, genre, platform, content type).
+
+    Args:
+        template_id (str): Template id (hook, intro, genre_requirements, script_intro, script_hook, script_hook_timed)
+        genre (str): Genre for customization
+        platform (str): Target platform
+        content_type (str): Content type (only used by intro templates)
+
+    Returns:
+        PromptTemplate: Template with cached token estimates
+
+    Raises:
+        KeyError: If the template id is unknown
+    """
+    system_prompt, user_template = _TEMPLATE_BUILDERS[template_id](genre, platform, content_type)
+
+    return PromptTemplate(
+        template_id=template_id,
+        genre=genre,
+        platform=platform,
+        content_type=content_type,
+        system_prompt=system_prompt,
+        user_template=user_template,
+        system_tokens=estimate_tokens(system_prompt),
+        template_tokens=estimate_tokens(Template(user_template).safe_substitute(movie_context='', title='')),
+        max_tokens=TEMPLATE_MAX_TOKENS.get(template_id, 0)
+    )
+
+
+def get_prompt_cache_stats() -> Dict[str, int]:
+    """
+    Get prompt template cache statistics.
+
+    Returns:
+        Dict[str, int]: Hits, misses and cached template count
+    """
+    info = get_prompt_template.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'cached_templates': info.currsize}
+
+
+def estimate_script_generation_tokens(movies: List[Dict],
+                                      genre: Optional[str] = None,
+                                      platform: Optional[str] = None,
+                                      content_type: Optional[str] = None,
+                                      max_tokens: Optional[Dict[str, int]] = None,
+                                      hook_candidates: int = 1) -> Dict[str, Any]:
+    """
+    Pre-flight token estimate for one script generation run (intro + one hook per movie).
+
+    Uses the cached template estimates, so only movie titles are measured per call.
+    Retries are not included.
+
+    Args:
+        movies (List[Dict]): Movies to write hooks for (movie 1 uses script_hook, the rest script_hook_timed)
+        genre (str): Genre
+        platform (str): Platform
+        content_type (str): Content type
+        max_tokens (Dict[str, int]): Completion budget overrides per template id
+        hook_candidates (int): Completions requested per timed hook (n)
+
+    Returns:
+        Dict[str, Any]: prompt_tokens, completion_tokens, total_tokens and requests
+    """
+    overrides = max_tokens or {}
+    requests = []
+
+    intro = get_prompt_template('script_intro', genre, platform, content_type)
+    requests.append(('intro', intro, intro.prompt_tokens))
+
+    for i, movie in enumerate(movies, 1):
+        template = get_prompt_template('script_hook' if i == 1 else 'script_hook_timed', genre, platform)
+        title = movie.get('title', f'Unknown Movie {i}')
+        requests.append((f'movie{i}', template, template.estimate_tokens(title=title)))
+
+    prompt_tokens = sum(tokens for _, _, tokens in requests)
+    completion_tokens = sum(overrides.get(template.template_id, template.max_tokens) *
+                            (hook_candidates if template.template_id == 'script_hook_timed' else 1)
+                            for _, template, _ in requests)
+
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+        'requests': [{'name': name, 'template_id': template.template_id, 'prompt_tokens': tokens}
+                     for name, template, tokens in requests]
+    }
+
+# =============================================================================
+# HOOK PROMPT TEMPLATES
+# =============================================================================
+
+def get_hook_prompt_template(movie_data: Dict, 
+                           genre: Optional[str] = None,
+                           platform: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Generate hook prompt template for a specific movie.
+    
+    Args:
+        movie_data (Dict): Movie information
+        genre (str): Genre for customization
+        platform (str): Target platform
         
-        return system_prompt, user_prompt
+    Returns:
+        Tuple[str, str]: (system_prompt, user_prompt)
+    """
+    try:
+        # System prompt and requirements are cached per (genre, platform)
+        template = get_prompt_template('hook', genre, platform)
+        user_prompt = template.render(movie_context=_format_movie_fields(movie_data, platform))
+        
+        return template.system_prompt, user_prompt
+        
+    except Exception as e:
+        logger.error(f"Error building hook prompt template: {str(e)}")
+        return BASE_SYSTEM_PROMPTS['hook'], f"Create a hook for: {movie_data.get('title', 'Unknown Movie')}"
+
+
+def get_intro_prompt_template(genre: Optional[str] = None,
+                            platform: Optional[str] = None,
+                            content_type: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Generate intro prompt template for video collection.
+    
+    Args:
+        genre (str): Genre for customization
+        platform (str): Target platform
+        content_type (str): Content type
+        
+    Returns:
+        Tuple[str, str]: (system_prompt, user_prompt)
+    """
+    try:
+        # Intro prompts have no per-movie fields - the whole render is cached
+        template = get_prompt_template('intro', genre, platform, content_type)
+        
+        return template.system_prompt, template.render()
         
     except Exception as e:
         logger.error(f"Error building intro prompt template: {str(e)}")
@@ -397,18 +714,8 @@ def customize_prompt_for_genre(base_prompt: str, genre: str) -> str:
         if not genre or genre not in GENRE_CUSTOMIZATIONS:
             return base_prompt
         
-        genre_info = GENRE_CUSTOMIZATIONS[genre]
-        
-        # Add genre-specific elements
-        customizations = f"""
-
-GENRE-SPECIFIC REQUIREMENTS:
-- Tone: {genre.lower()}-focused
-- Mood words to consider: {', '.join(genre_info['mood_words'])}
-- Viral angles: {', '.join(genre_info['viral_angles'])}
-- Engagement style: {', '.join(genre_info['engagement_hooks'])}"""
-        
-        return base_prompt + customizations
+        # Genre-specific elements are rendered once per genre
+        return base_prompt + get_prompt_template('genre_requirements', genre).render()
         
     except Exception as e:
         logger.error(f"Error customizing prompt for genre {genre}: {str(e)}")
@@ -518,56 +825,37 @@ Incorporate this element while maintaining all other requirements."""
 # PRIVATE HELPER FUNCTIONS
 # =============================================================================
 
+def _format_movie_fields(movie_data: Dict, platform: Optional[str]) -> str:
+    """Format the per-movie lines substituted into the hook template."""
+    # Extract movie information
+    title = movie_data.get('title', 'Unknown Movie')
+    year = movie_data.get('year', '')
+    imdb_score = movie_data.get('imdb_score', 0)
+    genres = movie_data.get('genres', [])
+    platform_name = movie_data.get('platform', platform or 'streaming')
+    
+    movie_fields = f"Movie: {title}"
+    
+    if year:
+        movie_fields += f"\nYear: {year}"
+    
+    if imdb_score and imdb_score > 0:
+        movie_fields += f"\nIMDb Score: {imdb_score}/10"
+    
+    if genres:
+        movie_fields += f"\nGenres: {', '.join(genres)}"
+    
+    movie_fields += f"\nPlatform: {platform_name}"
+    
+    return movie_fields
+
+
 def _build_movie_context_prompt(movie_data: Dict, genre: Optional[str], platform: Optional[str]) -> str:
     """Build detailed movie context for prompts."""
     try:
-        # Extract movie information
-        title = movie_data.get('title', 'Unknown Movie')
-        year = movie_data.get('year', '')
-        imdb_score = movie_data.get('imdb_score', 0)
-        genres = movie_data.get('genres', [])
-        platform_name = movie_data.get('platform', platform or 'streaming')
-        
-        # Build context
-        context_prompt = f"""Create a viral hook sentence for this movie:
-
-Movie: {title}"""
-        
-        if year:
-            context_prompt += f"\nYear: {year}"
-        
-        if imdb_score and imdb_score > 0:
-            context_prompt += f"\nIMDb Score: {imdb_score}/10"
-        
-        if genres:
-            context_prompt += f"\nGenres: {', '.join(genres)}"
-        
-        context_prompt += f"\nPlatform: {platform_name}"
-        
-        # Add genre-specific hook starters if available
-        hook_starters = "This movie", "You won't believe", "Everyone's talking about", "This is why", "Get ready for", "The moment when"
-        if genre and genre in GENRE_CUSTOMIZATIONS and 'hook_starters' in GENRE_CUSTOMIZATIONS[genre]:
-            genre_starters = GENRE_CUSTOMIZATIONS[genre]['hook_starters']
-            hook_starters = ', '.join([f'"{starter}"' for starter in genre_starters])
-        else:
-            hook_starters = '"This movie", "You won\'t believe", "Everyone\'s talking about", "This is why", "Get ready for", "The moment when"'
-        
-        # Add requirements
-        context_prompt += f"""
-
-Hook Requirements:
-- EXACTLY 1 sentence only
-- 10-18 words maximum  
-- Use varied viral starters: {hook_starters}
-- AVOID overusing "What happens when" - be more creative and varied
-- Create instant curiosity and urgency
-- Make viewers think "I MUST see this!"
-- Use viral TikTok language that makes people want to watch immediately
-- Focus on the movie's unique selling point or most shocking element
-
-Respond with ONLY the hook sentence."""
-        
-        return context_prompt
+        # Hook requirements come from the cached template, only movie fields are formatted
+        template = get_prompt_template('hook', genre, platform)
+        return template.render(movie_context=_format_movie_fields(movie_data, platform))
         
     except Exception as e:
         logger.error(f"Error building movie context prompt: {str(e)}")
@@ -10,8 +10,9 @@ Author: StreamGank Development Team
 Version: 2.0.0 - Streamlined Essential Functions Only
 """
 
+import math
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -99,3 +100,129 @@ def get_script_word_count(script: str) -> int:
 
 # That's it! 3 essential functions vs 16 bloated ones.
 # Total: ~80 lines vs ~600+ lines in original script_manager.py
+
+
+# =============================================================================
+# LOCAL DURATION PRE-VALIDATION (avoids OpenAI retry round trips)
+# =============================================================================
+
+# Spoken pace used for hook timing (180 WPM)
+WORDS_PER_SECOND = 3.0
+
+# Trailing words that leave a trimmed sentence dangling
+DANGLING_WORDS = {'a', 'an', 'and', 'as', 'at', 'but', 'by', 'for', 'from', 'in', 'into', 'of', 'on', 'or',
+                  'that', 'the', 'their', 'to', 'while', 'with', 'your'}
+
+# Closing sentences used to pad near-miss scripts, by word count
+PAD_SENTENCES = {
+    1: 'Unmissable.',
+    2: 'Watch tonight.',
+    3: 'Stream it tonight.',
+    4: 'This one is unforgettable.',
+    5: 'You will not look away.'
+}
+
+
+def estimate_spoken_duration(script: str, words_per_second: float = WORDS_PER_SECOND) -> float:
+    """
+    Estimate how long a script takes to speak.
+
+    Args:
+        script (str): Script text
+        words_per_second (float): Speaking pace
+
+    Returns:
+        float: Duration in seconds
+    """
+    return get_script_word_count(script) / words_per_second
+
+
+def fit_script_to_word_range(script: str, min_words: int, max_words: int) -> str:
+    """
+    Deterministically trim or pad a script into a word range.
+
+    Long scripts are cut at max_words and dangling connectors are dropped;
+    short scripts get a closing sentence from PAD_SENTENCES.
+
+    Args:
+        script (str): Script text
+        min_words (int): Minimum word count
+        max_words (int): Maximum word count
+
+    Returns:
+        str: Adjusted script (unchanged if already in range or the gap cannot be padded)
+    """
+    words = script.split()
+
+    if len(words) > max_words:
+        kept = words[:max_words]
+        # Drop dangling connectors while staying in range
+        while len(kept) > min_words and kept[-1].lower().strip(',;:-') in DANGLING_WORDS:
+            kept.pop()
+        trimmed = ' '.join(kept).rstrip(',;:- ')
+        if trimmed and trimmed[-1] not in '.!?':
+            trimmed += '.'
+        return trimmed
+
+    missing = min_words - len(words)
+    if 0 < missing and missing in PAD_SENTENCES:
+        padded = script.rstrip()
+        if padded[-1] not in '.!?':
+            padded += '.'
+        return f"{padded} {PAD_SENTENCES[missing]}"
+
+    return script
+
+
+def select_script_candidate(candidates: List[str],
+                            min_seconds: float,
+                            max_seconds: float,
+                            words_per_second: float = WORDS_PER_SECOND,
+                            max_adjust_words: int = 4) -> Optional[Dict[str, Any]]:
+    """
+    Pick the first candidate whose spoken duration fits, else repair the closest near miss.
+
+    Args:
+        candidates (List[str]): Cleaned scripts in the order they were generated
+        min_seconds (float): Minimum spoken duration
+        max_seconds (float): Maximum spoken duration
+        words_per_second (float): Speaking pace
+        max_adjust_words (int): Largest word gap that may be trimmed or padded
+
+    Returns:
+        Optional[Dict[str, Any]]: script, index, words, duration and adjustment
+        ('trimmed'/'padded'/None), or None if no candidate is usable
+    """
+    min_words = math.ceil(min_seconds * words_per_second)
+    max_words = math.floor(max_seconds * words_per_second)
+
+    def _result(script: str, index: int, adjustment: Optional[str]) -> Dict[str, Any]:
+        return {
+            'script': script,
+            'index': index,
+            'words': get_script_word_count(script),
+            'duration': estimate_spoken_duration(script, words_per_second),
+            'adjustment': adjustment,
+            'original_words': get_script_word_count(candidates[index])
+        }
+
+    # First candidate that already fits
+    for index, candidate in enumerate(candidates):
+        if candidate and min_words <= get_script_word_count(candidate) <= max_words:
+            return _result(candidate, index, None)
+
+    # Closest near miss (ties go to the earlier candidate)
+    near_misses = []
+    for index, candidate in enumerate(candidates):
+        word_count = get_script_word_count(candidate)
+        gap = word_count - max_words if word_count > max_words else min_words - word_count
+        if candidate and gap <= max_adjust_words:
+            near_misses.append((gap, index))
+
+    for gap, index in sorted(near_misses):
+        adjusted = fit_script_to_word_range(candidates[index], min_words, max_words)
+        if min_words <= get_script_word_count(adjusted) <= max_words:
+            adjustment = 'trimmed' if get_script_word_count(candidates[index]) > max_words else 'padded'
+            return _result(adjusted, index, adjustment)
+
+    return None
@@ -27,6 +27,7 @@ from pathlib import Path
 # Import configuration and utilities
 from config.settings import get_api_config, get_video_settings
 from utils.validators import is_valid_url
+from utils.http_session import get_http_session
 from utils.file_utils import ensure_directory, cleanup_temp_files
 
 logger = logging.getLogger(__name__)
@@ -152,7 +153,7 @@ class VizardClient:
             logger.info(f"   🎬 Max clips: 1 (best clip only)")
             
             # Send request to Vizard.ai
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.base_url}/project/create",
                 json=payload,
                 headers=self.headers,
@@ -198,7 +199,7 @@ class VizardClient:
             
             while time.time() - start_time < max_wait_time:
                 # Query project status
-                response = requests.get(
+                response = get_http_session().get(
                     f"{self.base_url}/project/query/{project_id}",
                     headers=self.headers,
                     timeout=30
@@ -254,7 +255,7 @@ class VizardClient:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             # Download the clip with timeout and streaming
-            response = requests.get(
+            response = get_http_session().get(
                 clip_url,
                 headers={"User-Agent": "StreamGang/1.0"},
                 stream=True,
@@ -643,7 +644,7 @@ def validate_vizard_requirements() -> Dict[str, Any]:
         
         # Check internet connectivity (basic test)
         try:
-            response = requests.get("https://www.google.com", timeout=5)
+            response = get_http_session().get("https://www.google.com", timeout=5)
             validation['internet_available'] = True
         except:
             validation['warnings'].append('Internet connectivity may be limited')
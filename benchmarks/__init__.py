@@ -0,0 +1,30 @@
+"""
+StreamGank Benchmark Suite
+
+Offline performance measurements for the media hot paths, run on synthetic
+fixtures (lavfi test trailer, generated poster, static results page).
+
+Benchmark Structure:
+    - bench_posters.py: Enhanced poster rendering
+    - bench_highlights.py: Highlight analysis and audio-position search
+    - bench_scroll.py: Scroll frame capture and video assembly
+    - bench_composition.py: Creatomate composition building
+    - bench_cache.py: Workflow cache, upload manifest and template cache lookups
+    - harness.py: Timing, JSON results and baseline comparison
+    - synthetic.py: Synthetic fixture generators
+
+Benchmarks whose dependencies (ffmpeg, Pillow, Playwright/Chromium, the
+media client libraries) are missing are skipped, and listed as skipped in
+the results file.
+
+Usage:
+    # Run and write benchmarks/results/latest.json
+    python -m pytest -c benchmarks/pytest.ini benchmarks
+
+    # Keep a baseline, then compare a later run against it
+    python -m pytest -c benchmarks/pytest.ini benchmarks --bench-json benchmarks/results/baseline.json
+    python -m pytest -c benchmarks/pytest.ini benchmarks --bench-compare benchmarks/results/baseline.json
+
+    # Compare two saved results files
+    python -m benchmarks.compare benchmarks/results/baseline.json benchmarks/results/latest.json
+"""
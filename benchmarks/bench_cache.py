@@ -0,0 +1,94 @@
+"""
+Cache Lookup Benchmarks
+
+Times the lookups every workflow run repeats: workflow cache store records
+and full workflows, upload manifest hits, memoized prompt templates and the
+per-trailer media timeline cache.
+"""
+
+import pytest
+
+from benchmarks.synthetic import TRAILER_DURATION
+from utils.upload_manifest import UploadManifest
+from utils.workflow_cache_store import WorkflowCacheStore, normalize_cache_params
+
+COUNTRIES = ('US', 'FR', 'UK', 'DE')
+GENRES = ('Horror', 'Comedy', 'Action', 'Drama', 'Thriller')
+PLATFORMS = ('Netflix', 'Prime Video', 'Disney+', 'Max', 'Hulu')
+
+# One synthetic workflow per (country, genre, platform) - 100 keys over the shards
+WORKFLOW_KEYS = [normalize_cache_params(country, genre, platform)
+                 for country in COUNTRIES for genre in GENRES for platform in PLATFORMS]
+
+
+def synthetic_workflow(index: int) -> dict:
+    movies = [{'id': index * 10 + rank, 'title': f"Movie {index}-{rank}", 'imdb_score': 7.5,
+               'genres': ['Horror', 'Thriller'], 'poster_url': f"https://cdn/poster/{index}/{rank}.jpg"}
+              for rank in range(3)]
+    return {
+        'status': 'completed',
+        'total_duration': 412.5,
+        'step_1_database_extraction': {'movies': movies},
+        'step_2_script_generation': {'scripts': {f"movie{rank + 1}": {'text': 'Hook ' * 30} for rank in range(3)}},
+        'step_3_asset_preparation': {'enhanced_posters': {m['title']: m['poster_url'] for m in movies}},
+        'step_4_heygen_creation': {'video_ids': {f"movie{rank + 1}": f"heygen_{index}_{rank}" for rank in range(3)}}
+    }
+
+
+@pytest.fixture(scope='module')
+def cache_store(tmp_path_factory):
+    store = WorkflowCacheStore(str(tmp_path_factory.mktemp('cache_store')))
+    for index, params in enumerate(WORKFLOW_KEYS):
+        store.save_workflow(params, synthetic_workflow(index))
+    yield store
+    store.close()
+
+
+def bench_workflow_record_hit(benchmark, cache_store):
+    record = benchmark(cache_store.get_record, WORKFLOW_KEYS[42], 'step_2_script_generation')
+    assert record['scripts']['movie1']['text'].startswith('Hook')
+
+
+def bench_workflow_record_miss(benchmark, cache_store):
+    params = normalize_cache_params('JP', 'Anime', 'Crunchyroll')
+    assert benchmark(cache_store.get_record, params, 'step_1_database_extraction') is None
+
+
+def bench_workflow_has_key(benchmark, cache_store):
+    assert benchmark(cache_store.has_key, WORKFLOW_KEYS[7])
+
+
+def bench_workflow_load(benchmark, cache_store):
+    workflow = benchmark(cache_store.load_workflow, WORKFLOW_KEYS[-1])
+    assert workflow['status'] == 'completed' and 'step_4_heygen_creation' in workflow
+
+
+def bench_normalize_cache_params(benchmark):
+    assert benchmark(normalize_cache_params, 'US', 'Action & Adventure', 'Prime Video', 'TV Shows')[2] == \
+        'action_and_adventure'
+
+
+def bench_upload_manifest_hit(benchmark, tmp_path):
+    manifest = UploadManifest(str(tmp_path / 'manifest'))
+    digests = [f"{index:064x}" for index in range(500)]
+    for digest in digests:
+        manifest.record(digest, {'public_id': f"posters/{digest[:12]}", 'secure_url': f"https://cdn/{digest}.png"})
+
+    result = benchmark(manifest.lookup, digests[250])
+    assert result['public_id'] == f"posters/{digests[250][:12]}"
+
+
+def bench_prompt_template_hit(benchmark):
+    prompt_templates = pytest.importorskip('ai.prompt_templates')
+    prompt_templates.get_prompt_template('hook', 'Horror', 'TikTok')
+
+    template = benchmark(prompt_templates.get_prompt_template, 'hook', 'Horror', 'TikTok')
+    assert 'Movie: Alien' in template.render(movie_context='Movie: Alien')
+
+
+def bench_media_timeline_hit(benchmark, synthetic_trailer):
+    clip_processor = pytest.importorskip('video.clip_processor')
+    clip_processor._analyze_media_timelines(synthetic_trailer)
+
+    timelines = benchmark(clip_processor._analyze_media_timelines, synthetic_trailer)
+    assert timelines['seconds'] >= TRAILER_DURATION - 1
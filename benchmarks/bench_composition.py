@@ -0,0 +1,51 @@
+"""
+Composition Building Benchmarks
+
+Times the Creatomate composition path with known durations (no FFprobe):
+the full strict build, the compiled template fill, validation and the
+draft/final structural diff.
+"""
+
+import pytest
+
+composition_builder = pytest.importorskip('video.composition_builder')
+from video.composition_template import diff_compositions, validate_composition  # noqa: E402
+
+HEYGEN_URLS = {key: f"https://cdn.example/heygen/{key}.mp4" for key in ('movie1', 'movie2', 'movie3', 'outro')}
+COVERS = [f"https://cdn.example/posters/poster{index}.png" for index in range(1, 4)]
+CLIPS = [f"https://cdn.example/clips/clip{index}.mp4" for index in range(1, 4)]
+SCROLL_URL = 'https://cdn.example/scroll/scroll.mp4'
+MUSIC_URL = 'https://cdn.example/music/theme.mp3'
+
+KNOWN_DURATIONS = {'movie1': 12.4, 'movie2': 10.8, 'movie3': 11.6, 'outro': 5.9}
+HEYGEN_DURATIONS = {'heygen1': 12.4, 'heygen2': 10.8, 'heygen3': 11.6, 'outro': 5.9}
+CLIP_DURATIONS = {'clip1': 15.0, 'clip2': 14.5, 'clip3': 15.0}
+
+
+def bench_build_video_composition(benchmark):
+    composition = benchmark(composition_builder.build_video_composition, HEYGEN_URLS, COVERS, CLIPS,
+                            scroll_video_url=SCROLL_URL, background_music_url=MUSIC_URL,
+                            known_durations=KNOWN_DURATIONS, known_clip_durations=CLIP_DURATIONS)
+    assert len(composition['elements']) > 8
+
+
+@pytest.mark.parametrize('poster_timing_mode', ['heygen_last3s', 'with_movie_clips'])
+def bench_template_build(benchmark, poster_timing_mode):
+    compiled = composition_builder.get_composition_template(poster_timing_mode)
+    composition = benchmark(compiled.build, HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS, CLIP_DURATIONS,
+                            SCROLL_URL, MUSIC_URL)
+    assert composition['elements'][-1]['source'] == SCROLL_URL
+
+
+def bench_validate_composition(benchmark):
+    composition = composition_builder.get_composition_template().build(
+        HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS, CLIP_DURATIONS, SCROLL_URL, MUSIC_URL)
+    assert benchmark(validate_composition, composition) == []
+
+
+def bench_diff_compositions(benchmark):
+    compiled = composition_builder.get_composition_template()
+    draft = compiled.build(HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS, CLIP_DURATIONS, SCROLL_URL, MUSIC_URL)
+    final = compiled.build(HEYGEN_URLS, COVERS, CLIPS, dict(HEYGEN_DURATIONS, heygen2=13.1), CLIP_DURATIONS,
+                           SCROLL_URL, MUSIC_URL)
+    assert benchmark(diff_compositions, draft, final, 0.01)
@@ -0,0 +1,47 @@
+"""
+Highlight Analysis and Audio-Position Search Benchmarks
+
+Times trailer analysis on the synthetic lavfi trailer: the single-pass
+loudness/scene timelines (cold), segment analysis, and the search for the
+best-sounding highlight positions with cold and warm timeline caches.
+"""
+
+import pytest
+
+from benchmarks.synthetic import TRAILER_DURATION
+
+clip_processor = pytest.importorskip('video.clip_processor')
+
+TITLE = 'Synthetic Feature'
+
+
+def clear_timeline_cache():
+    with clip_processor._timeline_cache_lock:
+        clip_processor._timeline_cache.clear()
+
+
+def bench_media_timelines_cold(benchmark, synthetic_trailer):
+    timelines = benchmark.pedantic(clip_processor._analyze_media_timelines, args=(synthetic_trailer,),
+                                   setup=clear_timeline_cache, rounds=3)
+    assert timelines and timelines['seconds'] >= TRAILER_DURATION - 1 and sum(timelines['scene_cuts']) > 0
+
+
+def bench_highlight_segments(benchmark, synthetic_trailer):
+    segments = benchmark.pedantic(clip_processor._analyze_video_for_highlights, args=(synthetic_trailer,),
+                                  setup=clear_timeline_cache, rounds=3)
+    assert segments
+
+
+def bench_audio_position_search_cold(benchmark, synthetic_trailer):
+    candidates = clip_processor._calculate_enhanced_highlight_positions(TRAILER_DURATION, TITLE)
+    positions = benchmark.pedantic(clip_processor._select_best_content_positions,
+                                   args=(synthetic_trailer, candidates), setup=clear_timeline_cache, rounds=3)
+    assert len(positions) == 2
+
+
+def bench_audio_position_search_warm(benchmark, synthetic_trailer):
+    candidates = clip_processor._calculate_enhanced_highlight_positions(TRAILER_DURATION, TITLE)
+    clip_processor._analyze_media_timelines(synthetic_trailer)
+
+    positions = benchmark(clip_processor._select_best_content_positions, synthetic_trailer, candidates)
+    assert len(positions) == 2
@@ -0,0 +1,28 @@
+"""
+Poster Rendering Benchmarks
+
+Times the enhanced poster card render (fetch over a local HTTP server,
+blurred background, overlays, typography, PNG save) on a synthetic poster.
+"""
+
+import pytest
+
+pytest.importorskip('PIL')
+poster_generator = pytest.importorskip('video.poster_generator')
+
+MOVIE = {
+    'title': 'Synthetic Feature',
+    'year': 2021,
+    'platform': 'Netflix',
+    'genres': ['Horror', 'Thriller'],
+    'imdb_score': 7.8,
+    'runtime': '117 min',
+    'imdb_votes': 184302
+}
+
+
+def bench_enhanced_poster(benchmark, synthetic_poster, local_server, tmp_path):
+    movie = dict(MOVIE, poster_url=f"{local_server}/poster.png")
+    poster_path = benchmark.pedantic(poster_generator.create_enhanced_movie_poster, args=(movie, str(tmp_path)),
+                                     rounds=3, warmup_rounds=1)
+    assert poster_path and poster_path.endswith('.png')
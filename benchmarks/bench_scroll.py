@@ -0,0 +1,60 @@
+"""
+Scroll Capture and Assembly Benchmarks
+
+Times the scroll video pipeline offline: assembling 240 pre-rendered frames
+(60 FPS x 4s) into the intermediate MP4, and the full headless capture of
+the static results page served from localhost followed by assembly.
+"""
+
+import os
+
+import pytest
+
+from benchmarks import synthetic
+
+scroll_generator = pytest.importorskip('video.scroll_generator')
+
+TARGET_FPS = 60
+TARGET_DURATION = 4
+
+
+@pytest.fixture
+def scroll_frames(tmp_path):
+    if not synthetic.ffmpeg_available():
+        pytest.skip('ffmpeg/ffprobe not installed')
+    frames_dir = str(tmp_path / 'scroll_frames_bench')
+    return synthetic.generate_scroll_frames(frames_dir, 'bench', count=TARGET_FPS * TARGET_DURATION)
+
+
+@pytest.fixture(scope='module')
+def chromium():
+    sync_api = pytest.importorskip('playwright.sync_api')
+    try:
+        with sync_api.sync_playwright() as playwright:
+            playwright.chromium.launch(headless=True, args=['--no-sandbox']).close()
+    except Exception as e:
+        pytest.skip(f"Chromium not available for Playwright: {e}")
+
+
+def bench_assemble_frames(benchmark, scroll_frames, tmp_path):
+    output_video = str(tmp_path / 'scroll.mp4')
+    assembled = benchmark.pedantic(scroll_generator._assemble_frames_to_video,
+                                   args=(scroll_frames, 'bench', output_video, TARGET_FPS, TARGET_DURATION),
+                                   rounds=3)
+    assert assembled and os.path.getsize(output_video) > 0
+
+
+def bench_capture_and_assemble(benchmark, chromium, results_page, local_server, tmp_path, monkeypatch):
+    if not synthetic.ffmpeg_available():
+        pytest.skip('ffmpeg/ffprobe not installed')
+    monkeypatch.setenv('APP_ENV', 'production')  # Headless browser
+
+    output_video = str(tmp_path / 'scroll_capture.mp4')
+
+    def capture():
+        frames_dir = tmp_path / 'frames_capture'
+        frames_dir.mkdir(exist_ok=True)
+        return scroll_generator._create_advanced_scroll_video(f"{local_server}/results.html", output_video,
+                                                              str(frames_dir), target_duration=TARGET_DURATION)
+
+    assert benchmark.pedantic(capture, rounds=1) == output_video
@@ -0,0 +1,51 @@
+"""
+StreamGank Benchmark Comparison
+
+Compare two benchmark results files and report regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json latest.json
+    python -m benchmarks.compare baseline.json latest.json --threshold 0.1 --fail-on-regression
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.harness import DEFAULT_THRESHOLD, compare_results, format_comparison, load_results
+
+
+def main(argv=None) -> int:
+    """
+    Print the comparison of two results files.
+
+    Returns:
+        int: 1 if --fail-on-regression is set and a benchmark regressed, else 0
+    """
+    parser = argparse.ArgumentParser(description='Compare StreamGank benchmark results')
+    parser.add_argument('baseline', help='Baseline results JSON')
+    parser.add_argument('current', help='Current results JSON')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative median slowdown reported as a regression (default: 0.25)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 when a benchmark regressed')
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    rows = compare_results(baseline, current, args.threshold)
+
+    print(f"📊 {args.baseline} ({baseline['metadata'].get('git_commit')}) -> "
+          f"{args.current} ({current['metadata'].get('git_commit')})")
+    for line in format_comparison(rows):
+        print(line)
+
+    regressions = [row for row in rows if row['status'] == 'regression']
+    print(f"{'🔴' if regressions else '✅'} {len(regressions)} regression(s) over {args.threshold:.0%}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Benchmark Configuration and Fixtures
+
+Pytest wiring for the StreamGank benchmark suite: the `benchmark` fixture,
+session-scoped synthetic inputs, and the JSON results file / baseline
+comparison written at the end of the run.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Make the project packages importable when running `pytest benchmarks/`
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks import synthetic
+from benchmarks.harness import (DEFAULT_THRESHOLD, Benchmark, compare_results, format_comparison, format_results,
+                                load_results, save_results)
+
+DEFAULT_RESULTS_PATH = PROJECT_ROOT / 'benchmarks' / 'results' / 'latest.json'
+
+_results_key = pytest.StashKey[list]()
+_comparison_key = pytest.StashKey[list]()
+
+# =============================================================================
+# PYTEST CONFIGURATION
+# =============================================================================
+
+def pytest_addoption(parser):
+    """Register benchmark options."""
+    group = parser.getgroup('streamgank-bench', 'StreamGank benchmarks')
+    group.addoption('--bench-json', default=str(DEFAULT_RESULTS_PATH),
+                    help='Write results as JSON to this file (default: benchmarks/results/latest.json)')
+    group.addoption('--bench-compare', default=None,
+                    help='Compare results against a baseline JSON file')
+    group.addoption('--bench-threshold', type=float, default=DEFAULT_THRESHOLD,
+                    help='Relative median slowdown reported as a regression (default: 0.25)')
+    group.addoption('--bench-fail-on-regression', action='store_true',
+                    help='Exit non-zero when a benchmark regressed beyond the threshold')
+    group.addoption('--bench-rounds', type=int, default=5,
+                    help='Timed rounds for calibrated benchmarks (default: 5)')
+
+
+def pytest_configure(config):
+    """Keep benchmark state out of the project directories."""
+    config.stash[_results_key] = []
+    config.stash[_comparison_key] = []
+
+    scratch = tempfile.mkdtemp(prefix='streamgank_bench_')
+    os.environ.setdefault('SCRATCH_DISK_DIR', os.path.join(scratch, 'scratch'))
+    os.environ.setdefault('SCRATCH_TMPFS_DIR', os.path.join(scratch, 'tmpfs'))
+    os.environ.setdefault('WORKFLOW_CACHE_DIR', os.path.join(scratch, 'cache_store'))
+    os.environ.setdefault('UPLOAD_MANIFEST_DIR', os.path.join(scratch, 'upload_manifest'))
+    os.environ['TESTING'] = 'true'
+
+
+def _skipped_benchmarks(config) -> list:
+    """Node ids and reasons of benchmarks skipped for a missing dependency."""
+    reporter = config.pluginmanager.get_plugin('terminalreporter')
+    skipped = []
+    for report in (reporter.stats.get('skipped', []) if reporter else []):
+        reason = report.longrepr[2] if isinstance(report.longrepr, tuple) else str(report.longrepr)
+        skipped.append(f"{report.nodeid}: {reason}")
+    return skipped
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the results file and compare against the baseline."""
+    config = session.config
+    results = config.stash[_results_key]
+    if not results:
+        return
+
+    save_results(config.getoption('--bench-json'), results, _skipped_benchmarks(config))
+
+    baseline_path = config.getoption('--bench-compare')
+    if baseline_path:
+        rows = compare_results(load_results(baseline_path), load_results(config.getoption('--bench-json')),
+                               config.getoption('--bench-threshold'))
+        config.stash[_comparison_key] = rows
+        if config.getoption('--bench-fail-on-regression') and any(row['status'] == 'regression' for row in rows):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print timings and the baseline comparison."""
+    results = config.stash[_results_key]
+    if not results:
+        return
+
+    terminalreporter.section('StreamGank benchmarks')
+    for line in format_results(results):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"📄 Results: {config.getoption('--bench-json')}")
+
+    rows = config.stash[_comparison_key]
+    if rows:
+        terminalreporter.section(f"Comparison with {config.getoption('--bench-compare')}")
+        for line in format_comparison(rows):
+            terminalreporter.write_line(line)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def benchmark(request):
+    """Time a function; the result is added to the session's results file."""
+    group = request.node.module.__name__.rsplit('.', 1)[-1].replace('bench_', '')
+    runner = Benchmark(request.node.name, group=group, rounds=request.config.getoption('--bench-rounds'))
+    yield runner
+    result = runner.result()
+    if result is not None:
+        request.config.stash[_results_key].append(result)
+
+
+@pytest.fixture(scope='session')
+def bench_dir(tmp_path_factory) -> Path:
+    """Directory holding the synthetic fixtures (also served over HTTP)."""
+    return tmp_path_factory.mktemp('bench_fixtures')
+
+
+@pytest.fixture(scope='session')
+def synthetic_trailer(bench_dir) -> str:
+    """90s test trailer generated with ffmpeg lavfi."""
+    if not synthetic.ffmpeg_available():
+        pytest.skip('ffmpeg/ffprobe not installed')
+    return synthetic.generate_trailer(str(bench_dir / 'trailer.mp4'))
+
+
+@pytest.fixture(scope='session')
+def synthetic_poster(bench_dir) -> str:
+    """Synthetic poster image drawn with Pillow."""
+    pytest.importorskip('PIL')
+    return synthetic.generate_poster(str(bench_dir / 'poster.png'))
+
+
+@pytest.fixture(scope='session')
+def results_page(bench_dir) -> str:
+    """Static StreamGank-like results page."""
+    return synthetic.write_results_page(str(bench_dir / 'results.html'))
+
+
+@pytest.fixture(scope='session')
+def local_server(bench_dir):
+    """Base URL of a local HTTP server serving the fixtures directory."""
+    with synthetic.serve_directory(str(bench_dir)) as base_url:
+        yield base_url
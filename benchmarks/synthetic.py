@@ -0,0 +1,210 @@
+"""
+StreamGank Synthetic Benchmark Fixtures
+
+Offline inputs for the benchmark suite: a generated test trailer (ffmpeg
+lavfi), a synthetic poster image, a static HTML results page, pre-rendered
+scroll frames and a local HTTP server, so no benchmark touches the network.
+
+Features:
+- Test trailer with scene cuts and a varying loudness envelope
+- Poster image drawn with Pillow (no downloads)
+- StreamGank-like results page with RESULTS header and movie cards
+- Local threaded HTTP server for code paths that fetch URLs
+
+Usage:
+    trailer = generate_trailer('/tmp/bench/trailer.mp4', duration=90)
+    with serve_directory('/tmp/bench') as base_url:
+        poster_url = f"{base_url}/poster.png"
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Benchmark Suite
+"""
+
+import functools
+import html
+import shutil
+import subprocess
+import threading
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+TRAILER_DURATION = 90
+TRAILER_SIZE = '1280x720'
+
+# Scene cut every N seconds (hue jump), loudness swells over 13 seconds
+SCENE_SECONDS = 6
+LOUDNESS_PERIOD = 13
+
+
+def ffmpeg_available() -> bool:
+    """Check that ffmpeg and ffprobe are on PATH."""
+    return shutil.which('ffmpeg') is not None and shutil.which('ffprobe') is not None
+
+
+# =============================================================================
+# MEDIA FIXTURES
+# =============================================================================
+
+def generate_trailer(output_path: str, duration: int = TRAILER_DURATION, size: str = TRAILER_SIZE) -> str:
+    """
+    Generate a test trailer with ffmpeg lavfi sources.
+
+    Video is testsrc2 with a hue jump every SCENE_SECONDS (scene cuts for the
+    scene detector); audio is a tone whose level swells and fades so loudness
+    windows differ.
+
+    Args:
+        output_path (str): MP4 file to write
+        duration (int): Length in seconds
+        size (str): Frame size (WxH)
+
+    Returns:
+        str: output_path
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    audio = (f"aevalsrc='0.7*sin(2*PI*220*t)*(0.55+0.45*sin(2*PI*t/{LOUDNESS_PERIOD}))'"
+             f":s=48000:d={duration}")
+    subprocess.run([
+        'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f"testsrc2=size={size}:rate=24:duration={duration}",
+        '-f', 'lavfi', '-i', audio,
+        '-vf', f"hue=h=floor(t/{SCENE_SECONDS})*67",
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', '128k', '-shortest',
+        output_path
+    ], check=True, capture_output=True)
+    return output_path
+
+
+def generate_scroll_frames(frames_dir: str, unique_id: str, count: int = 240, size: str = '1080x1920') -> str:
+    """
+    Render numbered PNG frames in the scroll generator's naming scheme.
+
+    Args:
+        frames_dir (str): Directory for the frames
+        unique_id (str): Frame prefix ({unique_id}_frame_000.png ...)
+        count (int): Number of frames (60 FPS x 4s by default)
+        size (str): Frame size (WxH)
+
+    Returns:
+        str: frames_dir
+    """
+    Path(frames_dir).mkdir(parents=True, exist_ok=True)
+    subprocess.run([
+        'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f"testsrc2=size={size}:rate=60",
+        '-frames:v', str(count), '-start_number', '0',
+        str(Path(frames_dir) / f"{unique_id}_frame_%03d.png")
+    ], check=True, capture_output=True)
+    return frames_dir
+
+
+def generate_poster(output_path: str, width: int = 500, height: int = 750) -> str:
+    """
+    Draw a synthetic movie poster (gradient, shapes and a title block).
+
+    Args:
+        output_path (str): PNG file to write
+        width (int): Poster width
+        height (int): Poster height
+
+    Returns:
+        str: output_path
+    """
+    from PIL import Image, ImageDraw
+
+    poster = Image.new('RGB', (width, height))
+    draw = ImageDraw.Draw(poster)
+    for y in range(height):
+        shade = int(255 * y / height)
+        draw.line([(0, y), (width, y)], fill=(shade // 3, 20, 255 - shade))
+    for index in range(12):
+        x = (index * 97) % width
+        y = (index * 151) % height
+        draw.ellipse([x, y, x + 80, y + 80], outline=(255, 200 - index * 10, 40), width=4)
+    draw.rectangle([40, height - 180, width - 40, height - 60], fill=(10, 10, 10))
+    draw.text((60, height - 150), 'SYNTHETIC FEATURE', fill=(240, 240, 240))
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    poster.save(output_path, 'PNG')
+    return output_path
+
+
+# =============================================================================
+# RESULTS PAGE AND LOCAL SERVER
+# =============================================================================
+
+def write_results_page(output_path: str, cards: int = 60) -> str:
+    """
+    Write a static page shaped like a StreamGank results listing.
+
+    It has the RESULTS header and movie-card elements the scroll generator
+    waits for, inline styles only (no external requests).
+
+    Args:
+        output_path (str): HTML file to write
+        cards (int): Number of movie cards
+
+    Returns:
+        str: output_path
+    """
+    items = '\n'.join(
+        f'<div class="movie-card" data-testid="movie-card"><div class="poster" style="background:hsl({index * 37 % 360},60%,40%)"></div>'
+        f'<h3>{html.escape(f"Synthetic Movie {index + 1}")}</h3><p>IMDb {5 + index % 5}.{index % 10}/10 · {1990 + index}</p></div>'
+        for index in range(cards)
+    )
+    page = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>StreamGank - Results</title>
+<style>
+  body {{ margin: 0; font-family: sans-serif; background: #0f0f23; color: #eee; }}
+  header {{ padding: 24px; font-size: 28px; font-weight: bold; }}
+  .grid {{ display: grid; grid-template-columns: repeat(2, 1fr); gap: 12px; padding: 12px; }}
+  .movie-card {{ background: #1c1c3a; border-radius: 12px; padding: 8px; }}
+  .poster {{ height: 240px; border-radius: 8px; }}
+</style>
+</head>
+<body>
+<header>RESULTS</header>
+<div class="grid">
+{items}
+</div>
+</body>
+</html>
+"""
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(output_path).write_text(page, encoding='utf-8')
+    return output_path
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_directory(directory: str) -> Iterator[str]:
+    """
+    Serve a directory over HTTP on localhost for the duration of the block.
+
+    Args:
+        directory (str): Directory to serve
+
+    Yields:
+        str: Base URL (http://127.0.0.1:<port>)
+    """
+    handler = functools.partial(_QuietHandler, directory=str(directory))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, name='benchmark-http', daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
@@ -23,6 +23,9 @@ __all__ = [
     'API_SETTINGS',
     'VIDEO_SETTINGS',
     'SCROLL_SETTINGS',
+    'ENCODING_PROFILES',
+    'get_encoding_args',
+    'get_ffmpeg_threads',
     
     # Constants
     'PLATFORM_COLORS',
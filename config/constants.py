@@ -350,6 +350,69 @@ PLATFORM_MAPPING = {
     "Amazon Prime": "Prime Video"  # Alternative name
 }
 
+# StreamGank URL `platforms=` parameter per platform (same in every country)
+STREAMGANK_PLATFORM_PARAMS = {
+    'Netflix': 'netflix',
+    'Prime Video': 'amazon',
+    'Apple TV+': 'apple',
+    'Disney+': 'disney',
+    'Max': 'max',
+    'Hulu': 'hulu',
+    'Paramount+': 'paramount',
+    'Free': 'free'
+}
+
+# Platform names as stored in movie_localizations.platform_name
+DATABASE_PLATFORM_NAMES = {
+    'Netflix': 'Netflix',
+    'Hulu': 'Hulu',
+    'Crunchyroll': 'Crunchyroll',
+    'Kanopy': 'Kanopy',
+    'Apple TV+': 'Apple TV+',
+    'Disney+': 'Disney+',
+    'Disney Plus': 'Disney Plus',
+    'Rakuten TV': 'Rakuten TV',
+    'Amazon Prime Video': 'Amazon Prime Video',
+    'Prime': 'Amazon Prime Video',  # Map "Prime" to full name
+    'HBO Max': 'HBO Max',
+    'free': 'free',
+    'Sky Go': 'Sky Go',
+    'Max': 'Max'
+}
+
+# =============================================================================
+# CONTENT TYPE AND GENRE NORMALIZATION
+# =============================================================================
+
+# Content types accepted in StreamGank URLs -> `type=` parameter
+URL_CONTENT_TYPE_MAPPING = {
+    'Film': 'Film',
+    'Movie': 'Film',
+    'Série': 'Série',  # Keep French accent for proper URL encoding
+    'Serie': 'Série',
+    'Series': 'Série',
+    'TV Show': 'Série',
+    'TV Series': 'Série',
+    'Émission': 'Série'  # French TV show term
+}
+
+# Input content type -> movies.content_type (URL names plus database filter aliases)
+CONTENT_TYPE_MAPPING = {
+    **URL_CONTENT_TYPE_MAPPING,
+    'Movies': 'Film',
+    'TV Shows': 'Série',
+    'Show': 'Série'
+}
+
+# Genre aliases -> genre names as stored in movie_genres.genre
+DATABASE_GENRE_ALIASES = {
+    'Sci-Fi': 'Science-Fiction',
+    'SciFi': 'Science-Fiction',
+    'Thriller': 'Mystery & Thriller',
+    'Family': 'Kids & Family',
+    'Musical': 'Music & Musical'
+}
+
 # =============================================================================
 # SPECIAL TITLE THEMES
 # =============================================================================
@@ -17,7 +17,7 @@ Example Priority Order:
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # =============================================================================
 # API CONFIGURATION SETTINGS
@@ -31,7 +31,9 @@ API_SETTINGS = {
         'hook_max_tokens': 40,  # For short hooks (10-18 words)
         'intro_max_tokens': 30,  # Optimized for 10-12 word intros (12-14s total video)
         'timeout': 15,  # Reduced timeout since gpt-3.5-turbo is faster
-        'retry_attempts': 3
+        'retry_attempts': 3,
+        'hook_candidates': 3,  # Timed hooks (movie2/3): candidates per request (n), picked locally by duration
+        'hook_adjust_words': 4  # Near-miss candidates within this many words are trimmed/padded instead of retried
     },
     
     # Gemini configuration removed - using OpenAI + Template fallback only
@@ -45,7 +47,11 @@ API_SETTINGS = {
         'default_template_id': 'cc6718c5363e42b282a123f99b94b335',
         'poll_interval': 15,  # Status check interval in seconds
         'max_poll_attempts': 40,  # Maximum status checks (10 minutes)
-        'timeout': 60  # Request timeout in seconds
+        'timeout': 60,  # Request timeout in seconds
+        'retry_attempts': 3,  # Attempts per generate request
+        'generate_concurrency': 4,  # Parallel generate requests (movie1-3 + outro)
+        'requests_per_second': 1.0,  # Shared limit for generate requests
+        'burst': 4
     },
     
     # Creatomate Configuration
@@ -53,7 +59,10 @@ API_SETTINGS = {
         'base_url': 'https://api.creatomate.com/v1',
         'timeout': 120,  # Request timeout in seconds
         'max_wait_time': 300,  # Maximum wait for completion
-        'poll_interval': 30  # Status check interval
+        'poll_interval': 30,  # Status check interval
+        'submit_concurrency': 4,  # Parallel render submissions in create_multiple_videos
+        'requests_per_second': 2.0,  # Shared limit for submissions and status polls
+        'burst': 4
     },
     
     # Cloudinary Configuration
@@ -89,6 +98,12 @@ VIDEO_SETTINGS = {
     'clip_start_offset': 30,  # Skip first 30 seconds of trailers
     'highlight_detection_threshold': 0.7,  # Audio energy threshold
     
+    # Vizard Clip Upload
+    'clip_upload_mode': 'remote',  # 'remote' = Cloudinary fetches the clip URL itself, 'local' = download + upload
+    'clip_max_duration': 20.0,  # Seconds - longer clips are trimmed (end_offset remotely, FFmpeg locally)
+    'clip_download_chunk_size': 1024 * 1024,  # 1MB read size for local clip downloads
+    'clip_upload_chunk_size': 20 * 1024 * 1024,  # 20MB parts for chunked (upload_large) clip uploads
+    
     # Poster Generation
     'poster_resolution': (1080, 1920),
     'poster_quality': 95,
@@ -106,11 +121,98 @@ VIDEO_SETTINGS = {
     },
     
     # FFmpeg Settings
-    'ffmpeg_threads': 4,
+    'ffmpeg_threads': 0,  # Encoder threads per ffmpeg process (0 = auto: cores split across concurrent encodes, FFMPEG_THREADS env overrides)
+    'ffmpeg_max_concurrent': 0,  # ffmpeg/ffprobe processes running at once (0 = auto: cores / ffmpeg_threads, FFMPEG_MAX_CONCURRENT env overrides)
+    'ffmpeg_priorities': {  # Lower value gets the next free slot first
+        'final': 0,  # Published highlights and compositions
+        'intermediate': 10,  # Temp clips, trims, scroll video assembly
+        'analysis': 20  # ffprobe and audio/scene analysis passes
+    },
     'ffmpeg_preset': 'medium',  # Balance between speed and quality
     'temp_dir': './temp_processing'
 }
 
+# =============================================================================
+# ENCODING PROFILES
+# =============================================================================
+
+# Encoder settings per output role - ffmpeg call sites build their codec
+# arguments with get_encoding_args() instead of hard-coding them
+ENCODING_PROFILES = {
+    # Deliverables: clips we compose and publish as-is
+    'final': {
+        'video_codec': 'libx264',
+        'preset': 'slow',
+        'crf': 15,  # Ultra-high quality for social media
+        'video_profile': 'high',
+        'level': '4.0',
+        'pix_fmt': 'yuv420p',
+        'audio_codec': 'aac',
+        'audio_bitrate': '192k',
+        'faststart': True
+    },
+    
+    # Files re-encoded downstream (Cloudinary, Creatomate, Vizard.ai) - speed over compression
+    'intermediate': {
+        'video_codec': 'libx264',
+        'preset': 'veryfast',
+        'crf': 18,  # Visually transparent, the downstream encode sets the final size
+        'pix_fmt': 'yuv420p',
+        'audio_codec': 'aac',
+        'audio_bitrate': '192k',
+        'faststart': True
+    },
+    
+    # Temp files re-encoded locally right after - no generation loss, minimal encode time
+    'intermediate_lossless': {
+        'video_codec': 'libx264',
+        'preset': 'ultrafast',
+        'qp': 0,  # Mathematically lossless H.264
+        'pix_fmt': 'yuv420p',
+        'audio_codec': 'aac',
+        'audio_bitrate': '320k',
+        'faststart': False
+    },
+    
+    # Cuts that keep the source streams untouched (start snaps to a keyframe)
+    'copy': {
+        'stream_copy': True
+    },
+    
+    # Quick-look renders for review
+    'preview': {
+        'video_codec': 'libx264',
+        'preset': 'veryfast',
+        'crf': 28,
+        'pix_fmt': 'yuv420p',
+        'audio_codec': 'aac',
+        'audio_bitrate': '96k',
+        'faststart': True
+    }
+}
+
+# Profile key -> ffmpeg option, in the order they are emitted
+ENCODING_OPTION_FLAGS = (
+    ('video_codec', '-c:v'),
+    ('preset', '-preset'),
+    ('tune', '-tune'),
+    ('crf', '-crf'),
+    ('qp', '-qp'),
+    ('video_profile', '-profile:v'),
+    ('level', '-level:v'),
+    ('video_bitrate', '-b:v'),
+    ('maxrate', '-maxrate'),
+    ('bufsize', '-bufsize'),
+    ('gop', '-g'),
+    ('keyint_min', '-keyint_min'),
+    ('sc_threshold', '-sc_threshold'),
+    ('pix_fmt', '-pix_fmt'),
+    ('frame_rate', '-r'),
+    ('audio_codec', '-c:a'),
+    ('audio_bitrate', '-b:a'),
+    ('audio_sample_rate', '-ar')
+)
+
 # =============================================================================
 # SCROLL VIDEO SETTINGS
 # =============================================================================
@@ -188,6 +290,11 @@ WORKFLOW_SETTINGS = {
     'max_concurrent_processes': 2,  # Parallel processing limit
     'strict_mode': True,  # Terminate on critical failures
     
+    # Batch Mode (python main.py --batch)
+    'batch_concurrency': 2,  # Jobs running at the same time
+    'http_pool_connections': 10,  # Hosts kept in the shared HTTP pool
+    'http_pool_maxsize': 20,  # Keep-alive connections per host
+    
     # Retry Logic
     'max_retries': 3,
     'retry_delay': 5,  # Seconds between retries
@@ -195,9 +302,19 @@ WORKFLOW_SETTINGS = {
     
     # Asset Processing
     'asset_timeout': 300,  # 5 minutes for asset creation
+    'upload_concurrency': 4,  # Parallel Cloudinary uploads in batch_upload_assets
+    'upload_max_attempts': 3,  # Attempts per asset before it is reported as failed
+    'upload_retry_backoff': 1.0,  # Seconds before the first retry (doubles per attempt)
+    'upload_chunk_size': 6 * 1024 * 1024,  # Files above this are sent with upload_large in parts of this size (min 5MB)
     'cleanup_temp_files': True,
     'preserve_debug_files': False,
-    
+
+    # Scratch Workspace (per-job temp media, removed when the job ends)
+    'scratch_tmpfs_dir': '/dev/shm/streamgank',  # RAM-backed root, overridden by SCRATCH_TMPFS_DIR ('' disables tmpfs)
+    'scratch_disk_dir': 'docker_volumes/scratch',  # Disk fallback, overridden by SCRATCH_DISK_DIR
+    'scratch_job_quota_bytes': 4 * 1024**3,  # Per-job scratch limit (0 = unlimited)
+    'scratch_min_free_bytes': 512 * 1024**2,  # tmpfs headroom kept free for other jobs and the OS
+
     # Timing Settings
     'poster_timing_modes': ['heygen_last3s', 'with_movie_clips'],
     'default_poster_timing': 'heygen_last3s',
@@ -205,6 +322,79 @@ WORKFLOW_SETTINGS = {
     'max_poster_duration': 3.0   # Maximum poster display time
 }
 
+# =============================================================================
+# WEBHOOK DELIVERY SETTINGS
+# =============================================================================
+
+WEBHOOK_SETTINGS = {
+    # Endpoints on the Node.js GUI server (relative to WEBHOOK_BASE_URL)
+    'step_endpoint': '/api/webhooks/step-update',
+    'batch_endpoint': '/api/webhooks/step-update/batch',
+    
+    # Background Delivery (utils/webhook_queue.py)
+    'async_delivery': True,  # False = send inline on the workflow thread (WEBHOOK_ASYNC=false)
+    'batch_interval': 0.25,  # Seconds to collect updates before sending a batch
+    'max_batch_size': 50,  # Updates per batch request
+    'max_pending': 200,  # Above this, stale intermediate updates are dropped
+    'request_timeout': 5,  # Seconds per HTTP request
+    
+    # Retry Logic
+    'max_attempts': 5,  # Delivery attempts per update before it is dropped
+    'backoff_base': 0.5,  # Seconds, doubled per failed attempt
+    'backoff_max': 30,  # Maximum backoff delay
+    
+    # Shutdown
+    'shutdown_flush_timeout': 10  # Seconds to deliver pending updates at exit
+}
+
+# =============================================================================
+# JOB ADMISSION CONTROL SETTINGS
+# =============================================================================
+
+ADMISSION_SETTINGS = {
+    # Admission (utils/admission_control.py) - worker processes and batch jobs share one ledger
+    'enabled': True,  # False = start every job immediately (ADMISSION_CONTROL=false)
+    'ledger_dir': 'docker_volumes/admission',  # Overridden by ADMISSION_LEDGER_DIR
+    'poll_interval': 5.0,  # Seconds between resource checks while a job waits
+    'max_wait_seconds': 3600,  # Waiting longer fails the job (0 = wait indefinitely)
+    'disk_reserve_bytes': 1024**3,  # Free disk never handed out to jobs
+    'ram_reserve_bytes': 512 * 1024**2,  # Available memory never handed out to jobs
+    
+    # Peak Resource Model (per job)
+    'default_trailer_seconds': 150,  # Assumed trailer length when durations are unknown
+    'trailer_mb_per_second': 1.0,  # 1080p trailer download size
+    'clip_mb_per_second': 2.5,  # Intermediate + final highlight encodes per trailer second
+    'poster_mb': 5,  # Enhanced poster card per movie
+    'scroll_frame_mb': 3.0,  # 1080x1920 PNG screenshot per scroll frame
+    'base_ram_mb': 400,  # Interpreter, API clients and caches
+    'analysis_ram_mb_per_second': 4.0,  # moviepy/librosa/OpenCV analysis per trailer second
+    'ffmpeg_ram_mb': 250,  # Per concurrent ffmpeg process
+    'browser_ram_mb': 600  # Playwright Chromium during scroll capture
+}
+
+# =============================================================================
+# HEYGEN RENDER PREDICTION SETTINGS
+# =============================================================================
+
+HEYGEN_PREDICTION_SETTINGS = {
+    # Render model (ai/heygen_predictor.py) - fitted from heygen_render_observed job log events
+    'enabled': True,  # False = fixed heuristics only
+    'min_samples': 8,  # Observations needed before the fitted model replaces the heuristics
+    'max_samples': 500,  # Most recent observations used for fitting
+    'refresh_seconds': 600,  # Refit from the job logs at most this often
+    
+    # Poll Schedule (relative to the predicted render time)
+    'first_check_seconds': 10,  # Early check catches immediate failures
+    'idle_check_seconds': 60,  # Longest gap between checks before the predicted finish
+    'early_fraction': 0.8,  # Start frequent polling at 80% of the predicted render time
+    'near_interval': 5,  # Interval around the predicted finish
+    'late_fraction': 1.5,  # Past 150% of the prediction, back off
+    'late_interval': 30,  # Interval once the render is overdue
+    
+    # Speculative Composition
+    'speculative_composition': True  # Pre-build the Creatomate composition while HeyGen renders
+}
+
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
@@ -216,7 +406,19 @@ LOGGING_SETTINGS = {
     'log_file': 'streamgank.log',
     'max_log_size': 10 * 1024 * 1024,  # 10MB
     'backup_count': 5,
-    'console_logging': True
+    'console_logging': True,
+    
+    # Tracing (utils/tracing.py) - local files only, no network exporter
+    'tracing_enabled': True,
+    'trace_export_dir': 'docker_volumes/traces',  # Overridden by TRACE_EXPORT_DIR ('' disables export)
+    'trace_export_formats': ['chrome', 'otel'],  # chrome://tracing / Perfetto and OTLP/JSON
+    'trace_max_spans': 20000,  # Finished spans kept in memory per process
+    'trace_orphan_seconds': 3600,  # Traces idle this long (never exported) may be evicted when full
+    
+    # Job logs (utils/job_logger.py) - one background writer thread per process
+    'job_log_max_open_files': 64,  # LRU bound on open per-job log segments
+    'job_log_idle_timeout': 300,  # Seconds before an unused job log segment is closed
+    'job_log_flush_timeout': 5  # Seconds reads wait for queued job log writes
 }
 
 # =============================================================================
@@ -328,6 +530,77 @@ def get_video_settings() -> Dict[str, Any]:
     return VIDEO_SETTINGS
 
 
+def get_ffmpeg_threads() -> int:
+    """
+    Encoder threads for one ffmpeg process.
+    
+    FFMPEG_THREADS (env) overrides VIDEO_SETTINGS['ffmpeg_threads']. With 0 the
+    CPU cores are split across the encodes that can run at the same time
+    (batch jobs x movies per job), so parallel jobs don't oversubscribe.
+    
+    Returns:
+        int: Thread count (at least 1)
+    """
+    try:
+        threads = int(os.getenv('FFMPEG_THREADS', VIDEO_SETTINGS.get('ffmpeg_threads', 0)))
+    except (TypeError, ValueError):
+        threads = 0
+    if threads > 0:
+        return threads
+    
+    concurrent_encodes = max(1, WORKFLOW_SETTINGS.get('batch_concurrency', 1)) * max(1, WORKFLOW_SETTINGS.get('max_movies', 1))
+    return max(1, (os.cpu_count() or 1) // concurrent_encodes)
+
+
+def get_encoding_profile(profile: str) -> Dict[str, Any]:
+    """
+    Get an encoding profile.
+    
+    Args:
+        profile (str): Key of ENCODING_PROFILES ('final', 'intermediate', ...)
+        
+    Returns:
+        dict: Copy of the profile settings
+        
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    if profile not in ENCODING_PROFILES:
+        raise ValueError(f"Unknown encoding profile '{profile}' (available: {', '.join(ENCODING_PROFILES)})")
+    return dict(ENCODING_PROFILES[profile])
+
+
+def get_encoding_args(profile: str, threads: int = None, **overrides) -> List[str]:
+    """
+    Build ffmpeg output codec arguments from an encoding profile.
+    
+    Args:
+        profile (str): Key of ENCODING_PROFILES
+        threads (int): Encoder threads for this call only (default: set by the media executor)
+        **overrides: Profile keys to change for this call site (None removes a key),
+                     e.g. crf=16, tune='film', maxrate='3500k', frame_rate=30
+        
+    Returns:
+        List[str]: Arguments to place before the output path
+    """
+    settings = get_encoding_profile(profile)
+    settings.update(overrides)
+    
+    if settings.get('stream_copy'):
+        args = ['-c', 'copy']
+    else:
+        args = []
+        for key, flag in ENCODING_OPTION_FLAGS:
+            if settings.get(key) is not None:
+                args.extend([flag, str(settings[key])])
+        if threads:
+            args.extend(['-threads', str(threads)])
+    
+    if settings.get('faststart'):
+        args.extend(['-movflags', '+faststart'])
+    return args
+
+
 def get_workflow_settings() -> Dict[str, Any]:
     """
     Get workflow configuration settings.
@@ -338,6 +611,36 @@ def get_workflow_settings() -> Dict[str, Any]:
     return WORKFLOW_SETTINGS
 
 
+def get_webhook_settings() -> Dict[str, Any]:
+    """
+    Get webhook delivery configuration settings.
+    
+    Returns:
+        dict: Webhook delivery settings
+    """
+    return WEBHOOK_SETTINGS
+
+
+def get_admission_settings() -> Dict[str, Any]:
+    """
+    Get job admission control settings.
+    
+    Returns:
+        dict: Admission control settings
+    """
+    return ADMISSION_SETTINGS
+
+
+def get_heygen_prediction_settings() -> Dict[str, Any]:
+    """
+    Get HeyGen render prediction settings.
+    
+    Returns:
+        dict: HeyGen render prediction settings
+    """
+    return HEYGEN_PREDICTION_SETTINGS
+
+
 def get_system_config() -> Dict[str, Any]:
     """
     Get complete system configuration.
@@ -348,8 +651,12 @@ def get_system_config() -> Dict[str, Any]:
     return {
         'api': API_SETTINGS,
         'video': VIDEO_SETTINGS,
+        'encoding': ENCODING_PROFILES,
         'scroll': SCROLL_SETTINGS,
         'workflow': WORKFLOW_SETTINGS,
+        'webhook': WEBHOOK_SETTINGS,
+        'admission': ADMISSION_SETTINGS,
+        'heygen_prediction': HEYGEN_PREDICTION_SETTINGS,
         'logging': LOGGING_SETTINGS,
         'environment': {
             'ready': is_environment_ready(),
@@ -11,7 +11,11 @@ Main Functions:
     - workflow_status_monitoring: Track workflow progress
 """
 
-from .workflow import *
+# Submodules load on first attribute access, so importing one core module
+# (or a quick CLI path) no longer imports every dependency of the package
+from utils.lazy_imports import lazy_package
+
+_SUBMODULES = ('workflow',)
 
 __all__ = [
     # Main Workflow Functions
@@ -24,4 +28,14 @@ __all__ = [
     'get_workflow_status',
     'log_workflow_summary',
     'save_workflow_results'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'run_full_workflow': 'workflow',
+    'process_existing_heygen_videos': 'workflow',
+    'validate_workflow_inputs': 'workflow',
+    'get_workflow_status': 'workflow'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
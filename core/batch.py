@@ -0,0 +1,313 @@
+"""
+StreamGank Batch Workflow Runner
+
+Runs many run_full_workflow parameter sets in one process (python main.py --batch)
+so setup cost is paid once and shared across jobs.
+
+Features:
+- Parameter sets from a JSON list, a JSON object with a "jobs" list, or JSON Lines
+  (file path or '-' for stdin)
+- Configurable concurrency limit (WORKFLOW_SETTINGS['batch_concurrency'])
+- Shared Supabase client, pooled HTTP session and workflow caches across jobs
+- Deduplicated trailer clips and scroll videos via utils.shared_work
+- Disk/memory admission control per job (utils.admission_control)
+- Per-job duration, admission wait and aggregate throughput report
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Batch Mode
+"""
+
+import io
+import sys
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, TextIO
+
+from config.settings import get_workflow_settings
+from utils.shared_work import get_shared_work_stats
+
+logger = logging.getLogger(__name__)
+
+# run_full_workflow arguments accepted in a batch parameter set
+BATCH_PARAMETER_KEYS = (
+    'num_movies', 'country', 'genre', 'platform', 'content_type',
+    'skip_scroll_video', 'smooth_scroll', 'scroll_distance',
+    'poster_timing_mode', 'heygen_template_id', 'job_id'
+)
+
+REQUIRED_BATCH_KEYS = ('country', 'genre', 'platform', 'content_type')
+
+
+# =============================================================================
+# PARAMETER LOADING
+# =============================================================================
+
+def normalize_batch_parameters(raw: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """
+    Validate one batch entry and map CLI-style keys (content-type) to workflow arguments.
+
+    Args:
+        raw (Dict): Parameter set as read from the batch file
+        index (int): Position in the batch (for error messages)
+
+    Returns:
+        Dict[str, Any]: run_full_workflow keyword arguments
+
+    Raises:
+        ValueError: If the entry is not an object, has unknown keys or misses required ones
+    """
+    if not isinstance(raw, dict):
+        raise ValueError(f"Batch entry {index + 1} must be a JSON object, got {type(raw).__name__}")
+
+    parameters = {key.replace('-', '_'): value for key, value in raw.items()}
+
+    unknown = sorted(set(parameters) - set(BATCH_PARAMETER_KEYS))
+    if unknown:
+        raise ValueError(f"Batch entry {index + 1} has unknown parameters: {', '.join(unknown)}")
+
+    missing = [key for key in REQUIRED_BATCH_KEYS if not parameters.get(key)]
+    if missing:
+        raise ValueError(f"Batch entry {index + 1} is missing required parameters: {', '.join(missing)}")
+
+    return parameters
+
+
+def load_batch_parameters(source: str, stdin: TextIO = None) -> List[Dict[str, Any]]:
+    """
+    Read batch parameter sets from a file path or '-' (stdin).
+
+    Accepts a JSON list, a JSON object with a "jobs" list, or one JSON object per line.
+
+    Args:
+        source (str): File path or '-'
+        stdin (TextIO): Stream used for '-' (default: sys.stdin)
+
+    Returns:
+        List[Dict[str, Any]]: Normalized run_full_workflow keyword arguments
+    """
+    if source == '-':
+        text = (stdin or sys.stdin).read()
+    else:
+        text = Path(source).read_text(encoding='utf-8')
+
+    text = text.strip()
+    if not text:
+        return []
+
+    try:
+        data = json.loads(text)
+        entries = data.get('jobs', []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            entries = [entries]
+    except json.JSONDecodeError:
+        # JSON Lines - one parameter set per non-empty line
+        entries = [json.loads(line) for line in io.StringIO(text) if line.strip()]
+
+    return [normalize_batch_parameters(entry, i) for i, entry in enumerate(entries)]
+
+
+# =============================================================================
+# SHARED RESOURCES
+# =============================================================================
+
+def warm_shared_resources() -> Dict[str, bool]:
+    """
+    Create process-wide clients once before jobs start so workers don't race to build them.
+
+    Returns:
+        Dict[str, bool]: Which shared resources are ready
+    """
+    ready = {'http_session': False, 'supabase': False, 'cache_store': False}
+
+    try:
+        from utils.http_session import get_http_session
+        get_http_session()
+        ready['http_session'] = True
+    except Exception as e:
+        logger.warning(f"⚠️ Batch: shared HTTP session unavailable: {str(e)}")
+
+    try:
+        from database.connection import get_supabase_client
+        ready['supabase'] = get_supabase_client() is not None
+    except Exception as e:
+        logger.warning(f"⚠️ Batch: Supabase client unavailable: {str(e)}")
+
+    try:
+        from utils.workflow_cache_store import get_workflow_cache_store
+        get_workflow_cache_store()
+        ready['cache_store'] = True
+    except Exception as e:
+        logger.warning(f"⚠️ Batch: workflow cache store unavailable: {str(e)}")
+
+    return ready
+
+
+# =============================================================================
+# BATCH EXECUTION
+# =============================================================================
+
+def _job_label(parameters: Dict[str, Any]) -> str:
+    return f"{parameters['country']}/{parameters['platform']}/{parameters['genre']}/{parameters['content_type']}"
+
+
+def run_batch(parameter_sets: List[Dict[str, Any]],
+              concurrency: int = None,
+              output_dir: str = None,
+              workflow_fn: Callable[..., Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run parameter sets through the workflow with at most `concurrency` jobs at once.
+
+    Args:
+        parameter_sets (List[Dict]): Normalized parameter sets (see load_batch_parameters)
+        concurrency (int): Maximum concurrent jobs (default: WORKFLOW_SETTINGS['batch_concurrency'])
+        output_dir (str): Directory for per-job result JSON and batch_summary.json (optional)
+        workflow_fn (Callable): Workflow entry point (default: core.workflow.run_full_workflow)
+
+    Returns:
+        Dict[str, Any]: {'batch_id', 'jobs': [...], 'summary': {...}}
+    """
+    if workflow_fn is None:
+        from core.workflow import run_full_workflow
+        workflow_fn = run_full_workflow
+
+    if concurrency is None:
+        concurrency = get_workflow_settings().get('batch_concurrency', 2)
+    concurrency = max(1, min(int(concurrency), len(parameter_sets) or 1))
+
+    batch_id = f"batch_{int(time.time())}"
+    output_path = Path(output_dir) if output_dir else None
+    if output_path:
+        output_path.mkdir(parents=True, exist_ok=True)
+
+    print(f"\n📦 Batch {batch_id}: {len(parameter_sets)} job(s), concurrency {concurrency}")
+    shared_ready = warm_shared_resources()
+    print(f"   🔌 Shared resources: {', '.join(name for name, ok in shared_ready.items() if ok) or 'none'}")
+
+    print_lock = threading.Lock()
+    batch_start = time.time()
+
+    def run_job(index: int, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs = dict(parameters)
+        job_id = kwargs.pop('job_id', None) or f"{batch_id}_{index + 1:03d}"
+        output = str(output_path / f"{job_id}.json") if output_path else None
+
+        job_start = time.time()
+        job_report = {
+            'index': index + 1,
+            'job_id': job_id,
+            'label': _job_label(parameters),
+            'parameters': parameters,
+            'status': 'completed',
+            'error': None,
+            'creatomate_id': None
+        }
+        try:
+            results = workflow_fn(output=output, job_id=job_id, pause_after_extraction=False, **kwargs) or {}
+            job_report['creatomate_id'] = (results.get('step_7_creatomate_assembly') or {}).get('creatomate_id')
+            job_report['status'] = results.get('status', 'completed')
+        except Exception as e:
+            job_report['status'] = 'failed'
+            job_report['error'] = str(e)
+
+        job_report['duration'] = time.time() - job_start
+        job_report['finished_at'] = time.time() - batch_start
+
+        with print_lock:
+            icon = '✅' if job_report['status'] == 'completed' else '❌'
+            print(f"{icon} [{job_report['index']}/{len(parameter_sets)}] {job_report['label']} "
+                  f"({job_id}) {job_report['status']} in {job_report['duration']:.1f}s")
+            if job_report['error']:
+                print(f"   Error: {job_report['error']}")
+
+        return job_report
+
+    job_reports: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch-job') as executor:
+        futures = [executor.submit(run_job, i, parameters) for i, parameters in enumerate(parameter_sets)]
+        for future in as_completed(futures):
+            job_reports.append(future.result())
+
+    job_reports.sort(key=lambda report: report['index'])
+    summary = summarize_batch(job_reports, time.time() - batch_start, concurrency)
+    report = {'batch_id': batch_id, 'jobs': job_reports, 'summary': summary}
+
+    print_batch_summary(report)
+
+    if output_path:
+        summary_file = output_path / 'batch_summary.json'
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"📁 Batch summary saved to: {summary_file}")
+
+    return report
+
+
+def summarize_batch(job_reports: List[Dict[str, Any]], wall_time: float, concurrency: int) -> Dict[str, Any]:
+    """
+    Aggregate throughput for a finished batch.
+
+    Args:
+        job_reports (List[Dict]): Per-job reports from run_batch
+        wall_time (float): Batch wall-clock seconds
+        concurrency (int): Concurrency limit used
+
+    Returns:
+        Dict[str, Any]: Counts, durations, throughput and shared-resource stats
+    """
+    try:
+        from utils.http_session import get_http_session_stats
+        http_stats = get_http_session_stats()
+    except ImportError:
+        http_stats = {'created': False, 'requests': 0}
+
+    try:
+        from utils.admission_control import get_admission_controller
+        admission_stats = get_admission_controller().stats()
+    except Exception as e:
+        logger.warning(f"⚠️ Admission stats unavailable: {str(e)}")
+        admission_stats = {}
+
+    durations = [report['duration'] for report in job_reports]
+    completed = sum(1 for report in job_reports if report['status'] == 'completed')
+    job_time = sum(durations)
+
+    return {
+        'total_jobs': len(job_reports),
+        'completed': completed,
+        'failed': len(job_reports) - completed,
+        'concurrency': concurrency,
+        'wall_time': wall_time,
+        'total_job_time': job_time,
+        'average_job_time': job_time / len(durations) if durations else 0.0,
+        'max_job_time': max(durations) if durations else 0.0,
+        # Sum of job durations / wall time - how much concurrency actually bought
+        'parallel_speedup': job_time / wall_time if wall_time > 0 else 0.0,
+        'videos_per_hour': completed * 3600 / wall_time if wall_time > 0 else 0.0,
+        'http': http_stats,
+        'admission': admission_stats,
+        'shared_work': get_shared_work_stats()
+    }
+
+
+def print_batch_summary(report: Dict[str, Any]) -> None:
+    """Print the aggregate batch report."""
+    summary = report['summary']
+    print(f"\n📊 Batch {report['batch_id']} complete")
+    print(f"   ✅ Completed: {summary['completed']}/{summary['total_jobs']}   ❌ Failed: {summary['failed']}")
+    print(f"   ⏱️ Wall time: {summary['wall_time']:.1f}s   Avg job: {summary['average_job_time']:.1f}s   "
+          f"Max job: {summary['max_job_time']:.1f}s")
+    print(f"   🚀 Throughput: {summary['videos_per_hour']:.1f} videos/hour   "
+          f"Parallel speedup: {summary['parallel_speedup']:.2f}x")
+    print(f"   🔌 HTTP requests on shared pool: {summary['http']['requests']}")
+    admission = summary.get('admission') or {}
+    if admission.get('admitted'):
+        headroom = admission.get('headroom', {})
+        print(f"   🚦 Admission: {admission['admitted_after_wait']}/{admission['admitted']} job(s) waited, "
+              f"avg wait {admission['average_wait_seconds']:.1f}s, max {admission['max_wait_seconds']:.1f}s, "
+              f"disk headroom {headroom.get('disk_headroom_bytes', 0) / 1024**3:.1f}GB")
+    for name, stats in summary['shared_work'].items():
+        print(f"   ♻️ {name}: {stats['hits']} reused / {stats['misses']} computed")
@@ -13,6 +13,8 @@ import logging
 import time
 import json
 import os
+import contextvars
+import concurrent.futures
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
@@ -31,28 +33,148 @@ from ai.heygen_client import create_heygen_video, get_heygen_videos_for_creatoma
 # Import video functions
 from video.scroll_generator import generate_scroll_video
 from video.creatomate_client import create_creatomate_video
+from video.composition_builder import prebuild_composition
 
 # Import media utilities for background music selection
 from media.media_utils import select_background_music, get_background_music_info
 
 # Import centralized settings
-from config.settings import get_scroll_settings, get_video_settings
+from config.settings import get_scroll_settings, get_video_settings, get_heygen_prediction_settings
 
 # Import test data caching utilities
 from utils.test_data_cache import (
     load_test_data, save_workflow_result,
     get_app_env, should_use_cache, should_save_results,
-    is_local_mode, is_development_mode, is_production_mode
+    is_local_mode, is_development_mode, is_production_mode,
+    WORKFLOW_STEP_SOURCES, extract_step_data
 )
 
+# Import job checkpoint store for resumable workflows
+from utils.job_checkpoint import get_checkpoint_store, RESUMABLE_STATUSES
+
 # Import webhook client for real-time step updates
 from utils.webhook_client import create_webhook_client
 
 # Import job logger for persistent logging
 from utils.job_logger import get_job_logger
 
+# Import tracing for per-step timing and resource instrumentation
+from utils.tracing import get_tracer, export_job_trace
+
+# Media execution - ffmpeg/ffprobe commands are tagged with the job for cancellation
+from utils.media_executor import get_media_executor, reset_media_job, set_media_job
+
+# Per-job scratch workspace (tmpfs when it has room) for temp media
+from utils.scratch_workspace import get_scratch_manager, set_scratch_workspace
+
+# Job admission control - wait for disk/memory headroom before heavy steps
+from utils.admission_control import get_admission_controller, estimate_job_requirements
+
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# CHECKPOINT HELPERS
+# =============================================================================
+
+def _load_step_data(data_type: str, resume_checkpoint: Optional[Dict[str, Any]],
+                    country: str, genre: str, platform: str, content_type: str, template: str) -> Optional[Any]:
+    """
+    Load data for a workflow step from the resumed job's checkpoint, falling back to the test data cache.
+    
+    Only steps the checkpoint recorded as completed are reused, so a resumed
+    workflow restarts at its first incomplete step.
+    
+    Args:
+        data_type (str): Cached data type ('script_result', 'assets', 'heygen', ...)
+        resume_checkpoint (Dict): Checkpoint loaded by JobCheckpointStore.load_checkpoint, or None
+        country, genre, platform, content_type, template: Cache key parameters
+        
+    Returns:
+        Any: Step data or None
+    """
+    if resume_checkpoint:
+        step_data = resume_checkpoint['steps'].get(WORKFLOW_STEP_SOURCES[data_type])
+        if step_data and str(step_data.get('step_status', '')).startswith('completed'):
+            resumed_data = extract_step_data(data_type, step_data)
+            if resumed_data:
+                print(f"   ♻️ RESUME: Reusing {data_type} from checkpoint of job {resume_checkpoint['job_id']}")
+                return resumed_data
+    
+    return load_test_data(data_type, country, genre, platform, content_type, template)
+
+# =============================================================================
+# SPECULATIVE COMPOSITION HELPERS
+# =============================================================================
+
+def _start_speculative_composition(scripts: Dict[str, Any], movie_covers: List[str], movie_clips: List[str],
+                                   poster_timing_mode: str, background_music_url: Optional[str]) -> Optional[concurrent.futures.Future]:
+    """
+    Prebuild the Creatomate composition in the background while HeyGen renders.
+    
+    Returns:
+        Future: Resolves to the composition draft, or None when speculation is disabled
+    """
+    if not get_heygen_prediction_settings().get('speculative_composition', True):
+        return None
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='speculative-composition')
+    future = executor.submit(contextvars.copy_context().run, prebuild_composition,
+                             scripts, movie_covers, movie_clips, poster_timing_mode, background_music_url)
+    executor.shutdown(wait=False)
+    print("   🔮 Prebuilding Creatomate composition from predicted HeyGen durations...")
+    return future
+
+
+def _collect_speculative_composition(future: Optional[concurrent.futures.Future]) -> Optional[Dict[str, Any]]:
+    """Wait for the speculative draft; a failed draft only means building from scratch."""
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(f"⚠️ Speculative composition unavailable, building from scratch: {str(e)}")
+        return None
+
+# =============================================================================
+# TRACING HELPERS
+# =============================================================================
+
+def _begin_step_span(step_spans: Dict[int, Any], workflow_span: Any, step_number: int, step_name: str) -> None:
+    """End the previous step's span and start a span for this step under the workflow span."""
+    for open_span in step_spans.values():
+        open_span.end()
+    step_spans[step_number] = get_tracer().start_span(
+        f"Step {step_number}: {step_name}", 'step', {'step_number': step_number}, parent=workflow_span
+    )
+
+
+def _finish_workflow_trace(workflow_span: Any, step_spans: Dict[int, Any], job_id: str,
+                           workflow_results: Dict[str, Any], error: str = None) -> None:
+    """
+    End the job's spans, attach a per-category timing summary to the results
+    and export the trace files (Chrome trace / OTLP JSON).
+    
+    Safe to call more than once - only the first call for a job ends and exports
+    its trace, so the workflow's finally block can cover every exit path.
+    """
+    if workflow_span.finished:
+        return
+    
+    status = 'error' if error else 'ok'
+    for open_span in step_spans.values():
+        open_span.end(status=status, error=error)
+    workflow_span.end(status=status, error=error)
+    
+    if workflow_span.trace_id is None:
+        return
+    
+    workflow_results['trace'] = {
+        'trace_id': workflow_span.trace_id,
+        'summary': get_tracer().summarize(workflow_span.trace_id),
+        'files': export_job_trace(workflow_span, job_id)
+    }
+    for trace_file in workflow_results['trace']['files']:
+        print(f"   🔬 Trace saved to: {trace_file}")
+
 # =============================================================================
 # MAIN WORKFLOW ORCHESTRATION
 # =============================================================================
@@ -68,7 +190,9 @@ def run_full_workflow(num_movies: int = 3,
                      scroll_distance: float = None,
                      poster_timing_mode: str = "heygen_last3s",
                      heygen_template_id: str = None,
-                     pause_after_extraction: bool = False) -> dict:
+                     pause_after_extraction: bool = False,
+                     resume_job_id: str = None,
+                     job_id: str = None) -> dict:
     """
     Run the complete StreamGank video generation workflow.
     
@@ -97,6 +221,8 @@ def run_full_workflow(num_movies: int = 3,
         smooth_scroll (bool): Use smooth scrolling (default: True)
         scroll_distance (float): Scroll distance factor (default: 1.5)
         poster_timing_mode (str): Poster timing strategy (default: "heygen_last3s")
+        resume_job_id (str): Resume this job from its checkpoint, skipping completed steps (optional)
+        job_id (str): Job ID for logs, webhooks and checkpoints (default: JOB_ID env var; set per job in batch mode)
         
     Returns:
         Dict[str, Any]: Complete workflow results including all generated assets
@@ -172,8 +298,41 @@ def run_full_workflow(num_movies: int = 3,
         'step_7_creatomate_assembly': {}
     }
     
-    # Get or generate job_id first
-    job_id = os.getenv('JOB_ID', f"workflow_{int(time.time())}")
+    # Get or generate job_id first (a resumed job keeps its original ID)
+    job_id = resume_job_id or job_id or os.getenv('JOB_ID', f"workflow_{int(time.time())}")
+    
+    # Checkpoints are kept in every environment so failed jobs can be resumed
+    checkpoint_store = get_checkpoint_store()
+    resume_checkpoint = None
+    
+    if resume_job_id:
+        resume_checkpoint = checkpoint_store.load_checkpoint(resume_job_id)
+        if not resume_checkpoint:
+            raise Exception(f"No checkpoint found for job {resume_job_id} - cannot resume")
+        
+        if resume_checkpoint['status'] == 'completed':
+            print(f"✅ Job {resume_job_id} already completed - nothing to resume")
+            return resume_checkpoint
+        
+        if resume_checkpoint['status'] not in RESUMABLE_STATUSES:
+            raise Exception(f"Job {resume_job_id} has status '{resume_checkpoint['status']}' and cannot be resumed")
+        
+        workflow_results['workflow_id'] = resume_checkpoint.get('workflow_id') or workflow_results['workflow_id']
+        workflow_results['resumed_from_checkpoint'] = True
+        print(f"♻️ RESUMING job {resume_job_id} - completed steps: {resume_checkpoint['steps_completed']}")
+    
+    checkpoint_store.start_job(job_id, {
+        'num_movies': num_movies,
+        'country': country,
+        'genre': genre,
+        'platform': platform,
+        'content_type': content_type,
+        'skip_scroll_video': skip_scroll_video,
+        'smooth_scroll': smooth_scroll,
+        'scroll_distance': scroll_distance,
+        'poster_timing_mode': poster_timing_mode,
+        'heygen_template_id': heygen_template_id
+    }, workflow_id=workflow_results['workflow_id'])
     
     # Initialize webhook client for real-time step updates with job_id
     webhook_client = create_webhook_client(job_id)
@@ -192,12 +351,49 @@ def run_full_workflow(num_movies: int = 3,
     # Send webhook notification
     webhook_client.send_workflow_started(total_steps=7)
     
+    # Root span for this job - HTTP, ffmpeg, OpenAI and browser spans nest below the step spans
+    workflow_span = get_tracer().start_span('workflow', 'workflow', {
+        'job_id': job_id,
+        'workflow_id': workflow_results['workflow_id'],
+        **workflow_results['parameters']
+    })
+    step_spans: Dict[int, Any] = {}
+    
+    # Temp media for this job lives in one scratch workspace, removed when the job ends
+    scratch_manager = get_scratch_manager()
+    set_scratch_workspace(scratch_manager.open(job_id))
+    admission_controller = get_admission_controller()
+    
+    # ffmpeg/ffprobe commands of this job (worker threads included) are tagged for per-job cancellation;
+    # a resumed job reuses the ID of a run that may have been cancelled
+    media_executor = get_media_executor()
+    media_executor.forget_job(job_id)
+    media_job_token = set_media_job(job_id)
+    
     try:
+        # Start only when disk and memory allow this job's peak usage (other workers and batch jobs included)
+        admission = admission_controller.admit(job_id, estimate_job_requirements(
+            num_movies=num_movies,
+            skip_scroll_video=skip_scroll_video,
+            completed_steps=(resume_checkpoint or {}).get('steps_completed', [])
+        ))
+        workflow_results['admission'] = {
+            'wait_seconds': admission['wait_seconds'],
+            'disk_bytes': admission['requirements']['disk_bytes'],
+            'ram_bytes': admission['requirements']['ram_bytes']
+        }
+        workflow_span.set_attribute('admission_wait_seconds', round(admission['wait_seconds'], 3))
+        job_logger.log_job_event(job_id, "job_admitted", f"Admitted after {admission['wait_seconds']:.1f}s", {
+            **workflow_results['admission'],
+            'headroom': admission['headroom']
+        })
+        
         # =============================================================================
         # STEP 1: DATABASE EXTRACTION
         # =============================================================================
         print(f"\n[STEP 1/7] Database Extraction - Extracting {num_movies} movies from database")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 1, "Database Extraction")
         print(f"   Filters: {country}, {genre}, {platform}, {content_type}")
         
         # Send real-time webhook update for step start
@@ -220,13 +416,20 @@ def run_full_workflow(num_movies: int = 3,
             }
         })
         
-        raw_movies = extract_movie_data(
-            num_movies=num_movies,
-            country=country,
-            genre=genre,
-            platform=platform,
-            content_type=content_type
-        )
+        # Reuse the resumed job's movies so cached assets and scripts still match
+        resumed_extraction = resume_checkpoint['steps'].get('step_1_database_extraction') if resume_checkpoint else None
+        
+        if resumed_extraction and resumed_extraction.get('raw_movies'):
+            raw_movies = resumed_extraction['raw_movies']
+            print(f"   ♻️ RESUME: Reusing {len(raw_movies)} movies from checkpoint")
+        else:
+            raw_movies = extract_movie_data(
+                num_movies=num_movies,
+                country=country,
+                genre=genre,
+                platform=platform,
+                content_type=content_type
+            )
         
         if not raw_movies:
             raise Exception("Database extraction failed - no movies found")
@@ -269,6 +472,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('database_extraction')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -321,6 +527,7 @@ def run_full_workflow(num_movies: int = 3,
                 }
             }
             
+            _finish_workflow_trace(workflow_span, step_spans, job_id, workflow_results)
             return workflow_results
         
         # =============================================================================
@@ -328,6 +535,7 @@ def run_full_workflow(num_movies: int = 3,
         # =============================================================================
         print(f"\n[STEP 2/7] Script Generation - Generating scripts for {genre} content on {platform}")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 2, "Script Generation")
         
         # Send real-time webhook update for step start
         webhook_client.send_step_update(
@@ -347,7 +555,7 @@ def run_full_workflow(num_movies: int = 3,
         
         # Try to load existing script data from test_output
         template = heygen_template_id or "auto"
-        cached_script_data = load_test_data('script_result', country, genre, platform, content_type, template)
+        cached_script_data = _load_step_data('script_result', resume_checkpoint, country, genre, platform, content_type, template)
         
         if is_local_mode():
             # 🛑 STRICT LOCAL MODE: ONLY cached data, NEVER API calls
@@ -381,7 +589,7 @@ def run_full_workflow(num_movies: int = 3,
             script_result = (combined_script, script_file_path, individual_scripts)
             print(f"   ✅ LOCAL MODE: Successfully loaded {len(individual_scripts)} cached scripts + outro")
             
-        elif cached_script_data and should_use_cache():
+        elif cached_script_data and (should_use_cache() or resume_checkpoint):
             # DEVELOPMENT/PRODUCTION MODE: Use cache if available
             print("   📂 Using cached script data from test_output...")
             
@@ -443,6 +651,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('script_generation')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -472,6 +683,7 @@ def run_full_workflow(num_movies: int = 3,
         # =============================================================================
         print(f"\n[STEP 3/7] Asset Preparation - Creating enhanced posters and movie clips")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 3, "Asset Preparation")
         
         # Send real-time webhook update for step start
         webhook_client.send_step_update(
@@ -490,7 +702,7 @@ def run_full_workflow(num_movies: int = 3,
         
         # Try to load existing asset data from test_output
         template = heygen_template_id or "auto"
-        cached_assets_data = load_test_data('assets', country, genre, platform, content_type, template)
+        cached_assets_data = _load_step_data('assets', resume_checkpoint, country, genre, platform, content_type, template)
         
         if is_local_mode():
             # 🛑 STRICT LOCAL MODE: ONLY cached data, NEVER API calls
@@ -525,7 +737,7 @@ def run_full_workflow(num_movies: int = 3,
             
             print(f"   🔗 Music URL: {background_music_url}")
             
-        elif cached_assets_data and should_use_cache():
+        elif cached_assets_data and (should_use_cache() or resume_checkpoint):
             print("   📂 Using cached asset data from test_output...")
             
             enhanced_posters = cached_assets_data.get('enhanced_posters', {})
@@ -661,6 +873,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('asset_preparation')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -693,6 +908,7 @@ def run_full_workflow(num_movies: int = 3,
         # =============================================================================
         print(f"\n[STEP 4/7] HeyGen Video Creation - Generating AI avatar videos")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 4, "HeyGen Video Creation")
         
         # Send real-time webhook update for step start
         webhook_client.send_step_update(
@@ -712,7 +928,7 @@ def run_full_workflow(num_movies: int = 3,
         
         # Try to load existing HeyGen data from cache
         template = heygen_template_id or "auto"
-        cached_heygen_data = load_test_data('heygen', country, genre, platform, content_type, template)
+        cached_heygen_data = _load_step_data('heygen', resume_checkpoint, country, genre, platform, content_type, template)
         
         if is_local_mode():
             # 🛑 STRICT LOCAL MODE: ONLY cached data, NEVER API calls
@@ -725,6 +941,7 @@ def run_full_workflow(num_movies: int = 3,
             
             # Extract cached data variables for LOCAL mode
             heygen_video_ids = cached_heygen_data.get('video_ids', {}) if isinstance(cached_heygen_data, dict) else {}
+            heygen_submitted_at = cached_heygen_data.get('submitted_at', {}) if isinstance(cached_heygen_data, dict) else {}
             template_id_used = cached_heygen_data.get('template_id', heygen_template_id) if isinstance(cached_heygen_data, dict) else heygen_template_id
             
             # Validate cached data completeness
@@ -735,11 +952,12 @@ def run_full_workflow(num_movies: int = 3,
             
             print(f"   ✅ LOCAL MODE: Successfully loaded {len(heygen_video_ids)} cached HeyGen video IDs")
             
-        elif cached_heygen_data and should_use_cache():
+        elif cached_heygen_data and (should_use_cache() or resume_checkpoint):
             print("   📂 Using cached HeyGen data from test_output...")
             
             # Extract data from cached result (with safe fallbacks)
             heygen_video_ids = cached_heygen_data.get('video_ids', {}) if isinstance(cached_heygen_data, dict) else {}
+            heygen_submitted_at = cached_heygen_data.get('submitted_at', {}) if isinstance(cached_heygen_data, dict) else {}
             template_id_used = cached_heygen_data.get('template_id', heygen_template_id) if isinstance(cached_heygen_data, dict) else heygen_template_id
             
             print(f"   📋 Loaded {len(heygen_video_ids)} cached HeyGen video IDs")
@@ -778,7 +996,10 @@ def run_full_workflow(num_movies: int = 3,
                 print(f"   ⚠️ Warning: Missing intro or movie1 scripts for combination")
             
             print(f"   🎬 Creating HeyGen videos for {len(heygen_scripts)} scripts: {list(heygen_scripts.keys())}")
-            heygen_video_ids = create_heygen_video(heygen_scripts, True, heygen_template_id)
+            # Render times for the HeyGen predictor are measured from each video's own submission
+            heygen_submitted_at = {}
+            heygen_video_ids = create_heygen_video(heygen_scripts, True, heygen_template_id,
+                                                   submitted_at=heygen_submitted_at)
             
             if not heygen_video_ids:
                 raise Exception("HeyGen video creation failed")
@@ -788,6 +1009,7 @@ def run_full_workflow(num_movies: int = 3,
         # Save step 4 data in organized structure
         workflow_results['step_4_heygen_creation'] = {
             'heygen_video_ids': heygen_video_ids,
+            'submitted_at': heygen_submitted_at,
             'template_id_used': template_id_used if 'template_id_used' in locals() else heygen_template_id,
             'videos_created': len(heygen_video_ids),
             'step_duration': time.time() - step_start,
@@ -796,6 +1018,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('heygen_creation')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -828,6 +1053,9 @@ def run_full_workflow(num_movies: int = 3,
         # =============================================================================
         print(f"\n[STEP 5/7] HeyGen Video Processing - Waiting for video completion")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 5, "HeyGen Processing")
+        speculative_composition = None
+        heygen_video_durations = {}
         
         # Send real-time webhook update for step start
         webhook_client.send_step_update(
@@ -846,7 +1074,7 @@ def run_full_workflow(num_movies: int = 3,
         
         # Try to load existing HeyGen URLs from cache
         template = heygen_template_id or "auto"
-        cached_heygen_urls_data = load_test_data('heygen_urls', country, genre, platform, content_type, template)
+        cached_heygen_urls_data = _load_step_data('heygen_urls', resume_checkpoint, country, genre, platform, content_type, template)
         
         if is_local_mode():
             # 🛑 STRICT LOCAL MODE: ONLY cached data, NEVER API calls
@@ -859,6 +1087,7 @@ def run_full_workflow(num_movies: int = 3,
             
             # Extract cached data variables for LOCAL mode
             heygen_video_urls = cached_heygen_urls_data.get('video_urls', {}) if isinstance(cached_heygen_urls_data, dict) else {}
+            heygen_video_durations = cached_heygen_urls_data.get('video_durations', {}) if isinstance(cached_heygen_urls_data, dict) else {}
             
             # Validate cached data completeness
             if not heygen_video_urls:
@@ -868,11 +1097,12 @@ def run_full_workflow(num_movies: int = 3,
             
             print(f"   ✅ LOCAL MODE: Successfully loaded {len(heygen_video_urls)} cached HeyGen video URLs")
             
-        elif cached_heygen_urls_data and should_use_cache():
+        elif cached_heygen_urls_data and (should_use_cache() or resume_checkpoint):
             print("   📂 Using cached HeyGen URLs from test_output...")
             
             # Extract data from cached result (with safe fallbacks)
             heygen_video_urls = cached_heygen_urls_data.get('video_urls', {}) if isinstance(cached_heygen_urls_data, dict) else {}
+            heygen_video_durations = cached_heygen_urls_data.get('video_durations', {}) if isinstance(cached_heygen_urls_data, dict) else {}
             
             print(f"   📋 Loaded {len(heygen_video_urls)} cached HeyGen video URLs")
             
@@ -883,7 +1113,17 @@ def run_full_workflow(num_movies: int = 3,
             print("   🔄 No cached HeyGen URLs found, fetching from API...")
             print("   Waiting for HeyGen video processing completion...")
             
-            heygen_video_urls = get_heygen_videos_for_creatomate(heygen_video_ids, individual_scripts)
+            # Probe clips and lay out the composition from predicted durations while HeyGen renders
+            speculative_composition = _start_speculative_composition(
+                individual_scripts, movie_covers, movie_clips, poster_timing_mode,
+                workflow_results['step_3_asset_preparation'].get('background_music_url')
+            )
+            
+            # Durations HeyGen reports on completion replace FFprobe in step 7
+            heygen_video_durations = {}
+            heygen_video_urls = get_heygen_videos_for_creatomate(heygen_video_ids, individual_scripts,
+                                                                 durations=heygen_video_durations,
+                                                                 submitted_at=heygen_submitted_at)
             
             if not heygen_video_urls:
                 # 🚨 PRODUCTION FIX: Don't fail the entire workflow on HeyGen timeout
@@ -896,10 +1136,15 @@ def run_full_workflow(num_movies: int = 3,
                 workflow_results['heygen_timeout'] = {
                     'video_ids': heygen_video_ids,
                     'timeout_timestamp': time.time(),
-                    'recovery_instructions': 'Retry this job or check HeyGen video status manually'
+                    'recovery_instructions': f'Resume with: python main.py --resume {job_id}'
                 }
                 
+                _finish_workflow_trace(workflow_span, step_spans, job_id, workflow_results,
+                                       error='HeyGen video processing timed out')
+                
                 # Save the partial progress
+                checkpoint_store.save_checkpoint(job_id, workflow_results)
+                checkpoint_store.mark_status(job_id, 'heygen_timeout', error='HeyGen video processing timed out', failed_step=5)
                 if save_enabled:
                     template = heygen_template_id or "auto"
                     save_workflow_result(workflow_results, country, genre, platform, content_type, template)
@@ -919,6 +1164,7 @@ def run_full_workflow(num_movies: int = 3,
         # Save step 5 data in organized structure
         workflow_results['step_5_heygen_processing'] = {
             'heygen_video_urls': heygen_video_urls,
+            'heygen_video_durations': heygen_video_durations,
             'urls_retrieved': len(heygen_video_urls),
             'step_duration': time.time() - step_start,
             'step_status': 'completed',
@@ -926,6 +1172,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('heygen_processing')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -949,6 +1198,7 @@ def run_full_workflow(num_movies: int = 3,
         if not skip_scroll_video:
             print(f"\n[STEP 6/7] Scroll Video Generation - Creating StreamGank scroll overlay")
             step_start = time.time()
+            _begin_step_span(step_spans, workflow_span, 6, "Scroll Video Generation")
             
             # Send real-time webhook update for step start
             webhook_client.send_step_update(
@@ -969,7 +1219,7 @@ def run_full_workflow(num_movies: int = 3,
             
             # Try to load existing scroll video data from cache
             template = heygen_template_id or "auto"
-            cached_scroll_data = load_test_data('scroll_video', country, genre, platform, content_type, template)
+            cached_scroll_data = _load_step_data('scroll_video', resume_checkpoint, country, genre, platform, content_type, template)
             
             if is_local_mode():
                 # 🛑 STRICT LOCAL MODE: ONLY cached data, NEVER API calls
@@ -991,7 +1241,7 @@ def run_full_workflow(num_movies: int = 3,
                 
                 print(f"   ✅ LOCAL MODE: Successfully loaded cached scroll video URL")
                 
-            elif cached_scroll_data and should_use_cache():
+            elif cached_scroll_data and (should_use_cache() or resume_checkpoint):
                 print("   📂 Using cached scroll video data from test_output...")
                 
                 # Extract data from cached result (with safe fallbacks)
@@ -1067,6 +1317,9 @@ def run_full_workflow(num_movies: int = 3,
         
         workflow_results['steps_completed'].append('scroll_generation')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -1077,6 +1330,7 @@ def run_full_workflow(num_movies: int = 3,
         # =============================================================================
         print(f"\n[STEP 7/7] Creatomate Assembly - Creating final video")
         step_start = time.time()
+        _begin_step_span(step_spans, workflow_span, 7, "Creatomate Assembly")
         
         # Send real-time webhook update for step start
         webhook_client.send_step_update(
@@ -1186,6 +1440,7 @@ def run_full_workflow(num_movies: int = 3,
         
         # Convert HeyGen URLs to the format expected by Creatomate (movie1, movie2, movie3)
         creatomate_heygen_urls = {}
+        creatomate_heygen_durations = {}
         for i, movie in enumerate(ordered_movies, 1):
             movie_title = movie.get('title', 'Unknown')
             if movie_title in ordered_heygen_urls:
@@ -1206,6 +1461,13 @@ def run_full_workflow(num_movies: int = 3,
         else:
             logger.warning(f"⚠️ No outro HeyGen URL found - outro video may not play in final video")
         
+        # Reported HeyGen durations follow their video through the reordering above
+        durations_by_url = {heygen_video_urls[key]: duration for key, duration in (heygen_video_durations or {}).items()
+                            if key in heygen_video_urls}
+        for key, url in creatomate_heygen_urls.items():
+            if url in durations_by_url:
+                creatomate_heygen_durations[key] = durations_by_url[url]
+        
         # Log the ordering for verification
         logger.info(f"🎬 FINAL ASSET ORDERING for Creatomate:")
         for i, movie in enumerate(ordered_movies):
@@ -1256,7 +1518,9 @@ def run_full_workflow(num_movies: int = 3,
                 scroll_video_url=scroll_video_url,
                 scripts=ordered_individual_scripts,
                 poster_timing_mode=poster_timing_mode,
-                background_music_url=background_music_url
+                background_music_url=background_music_url,
+                known_durations=creatomate_heygen_durations,
+                composition_draft=_collect_speculative_composition(speculative_composition)
             )
             
             if not creatomate_id or creatomate_id.startswith('error'):
@@ -1274,6 +1538,9 @@ def run_full_workflow(num_movies: int = 3,
         }
         workflow_results['steps_completed'].append('creatomate_assembly')
         
+        # Checkpoint completed steps for --resume (all environments)
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        
         # Save incremental progress in development mode
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -1313,6 +1580,11 @@ def run_full_workflow(num_movies: int = 3,
         workflow_results['total_duration'] = total_duration
         workflow_results['end_time'] = time.time()
         
+        _finish_workflow_trace(workflow_span, step_spans, job_id, workflow_results)
+        
+        checkpoint_store.save_checkpoint(job_id, workflow_results)
+        checkpoint_store.mark_status(job_id, 'completed')
+        
         # Save complete workflow results (only in development/production modes)
         if save_enabled:
             template = heygen_template_id or "auto"
@@ -1366,12 +1638,18 @@ def run_full_workflow(num_movies: int = 3,
         workflow_results['total_duration'] = total_duration
         workflow_results['end_time'] = time.time()
         
+        _finish_workflow_trace(workflow_span, step_spans, job_id, workflow_results, error=str(e))
+        
+        # Media commands other threads still run for the failed job are killed, queued ones dropped
+        media_executor.cancel_job(job_id)
+        
         print(f"\n❌ WORKFLOW FAILED at step {len(workflow_results['steps_completed']) + 1}")
         print(f"   Error: {str(e)}")
         print(f"   Duration before failure: {total_duration:.1f}s")
         
         # Log workflow failure
         failed_step = len(workflow_results['steps_completed']) + 1
+        checkpoint_store.mark_status(job_id, 'failed', error=str(e), failed_step=failed_step)
         job_logger.log_workflow_failed(job_id, str(e), failed_step, {
             'steps_completed_before_failure': len(workflow_results['steps_completed']),
             'failed_at_step': failed_step,
@@ -1392,6 +1670,8 @@ def run_full_workflow(num_movies: int = 3,
         elif is_development_mode():
             print(f"   🔧 DEVELOPMENT MODE: Check API connectivity, cached data will be preserved")
         
+        print(f"   ♻️ Resume from step {failed_step}: python main.py --resume {job_id}")
+        
         # Save partial results if output file specified
         if output:
             try:
@@ -1403,6 +1683,17 @@ def run_full_workflow(num_movies: int = 3,
         
         # Re-raise the original exception instead of a generic one
         raise
+    
+    finally:
+        # Exit paths that did not export the trace (e.g. SIGTERM) still end and export it
+        _finish_workflow_trace(workflow_span, step_spans, job_id, workflow_results,
+                               error=workflow_results.get('error') or 'Workflow exited before completion')
+        
+        # Job end (success, failure or SIGTERM exit) - drop the scratch workspace and resource reservation
+        reset_media_job(media_job_token)
+        set_scratch_workspace(None)
+        scratch_manager.close(job_id)
+        admission_controller.release(job_id)
 
 # =============================================================================
 # LEGACY COMPATIBILITY FUNCTIONS
@@ -11,10 +11,11 @@ Modules:
     - validators: Database response validation
 """
 
-from .movie_extractor import *
-from .connection import *
-from .filters import *
-from .validators import *
+# Submodules load on first attribute access, so importing one database module
+# (or a quick CLI path) no longer imports every dependency of the package
+from utils.lazy_imports import lazy_package
+
+_SUBMODULES = ('movie_extractor', 'connection', 'filters', 'validators')
 
 __all__ = [
     # Movie Extraction
@@ -38,4 +39,24 @@ __all__ = [
     'validate_movie_response',
     'validate_extraction_params',
     'process_movie_data'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'extract_movie_data': 'movie_extractor',
+    'extract_movies_by_filters': 'movie_extractor',
+    'get_movie_details': 'movie_extractor',
+    'simulate_movie_data': 'movie_extractor',
+    'test_supabase_connection': 'connection',
+    'get_supabase_client': 'connection',
+    'validate_database_config': 'connection',
+    'build_movie_query': 'filters',
+    'apply_content_filters': 'filters',
+    'apply_localization_filters': 'filters',
+    'apply_genre_filters': 'filters',
+    'validate_movie_response': 'validators',
+    'validate_extraction_params': 'validators',
+    'process_movie_data': 'validators'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
@@ -7,8 +7,15 @@ and connection testing for the StreamGang video generation system.
 
 import os
 import logging
-from typing import Optional, Dict, Any
-from supabase import create_client, Client
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+from utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+# Supabase SDK is loaded on first connection, not on module import
+create_client = lazy_import('supabase', 'create_client')
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +23,9 @@ logger = logging.getLogger(__name__)
 # GLOBAL CONNECTION MANAGEMENT
 # =============================================================================
 
-_supabase_client: Optional[Client] = None
+_supabase_client: Optional['Client'] = None
 
-def get_supabase_client(force_recreate: bool = False) -> Optional[Client]:
+def get_supabase_client(force_recreate: bool = False) -> Optional['Client']:
     """
     Get or create Supabase client instance.
     
@@ -241,6 +248,6 @@ class DatabaseConnection:
         """Check if database connection is active."""
         return self._connected and self.client is not None
     
-    def get_client(self) -> Optional[Client]:
+    def get_client(self) -> Optional['Client']:
         """Get the database client instance."""
         return self.client if self.is_connected() else None
\ No newline at end of file
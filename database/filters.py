@@ -6,8 +6,12 @@ database operations, handling complex joins and parameter filtering.
 """
 
 import logging
-from typing import Optional, Any
-from supabase import Client
+from typing import Optional, Any, TYPE_CHECKING
+
+from utils.mapping_registry import MAPPING_REGISTRY
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +19,7 @@ logger = logging.getLogger(__name__)
 # QUERY BUILDING FUNCTIONS
 # =============================================================================
 
-def build_movie_query(supabase_client: Client, genre_filter=None):
+def build_movie_query(supabase_client: 'Client', genre_filter=None):
     """
     Build the base movie query with all necessary joins.
     
@@ -88,17 +92,7 @@ def apply_filters(query,
         logger.debug(f"🎬 Applying content type filter: {content_type}")
         
         # Normalize content type variations (same logic as apply_content_filters)
-        content_type_mapping = {
-            'Movie': 'Film',
-            'Movies': 'Film',
-            'Series': 'Série',
-            'Serie': 'Série',
-            'TV Show': 'Série',
-            'TV Shows': 'Série',
-            'Show': 'Série'
-        }
-        
-        normalized_type = content_type_mapping.get(content_type, content_type)
+        normalized_type = MAPPING_REGISTRY.database_content_types.resolve(content_type, content_type)
         
         if normalized_type != content_type:
             logger.debug(f"📝 Content type normalized: {content_type} -> {normalized_type}")
@@ -116,29 +110,14 @@ def apply_filters(query,
         logger.debug(f"📺 Applying platform filter: {platform} (type: {type(platform)})")
         
         # Map platform names to exact database values
-        platform_mapping = {
-            'Netflix': 'Netflix',
-            'Hulu': 'Hulu',
-            'Crunchyroll': 'Crunchyroll',
-            'Kanopy': 'Kanopy',
-            'Apple TV+': 'Apple TV+',
-            'Disney+': 'Disney+',
-            'Disney Plus': 'Disney Plus',
-            'Rakuten TV': 'Rakuten TV',
-            'Amazon Prime Video': 'Amazon Prime Video',
-            'Prime': 'Amazon Prime Video',  # Map "Prime" to full name
-            'HBO Max': 'HBO Max',
-            'free': 'free',
-            'Sky Go': 'Sky Go',
-            'Max': 'Max'
-        }
+        platform_mapping = MAPPING_REGISTRY.database_platforms
         
         # Handle both single platform (string) and multiple platforms (list)
         if isinstance(platform, list):
             # Multiple platforms - use OR condition
             mapped_platforms = []
             for p in platform:
-                mapped_p = platform_mapping.get(p, p)
+                mapped_p = platform_mapping.resolve(p, p)
                 mapped_platforms.append(mapped_p)
             
             logger.debug(f"📺 Mapped platforms: {platform} -> {mapped_platforms}")
@@ -150,7 +129,7 @@ def apply_filters(query,
             filters_applied.append(f"platforms={platform} (mapped to {mapped_platforms})")
         else:
             # Single platform (backward compatibility)
-            mapped_platform = platform_mapping.get(platform, platform)
+            mapped_platform = platform_mapping.resolve(platform, platform)
             logger.debug(f"📺 Single platform mapped: {platform} -> {mapped_platform}")
             query = query.eq("movie_localizations.platform_name", mapped_platform)
             filters_applied.append(f"platform={platform} (mapped to {mapped_platform})")
@@ -206,17 +185,7 @@ def apply_content_filters(query, content_type: Optional[str] = None):
     logger.debug(f"🎬 Applying content type filter: {content_type}")
     
     # Normalize content type variations
-    content_type_mapping = {
-        'Movie': 'Film',
-        'Movies': 'Film',
-        'Series': 'Série',
-        'Serie': 'Série',
-        'TV Show': 'Série',
-        'TV Shows': 'Série',
-        'Show': 'Série'
-    }
-    
-    normalized_type = content_type_mapping.get(content_type, content_type)
+    normalized_type = MAPPING_REGISTRY.database_content_types.resolve(content_type, content_type)
     
     if normalized_type != content_type:
         logger.debug(f"📝 Content type normalized: {content_type} -> {normalized_type}")
@@ -273,15 +242,7 @@ def apply_genre_filters(query, genre: Optional[str] = None):
     logger.debug(f"🎭 Applying genre filter: {genre}")
     
     # Handle genre variations and mappings
-    genre_mapping = {
-        'Sci-Fi': 'Science-Fiction',
-        'SciFi': 'Science-Fiction',
-        'Thriller': 'Mystery & Thriller',
-        'Family': 'Kids & Family',
-        'Musical': 'Music & Musical'
-    }
-    
-    normalized_genre = genre_mapping.get(genre, genre)
+    normalized_genre = MAPPING_REGISTRY.database_genres.resolve(genre, genre)
     
     if normalized_genre != genre:
         logger.debug(f"📝 Genre normalized: {genre} -> {normalized_genre}")
@@ -894,7 +894,7 @@ app.get("/api/webhooks/status", (req, res) => {
 });
 
 // API endpoint to receive step completion webhooks from Python workflow
-app.post("/api/webhooks/step-update", async (req, res) => {
+async function handleStepUpdate(req, res) {
     try {
         // 📡 HANDLE INTERNAL PYTHON WORKFLOW WEBHOOKS WITH STEP VALIDATION
         const { job_id, step_number, step_name, status, duration, details, timestamp, step_key, sequence, workflow_stage } = req.body;
@@ -1131,6 +1131,42 @@ app.post("/api/webhooks/step-update", async (req, res) => {
         console.error("❌ Real-time webhook error:", error);
         res.status(500).json({ success: false, error: error.message });
     }
+}
+app.post("/api/webhooks/step-update", handleStepUpdate);
+
+// Batch endpoint used by the Python webhook delivery queue (utils/webhook_queue.py)
+// Request:  { updates: [<step-update payload>, ...] }
+// Response: { success, processed, results: [{ step_key, status_code, success, ... }] }
+// Updates are applied in sequence order. Only updates with status_code >= 500 are retried by the sender.
+app.post("/api/webhooks/step-update/batch", async (req, res) => {
+    const updates = Array.isArray(req.body?.updates) ? req.body.updates : null;
+    if (!updates) {
+        return res.status(400).json({ success: false, message: "updates array is required" });
+    }
+
+    const ordered = [...updates].sort((a, b) => (a.sequence || 0) - (b.sequence || 0));
+    const results = [];
+
+    for (const update of ordered) {
+        let statusCode = 200;
+        let body = {};
+        const collector = {
+            status(code) {
+                statusCode = code;
+                return collector;
+            },
+            json(payload) {
+                body = payload;
+                return collector;
+            },
+        };
+
+        await handleStepUpdate({ body: update }, collector);
+        results.push({ step_key: update.step_key, status_code: statusCode, ...body });
+    }
+
+    console.log(`📡 WEBHOOK BATCH: ${results.length} update(s) processed`);
+    res.json({ success: results.every((result) => result.status_code < 500), processed: results.length, results });
 });
 
 // Test webhook endpoint connectivity
@@ -164,11 +164,7 @@ class FileLogger {
         const logFile = path.join(this.jobLogsDir, `${jobId}.log`);
 
         try {
-            const content = await fs.readFile(logFile, 'utf8');
-            const lines = content
-                .trim()
-                .split('\n')
-                .filter((line) => line);
+            const lines = await this.readTailLines(logFile, limit);
 
             const logs = [];
             for (const line of lines) {
@@ -199,6 +195,49 @@ class FileLogger {
         }
     }
 
+    /**
+     * Read the last `limit` non-empty lines of a file, walking backwards in chunks
+     * so large job logs are never loaded whole
+     */
+    async readTailLines(filePath, limit, chunkSize = 64 * 1024) {
+        const handle = await fs.open(filePath, 'r');
+        try {
+            const { size } = await handle.stat();
+            let position = size;
+            let remainder = Buffer.alloc(0);
+            const lines = [];
+
+            while (position > 0 && lines.length < limit) {
+                const readSize = Math.min(chunkSize, position);
+                position -= readSize;
+
+                const chunk = Buffer.alloc(readSize);
+                await handle.read(chunk, 0, readSize, position);
+                const buffer = Buffer.concat([chunk, remainder]);
+
+                // Everything before the first newline may continue in the previous chunk
+                let end = buffer.length;
+                let newline = buffer.lastIndexOf(0x0a, end - 1);
+                while (newline !== -1 && lines.length < limit) {
+                    const line = buffer.toString('utf8', newline + 1, end).trim();
+                    if (line) lines.push(line);
+                    end = newline;
+                    newline = end > 0 ? buffer.lastIndexOf(0x0a, end - 1) : -1;
+                }
+                remainder = buffer.subarray(0, end);
+            }
+
+            if (position === 0 && lines.length < limit) {
+                const line = remainder.toString('utf8').trim();
+                if (line) lines.push(line);
+            }
+
+            return lines.reverse();
+        } finally {
+            await handle.close();
+        }
+    }
+
     /**
      * Search logs with filters
      */
@@ -38,6 +38,7 @@ from supabase import create_client
 import openai
 from typing import Dict, List, Tuple, Optional, Any
 from video.scroll_generator import generate_scroll_video
+from utils.media_executor import MediaJobCancelled, run_media_command
 
 # Import StreamGang helper functions
 from legacy_streamgank_helpers import (
@@ -1537,7 +1538,7 @@ def get_actual_heygen_duration(video_url, fallback_script_text=None):
             video_url
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode == 0:
             metadata = json.loads(result.stdout)
@@ -1547,6 +1548,8 @@ def get_actual_heygen_duration(video_url, fallback_script_text=None):
         else:
             logger.warning(f"⚠️ FFprobe failed: {result.stderr}")
             
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.warning("⚠️ FFprobe timeout - video analysis took too long")
     except FileNotFoundError:
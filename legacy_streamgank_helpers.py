@@ -25,6 +25,9 @@ import cloudinary.uploader
 from pathlib import Path
 import openai
 
+from config.settings import get_encoding_args
+from utils.media_executor import MediaJobCancelled, run_media_command
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -365,29 +368,26 @@ def extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
             '-i', video_path,           # Input file
             '-ss', str(start_time),     # Start time
             '-t', '15',                 # Duration
-            '-c:v', 'libx264',         # Video codec
-            '-c:a', 'aac',             # Audio codec
-            '-crf', '15',              # Ultra-high quality for social media
-            '-preset', 'slow',         # Better compression efficiency
-            '-profile:v', 'high',      # H.264 high profile for better quality
-            '-level:v', '4.0',         # H.264 level 4.0 for high resolution
-            '-movflags', '+faststart', # Optimize for web streaming
-            '-pix_fmt', 'yuv420p',     # Ensure compatibility
             # Complex filter for Gaussian blur background + centered original
             '-filter_complex', 
             '[0:v]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,gblur=sigma=20[blurred];'
             '[0:v]scale=1080:1920:force_original_aspect_ratio=decrease[scaled];'
             '[blurred][scaled]overlay=(W-w)/2:(H-h)/2,unsharp=5:5:1.0:5:5:0.3,eq=contrast=1.1:brightness=0.05:saturation=1.2',
-            '-r', '30',                # 30 FPS for smooth playback
-            '-maxrate', '4000k',       # Higher bitrate for premium quality
-            '-bufsize', '8000k',       # Larger buffer size
+            # Published highlight - final profile (H.264 high, CRF 15, slow preset, faststart)
+            *get_encoding_args(
+                'final',
+                frame_rate=30,                  # 30 FPS for smooth playback
+                maxrate='4000k',                # Higher bitrate for premium quality
+                bufsize='8000k'                 # Larger buffer size
+            ),
             '-y',                       # Overwrite output file
             output_path
         ]
         
-        # Run FFmpeg command
-        result = subprocess.run(
-            ffmpeg_cmd, 
+        # Run FFmpeg command in a media executor slot
+        result = run_media_command(
+            ffmpeg_cmd,
+            priority='final',
             capture_output=True, 
             text=True,
             timeout=60  # 60 second timeout
@@ -402,6 +402,8 @@ def extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
             logger.error(f"❌ FFmpeg error: {result.stderr}")
             return None
             
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"❌ FFmpeg timeout while processing: {video_path}")
         return None
@@ -579,6 +581,52 @@ def process_movie_trailers_to_clips(movie_data: List[Dict], max_movies: int = 3,
 
 # === EXISTING STREAMGANK HELPER FUNCTIONS ===
 
+# Lookup tables built once at import; the getters below hand out copies
+# US-only genre mapping (no country-specific translations)
+_US_GENRES = {
+    "Action & Adventure": "Action & Adventure",
+    "Animation": "Animation",
+    "Comedy": "Comedy",
+    "Crime": "Crime",
+    "Documentary": "Documentary",
+    "Drama": "Drama",
+    "Fantasy": "Fantasy",
+    "History": "History",
+    "Horror": "Horror",
+    "Kids & Family": "Kids & Family",
+    "Made in Europe": "Made in Europe",
+    "Music & Musical": "Music & Musical",
+    "Mystery & Thriller": "Mystery & Thriller",
+    "Reality TV": "Reality TV",
+    "Romance": "Romance",
+    "Science-Fiction": "Science-Fiction",
+    "Sport": "Sport",
+    "War & Military": "War & Military",
+    "Western": "Western"
+}
+
+# Base platform mapping (consistent across most countries)
+_PLATFORM_PARAMS = {
+    'Prime': 'amazon',
+    'Apple TV+': 'apple',
+    'Disney+': 'disney',
+    'Max': 'max',
+    'Netflix': 'Netflix',
+    'Free': 'free',
+}
+
+# Universal content type mapping (supports both French and English terms)
+_CONTENT_TYPES = {
+    'Film': 'Film',
+    'Movie': 'Film',
+    'Série': 'Série',  # Keep French accent for proper URL encoding
+    'Serie': 'Série',   # Map Serie input to Série for URL encoding
+    'Series': 'Série',  # Map English Series to Série for URL encoding
+    'TV Show': 'Série',
+    'TV Series': 'Série',
+    'Émission': 'Série'  # French TV show term
+}
+
 def get_genre_mapping_by_country(country_code):
     """
     Get genre mapping dictionary (US-ONLY SIMPLIFIED)
@@ -593,49 +641,15 @@ def get_genre_mapping_by_country(country_code):
         >>> mapping = get_genre_mapping_by_country('US')
         >>> mapping.get('Horror')   # Returns 'Horror' (no translation needed)
     """
-    # US-only genre mapping (no country-specific translations)
-    us_genres = {
-        "Action & Adventure": "Action & Adventure",
-        "Animation": "Animation",
-        "Comedy": "Comedy",
-        "Crime": "Crime",
-        "Documentary": "Documentary",
-        "Drama": "Drama",
-        "Fantasy": "Fantasy",
-        "History": "History",
-        "Horror": "Horror",
-        "Kids & Family": "Kids & Family",
-        "Made in Europe": "Made in Europe",
-        "Music & Musical": "Music & Musical",
-        "Mystery & Thriller": "Mystery & Thriller",
-        "Reality TV": "Reality TV",
-        "Romance": "Romance",
-        "Science-Fiction": "Science-Fiction",
-        "Sport": "Sport",
-        "War & Military": "War & Military",
-        "Western": "Western"
-    }
-    
     # Always return US English mapping regardless of country_code
-    return us_genres
+    return dict(_US_GENRES)
 
 
 def get_platform_mapping():
     """
     Get platform for StreamGank URL parameters
     """
-    
-    # Base platform mapping (consistent across most countries)
-    base_platforms = {
-        'Prime': 'amazon',
-        'Apple TV+': 'apple',
-        'Disney+': 'disney',
-        'Max': 'max',
-        'Netflix': 'Netflix',
-        'Free': 'free',
-    }
-    
-    return base_platforms
+    return dict(_PLATFORM_PARAMS)
 
 def get_content_type_mapping():
     """
@@ -650,18 +664,7 @@ def get_content_type_mapping():
         >>> mapping.get('Série')    # Returns 'Série' (with accent for URL encoding)
         >>> mapping.get('Émission') # Returns 'Série' (French TV show term)
     """
-    
-    # Universal content type mapping (supports both French and English terms)
-    return {
-        'Film': 'Film',
-        'Movie': 'Film',
-        'Série': 'Série',  # Keep French accent for proper URL encoding
-        'Serie': 'Série',   # Map Serie input to Série for URL encoding
-        'Series': 'Série',  # Map English Series to Série for URL encoding
-        'TV Show': 'Série',
-        'TV Series': 'Série',
-        'Émission': 'Série'  # French TV show term
-    }
+    return dict(_CONTENT_TYPES)
 
 def get_content_type_mapping_by_country(country_code):
     """
@@ -686,8 +689,7 @@ def validate_platform(platform):
     Returns:
         bool: True if valid, False otherwise
     """
-    mapping = get_platform_mapping()
-    return platform in mapping
+    return platform in _PLATFORM_PARAMS
 
 def validate_content_type(content_type):
     """
@@ -699,8 +701,7 @@ def validate_content_type(content_type):
     Returns:
         bool: True if valid, False otherwise
     """
-    mapping = get_content_type_mapping()
-    return content_type in mapping
+    return content_type in _CONTENT_TYPES
 
 
 def build_streamgank_url(country=None, genre=None, platform=None, content_type=None):
@@ -733,20 +734,17 @@ def build_streamgank_url(country=None, genre=None, platform=None, content_type=N
     
     if genre:
         # Use US-only genre mapping (restored for proper URL formatting)
-        genre_mapping = get_genre_mapping_by_country(country)
-        streamgank_genre = genre_mapping.get(genre, genre)
+        streamgank_genre = _US_GENRES.get(genre, genre)
         url_params.append(f"genres={streamgank_genre}")
     
     if platform:
         # Use country-specific platform mapping
-        platform_mapping = get_platform_mapping()
-        streamgank_platform = platform_mapping.get(platform, platform.lower())
+        streamgank_platform = _PLATFORM_PARAMS.get(platform, platform.lower())
         url_params.append(f"platforms={streamgank_platform}")
     
     if content_type:
         # Use universal content type mapping (same across all countries)
-        type_mapping = get_content_type_mapping()
-        streamgank_type = type_mapping.get(content_type, content_type)
+        streamgank_type = _CONTENT_TYPES.get(content_type, content_type)
         # URL encode to handle accents (e.g., "Série" -> "S%C3%A9rie")
         import urllib.parse
         encoded_type = urllib.parse.quote(streamgank_type)
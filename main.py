@@ -13,10 +13,14 @@ Usage:
     python main.py --check-creatomate <render_id>
     python main.py --wait-creatomate <render_id>
     python main.py --process-heygen <file_path>
+    python main.py --resume <job_id>
+    python main.py --batch jobs.json --batch-concurrency 3 --batch-output batch_results/
+    cat jobs.jsonl | python main.py --batch -
 """
 
 import os
 import sys
+import signal
 import argparse
 import json
 import time
@@ -31,13 +35,26 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 # Import MODULAR functions - Clean CLI interface
+# core.workflow (AI, browser, imaging and upload stacks) is imported only by the
+# modes that run a workflow, so status checks start in a fraction of the time
 from video.creatomate_client import check_creatomate_render_status, wait_for_creatomate_completion
-from core.workflow import process_existing_heygen_videos, run_full_workflow
+
+
+def _handle_termination(signum, frame):
+    """Stop child ffmpeg/ffprobe processes when the job is cancelled (SIGTERM from the queue manager)."""
+    from utils.media_executor import get_media_executor
+    
+    print(f"\n🛑 Received signal {signum} - cancelling running media processes")
+    get_media_executor().cancel_all()
+    sys.exit(128 + signum)
 
 
 def main():
     """Main entry point for the StreamGank video generation system"""
     
+    # Job cancellation kills this process - take the ffmpeg children down with it
+    signal.signal(signal.SIGTERM, _handle_termination)
+    
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description="StreamGank Video Generation System - MODULAR SYSTEM",
@@ -48,6 +65,10 @@ def main():
     parser.add_argument("--process-heygen", help="Process existing HeyGen video IDs from JSON file")
     parser.add_argument("--check-creatomate", help="Check Creatomate render status by ID")
     parser.add_argument("--wait-creatomate", help="Wait for Creatomate render completion by ID")
+    parser.add_argument("--resume", help="Resume a failed job from its last checkpoint by job ID")
+    parser.add_argument("--batch", help="Run many parameter sets from a JSON/JSONL file ('-' for stdin)")
+    parser.add_argument("--batch-concurrency", type=int, help="Maximum concurrent batch jobs (default: from settings)")
+    parser.add_argument("--batch-output", help="Directory for per-job results and the batch summary")
 
     
     # Parameters
@@ -134,6 +155,64 @@ def main():
             print(f"❌ Error waiting for completion: {str(e)}")
             sys.exit(1)
             
+    elif args.resume:
+        # Resume a failed workflow from its checkpoint
+        print(f"\n🎬 StreamGank Video Generator - Resume Mode")
+        print(f"Resuming job: {args.resume}")
+        
+        from utils.job_checkpoint import get_checkpoint_store
+        from core.workflow import run_full_workflow
+        
+        checkpoint = get_checkpoint_store().load_checkpoint(args.resume)
+        if not checkpoint:
+            print(f"❌ No checkpoint found for job {args.resume}")
+            sys.exit(1)
+        
+        print(f"📊 Checkpoint status: {checkpoint['status']}")
+        print(f"✅ Steps completed: {', '.join(checkpoint['steps_completed']) or 'none'}")
+        
+        try:
+            results = run_full_workflow(
+                output=args.output,
+                resume_job_id=args.resume,
+                **checkpoint['parameters']
+            )
+            print("\n✅ Resumed workflow completed successfully!")
+            
+            if args.output:
+                print(f"\n📁 Full results saved to: {args.output}")
+                
+        except Exception as e:
+            print(f"\n❌ Error during resumed execution: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+            
+    elif args.batch:
+        # Run many parameter sets in one process with shared resources
+        print(f"\n🎬 StreamGank Video Generator - Batch Mode")
+        
+        from core.batch import load_batch_parameters, run_batch
+        
+        try:
+            parameter_sets = load_batch_parameters(args.batch)
+        except Exception as e:
+            print(f"❌ Error loading batch parameters from {args.batch}: {str(e)}")
+            sys.exit(1)
+        
+        if not parameter_sets:
+            print("No batch parameter sets provided")
+            sys.exit(1)
+        
+        report = run_batch(
+            parameter_sets,
+            concurrency=args.batch_concurrency,
+            output_dir=args.batch_output
+        )
+        
+        if report['summary']['failed']:
+            sys.exit(1)
+            
     elif args.process_heygen or args.heygen_ids:
         # Process existing HeyGen videos
         print(f"\n🎬 StreamGank Video Generator - HeyGen Processing Mode")
@@ -167,6 +246,8 @@ def main():
         
         print(f"Processing HeyGen video IDs: {list(heygen_video_ids.keys())}")
         
+        from core.workflow import process_existing_heygen_videos
+        
         try:
             results = process_existing_heygen_videos(heygen_video_ids, args.output)
             print("\n✅ HeyGen processing completed!")
@@ -215,6 +296,8 @@ def main():
         print(f"Parameters: {args.num_movies} movies, {country}, {genre}, {platform}, {content_type}")
         print("Starting end-to-end workflow...\n")
 
+        from core.workflow import run_full_workflow
+        
         try:
             results = run_full_workflow(
                 num_movies=args.num_movies,
@@ -10,8 +10,11 @@ Modules:
     - screenshot_capture: Screenshot capture functionality
 """
 
-from .cloudinary_uploader import *
-from .media_utils import *
+# Submodules load on first attribute access, so importing one media module
+# (or a quick CLI path) no longer imports every dependency of the package
+from utils.lazy_imports import lazy_package
+
+_SUBMODULES = ('cloudinary_uploader', 'media_utils')
 # from .screenshot_capture import *  # Commented out due to import issues - import directly when needed
 
 __all__ = [
@@ -20,6 +23,7 @@ __all__ = [
     'upload_clip_to_cloudinary',
     'get_cloudinary_transformation',
     'batch_upload_assets',
+    'upload_assets_concurrently',
     'upload_file_to_cloudinary',
     
     # Media Utilities
@@ -36,4 +40,23 @@ __all__ = [
     # 'capture_streamgank_screenshots',
     # 'batch_capture_screenshots', 
     # 'validate_screenshots'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'upload_poster_to_cloudinary': 'cloudinary_uploader',
+    'upload_clip_to_cloudinary': 'cloudinary_uploader',
+    'get_cloudinary_transformation': 'cloudinary_uploader',
+    'batch_upload_assets': 'cloudinary_uploader',
+    'upload_assets_concurrently': 'cloudinary_uploader',
+    'validate_image_url': 'media_utils',
+    'validate_video_file': 'media_utils',
+    'get_video_duration': 'media_utils',
+    'get_image_dimensions': 'media_utils',
+    'clean_temp_files': 'media_utils',
+    'detect_media_format': 'media_utils',
+    'is_portrait_format': 'media_utils',
+    'get_fallback_poster': 'media_utils'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
@@ -10,18 +10,23 @@ Features:
 - Batch upload capabilities
 - Retry logic and error handling
 - Transformation presets for different platforms
+- Content-hash deduplication (unchanged assets are never re-uploaded)
 """
 
+import io
 import os
 import re
+import time
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import concurrent.futures
+from typing import Callable, Dict, List, Optional, Any
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
 from pathlib import Path
 
-from config.settings import get_api_config
+from config.settings import get_api_config, get_workflow_settings
 # Simple inline function replaces bloated formatters.clean_filename
 def clean_filename(filename):
     """Clean filename for safe storage."""
@@ -30,6 +35,7 @@ def clean_filename(filename):
     return re.sub(r'[^\w\-_.]', '_', str(filename))
 from utils.file_utils import get_file_info
 from utils.validators import validate_file_path
+from utils.upload_manifest import compute_upload_digest, get_upload_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +74,81 @@ def _ensure_cloudinary_config() -> bool:
         logger.error(f"❌ Error configuring Cloudinary: {str(e)}")
         return False
 
+# =============================================================================
+# CONTENT-ADDRESSED UPLOADS
+# =============================================================================
+
+# Digest characters appended to public IDs (64 bits - collisions are not a concern)
+CONTENT_ID_LENGTH = 16
+
+# Callback(bytes_sent, total_bytes) invoked as the SDK reads the file
+ProgressCallback = Callable[[int, int], None]
+
+
+class _ProgressReader(io.BufferedReader):
+    """Binary file reporting every read made by the Cloudinary SDK to a progress callback."""
+    
+    def __init__(self, file_path: str, progress_callback: ProgressCallback):
+        super().__init__(io.FileIO(file_path, 'rb'))
+        self.total_bytes = os.path.getsize(file_path)
+        self.bytes_sent = 0
+        self.progress_callback = progress_callback
+    
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        if data:
+            self.bytes_sent += len(data)
+            self.progress_callback(self.bytes_sent, self.total_bytes)
+        return data
+
+
+def _upload_deduplicated(file_path: str, name_prefix: str, progress_callback: ProgressCallback = None,
+                         **upload_options) -> Optional[Dict[str, Any]]:
+    """
+    Upload a file under a content-derived public ID unless it was uploaded before.
+    
+    The public ID is "<name_prefix>_<digest>", so new content always gets a new
+    URL and existing URLs never change - no overwrite and no CDN invalidation.
+    
+    Args:
+        file_path (str): Local file to upload
+        name_prefix (str): Readable public ID prefix (e.g. "enhanced_posters/the_matrix_42")
+        progress_callback (Callable): Optional (bytes_sent, total_bytes) callback; files above
+                                      upload_chunk_size are sent in parts so it fires per part
+        **upload_options: cloudinary.uploader.upload keyword arguments (without public_id)
+        
+    Returns:
+        Dict[str, Any]: Upload result with 'deduplicated' flag, or None if Cloudinary returned no URL
+    """
+    digest = compute_upload_digest(file_path, upload_options)
+    manifest = get_upload_manifest()
+    
+    previous = manifest.lookup(digest)
+    if previous and previous.get('secure_url'):
+        logger.info(f"♻️ Unchanged asset, skipping upload: {previous['secure_url']}")
+        return dict(previous, deduplicated=True)
+    
+    upload_options.update(
+        public_id=f"{name_prefix}_{digest[:CONTENT_ID_LENGTH]}",
+        overwrite=False  # Same public ID means same bytes - Cloudinary returns the stored asset
+    )
+    
+    if progress_callback is None:
+        upload_result = cloudinary.uploader.upload(file_path, **upload_options)
+    else:
+        chunk_size = get_workflow_settings().get('upload_chunk_size', 6 * 1024 * 1024)
+        with _ProgressReader(file_path, progress_callback) as reader:
+            if reader.total_bytes > chunk_size:
+                upload_result = cloudinary.uploader.upload_large(reader, chunk_size=chunk_size, **upload_options)
+            else:
+                upload_result = cloudinary.uploader.upload(reader, **upload_options)
+    
+    if not upload_result or not upload_result.get('secure_url'):
+        return None
+    
+    manifest.record(digest, upload_result, file_path)
+    return dict(upload_result, deduplicated=False)
+
 # =============================================================================
 # POSTER UPLOAD FUNCTIONS
 # =============================================================================
@@ -75,7 +156,8 @@ def _ensure_cloudinary_config() -> bool:
 def upload_poster_to_cloudinary(poster_path: str, 
                                movie_title: str, 
                                movie_id: str = None,
-                               folder: str = "enhanced_posters") -> Optional[str]:
+                               folder: str = "enhanced_posters",
+                               progress_callback: ProgressCallback = None) -> Optional[str]:
     """
     Upload enhanced movie poster to Cloudinary with optimization.
     
@@ -84,6 +166,7 @@ def upload_poster_to_cloudinary(poster_path: str,
         movie_title (str): Movie title for naming
         movie_id (str): Movie ID for unique identification
         folder (str): Cloudinary folder name
+        progress_callback (Callable): Optional (bytes_sent, total_bytes) upload progress callback
         
     Returns:
         str: Cloudinary URL of uploaded poster or None if failed
@@ -98,22 +181,23 @@ def upload_poster_to_cloudinary(poster_path: str,
             logger.error(f"❌ Invalid poster file: {poster_path}")
             return None
         
-        # Create clean public ID
+        # Create clean public ID prefix (content digest is appended)
         clean_title = clean_filename(movie_title)
         public_id = f"{folder}/{clean_title}_{movie_id}" if movie_id else f"{folder}/{clean_title}"
         
         logger.info(f"🖼️ Uploading poster to Cloudinary: {poster_path}")
         logger.info(f"   Movie: {movie_title}")
-        logger.info(f"   Public ID: {public_id}")
+        logger.info(f"   Public ID prefix: {public_id}")
         
         # Get file info for logging
         file_info = get_file_info(poster_path)
         logger.info(f"   File size: {file_info['size_mb']:.1f} MB")
         
         # Upload with poster-optimized settings
-        upload_result = cloudinary.uploader.upload(
+        upload_result = _upload_deduplicated(
             poster_path,
-            public_id=public_id,
+            public_id,
+            progress_callback=progress_callback,
             folder=folder,
             resource_type="image",
             format="jpg",  # Convert to JPG for better compression
@@ -128,9 +212,7 @@ def upload_poster_to_cloudinary(poster_path: str,
                 "movie_title": movie_title,
                 "movie_id": str(movie_id) if movie_id else "",
                 "type": "enhanced_poster"
-            },
-            overwrite=True,  # Allow overwriting existing uploads
-            invalidate=True  # Invalidate CDN cache
+            }
         )
         
         if upload_result and 'secure_url' in upload_result:
@@ -156,7 +238,8 @@ def upload_clip_to_cloudinary(clip_path: str,
                              movie_title: str, 
                              movie_id: str = None,
                              transform_mode: str = "youtube_shorts",
-                             folder: str = "movie_clips") -> Optional[str]:
+                             folder: str = "movie_clips",
+                             progress_callback: ProgressCallback = None) -> Optional[str]:
     """
     Upload video clip to Cloudinary with platform-specific transformations.
     
@@ -166,6 +249,7 @@ def upload_clip_to_cloudinary(clip_path: str,
         movie_id (str): Movie ID for unique identification
         transform_mode (str): Transformation mode ("youtube_shorts", "tiktok", "instagram", "fit")
         folder (str): Cloudinary folder name
+        progress_callback (Callable): Optional (bytes_sent, total_bytes) upload progress callback
         
     Returns:
         str: Cloudinary URL of uploaded clip or None if failed
@@ -180,13 +264,13 @@ def upload_clip_to_cloudinary(clip_path: str,
             logger.error(f"❌ Invalid clip file: {clip_path}")
             return None
         
-        # Create clean public ID
+        # Create clean public ID prefix (content digest is appended)
         clean_title = clean_filename(movie_title)
         public_id = f"{folder}/{clean_title}_{movie_id}_clip" if movie_id else f"{folder}/{clean_title}_clip"
         
         logger.info(f"🎬 Uploading clip to Cloudinary: {clip_path}")
         logger.info(f"   Movie: {movie_title}")
-        logger.info(f"   Public ID: {public_id}")
+        logger.info(f"   Public ID prefix: {public_id}")
         logger.info(f"   Transform mode: {transform_mode}")
         
         # Get file info for logging
@@ -197,9 +281,10 @@ def upload_clip_to_cloudinary(clip_path: str,
         transformation = get_cloudinary_transformation(transform_mode)
         
         # Upload with video-optimized settings (match legacy exactly)
-        upload_result = cloudinary.uploader.upload(
+        upload_result = _upload_deduplicated(
             clip_path,
-            public_id=public_id,
+            public_id,
+            progress_callback=progress_callback,
             folder=folder,
             resource_type="video",
             format="mp4",  # Standard MP4 format
@@ -212,16 +297,14 @@ def upload_clip_to_cloudinary(clip_path: str,
                 "movie_id": str(movie_id) if movie_id else "",
                 "type": "highlight_clip",
                 "transform_mode": transform_mode
-            },
-            overwrite=True,  # Allow overwriting existing uploads
-            invalidate=True  # Invalidate CDN cache
+            }
         )
         
         if upload_result and 'secure_url' in upload_result:
             cloudinary_url = upload_result['secure_url']
             logger.info(f"✅ Clip uploaded successfully: {cloudinary_url}")
             logger.info(f"   Cloudinary public ID: {upload_result.get('public_id', 'Unknown')}")
-            logger.info(f"   Duration: {upload_result.get('duration', 0):.1f}s")
+            logger.info(f"   Duration: {upload_result.get('duration') or 0:.1f}s")
             logger.info(f"   Final size: {upload_result.get('width', 0)}x{upload_result.get('height', 0)}")
             
             return cloudinary_url
@@ -334,73 +417,162 @@ def get_cloudinary_transformation(transform_mode: str) -> Dict[str, Any]:
 # BATCH UPLOAD FUNCTIONS
 # =============================================================================
 
-def batch_upload_assets(file_paths: List[str], 
-                       asset_type: str = "auto",
-                       folder: str = "batch_upload") -> Dict[str, str]:
+def upload_assets_concurrently(file_paths: List[str],
+                               asset_type: str = "auto",
+                               folder: str = "batch_upload",
+                               max_workers: int = None,
+                               max_attempts: int = None,
+                               progress_callback: Callable[[str, int, int], None] = None) -> Dict[str, Any]:
     """
-    Batch upload multiple assets to Cloudinary.
+    Upload assets on a bounded worker pool with per-asset retries.
+    
+    Every asset goes through the deduplicated upload path, so unchanged files
+    cost only a hash. Failed uploads are retried with exponential backoff
+    (upload_retry_backoff, doubling per attempt).
     
     Args:
         file_paths (List[str]): List of file paths to upload
         asset_type (str): Asset type ("poster", "clip", "auto")
         folder (str): Cloudinary folder name
+        max_workers (int): Concurrent uploads (default: WORKFLOW_SETTINGS['upload_concurrency'])
+        max_attempts (int): Attempts per asset (default: WORKFLOW_SETTINGS['upload_max_attempts'])
+        progress_callback (Callable): Optional (file_path, bytes_sent, total_bytes) callback, called
+                                      from worker threads; bytes_sent restarts at 0 on a retry
         
     Returns:
-        Dict[str, str]: Mapping of file paths to Cloudinary URLs
+        Dict[str, Any]: {'results': {path: url}, 'failed': {path: reason}, 'report': throughput report}
     """
-    results = {}
+    settings = get_workflow_settings()
+    max_workers = max_workers or settings.get('upload_concurrency', 4)
+    max_attempts = max(1, max_attempts or settings.get('upload_max_attempts', 3))
+    retry_backoff = settings.get('upload_retry_backoff', 1.0)
     
-    try:
-        if not _ensure_cloudinary_config():
-            return results
+    unique_paths = list(dict.fromkeys(file_paths))
+    results: Dict[str, str] = {}
+    failed: Dict[str, str] = {}
+    counters = {'uploaded': 0, 'deduplicated': 0, 'retries': 0, 'bytes_uploaded': 0}
+    counters_lock = threading.Lock()
+    
+    def upload_one(file_path: str) -> Optional[str]:
+        # Determine asset type if auto
+        detected_type = _detect_asset_type(file_path) if asset_type == "auto" else asset_type
+        if detected_type in ("poster", "image"):
+            upload_fn = upload_poster_to_cloudinary
+        elif detected_type in ("clip", "video"):
+            upload_fn = upload_clip_to_cloudinary
+        else:
+            failed[file_path] = f"unknown asset type ({Path(file_path).suffix or 'no extension'})"
+            logger.warning(f"⚠️ Unknown asset type for {file_path}")
+            return None
         
+        for attempt in range(1, max_attempts + 1):
+            sent = [0]
+            
+            def on_progress(bytes_sent: int, total_bytes: int):
+                sent[0] = bytes_sent
+                if progress_callback is not None:
+                    progress_callback(file_path, bytes_sent, total_bytes)
+            
+            cloudinary_url = upload_fn(file_path, Path(file_path).stem, folder=folder, progress_callback=on_progress)
+            if cloudinary_url:
+                with counters_lock:
+                    # Nothing read by the SDK means the manifest already had this content
+                    counters['uploaded' if sent[0] else 'deduplicated'] += 1
+                    counters['bytes_uploaded'] += sent[0]
+                return cloudinary_url
+            
+            if attempt < max_attempts:
+                delay = retry_backoff * (2 ** (attempt - 1))
+                with counters_lock:
+                    counters['retries'] += 1
+                logger.warning(f"🔄 Retrying {Path(file_path).name} in {delay:.1f}s (attempt {attempt + 1}/{max_attempts})")
+                time.sleep(delay)
+        
+        failed[file_path] = f"upload failed after {max_attempts} attempt(s)"
+        return None
+    
+    start_time = time.time()
+    if _ensure_cloudinary_config() and unique_paths:
         logger.info(f"☁️ BATCH UPLOAD TO CLOUDINARY")
-        logger.info(f"📋 Uploading {len(file_paths)} files")
+        logger.info(f"📋 Uploading {len(unique_paths)} files with {min(max_workers, len(unique_paths))} workers")
         logger.info(f"🎯 Asset type: {asset_type}")
         logger.info(f"📁 Folder: {folder}")
         
-        for i, file_path in enumerate(file_paths):
-            try:
+        workers = max(1, min(max_workers, len(unique_paths)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cloudinary-upload') as executor:
+            futures = {executor.submit(upload_one, file_path): file_path for file_path in unique_paths}
+            
+            for future in concurrent.futures.as_completed(futures):
+                file_path = futures[future]
                 file_name = Path(file_path).name
-                logger.info(f"📤 Uploading {i+1}/{len(file_paths)}: {file_name}")
-                
-                # Determine asset type if auto
-                detected_type = _detect_asset_type(file_path) if asset_type == "auto" else asset_type
-                
-                # Upload based on type
-                if detected_type == "poster" or detected_type == "image":
-                    cloudinary_url = upload_poster_to_cloudinary(
-                        file_path, 
-                        Path(file_path).stem, 
-                        folder=folder
-                    )
-                elif detected_type == "clip" or detected_type == "video":
-                    cloudinary_url = upload_clip_to_cloudinary(
-                        file_path,
-                        Path(file_path).stem,
-                        folder=folder
-                    )
-                else:
-                    logger.warning(f"⚠️ Unknown asset type for {file_path}")
+                try:
+                    cloudinary_url = future.result()
+                except Exception as e:
+                    failed[file_path] = str(e)
+                    logger.error(f"❌ Error uploading {file_path}: {str(e)}")
                     continue
                 
                 if cloudinary_url:
                     results[file_path] = cloudinary_url
-                    logger.info(f"✅ Uploaded: {file_name}")
+                    logger.info(f"✅ Uploaded {len(results)}/{len(unique_paths)}: {file_name}")
                 else:
                     logger.error(f"❌ Failed to upload: {file_name}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Error uploading {file_path}: {str(e)}")
-                continue
-        
-        logger.info(f"🏁 BATCH UPLOAD COMPLETE: {len(results)}/{len(file_paths)} files uploaded")
-        
-        return results
+    else:
+        for file_path in unique_paths:
+            failed[file_path] = "Cloudinary not configured"
+    
+    elapsed = time.time() - start_time
+    bytes_total = sum(os.path.getsize(path) for path in unique_paths if os.path.isfile(path))
+    report = {
+        'files': len(unique_paths),
+        'uploaded': counters['uploaded'],
+        'deduplicated': counters['deduplicated'],
+        'failed': len(failed),
+        'retries': counters['retries'],
+        'workers': max(1, min(max_workers, len(unique_paths) or 1)),
+        'bytes_total': bytes_total,
+        'bytes_uploaded': counters['bytes_uploaded'],
+        'elapsed_seconds': round(elapsed, 2),
+        'throughput_mb_per_second': round(counters['bytes_uploaded'] / 1024 / 1024 / elapsed, 2) if elapsed > 0 else 0.0,
+        'files_per_second': round(len(results) / elapsed, 2) if elapsed > 0 else 0.0
+    }
+    
+    logger.info(f"🏁 BATCH UPLOAD COMPLETE: {len(results)}/{len(unique_paths)} files in {report['elapsed_seconds']:.1f}s")
+    logger.info(f"   📤 Uploaded: {report['uploaded']} | ♻️ Unchanged: {report['deduplicated']} | "
+                f"❌ Failed: {report['failed']} | 🔄 Retries: {report['retries']}")
+    logger.info(f"   📊 {report['bytes_uploaded'] / 1024 / 1024:.1f} MB sent at "
+                f"{report['throughput_mb_per_second']:.2f} MB/s ({report['files_per_second']:.2f} files/s)")
+    
+    return {'results': results, 'failed': failed, 'report': report}
+
+
+def batch_upload_assets(file_paths: List[str], 
+                       asset_type: str = "auto",
+                       folder: str = "batch_upload",
+                       max_workers: int = None,
+                       progress_callback: Callable[[str, int, int], None] = None) -> Dict[str, str]:
+    """
+    Batch upload multiple assets to Cloudinary.
+    
+    Thin wrapper around upload_assets_concurrently() for callers that only need URLs.
+    
+    Args:
+        file_paths (List[str]): List of file paths to upload
+        asset_type (str): Asset type ("poster", "clip", "auto")
+        folder (str): Cloudinary folder name
+        max_workers (int): Concurrent uploads (default: WORKFLOW_SETTINGS['upload_concurrency'])
+        progress_callback (Callable): Optional (file_path, bytes_sent, total_bytes) callback
         
+    Returns:
+        Dict[str, str]: Mapping of file paths to Cloudinary URLs
+    """
+    try:
+        return upload_assets_concurrently(
+            file_paths, asset_type, folder, max_workers=max_workers, progress_callback=progress_callback
+        )['results']
     except Exception as e:
         logger.error(f"❌ Error in batch upload: {str(e)}")
-        return results
+        return {}
 
 # =============================================================================
 # CLOUDINARY MANAGEMENT FUNCTIONS
@@ -467,6 +639,7 @@ def delete_cloudinary_asset(public_id: str, resource_type: str = "image") -> boo
         result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
         
         if result.get('result') == 'ok':
+            get_upload_manifest().forget_public_id(public_id)
             logger.info(f"✅ Deleted Cloudinary asset: {public_id}")
             return True
         else:
@@ -616,25 +789,24 @@ def upload_enhanced_poster_to_cloudinary(poster_path: str, movie_title: str, mov
         clean_title = re.sub(r'[^a-zA-Z0-9_-]', '_', movie_title.lower())
         clean_title = re.sub(r'_+', '_', clean_title).strip('_')
         
-        # Create unique public ID
+        # Create unique public ID prefix (content digest is appended)
         public_id = f"enhanced_posters/{clean_title}_{movie_id}" if movie_id else f"enhanced_posters/{clean_title}"
         
         logger.info(f"☁️ STRICT MODE: Uploading enhanced poster to Cloudinary")
         logger.info(f"   File: {poster_path}")
         logger.info(f"   Movie: {movie_title}")
-        logger.info(f"   Public ID: {public_id}")
+        logger.info(f"   Public ID prefix: {public_id}")
         
         # Get file info for logging
         file_info = get_file_info(poster_path)
         logger.info(f"   File size: {file_info['size_mb']:.2f} MB")
         
         # Upload to Cloudinary with enhanced poster optimization
-        upload_result = cloudinary.uploader.upload(
+        upload_result = _upload_deduplicated(
             poster_path,
+            public_id,
             resource_type="image",
-            public_id=public_id,
             folder="enhanced_posters",
-            overwrite=True,
             quality="auto:best",
             format="png",
             transformation=[
@@ -645,7 +817,7 @@ def upload_enhanced_poster_to_cloudinary(poster_path: str, movie_title: str, mov
             tags=["enhanced_poster", "movie", "tiktok", "instagram", "portrait"]
         )
         
-        cloudinary_url = upload_result.get('secure_url')
+        cloudinary_url = upload_result.get('secure_url') if upload_result else None
         if not cloudinary_url:
             error_msg = "No URL returned from Cloudinary upload"
             logger.error(f"❌ STRICT MODE: {error_msg}")
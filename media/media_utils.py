@@ -14,15 +14,20 @@ Features:
 
 import os
 import logging
-import subprocess
 import json
 from typing import Dict, Optional, Tuple, List, Any
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
 import requests
 
 from utils.file_utils import ensure_directory, safe_delete_file
 from utils.validators import is_valid_url
+from utils.media_executor import MediaJobCancelled, run_media_command
+from utils.lazy_imports import lazy_import
+
+# Pillow is loaded on first image operation, not on module import
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+ImageFont = lazy_import('PIL.ImageFont')
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +94,7 @@ def validate_video_file(file_path: str) -> bool:
             file_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode != 0:
             return False
@@ -107,6 +112,8 @@ def validate_video_file(file_path: str) -> bool:
         
         return has_video and duration > 0
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.debug(f"Error validating video file {file_path}: {str(e)}")
         return False
@@ -133,7 +140,7 @@ def get_video_duration(file_path: str) -> Optional[float]:
             file_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode != 0:
             return None
@@ -144,6 +151,8 @@ def get_video_duration(file_path: str) -> Optional[float]:
         
         return duration if duration > 0 else None
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.debug(f"Error getting video duration for {file_path}: {str(e)}")
         return None
@@ -192,7 +201,7 @@ def get_video_info(file_path: str) -> Optional[Dict[str, Any]]:
             file_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode != 0:
             return None
@@ -239,6 +248,8 @@ def get_video_info(file_path: str) -> Optional[Dict[str, Any]]:
         
         return info
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.debug(f"Error getting video info for {file_path}: {str(e)}")
         return None
@@ -249,7 +260,7 @@ def get_video_info(file_path: str) -> Optional[Dict[str, Any]]:
 
 def get_fallback_poster(title: str = "Movie Poster", 
                        width: int = 600, 
-                       height: int = 900) -> Image.Image:
+                       height: int = 900) -> 'Image.Image':
     """
     Generate a fallback poster image when original poster is unavailable.
     
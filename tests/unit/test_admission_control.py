@@ -0,0 +1,188 @@
+"""
+Unit Tests for StreamGank Job Admission Control
+
+Tests the peak resource model, headroom-based admission, waiting and
+timeouts, the shared reservation ledger and container memory detection.
+Free disk and memory are patched per test.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+import pytest
+
+from utils import admission_control
+from utils.admission_control import AdmissionController, AdmissionTimeout, estimate_job_requirements, get_memory_info
+
+MB = 1024**2
+GB = 1024**3
+
+SETTINGS = {
+    'enabled': True,
+    'poll_interval': 0.05,
+    'max_wait_seconds': 0,
+    'disk_reserve_bytes': 1 * GB,
+    'ram_reserve_bytes': 512 * MB,
+    'default_trailer_seconds': 100,
+    'trailer_mb_per_second': 1.0,
+    'clip_mb_per_second': 2.0,
+    'poster_mb': 5,
+    'scroll_frame_mb': 2.0,
+    'base_ram_mb': 400,
+    'analysis_ram_mb_per_second': 4.0,
+    'ffmpeg_ram_mb': 250,
+    'browser_ram_mb': 600
+}
+
+JOB = {'disk_bytes': 2 * GB, 'ram_bytes': 1 * GB}
+
+
+def set_resources(monkeypatch, disk_free: int, ram_available=None):
+    monkeypatch.setattr(admission_control, 'get_available_space', lambda directory: {'free_bytes': disk_free})
+    monkeypatch.setattr(admission_control, 'get_memory_info',
+                        lambda: {'total_bytes': None, 'available_bytes': ram_available, 'source': 'test'})
+
+
+@pytest.fixture
+def controller(temp_directory, monkeypatch):
+    monkeypatch.delenv('ADMISSION_CONTROL', raising=False)
+    return AdmissionController(ledger_dir=str(temp_directory / 'ledger'), scratch_dir=str(temp_directory / 'scratch'),
+                               settings=dict(SETTINGS))
+
+
+class TestEstimate:
+    """Test the per-job peak resource model."""
+
+    def test_full_job(self):
+        estimate = estimate_job_requirements(num_movies=3, trailer_durations=[120], settings=SETTINGS)
+        breakdown = estimate['breakdown']
+
+        assert estimate['trailer_seconds'] == 320
+        assert breakdown['assets_disk_bytes'] == (320 * 3 + 15) * MB
+        assert breakdown['scroll_disk_bytes'] == 240 * 2 * MB
+        assert estimate['disk_bytes'] == breakdown['assets_disk_bytes'] + breakdown['scroll_disk_bytes']
+        # Trailer analysis outweighs the browser phase
+        assert estimate['ram_bytes'] == (400 + 320 * 4 + 3 * 250) * MB
+
+    def test_step_configuration_reduces_needs(self):
+        no_scroll = estimate_job_requirements(num_movies=3, skip_scroll_video=True, settings=SETTINGS)
+        assert no_scroll['breakdown']['scroll_disk_bytes'] == 0
+
+        resumed = estimate_job_requirements(num_movies=3, completed_steps=['database_extraction', 'asset_preparation'],
+                                            settings=SETTINGS)
+        assert resumed['breakdown']['assets_disk_bytes'] == 0
+        assert resumed['trailer_seconds'] == 0
+        assert resumed['ram_bytes'] == (400 + 600 + 250) * MB
+
+        longer = estimate_job_requirements(num_movies=3, trailer_durations=[300, 300, 300], settings=SETTINGS)
+        assert longer['disk_bytes'] > estimate_job_requirements(num_movies=3, settings=SETTINGS)['disk_bytes']
+
+
+class TestAdmission:
+    """Test admission decisions against headroom and reservations."""
+
+    def test_admits_within_headroom_and_reserves(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=10 * GB, ram_available=8 * GB)
+        admitted, headroom = controller.try_admit('job-1', JOB)
+        assert admitted
+        assert headroom['disk_headroom_bytes'] == 9 * GB
+
+        after = controller.headroom()
+        assert after['disk_reserved_bytes'] == 2 * GB
+        assert after['ram_headroom_bytes'] == 8 * GB - 512 * MB - 1 * GB
+        assert after['active_jobs'] == 1
+
+    def test_lone_job_is_always_admitted(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=1 * GB)
+        assert controller.try_admit('job-1', JOB)[0]
+        assert controller.stats()['forced'] == 1
+
+    def test_waits_for_release(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=4 * GB, ram_available=None)
+        controller.admit('job-1', JOB)
+        assert not controller.try_admit('job-2', JOB)[0]
+
+        tickets = []
+        waiter = threading.Thread(target=lambda: tickets.append(controller.admit('job-2', JOB)))
+        waiter.start()
+        time.sleep(0.2)
+        assert controller.stats()['waiting'] == 1
+
+        assert controller.release('job-1')
+        waiter.join(timeout=5)
+        assert tickets and tickets[0]['wait_seconds'] >= 0.2
+
+        stats = controller.stats()
+        assert stats['admitted'] == 2
+        assert stats['admitted_after_wait'] == 1
+        assert stats['max_wait_seconds'] >= 0.2
+        assert stats['headroom']['active_jobs'] == 1
+
+    def test_memory_limits_admission(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=100 * GB, ram_available=2 * GB)
+        controller.admit('job-1', JOB)
+        assert not controller.try_admit('job-2', JOB)[0]
+
+    def test_timeout(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=4 * GB)
+        controller.admit('job-1', JOB)
+        with pytest.raises(AdmissionTimeout):
+            controller.admit('job-2', JOB, max_wait=0.1)
+        assert controller.stats()['timeouts'] == 1
+
+    def test_disabled(self, controller, monkeypatch):
+        monkeypatch.setenv('ADMISSION_CONTROL', 'false')
+        disabled = AdmissionController(ledger_dir=str(controller.ledger_dir), settings=dict(SETTINGS))
+        assert disabled.admit('job-1', JOB)['wait_seconds'] == 0.0
+        assert not disabled.db_path.exists()
+
+
+class TestLedger:
+    """Test reservations shared between worker processes."""
+
+    def _insert(self, controller, job_id: str, pid: int):
+        conn = sqlite3.connect(str(controller.db_path))
+        with conn:
+            conn.execute('INSERT INTO reservations VALUES (?, ?, ?, ?, ?)', (job_id, pid, 2 * GB, 1 * GB, time.time()))
+        conn.close()
+
+    def test_dead_and_stale_owners_are_dropped(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=4 * GB)
+        controller.admit('job-1', JOB)
+        self._insert(controller, 'other-worker', os.getppid())
+        self._insert(controller, 'crashed-worker', 2**22 + 1)
+        self._insert(controller, 'previous-incarnation', os.getpid())
+
+        headroom = controller.headroom()
+        assert headroom['active_jobs'] == 2
+        assert headroom['disk_reserved_bytes'] == 4 * GB
+
+    def test_release_only_own_reservations(self, controller, monkeypatch):
+        set_resources(monkeypatch, disk_free=10 * GB)
+        controller.admit('job-1', JOB)
+        self._insert(controller, 'other-worker', os.getppid())
+        assert not controller.release('other-worker')
+        assert controller.headroom()['active_jobs'] == 2
+
+
+class TestMemoryInfo:
+    """Test container-aware memory detection."""
+
+    def test_cgroup_limit_caps_host_memory(self, temp_directory, monkeypatch):
+        meminfo = temp_directory / 'meminfo'
+        meminfo.write_text('MemTotal:       16384000 kB\nMemFree:         1000000 kB\nMemAvailable:    8192000 kB\n')
+        limit, usage = temp_directory / 'memory.max', temp_directory / 'memory.current'
+        limit.write_text(str(2 * GB))
+        usage.write_text(str(512 * MB))
+        monkeypatch.setattr(admission_control, '_MEMINFO_PATH', str(meminfo))
+        monkeypatch.setattr(admission_control, '_CGROUP_MEMORY_FILES', ((str(limit), str(usage)),))
+
+        info = get_memory_info()
+        assert info == {'total_bytes': 2 * GB, 'available_bytes': 2 * GB - 512 * MB, 'source': 'cgroup'}
+
+        limit.write_text('max')
+        info = get_memory_info()
+        assert info['available_bytes'] == 8192000 * 1024
+        assert info['source'] == 'meminfo'
@@ -0,0 +1,144 @@
+"""
+Unit Tests for StreamGank Batch Mode
+
+Tests batch parameter loading, the concurrency-limited runner and the
+shared work cache used to deduplicate trailers and scroll videos.
+"""
+
+import io
+import json
+import threading
+import time
+import pytest
+
+from core.batch import load_batch_parameters, run_batch
+from utils.shared_work import SharedWorkCache
+
+
+JOBS = [
+    {'country': 'US', 'genre': 'Horror', 'platform': 'Netflix', 'content-type': 'Movies'},
+    {'country': 'FR', 'genre': 'Horreur', 'platform': 'Netflix', 'content_type': 'Movies', 'num_movies': 3}
+]
+
+
+class TestLoadBatchParameters:
+    """Test batch file formats."""
+
+    def test_json_list_file(self, temp_directory):
+        """Test a JSON list with CLI-style keys."""
+        batch_file = temp_directory / 'jobs.json'
+        batch_file.write_text(json.dumps(JOBS), encoding='utf-8')
+
+        parameter_sets = load_batch_parameters(str(batch_file))
+
+        assert [p['content_type'] for p in parameter_sets] == ['Movies', 'Movies']
+        assert parameter_sets[1]['num_movies'] == 3
+
+    def test_jsonl_from_stdin(self):
+        """Test JSON Lines read from stdin."""
+        stdin = io.StringIO('\n'.join(json.dumps(job) for job in JOBS) + '\n\n')
+
+        assert len(load_batch_parameters('-', stdin=stdin)) == 2
+
+    def test_invalid_entries_are_rejected(self):
+        """Test unknown and missing parameters fail before any job runs."""
+        with pytest.raises(ValueError, match='unknown parameters: colour'):
+            load_batch_parameters('-', stdin=io.StringIO(json.dumps([dict(JOBS[0], colour='red')])))
+
+        with pytest.raises(ValueError, match='missing required parameters: genre'):
+            load_batch_parameters('-', stdin=io.StringIO(json.dumps({'jobs': [{'country': 'US', 'platform': 'Netflix', 'content_type': 'Movies'}]})))
+
+
+class TestRunBatch:
+    """Test the concurrency-limited runner."""
+
+    def test_concurrency_limit_and_report(self, temp_directory):
+        """Test at most `concurrency` jobs run at once and failures are reported per job."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_workflow(job_id, genre, **kwargs):
+            with lock:
+                active.append(job_id)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(job_id)
+            if genre == 'Broken':
+                raise RuntimeError('no movies')
+            return {'status': 'completed', 'step_7_creatomate_assembly': {'creatomate_id': f'render_{job_id}'}}
+
+        parameter_sets = [
+            {'country': 'US', 'genre': genre, 'platform': 'Netflix', 'content_type': 'Movies'}
+            for genre in ('Horror', 'Comedy', 'Broken', 'Drama')
+        ]
+
+        report = run_batch(parameter_sets, concurrency=2, output_dir=str(temp_directory / 'out'),
+                           workflow_fn=fake_workflow)
+
+        assert max(peak) <= 2
+        assert report['summary']['completed'] == 3
+        assert report['summary']['failed'] == 1
+        assert [job['index'] for job in report['jobs']] == [1, 2, 3, 4]
+        assert report['jobs'][2]['error'] == 'no movies'
+        assert report['jobs'][0]['creatomate_id'] == f"render_{report['jobs'][0]['job_id']}"
+        assert (temp_directory / 'out' / 'batch_summary.json').exists()
+
+
+class TestSharedWorkCache:
+    """Test single-flight deduplication."""
+
+    def test_concurrent_callers_share_one_computation(self):
+        """Test the same key is computed once while in flight and reused afterwards."""
+        cache = SharedWorkCache('trailers')
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'https://cdn/clip.mp4'
+
+        threads = [threading.Thread(target=cache.get_or_compute, args=('trailer', compute)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.get_or_compute('trailer', compute) == 'https://cdn/clip.mp4'
+        assert len(calls) == 1
+        assert cache.stats()['hits'] == 4
+
+    def test_failures_are_not_cached(self):
+        """Test None results and exceptions are retried by the next caller."""
+        cache = SharedWorkCache('trailers')
+
+        assert cache.get_or_compute('trailer', lambda: None) is None
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute('trailer', lambda: (_ for _ in ()).throw(RuntimeError('vizard down')))
+        assert cache.get_or_compute('trailer', lambda: 'url') == 'url'
+
+    def test_scroll_video_generation_is_shared(self, monkeypatch):
+        """Test jobs asking for the same scroll video share one render and upload."""
+        scroll_generator = pytest.importorskip('video.scroll_generator')
+        monkeypatch.setattr('utils.shared_work._shared_caches', {})
+        renders = []
+
+        def fake_render(*args):
+            renders.append(args)
+            time.sleep(0.05)
+            return f"https://cdn/scroll_{args[1]}.mp4"
+
+        monkeypatch.setattr(scroll_generator, '_render_scroll_video', fake_render)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            scroll_generator.generate_scroll_video('US', 'Horror', 'Netflix', 'Movies'))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['https://cdn/scroll_Horror.mp4'] * 3
+        assert scroll_generator.generate_scroll_video('US', 'Comedy', 'Netflix', 'Movies') == 'https://cdn/scroll_Comedy.mp4'
+        assert len(renders) == 2
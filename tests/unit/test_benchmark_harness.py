@@ -0,0 +1,76 @@
+"""
+Unit Tests for the StreamGank Benchmark Harness
+
+Tests calibrated and pedantic timing, the JSON results round trip, baseline
+comparison statuses, and the offline results page / local server fixtures.
+"""
+
+import urllib.request
+
+import pytest
+
+from benchmarks.harness import Benchmark, compare_results, format_comparison, load_results, save_results
+from benchmarks.synthetic import serve_directory, write_results_page
+
+
+def results(**medians):
+    return {'benchmarks': [{'name': name, 'group': 'cache', 'stats': {'median': median}}
+                           for name, median in medians.items()]}
+
+
+class TestTiming:
+    """Test the benchmark fixture's timing modes."""
+
+    def test_fast_calls_are_batched(self):
+        runner = Benchmark('sum', rounds=3, min_round_seconds=0.001)
+        assert runner(sum, [1, 2, 3]) == 6
+        result = runner.result()
+        assert result['stats']['rounds'] == 3
+        assert result['stats']['iterations'] >= 10
+        assert 0 < result['stats']['min'] <= result['stats']['median'] <= result['stats']['max']
+
+    def test_pedantic_runs_setup_before_each_round(self):
+        calls = []
+        runner = Benchmark('cold')
+        value = runner.pedantic(lambda x: calls.append('run') or x * 2, args=(21,),
+                                setup=lambda: calls.append('setup'), rounds=2, warmup_rounds=1)
+        assert value == 42
+        assert calls == ['setup', 'run'] * 3
+        assert runner.result()['stats']['rounds'] == 2
+
+    def test_untimed_benchmark_has_no_result(self):
+        assert Benchmark('never').result() is None
+
+
+class TestResults:
+    """Test results files and baseline comparison."""
+
+    def test_save_and_load(self, temp_directory):
+        runner = Benchmark('lookup', group='cache', rounds=2)
+        runner(len, 'abc')
+        path = save_results(str(temp_directory / 'out' / 'latest.json'), [runner.result()], ['bench_x: no ffmpeg'])
+
+        loaded = load_results(path)
+        assert loaded['benchmarks'][0]['name'] == 'lookup'
+        assert loaded['skipped'] == ['bench_x: no ffmpeg']
+        assert loaded['metadata']['python']
+
+    def test_compare_statuses(self):
+        rows = compare_results(results(slower=1.0, faster=1.0, same=1.0, gone=1.0),
+                               results(slower=1.5, faster=0.5, same=1.1, added=2.0), threshold=0.25)
+        statuses = {row['name']: row['status'] for row in rows}
+        assert statuses == {'slower': 'regression', 'faster': 'improvement', 'same': 'ok',
+                            'gone': 'missing', 'added': 'new'}
+        assert next(row for row in rows if row['name'] == 'slower')['ratio'] == pytest.approx(1.5)
+        assert any('x1.50 regression' in line for line in format_comparison(rows))
+
+
+class TestSyntheticFixtures:
+    """Test the offline results page and local server."""
+
+    def test_results_page_served_locally(self, temp_directory):
+        write_results_page(str(temp_directory / 'results.html'), cards=5)
+        with serve_directory(str(temp_directory)) as base_url:
+            page = urllib.request.urlopen(f"{base_url}/results.html", timeout=10).read().decode('utf-8')
+        assert '<header>RESULTS</header>' in page
+        assert page.count('class="movie-card"') == 5
@@ -0,0 +1,81 @@
+"""
+Unit Tests for StreamGank Vizard Clip Uploads
+
+Tests the remote-fetch Cloudinary upload with server-side trimming and the
+local download + chunked upload fallback.
+"""
+
+from unittest.mock import Mock, patch
+
+from video import clip_processor
+from video.clip_processor import _build_clip_upload_options, _download_and_upload_vizard_clip
+
+VIZARD_URL = 'https://vizard.example/clip.mp4'
+
+
+class TestClipUploadOptions:
+    """Test Cloudinary upload option building."""
+
+    def test_trim_adds_offsets_before_resize(self):
+        """Test trimming is the first incoming transformation."""
+        options = _build_clip_upload_options('The Matrix', '42', 'youtube_shorts', trim_to=20.0)
+
+        assert options['public_id'] == 'the_matrix_42'
+        assert options['transformation'][0] == {'start_offset': '0', 'end_offset': '20'}
+        assert options['transformation'][1]['crop'] == 'fill'
+
+    def test_no_trim_keeps_mode_transformation(self):
+        """Test untrimmed uploads use the mode transformation unchanged."""
+        options = _build_clip_upload_options('Alien', None, 'fit')
+
+        assert options['public_id'] == 'alien'
+        assert options['transformation'] == clip_processor.CLIP_TRANSFORM_MODES['fit']
+
+
+class TestVizardClipUpload:
+    """Test remote and fallback upload paths."""
+
+    @patch('video.clip_processor.get_http_session')
+    @patch('video.clip_processor.cloudinary.uploader.upload')
+    def test_remote_upload_trims_server_side(self, mock_upload, mock_session, monkeypatch):
+        """Test long clips are fetched and trimmed by Cloudinary without downloading."""
+        monkeypatch.delenv('CLIP_UPLOAD_MODE', raising=False)
+        mock_upload.return_value = {'secure_url': 'https://res.cloudinary.com/clip.mp4'}
+
+        url = _download_and_upload_vizard_clip(VIZARD_URL, 'The Matrix', '42', duration=34.5)
+
+        assert url == 'https://res.cloudinary.com/clip.mp4'
+        assert mock_upload.call_args[0][0] == VIZARD_URL
+        assert mock_upload.call_args[1]['transformation'][0]['end_offset'] == '20'
+        mock_session.assert_not_called()
+
+    @patch('video.clip_processor.cloudinary.uploader.upload')
+    def test_short_remote_clip_is_not_trimmed(self, mock_upload, monkeypatch):
+        """Test clips within the limit are uploaded as-is."""
+        monkeypatch.delenv('CLIP_UPLOAD_MODE', raising=False)
+        mock_upload.return_value = {'secure_url': 'https://res.cloudinary.com/clip.mp4'}
+
+        _download_and_upload_vizard_clip(VIZARD_URL, 'Alien', '7', duration=15.0)
+
+        assert 'start_offset' not in mock_upload.call_args[1]['transformation'][0]
+
+    @patch('video.clip_processor._check_and_trim_clip_duration', side_effect=lambda path, *args: path)
+    @patch('video.clip_processor.get_http_session')
+    @patch('video.clip_processor.cloudinary.uploader.upload_large')
+    @patch('video.clip_processor.cloudinary.uploader.upload')
+    def test_falls_back_to_chunked_local_upload(self, mock_upload, mock_upload_large, mock_session,
+                                                mock_trim, monkeypatch):
+        """Test a failed remote fetch downloads in large chunks and uses upload_large."""
+        monkeypatch.delenv('CLIP_UPLOAD_MODE', raising=False)
+        mock_upload.side_effect = RuntimeError('Resource not found')
+        response = Mock()
+        response.iter_content.return_value = [b'x' * 1024]
+        mock_session.return_value.get.return_value = response
+        mock_upload_large.return_value = {'secure_url': 'https://res.cloudinary.com/local.mp4'}
+
+        url = _download_and_upload_vizard_clip(VIZARD_URL, 'Alien', '7', duration=25.0)
+
+        assert url == 'https://res.cloudinary.com/local.mp4'
+        assert response.iter_content.call_args[1]['chunk_size'] == 1024 * 1024
+        assert mock_upload_large.call_args[1]['chunk_size'] == 20 * 1024 * 1024
+        mock_trim.assert_called_once()
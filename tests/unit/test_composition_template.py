@@ -0,0 +1,142 @@
+"""
+Unit Tests for StreamGank Composition Templates
+
+Tests slot compilation and filling, structural diffs, composition
+validation, and the compiled StreamGank layout cached per poster timing mode.
+"""
+
+import json
+
+import pytest
+
+from video import video_processor
+from video.composition_builder import (HeyGenLast3sStrategy, WithMovieClipsStrategy, build_video_composition,
+                                       get_composition_template)
+from video.composition_template import CompositionTemplate, Slot, diff_compositions, validate_composition
+
+HEYGEN_URLS = {key: f"https://heygen/{key}.mp4" for key in ('movie1', 'movie2', 'movie3', 'outro')}
+COVERS = [f"https://cdn/poster{i}.png" for i in range(1, 4)]
+CLIPS = [f"https://cdn/clip{i}.mp4" for i in range(1, 4)]
+HEYGEN_DURATIONS = {'heygen1': 12.0, 'heygen2': 10.5, 'heygen3': 9.0, 'outro': 6.0}
+CLIP_DURATIONS = {'clip1': 8.0, 'clip2': 7.5, 'clip3': 9.25}
+
+
+def element(**overrides):
+    base = {'type': 'video', 'track': 1, 'time': 0, 'duration': 5, 'source': 'https://cdn/a.mp4'}
+    base.update(overrides)
+    return base
+
+
+def composition(*elements):
+    return {'width': 1080, 'height': 1920, 'frame_rate': 30, 'elements': list(elements)}
+
+
+class TestCompositionTemplate:
+    """Test compiling and filling slot templates."""
+
+    TREE = {'type': 'image', 'source': Slot('url'), 'duration': Slot('duration'),
+            'animations': [{'type': 'fade', 'duration': 0.5}], 'volume': None}
+
+    def test_fill_replaces_slots(self):
+        template = CompositionTemplate('poster', self.TREE)
+        assert template.slots == {'url', 'duration'}
+        assert template.fill({'url': 'https://cdn/p.png', 'duration': 3.5, 'extra': 1}) == {
+            'type': 'image', 'source': 'https://cdn/p.png', 'duration': 3.5,
+            'animations': [{'type': 'fade', 'duration': 0.5}], 'volume': None}
+
+    def test_missing_slots_fail_fast(self):
+        template = CompositionTemplate('poster', self.TREE)
+        with pytest.raises(ValueError, match='duration, url'):
+            template.fill({})
+
+    def test_fills_are_independent(self):
+        template = CompositionTemplate('poster', self.TREE)
+        first = template.fill({'url': 'a', 'duration': 1})
+        first['animations'][0]['duration'] = 99
+        assert template.fill({'url': 'b', 'duration': 2})['animations'][0]['duration'] == 0.5
+
+    def test_unsupported_values_are_rejected(self):
+        with pytest.raises(TypeError):
+            CompositionTemplate('bad', {'time': float('nan')})
+        with pytest.raises(TypeError):
+            CompositionTemplate('bad', {'items': ('a', 'b')})
+
+
+class TestDiffAndValidation:
+    """Test structural diffs and pre-render validation."""
+
+    def test_diff_paths_and_tolerance(self):
+        expected = composition(element(duration=5.0), element(source='https://cdn/b.mp4'))
+        actual = composition(element(duration=5.004), element(source='https://cdn/c.mp4', volume='40%'))
+
+        assert diff_compositions(expected, actual, tolerance=0.01) == [
+            {'path': '$.elements[1].source', 'expected': 'https://cdn/b.mp4', 'actual': 'https://cdn/c.mp4'},
+            {'path': '$.elements[1].volume', 'expected': None, 'actual': '40%'}
+        ]
+        assert diff_compositions(expected, actual)[0]['path'] == '$.elements[0].duration'
+        assert diff_compositions(expected, expected) == []
+        assert diff_compositions([1], [1, 2]) == [{'path': '$[1]', 'expected': None, 'actual': 2}]
+
+    def test_validation_problems(self):
+        assert validate_composition(composition(element(), element(type='audio', source=None, time='auto'))) == []
+
+        problems = validate_composition({
+            'width': 1080, 'height': 1920,
+            'elements': [
+                element(duration=-1),
+                element(source=''),
+                {'type': 'image', 'source': 'https://cdn/p.png'},
+                element(animations=[{'type': 'fade', 'duration': 0}]),
+                {'type': 'composition', 'track': 2, 'elements': [element(time='later', track=None)]}
+            ]
+        })
+        assert problems == [
+            '$: missing frame_rate',
+            '$.elements[0].duration: must be positive (-1)',
+            '$.elements[1]: video without source',
+            '$.elements[2]: missing track',
+            '$.elements[3].animations[0].duration: must be positive (0)',
+            "$.elements[4].elements[0].time: unknown time value 'later'"
+        ]
+
+
+class TestCompiledLayout:
+    """Test the StreamGank layout compiled once per poster timing mode."""
+
+    def test_cached_per_mode(self):
+        compiled = get_composition_template('heygen_last3s')
+        assert get_composition_template('heygen_last3s') is compiled
+        assert isinstance(compiled.timing_strategy, HeyGenLast3sStrategy)
+        assert isinstance(get_composition_template('with_movie_clips').timing_strategy, WithMovieClipsStrategy)
+
+    def test_built_layout_is_valid(self):
+        compiled = get_composition_template()
+        built = compiled.build(HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS, CLIP_DURATIONS,
+                               scroll_video_url='https://cdn/scroll.mp4')
+        assert validate_composition(built) == []
+        assert built['elements'][-1]['source'] == 'https://cdn/scroll.mp4'
+        assert len(built['elements']) == len(compiled.build(HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS,
+                                                            CLIP_DURATIONS)['elements']) + 1
+
+        # Same layout, new timings: only times and durations change
+        longer = dict(HEYGEN_DURATIONS, heygen2=14.0)
+        retimed = compiled.build(HEYGEN_URLS, COVERS, CLIPS, longer, CLIP_DURATIONS,
+                                 scroll_video_url='https://cdn/scroll.mp4')
+        changed = {difference['path'].rsplit('.', 1)[-1] for difference in diff_compositions(built, retimed)}
+        assert changed and changed <= {'time', 'duration'}
+
+    def test_build_video_composition_uses_template(self, monkeypatch):
+        monkeypatch.setattr(video_processor, 'get_video_duration_from_url', lambda url, timeout=30: 8.0)
+        known = {'movie1': 12.0, 'movie2': 10.5, 'movie3': 9.0, 'outro': 6.0}
+
+        result = build_video_composition(HEYGEN_URLS, COVERS, CLIPS, known_durations=known,
+                                         known_clip_durations={'clip1': 8.0, 'clip2': 7.5, 'clip3': 9.25})
+        expected = get_composition_template().build(HEYGEN_URLS, COVERS, CLIPS, HEYGEN_DURATIONS, CLIP_DURATIONS)
+        assert json.dumps(result) == json.dumps(expected)
+
+    def test_invalid_inputs_are_caught_before_render(self, monkeypatch):
+        monkeypatch.setattr(video_processor, 'get_video_duration_from_url', lambda url, timeout=30: 8.0)
+        with pytest.raises(RuntimeError, match='not a finite number'):
+            build_video_composition(HEYGEN_URLS, COVERS, CLIPS,
+                                    known_durations={'movie1': 12.0, 'movie2': 10.5, 'movie3': 9.0, 'outro': 6.0},
+                                    known_clip_durations={'clip1': 8.0, 'clip2': float('nan'), 'clip3': 9.25})
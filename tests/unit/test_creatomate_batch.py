@@ -0,0 +1,103 @@
+"""
+Unit Tests for StreamGank Creatomate Batch Rendering
+
+Tests concurrent submission and the multiplexed completion poller.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from video.creatomate_client import create_multiple_videos, iter_batch_completion, wait_for_batch_completion
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleep()."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch('video.creatomate_client.time', clock):
+        yield clock
+
+
+def scripted_status(clock, finish_times, progress_rate=1.0):
+    """Renders report progress until their finish time, then succeed (or fail if negative)."""
+    calls = []
+
+    def check(render_id, silent=False):
+        calls.append((clock.now, render_id))
+        finish = finish_times[render_id]
+        if clock.now >= abs(finish):
+            if finish < 0:
+                return {'status': 'failed', 'error': 'bad source'}
+            return {'status': 'succeeded', 'url': f"https://cdn.example/{render_id}.mp4", 'progress': 100}
+        return {'status': 'processing', 'progress': min(99, int(clock.now * progress_rate))}
+
+    return check, calls
+
+
+class TestBatchSubmission:
+    """Test concurrent render submission."""
+
+    @patch('video.creatomate_client.create_creatomate_video')
+    def test_submissions_keep_config_order(self, mock_create):
+        """Test all configs are submitted and failures are reported per video."""
+        def create(heygen_video_urls, **kwargs):
+            if heygen_video_urls == 'broken':
+                raise RuntimeError('composition invalid')
+            return None if heygen_video_urls == 'rejected' else f"render_{heygen_video_urls}"
+
+        mock_create.side_effect = create
+        configs = [{'heygen_video_urls': name} for name in ('a', 'broken', 'b', 'rejected', 'c')]
+
+        results = create_multiple_videos(configs, max_workers=3)
+
+        assert [entry['render_id'] for entry in results['render_ids']] == ['render_a', 'render_b', 'render_c']
+        assert [entry['video_id'] for entry in results['render_ids']] == ['video_1', 'video_3', 'video_5']
+        assert results['successful_renders'] == 3 and results['failed_renders'] == 2
+        assert sorted(results['errors']) == ['video_2: composition invalid', 'video_4: Render submission failed']
+
+
+class TestBatchCompletion:
+    """Test the multiplexed poller."""
+
+    def test_renders_yield_in_completion_order(self, clock):
+        """Test a fast render is reported while a slow one is still rendering."""
+        check, calls = scripted_status(clock, {'slow': 600, 'fast': 40, 'broken': -20})
+
+        with patch('video.creatomate_client.check_render_status', side_effect=check):
+            completed = [(clock.now, render_id, status['status'])
+                         for render_id, status in iter_batch_completion(['slow', 'fast', 'broken'], poll_interval=10)]
+
+        assert [render_id for _, render_id, _ in completed] == ['broken', 'fast', 'slow']
+        assert completed[1][2] == 'succeeded' and completed[1][0] < 60
+        assert completed[0][2] == 'failed'
+        # Adaptive intervals stay within the 5-30s bounds of _calculate_adaptive_poll_interval
+        slow_polls = [at for at, render_id in calls if render_id == 'slow']
+        gaps = [b - a for a, b in zip(slow_polls, slow_polls[1:])]
+        assert all(5 <= gap <= 30 for gap in gaps)
+
+    def test_timeout_and_callback(self, clock):
+        """Test renders exceeding max_wait_time are returned with timeout analytics."""
+        check, _ = scripted_status(clock, {'done': 15, 'stuck': 10 ** 6}, progress_rate=0.1)
+        finished = []
+
+        with patch('video.creatomate_client.check_render_status', side_effect=check):
+            results = wait_for_batch_completion(['done', 'stuck'], max_wait_time=120, poll_interval=10,
+                                                on_complete=lambda render_id, status: finished.append(render_id))
+
+        assert finished == ['done', 'stuck']
+        assert results['done']['status'] == 'succeeded'
+        assert 'render_analytics' in results['done']
+        assert results['stuck']['status'] == 'processing'
+        assert results['stuck']['timeout_analytics']['elapsed_time'] > 120
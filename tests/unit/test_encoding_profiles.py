@@ -0,0 +1,88 @@
+"""
+Unit Tests for StreamGank Encoding Profiles
+
+Tests profile-to-ffmpeg argument building, per-call overrides, stream copy
+and the ffmpeg thread budget.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from config import settings
+from config.settings import ENCODING_PROFILES, get_encoding_args, get_encoding_profile, get_ffmpeg_threads
+
+
+def _option(args, flag):
+    return args[args.index(flag) + 1] if flag in args else None
+
+
+class TestEncodingArgs:
+    """Test building ffmpeg codec arguments from profiles."""
+
+    def test_final_profile(self):
+        args = get_encoding_args('final', threads=2)
+        assert args[:2] == ['-c:v', 'libx264']
+        assert _option(args, '-crf') == '15'
+        assert _option(args, '-preset') == 'slow'
+        assert _option(args, '-profile:v') == 'high'
+        assert _option(args, '-pix_fmt') == 'yuv420p'
+        assert _option(args, '-b:a') == '192k'
+        assert _option(args, '-threads') == '2'
+        assert args[-2:] == ['-movflags', '+faststart']
+
+    def test_intermediate_profiles_are_faster(self):
+        presets = ['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow']
+        final = presets.index(ENCODING_PROFILES['final']['preset'])
+        for profile in ('intermediate', 'intermediate_lossless', 'preview'):
+            assert presets.index(ENCODING_PROFILES[profile]['preset']) < final
+
+        lossless = get_encoding_args('intermediate_lossless', threads=1)
+        assert _option(lossless, '-qp') == '0'
+        assert '-crf' not in lossless
+        assert '-movflags' not in lossless
+
+    def test_overrides_change_and_remove_options(self):
+        args = get_encoding_args('final', threads=1, crf=16, tune='film', frame_rate=30,
+                                 video_profile=None, audio_bitrate=None)
+        assert _option(args, '-crf') == '16'
+        assert _option(args, '-tune') == 'film'
+        assert _option(args, '-r') == '30'
+        assert '-profile:v' not in args
+        assert '-b:a' not in args
+        # Overrides never leak into the shared profile
+        assert ENCODING_PROFILES['final']['crf'] == 15
+        assert 'tune' not in ENCODING_PROFILES['final']
+
+    def test_stream_copy(self):
+        assert get_encoding_args('copy') == ['-c', 'copy']
+        assert get_encoding_args('copy', faststart=True) == ['-c', 'copy', '-movflags', '+faststart']
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError, match='Unknown encoding profile'):
+            get_encoding_profile('lossy')
+
+
+class TestFfmpegThreads:
+    """Test the per-process encoder thread budget."""
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv('FFMPEG_THREADS', '3')
+        assert get_ffmpeg_threads() == 3
+        # The media executor adds -threads; profiles only carry an explicit per-call value
+        assert '-threads' not in get_encoding_args('intermediate')
+
+    def test_auto_splits_cores_across_concurrent_encodes(self, monkeypatch):
+        monkeypatch.delenv('FFMPEG_THREADS', raising=False)
+        monkeypatch.setitem(settings.VIDEO_SETTINGS, 'ffmpeg_threads', 0)
+        monkeypatch.setitem(settings.WORKFLOW_SETTINGS, 'batch_concurrency', 2)
+        monkeypatch.setitem(settings.WORKFLOW_SETTINGS, 'max_movies', 3)
+
+        with patch('config.settings.os.cpu_count', return_value=12):
+            assert get_ffmpeg_threads() == 2
+        with patch('config.settings.os.cpu_count', return_value=4):
+            assert get_ffmpeg_threads() == 1
+
+    def test_configured_value(self, monkeypatch):
+        monkeypatch.delenv('FFMPEG_THREADS', raising=False)
+        monkeypatch.setitem(settings.VIDEO_SETTINGS, 'ffmpeg_threads', 6)
+        assert get_ffmpeg_threads() == 6
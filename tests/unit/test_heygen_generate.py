@@ -0,0 +1,122 @@
+"""
+Unit Tests for StreamGank HeyGen Video Generation
+
+Tests concurrent generate submission, per-request retries and batch flattening.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from ai import heygen_client
+from ai.heygen_client import create_heygen_video, create_heygen_videos_batch
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+SCRIPTS = {
+    'movie1': {'text': 'First pick is a slow-burn thriller.'},
+    'movie2': {'text': 'Second pick will keep you guessing.'},
+    'movie3': {'text': 'Third pick is pure nostalgia.'},
+    'outro': {'text': 'Follow for more picks!'}
+}
+
+
+def response(status_code, video_id=None, headers=None):
+    mock = Mock(status_code=status_code, headers=headers or {}, text='')
+    mock.json.return_value = {'data': {'video_id': video_id}}
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def heygen_env(monkeypatch):
+    monkeypatch.setattr(rate_limiter, '_limiters', {'heygen': RateLimiter(None, name='heygen')})
+    monkeypatch.setattr(heygen_client, '_get_heygen_headers', lambda: {'X-Api-Key': 'test'})
+    monkeypatch.setattr('utils.test_data_cache.is_local_mode', lambda: False)
+    monkeypatch.setattr(heygen_client, 'validate_script_content', lambda text: True)
+    monkeypatch.setattr(heygen_client, 'time', Mock(sleep=Mock()))
+
+
+class TestConcurrentGenerate:
+    """Test generate requests run in parallel."""
+
+    def test_all_scripts_submitted_concurrently(self):
+        """Test the four generate requests overlap instead of running one after another."""
+        # Every request waits for all four to be in flight - serial submission would time out
+        barrier = threading.Barrier(len(SCRIPTS), timeout=5)
+
+        def post(url, headers, json, timeout):
+            barrier.wait()
+            return response(200, f"vid_{json['title'].split()[-1]}")
+
+        session = Mock(post=Mock(side_effect=post))
+        with patch('ai.heygen_client.get_http_session', return_value=session):
+            videos = create_heygen_video(SCRIPTS, template_id='tmpl')
+
+        assert list(videos) == ['movie1', 'movie2', 'movie3', 'outro']
+        assert videos['outro'] == 'vid_outro'
+        assert rate_limiter.get_rate_limiter('heygen').stats()['acquired'] == 4
+
+    def test_failed_request_retries_alone(self):
+        """Test a rate-limited or failing request is retried without failing the rest."""
+        calls = {}
+
+        def post(url, headers, json, timeout):
+            key = json['title'].split()[-1]
+            calls[key] = calls.get(key, 0) + 1
+            if key == 'movie2' and calls[key] == 1:
+                return response(429, headers={'Retry-After': '1'})
+            if key == 'movie3':
+                return response(500)
+            return response(200, f"vid_{key}")
+
+        session = Mock(post=Mock(side_effect=post))
+        submitted_at = {}
+        with patch('ai.heygen_client.get_http_session', return_value=session):
+            videos = create_heygen_video(SCRIPTS, template_id='tmpl', submitted_at=submitted_at)
+
+        assert videos == {'movie1': 'vid_movie1', 'movie2': 'vid_movie2', 'outro': 'vid_outro'}
+        assert sorted(submitted_at) == ['movie1', 'movie2', 'outro']
+        assert calls == {'movie1': 1, 'movie2': 2, 'movie3': 3, 'outro': 1}
+        heygen_client.time.sleep.assert_any_call(1)
+
+    @pytest.mark.parametrize('retry_after, expected_wait', [
+        ('1.5', 1.5),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0),  # HTTP-date already in the past
+        ('soon', 2),  # Unparseable - exponential backoff
+    ])
+    def test_rate_limit_retry_after_formats(self, retry_after, expected_wait):
+        """Test fractional and HTTP-date Retry-After values still retry the render."""
+        calls = []
+
+        def post(url, headers, json, timeout):
+            calls.append(json['title'])
+            if len(calls) == 1:
+                return response(429, headers={'Retry-After': retry_after})
+            return response(200, 'vid_movie1')
+
+        session = Mock(post=Mock(side_effect=post))
+        with patch('ai.heygen_client.get_http_session', return_value=session):
+            videos = create_heygen_video({'movie1': SCRIPTS['movie1']}, template_id='tmpl')
+
+        assert videos == {'movie1': 'vid_movie1'}
+        heygen_client.time.sleep.assert_called_once_with(expected_wait)
+
+
+class TestBatchGenerate:
+    """Test batches share one submission."""
+
+    @patch('ai.heygen_client._create_videos_concurrently')
+    def test_batches_are_flattened(self, mock_create):
+        """Test every batch's scripts go out in a single concurrent submission."""
+        mock_create.side_effect = lambda jobs, *args: {
+            job_key: f"vid_{job_key[0]}_{key}" for job_key, key, _ in jobs if key != 'movie2'
+        }
+        batches = [{'movie1': 'a', 'movie2': 'b'}, {'movie2': 'c'}, {'movie1': 'd'}]
+
+        results = create_heygen_videos_batch(batches, {'template_id': 'tmpl'})
+
+        assert mock_create.call_count == 1
+        assert len(mock_create.call_args[0][0]) == 4
+        assert results['batch_results']['batch_1']['video_ids'] == {'movie1': 'vid_batch_1_movie1'}
+        assert results['batch_results']['batch_2']['status'] == 'failed'
+        assert results['successful_batches'] == 2 and results['total_videos'] == 2
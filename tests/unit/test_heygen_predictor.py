@@ -0,0 +1,261 @@
+"""
+Unit Tests for StreamGank HeyGen Render Predictor
+
+Tests the least-squares fit from job log observations, the heuristic
+fallback, the poll schedule around the predicted finish, reported durations
+replacing FFprobe, and speculative compositions re-timed with exact durations.
+"""
+
+import json
+import threading
+import types
+
+import pytest
+
+from ai import heygen_client, heygen_predictor
+from ai.heygen_predictor import (HEYGEN_RENDER_EVENT, HeyGenPredictor, HeyGenRenderModel, fit_linear,
+                                 heygen_script_texts, next_poll_delay, script_features)
+from utils.job_log_store import JobLogStore
+from video import composition_builder, video_processor
+
+SETTINGS = {
+    'enabled': True, 'min_samples': 4, 'max_samples': 100, 'refresh_seconds': 600,
+    'first_check_seconds': 10, 'idle_check_seconds': 60, 'early_fraction': 0.8,
+    'near_interval': 5, 'late_fraction': 1.5, 'late_interval': 30
+}
+
+SCRIPTS = {
+    'intro': 'Here are the best horror movies on Netflix.',
+    'movie1': {'text': 'Alien is a masterpiece. Watch it tonight.'},
+    'movie2': 'The Thing will freeze your blood.',
+    'movie3': 'It Follows never lets go.',
+    'outro': 'Follow for more!'
+}
+
+
+def observation(words, sentences=2):
+    return {
+        'script_words': words,
+        'script_sentences': sentences,
+        'render_seconds': 60 + 4 * words + 10 * sentences,
+        'duration_seconds': 1 + 0.4 * words
+    }
+
+
+class FakeClock:
+    """time module stand-in whose sleep() advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRenderModel:
+    """Test fitting and predictions."""
+
+    def test_script_features(self):
+        assert script_features('Alien is great. Watch it! Now?') == {'words': 6, 'sentences': 3, 'chars': 30}
+        texts = heygen_script_texts(SCRIPTS)
+        assert 'intro' not in texts
+        assert texts['movie1'] == 'Here are the best horror movies on Netflix. Alien is a masterpiece. Watch it tonight.'
+
+    def test_fit_recovers_linear_relation(self):
+        rows = [[1.0, w, s] for w, s in ((10, 1), (20, 3), (30, 2), (40, 5), (50, 4))]
+        coefficients = fit_linear(rows, [5 + 2 * r[1] + 3 * r[2] for r in rows], ridge=0)
+        assert coefficients == pytest.approx([5, 2, 3], abs=1e-6)
+
+    def test_fitted_predictions(self):
+        model = HeyGenRenderModel(min_samples=4).fit([observation(w, s) for w, s in ((10, 1), (25, 2), (40, 3), (60, 4), (80, 3))])
+        assert model.fitted and model.sample_count == 5
+
+        prediction = model.predict(' '.join(['word'] * 30) + '. End. Now.')
+        assert prediction['source'] == 'model'
+        assert prediction['render_seconds'] == pytest.approx(60 + 4 * 32 + 10 * 3, abs=1)
+        assert prediction['duration_seconds'] == pytest.approx(1 + 0.4 * 32, abs=0.1)
+
+    def test_heuristic_until_enough_samples(self):
+        model = HeyGenRenderModel(min_samples=4).fit([observation(10), observation(20), {'script_words': 'bad'}])
+        assert not model.fitted
+        text = 'Short script.'
+        prediction = model.predict(text)
+        assert prediction['source'] == 'heuristic'
+        assert prediction['render_seconds'] == heygen_client.estimate_heygen_processing_time(len(text)) * 60
+        assert prediction['duration_seconds'] == heygen_client.estimate_video_duration(text)
+
+    def test_refit_from_job_logs(self, temp_directory):
+        store = JobLogStore(str(temp_directory / 'jobs'))
+        try:
+            for i, words in enumerate((10, 20, 30, 40, 50)):
+                store.append('job_a', json.dumps({
+                    'timestamp': '2025-01-01T00:00:00', 'job_id': 'job_a', 'event_type': HEYGEN_RENDER_EVENT,
+                    'level': 'info', 'message': 'rendered', 'details': observation(words, 1 + i % 3),
+                    'process_time': 1000.0 + i
+                }))
+            store.append('job_a', json.dumps({'timestamp': '2025-01-01T00:00:00', 'job_id': 'job_a',
+                                              'event_type': 'step_start', 'level': 'info', 'message': 'x',
+                                              'details': {}, 'process_time': 2000.0}))
+
+            predictor = HeyGenPredictor(log_store=store, settings=SETTINGS)
+            assert predictor.predict('one two three four five six seven eight nine ten.')['source'] == 'model'
+            assert predictor.model.sample_count == 5
+            assert predictor.refresh() is predictor.model  # Not stale yet
+        finally:
+            store.close()
+
+
+class TestPollSchedule:
+    """Test status checks are scheduled around the predicted finish."""
+
+    def test_next_poll_delay(self):
+        assert next_poll_delay(0, 300, SETTINGS) == 10
+        assert next_poll_delay(10, 300, SETTINGS) == 60
+        assert next_poll_delay(200, 300, SETTINGS) == 40  # Lands on 80% of the prediction
+        assert next_poll_delay(240, 300, SETTINGS) == 5
+        assert next_poll_delay(460, 300, SETTINGS) == 30
+
+    def test_wait_checks_around_prediction(self, monkeypatch):
+        clock = FakeClock()
+        checks = []
+
+        def fake_status(video_id, silent=False):
+            checks.append(clock.now - 1000.0)
+            if clock.now - 1000.0 >= 290:
+                return {'status': 'completed', 'video_url': 'https://heygen/v.mp4', 'data': {'duration': 12.5}}
+            return {'status': 'processing', 'video_url': '', 'data': {}}
+
+        monkeypatch.setattr(heygen_client, 'time', clock)
+        monkeypatch.setattr(heygen_client, 'check_heygen_video_status', fake_status)
+        monkeypatch.setattr(heygen_predictor, 'get_heygen_prediction_settings', lambda: SETTINGS)
+        monkeypatch.setattr(heygen_predictor.HeyGenPredictor, 'predict',
+                            lambda self, text: {'render_seconds': 300.0, 'duration_seconds': 12.0, 'source': 'model'})
+
+        result = heygen_client.wait_for_heygen_video('video_123456', script_text='Alien rocks.', started_at=1000.0)
+
+        assert result['success'] and result['duration'] == 12.5
+        assert result['render_seconds'] == 290
+        assert result['completed_on_first_check'] is False
+        # 0, 10, then sparse until 240, then every 5s - the fixed tiers needed 24 checks
+        assert checks[:4] == [0, 10, 70, 130]
+        assert len(checks) == 16
+
+
+class TestDurationsForCreatomate:
+    """Test reported durations and observations from the HeyGen wait."""
+
+    def test_reported_durations_and_observations(self, monkeypatch):
+        recorded = []
+        waits = {}
+        # Every wait has to be in flight at once - polling one video after another would time out
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_wait(video_id, script_length=None, max_wait_minutes=45, script_text=None, started_at=None,
+                      show_progress=True, stop_event=None):
+            barrier.wait()
+            waits[video_id] = (script_text, started_at)
+            return {'success': True, 'video_url': f"https://heygen/{video_id}.mp4", 'render_seconds': 100.0,
+                    'duration': 10.0 if video_id != 'v4' else None, 'completed_on_first_check': video_id == 'v3'}
+
+        monkeypatch.setattr('utils.test_data_cache.is_local_mode', lambda: False)
+        monkeypatch.setattr(heygen_client, 'wait_for_heygen_video', fake_wait)
+        monkeypatch.setattr('utils.media_executor.get_media_job', lambda: 'job_x')
+        monkeypatch.setattr(heygen_predictor.HeyGenPredictor, 'record_observation',
+                            lambda self, *args: recorded.append(args))
+
+        durations = {}
+        urls = heygen_client.get_heygen_videos_for_creatomate(
+            {'movie1': 'v1', 'movie2': 'v2', 'movie3': 'v3', 'outro': 'v4'}, SCRIPTS, durations=durations,
+            submitted_at={'movie1': 1000.0, 'movie2': 1002.5, 'movie3': 1003.0})
+
+        assert urls['outro'] == 'https://heygen/v4.mp4'
+        assert durations == {'movie1': 10.0, 'movie2': 10.0, 'movie3': 10.0}
+        assert waits['v1'][0].startswith('Here are the best horror movies')
+        assert waits['v2'][1] == 1002.5 and waits['v4'][1] is None
+        # movie3 was already done at the first check and outro has no submission time
+        assert sorted(args[:3] for args in recorded) == [('job_x', 'movie1', 'v1'), ('job_x', 'movie2', 'v2')]
+
+    def test_failed_video_stops_the_other_waits(self, monkeypatch):
+        stopped = []
+
+        def fake_wait(video_id, script_length=None, max_wait_minutes=45, script_text=None, started_at=None,
+                      show_progress=True, stop_event=None):
+            if video_id == 'v2':
+                return {'success': False, 'status': 'failed', 'video_url': '', 'data': {}}
+            stopped.append(stop_event.wait(timeout=5))
+            return {'success': False, 'status': 'cancelled', 'video_url': '', 'data': {}}
+
+        monkeypatch.setattr('utils.test_data_cache.is_local_mode', lambda: False)
+        monkeypatch.setattr(heygen_client, 'wait_for_heygen_video', fake_wait)
+
+        assert heygen_client.get_heygen_videos_for_creatomate({'movie1': 'v1', 'movie2': 'v2'}, SCRIPTS) is None
+        assert stopped == [True]
+
+    def test_record_observation_logs_event(self, monkeypatch):
+        events = []
+        fake_logger = types.SimpleNamespace(log_job_event=lambda *args: events.append(args))
+        monkeypatch.setattr('utils.job_logger.get_job_logger', lambda: fake_logger)
+
+        predictor = HeyGenPredictor(log_store=types.SimpleNamespace(query=lambda **kwargs: []), settings=SETTINGS)
+        assert predictor.record_observation(None, 'movie1', 'v1', 'Alien rocks.', 120.0, 9.0) is None
+
+        details = predictor.record_observation('job_x', 'movie1', 'v1', 'Alien rocks.', 120.0, 9.0)
+        job_id, event_type, _, logged = events[0]
+        assert (job_id, event_type) == ('job_x', HEYGEN_RENDER_EVENT)
+        assert logged == details
+        assert details['script_words'] == 2 and details['render_seconds'] == 120.0
+
+
+class TestSpeculativeComposition:
+    """Test compositions laid out from predictions and re-timed with exact durations."""
+
+    HEYGEN_URLS = {key: f"https://heygen/{key}.mp4" for key in ('movie1', 'movie2', 'movie3', 'outro')}
+    COVERS = [f"https://cdn/poster{i}.png" for i in range(1, 4)]
+    CLIPS = [f"https://cdn/clip{i}.mp4" for i in range(1, 4)]
+
+    @pytest.fixture
+    def probes(self, monkeypatch):
+        probed = []
+
+        def fake_probe(url, timeout=30):
+            probed.append(url)
+            return 8.0
+
+        monkeypatch.setattr(video_processor, 'get_video_duration_from_url', fake_probe)
+        monkeypatch.setattr(heygen_predictor.HeyGenPredictor, 'predict_scripts', lambda self, scripts: {
+            key: {'render_seconds': 200.0, 'duration_seconds': 11.0, 'source': 'model'}
+            for key in ('movie1', 'movie2', 'movie3', 'outro')})
+        return probed
+
+    def test_known_durations_skip_ffprobe(self, probes):
+        durations = video_processor.calculate_video_durations(self.HEYGEN_URLS, known_durations={'movie1': 12.345})
+        assert durations['heygen1'] == 12.35
+        assert probes == [self.HEYGEN_URLS['movie2'], self.HEYGEN_URLS['movie3'], self.HEYGEN_URLS['outro']]
+
+    def test_draft_is_retimed_with_exact_durations(self, probes):
+        draft = composition_builder.prebuild_composition(SCRIPTS, self.COVERS, self.CLIPS)
+        assert draft['predicted_durations']['movie2'] == 11.0
+        assert draft['predicted_total_duration'] == 1 + 4 * 11.0 + 3 * 8.0 + 3
+        sources = json.dumps(draft['composition'])
+        assert composition_builder.SPECULATIVE_SOURCE_PREFIX + 'movie1' in sources
+        assert probes == self.CLIPS
+
+        exact = {'movie1': 12.0, 'movie2': 10.0, 'movie3': 9.5, 'outro': 6.0}
+        final = composition_builder.finalize_composition(draft, self.HEYGEN_URLS, self.COVERS, self.CLIPS,
+                                                         known_durations=exact)
+        expected = composition_builder.build_video_composition(self.HEYGEN_URLS, self.COVERS, self.CLIPS,
+                                                               known_durations=exact)
+        assert final == expected
+        assert composition_builder.SPECULATIVE_SOURCE_PREFIX not in json.dumps(final)
+        # Finalizing reused the draft's clip probes (the expected build probed them again)
+        assert probes == self.CLIPS * 2
+
+    def test_stale_draft_is_rebuilt(self, probes):
+        draft = composition_builder.prebuild_composition(SCRIPTS, self.COVERS, self.CLIPS)
+        composition_builder.finalize_composition(draft, self.HEYGEN_URLS, self.COVERS, self.CLIPS,
+                                                 poster_timing_mode='with_movie_clips',
+                                                 known_durations={key: 10.0 for key in self.HEYGEN_URLS})
+        assert probes == self.CLIPS * 2
@@ -0,0 +1,95 @@
+"""
+Unit Tests for StreamGank Single-Pass Highlight Composition
+
+Tests the filtergraph, the seeked-input ffmpeg command and the fallback to the
+multi-step extract + compose path.
+"""
+
+from unittest.mock import Mock, patch
+
+from video.clip_processor import (
+    _build_highlight_filtergraph,
+    _build_single_pass_highlight_command,
+    _compose_highlights_from_source
+)
+
+TRAILER = '/tmp/trailers/abc_trailer.mp4'
+
+
+def ffmpeg_result(returncode=0, output_path=None):
+    """Fake ffmpeg run that creates the output file on success."""
+    def run(cmd, **kwargs):
+        if returncode == 0 and output_path is None:
+            with open(cmd[-1], 'wb') as f:
+                f.write(b'mp4')
+        return Mock(returncode=returncode, stderr='' if returncode == 0 else 'Stream specifier :a matches no streams')
+    return run
+
+
+class TestHighlightFiltergraph:
+    """Test filtergraph construction."""
+
+    def test_dual_segments_concat_with_transitions(self):
+        """Test two segments get fades at the cut and one outro fade on the joined stream."""
+        graph = _build_highlight_filtergraph([9, 9], 'transitions')
+
+        assert graph.count('gblur=sigma=20') == 2
+        assert '[0:v]split=2' in graph and '[1:v]split=2' in graph
+        assert 'fade=in:st=0:d=0.3' in graph and 'fade=out:st=8.5:d=0.5' in graph
+        assert '[v0][a0][v1][a1]concat=n=2:v=1:a=1[vcat][acat]' in graph
+        assert graph.endswith('[acat]atrim=duration=18,afade=out:st=17:d=1[aout]')
+        assert '[vcat]trim=duration=18,fade=out:st=17:d=1[vout]' in graph
+
+    def test_single_segment_premium_grading(self):
+        """Test one segment uses the premium look with a 1.5s outro and no concat."""
+        graph = _build_highlight_filtergraph([15], 'single')
+
+        assert 'concat' not in graph
+        assert 'eq=contrast=1.15:brightness=0.08:saturation=1.25:gamma=0.98' in graph
+        assert '[v0]trim=duration=15,fade=out:st=13.5:d=1.5[vout]' in graph
+
+    def test_command_seeks_each_input_in_source(self):
+        """Test every segment is an input-side -ss/-t seek into the source trailer."""
+        segments = [{'start': 12.25, 'duration': 9}, {'start': 71.0, 'duration': 9}]
+        cmd = _build_single_pass_highlight_command(TRAILER, segments, 'out.mp4', 'transitions')
+
+        first_input = cmd.index('-i')
+        assert cmd[first_input - 4:first_input + 2] == ['-ss', '12.250', '-t', '9.000', '-i', TRAILER]
+        assert cmd.count('-i') == 2 and cmd.count(TRAILER) == 2
+        assert cmd.index('-filter_complex') > cmd.index('71.000')
+        assert cmd.count('-filter_complex') == 1 and cmd[-1] == 'out.mp4'
+
+
+class TestComposeFromSource:
+    """Test the single-pass path and its fallback."""
+
+    def test_single_pass_writes_no_intermediate_clips(self, temp_directory, monkeypatch):
+        """Test a successful render runs ffmpeg once and never extracts temp clips."""
+        monkeypatch.chdir(temp_directory)
+        with patch('video.clip_processor.run_media_command', side_effect=ffmpeg_result()) as mock_run, \
+             patch('video.clip_processor._extract_highlight_clips') as mock_extract:
+            final_clip = _compose_highlights_from_source(
+                TRAILER, [{'start': 10, 'duration': 9}, {'start': 60, 'duration': 9}], 'The Matrix', '42', 'youtube_shorts'
+            )
+
+        assert final_clip.endswith('the_matrix_42_enhanced_highlights.mp4')
+        assert mock_run.call_count == 1
+        mock_extract.assert_not_called()
+
+    def test_falls_back_to_multi_step(self, temp_directory, monkeypatch):
+        """Test a failed single-pass render uses extract + compose and removes the temp clips."""
+        monkeypatch.chdir(temp_directory)
+        clip = temp_directory / 'clip_1.mp4'
+        clip.write_bytes(b'mp4')
+
+        with patch('video.clip_processor.run_media_command', side_effect=ffmpeg_result(returncode=1)), \
+             patch('video.clip_processor._extract_highlight_clips', return_value=[str(clip)]) as mock_extract, \
+             patch('video.clip_processor._compose_highlights_with_transitions', return_value='composed.mp4') as mock_compose:
+            final_clip = _compose_highlights_from_source(
+                TRAILER, [{'start': 5, 'duration': 15}], 'Alien', '7', 'fit'
+            )
+
+        assert final_clip == 'composed.mp4'
+        mock_extract.assert_called_once_with(TRAILER, [{'start': 5, 'duration': 15}])
+        mock_compose.assert_called_once_with([str(clip)], 'Alien', '7', 'fit')
+        assert not clip.exists()
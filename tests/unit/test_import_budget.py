@@ -0,0 +1,143 @@
+"""
+Unit Tests for StreamGank Lazy Imports
+
+Tests lazy package attributes and module proxies, and enforces a startup
+budget: importing the packages (and the quick CLI paths) must stay under a
+`python -X importtime` limit without loading heavy third-party stacks.
+"""
+
+import os
+import sys
+import json
+import textwrap
+import subprocess
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from utils.lazy_imports import lazy_import
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Third-party stacks that must only load when a workflow step actually needs them
+HEAVY_MODULES = ('playwright', 'supabase', 'openai', 'cloudinary', 'PIL', 'cv2',
+                 'librosa', 'moviepy', 'yt_dlp', 'numpy')
+
+# Cumulative `-X importtime` budgets in milliseconds (generous for slow CI machines)
+PACKAGE_IMPORT_BUDGET_MS = 300
+CLI_IMPORT_BUDGET_MS = 1500
+
+
+def _import_profile(code: str):
+    """Run code in a fresh interpreter with -X importtime; return (total ms, loaded heavy modules)."""
+    probe = code + textwrap.dedent(f"""
+        import sys, json
+        print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))
+    """)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, timeout=60,
+        env={**os.environ, 'PYTHONPATH': str(PROJECT_ROOT)}
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name[1:].startswith(' '):  # Top-level imports only - nested ones are included in their parent
+            total_us += int(cumulative)
+    return total_us / 1000, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _available(*modules: str) -> bool:
+    return all(importlib.util.find_spec(module) is not None for module in modules)
+
+
+class TestStartupBudget:
+    """Test that package imports and quick CLI paths stay light."""
+
+    def test_package_imports_are_lazy(self):
+        elapsed_ms, heavy = _import_profile('import ai, video, media, database, utils, core, config\n')
+        assert heavy == []
+        assert elapsed_ms < PACKAGE_IMPORT_BUDGET_MS
+
+    def test_deferred_dependency_modules(self):
+        _, heavy = _import_profile(
+            'import ai.intelligent_highlight_extractor, database.connection, database.filters\n'
+        )
+        assert heavy == []
+
+    @pytest.mark.skipif(not _available('dotenv', 'requests'), reason="main.py needs python-dotenv and requests")
+    def test_check_creatomate_path(self):
+        elapsed_ms, heavy = _import_profile('import main\n')
+        assert heavy == []
+        assert elapsed_ms < CLI_IMPORT_BUDGET_MS
+
+
+class TestLazyPackage:
+    """Test PEP 562 package attributes built by lazy_package."""
+
+    @pytest.fixture
+    def package(self, temp_directory, monkeypatch):
+        root = temp_directory / 'lazypkg'
+        root.mkdir()
+        (root / '__init__.py').write_text(textwrap.dedent("""
+            from utils.lazy_imports import lazy_package
+
+            _SUBMODULES = ('first', 'second')
+
+            __all__ = ['shared', 'only_first']
+
+            _EXPORTS = {'only_first': 'first'}
+
+            __getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
+        """))
+        (root / 'first.py').write_text("only_first = 'first'\nshared = 'first'\n")
+        (root / 'second.py').write_text("shared = 'second'\n")
+        (root / 'extra.py').write_text("value = 42\n")
+
+        monkeypatch.syspath_prepend(str(temp_directory))
+        yield __import__('lazypkg')
+        for name in [m for m in sys.modules if m == 'lazypkg' or m.startswith('lazypkg.')]:
+            del sys.modules[name]
+
+    def test_export_loads_only_its_submodule(self, package):
+        assert package.only_first == 'first'
+        assert 'lazypkg.first' in sys.modules
+        assert 'lazypkg.second' not in sys.modules
+
+    def test_unlisted_name_matches_wildcard_order(self, package):
+        # `from .first import *` then `from .second import *` - the later module wins
+        assert package.shared == 'second'
+
+    def test_submodule_and_missing_names(self, package):
+        from lazypkg import extra
+        assert extra.value == 42
+        with pytest.raises(AttributeError):
+            package.missing_name
+        with pytest.raises(ImportError):
+            from lazypkg import missing_name  # noqa: F401
+
+
+class TestLazyImport:
+    """Test module proxies."""
+
+    def test_imports_on_first_use(self):
+        proxy = lazy_import('colorsys')
+        sys.modules.pop('colorsys', None)
+        assert 'not loaded' in repr(proxy)
+        assert proxy.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert 'colorsys' in sys.modules
+        assert 'loaded' in repr(proxy)
+
+    def test_attribute_proxy_is_callable(self):
+        fraction = lazy_import('fractions', 'Fraction')
+        assert fraction(1, 2) * 2 == 1
+
+    def test_missing_module_raises_on_use(self):
+        proxy = lazy_import('streamgank_missing_dependency')
+        with pytest.raises(ImportError):
+            proxy.anything
@@ -0,0 +1,89 @@
+"""
+Unit Tests for StreamGank Job Checkpoints
+
+Tests the per-job checkpoint store used by run_full_workflow(resume_job_id=...).
+"""
+
+import pytest
+
+from utils.job_checkpoint import JobCheckpointStore, RESUMABLE_STATUSES
+
+
+@pytest.fixture
+def checkpoint_store(temp_directory):
+    """Checkpoint store rooted in a temporary directory."""
+    return JobCheckpointStore(checkpoint_dir=str(temp_directory / 'checkpoints'))
+
+
+@pytest.fixture
+def partial_workflow():
+    """Workflow results after steps 1-4, failed in step 5."""
+    return {
+        'workflow_id': 'workflow_1',
+        'steps_completed': ['database_extraction', 'script_generation', 'asset_preparation', 'heygen_creation'],
+        'step_1_database_extraction': {'raw_movies': [{'title': 'Movie 1'}], 'step_status': 'completed'},
+        'step_2_script_generation': {'individual_scripts': {'movie1': 'Hook'}, 'step_status': 'completed'},
+        'step_3_asset_preparation': {'enhanced_posters': {'Movie 1': 'poster'}, 'step_status': 'completed'},
+        'step_4_heygen_creation': {'heygen_video_ids': {'movie1': 'abc'}, 'step_status': 'completed'},
+        'step_5_heygen_processing': {}
+    }
+
+
+class TestJobCheckpointStore:
+    """Test checkpoint persistence and resume metadata."""
+
+    def test_checkpoint_round_trip(self, checkpoint_store, partial_workflow):
+        """Test parameters, steps and failure status are restored."""
+        parameters = {'country': 'US', 'genre': 'Horror', 'platform': 'Netflix', 'content_type': 'Movies'}
+        checkpoint_store.start_job('job_1', parameters, workflow_id='workflow_1')
+        checkpoint_store.save_checkpoint('job_1', partial_workflow)
+        checkpoint_store.mark_status('job_1', 'failed', error='HeyGen timeout', failed_step=5)
+
+        checkpoint = checkpoint_store.load_checkpoint('job_1')
+
+        assert checkpoint['parameters'] == parameters
+        assert checkpoint['status'] == 'failed'
+        assert checkpoint['failed_step'] == 5
+        assert checkpoint['steps_completed'] == partial_workflow['steps_completed']
+        # Empty step sections are not checkpointed
+        assert set(checkpoint['steps']) == {
+            'step_1_database_extraction', 'step_2_script_generation',
+            'step_3_asset_preparation', 'step_4_heygen_creation'
+        }
+        assert checkpoint['steps']['step_4_heygen_creation']['heygen_video_ids'] == {'movie1': 'abc'}
+
+    def test_unchanged_steps_are_skipped(self, checkpoint_store, partial_workflow):
+        """Test repeated checkpoints only write changed steps."""
+        checkpoint_store.start_job('job_2', {})
+
+        assert checkpoint_store.save_checkpoint('job_2', partial_workflow) == 4
+        partial_workflow['step_5_heygen_processing'] = {'heygen_video_urls': {'movie1': 'url'}, 'step_status': 'completed'}
+        assert checkpoint_store.save_checkpoint('job_2', partial_workflow) == 1
+
+    def test_restart_reopens_job(self, checkpoint_store):
+        """Test resuming a failed job marks it running again."""
+        checkpoint_store.start_job('job_3', {'country': 'US'})
+        checkpoint_store.mark_status('job_3', 'failed', error='boom', failed_step=7)
+        checkpoint_store.start_job('job_3', {'country': 'US'})
+
+        checkpoint = checkpoint_store.load_checkpoint('job_3')
+        assert checkpoint['status'] == 'running'
+        assert checkpoint['error'] is None
+
+    def test_list_jobs_flags_resumable(self, checkpoint_store):
+        """Test job listing reports which jobs can be resumed."""
+        checkpoint_store.start_job('job_ok', {})
+        checkpoint_store.mark_status('job_ok', 'completed')
+        checkpoint_store.start_job('job_bad', {})
+        checkpoint_store.mark_status('job_bad', 'heygen_timeout')
+
+        jobs = {job['job_id']: job for job in checkpoint_store.list_jobs()}
+
+        assert 'heygen_timeout' in RESUMABLE_STATUSES
+        assert jobs['job_bad']['resumable'] is True
+        assert jobs['job_ok']['resumable'] is False
+        assert [job['job_id'] for job in checkpoint_store.list_jobs(status='completed')] == ['job_ok']
+
+    def test_unknown_job(self, checkpoint_store):
+        """Test loading a job that was never checkpointed."""
+        assert checkpoint_store.load_checkpoint('missing') is None
@@ -0,0 +1,131 @@
+"""
+Unit Tests for StreamGank Indexed Job Log Store
+
+Tests tail reads, reverse iteration, filters, cross-job search, catch-up of
+externally appended lines and segment rollover.
+"""
+
+import json
+import pytest
+
+from utils.job_log_store import JobLogStore, to_epoch
+
+
+def make_line(job_id, index, event_type='step_start', level='info', process_time=None, message=None):
+    return json.dumps({
+        'timestamp': '2025-01-01T00:00:00',
+        'job_id': job_id,
+        'event_type': event_type,
+        'level': level,
+        'message': message or f"event {index}",
+        'details': {'index': index},
+        'process_time': process_time if process_time is not None else 1000.0 + index
+    })
+
+
+@pytest.fixture
+def store(temp_directory):
+    store = JobLogStore(str(temp_directory / 'jobs'))
+    yield store
+    store.close()
+
+
+class TestJobLogStore:
+    """Test indexed reads against the append-only segments."""
+
+    def test_tail_and_reverse_iteration(self, store):
+        """Test tail returns the last entries in order and iteration walks backwards."""
+        for i in range(50):
+            store.append('job_a', make_line('job_a', i))
+
+        tail = store.tail('job_a', 5)
+        assert [e['details']['index'] for e in tail] == [45, 46, 47, 48, 49]
+
+        newest = store.iter_entries(job_id='job_a', batch_size=7)
+        assert [next(newest)['details']['index'] for _ in range(10)] == list(range(49, 39, -1))
+
+        oldest = store.query(limit=3, job_id='job_a', newest_first=False)
+        assert [e['details']['index'] for e in oldest] == [0, 1, 2]
+
+    def test_filters_and_time_range(self, store):
+        """Test event, level, message and time filters are applied by the index."""
+        for i in range(20):
+            level = 'error' if i % 5 == 0 else 'info'
+            store.append('job_a', make_line('job_a', i, level=level, message=f"Step {i} Uploading"))
+        store.append('job_a', make_line('job_a', 20, event_type='workflow_complete'))
+
+        errors = store.query(job_id='job_a', level='error')
+        assert [e['details']['index'] for e in errors] == [15, 10, 5, 0]
+
+        window = store.query(job_id='job_a', since=1005, until=1008)
+        assert [e['details']['index'] for e in window] == [8, 7, 6, 5]
+
+        assert [e['details']['index'] for e in store.query(job_id='job_a', message_contains='step 1 upl')] == [1]
+        assert store.query(job_id='job_a', event_type='workflow_complete')[0]['details']['index'] == 20
+
+    def test_cross_job_search_orders_by_time(self, store):
+        """Test searching without job_id merges jobs newest first."""
+        store.append('job_a', make_line('job_a', 1, process_time=10))
+        store.append('job_b', make_line('job_b', 2, process_time=30))
+        store.append('job_a', make_line('job_a', 3, process_time=20))
+
+        results = store.query(limit=10)
+        assert [e['job_id'] for e in results] == ['job_b', 'job_a', 'job_a']
+        assert [e['job_id'] for e in store.query(limit=10, since=15)] == ['job_b', 'job_a']
+
+    def test_indexes_lines_written_by_other_processes(self, store):
+        """Test lines appended directly to the segment (Node.js logger) are picked up."""
+        store.append('job_a', make_line('job_a', 0))
+        node_entry = json.loads(make_line('job_a', 1))
+        node_entry.update({'source': 'nodejs', 'process_time': 1735689600123})  # Date.now() milliseconds
+        with open(store.segment_path('job_a'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(node_entry) + '\n')
+            f.write('plain text line\n')
+            f.write('{"partial": ')
+
+        tail = store.tail('job_a', 10)
+        assert [e.get('source') for e in tail] == [None, 'nodejs', None]
+        assert tail[2]['event_type'] == 'raw_log'
+        assert store.query(job_id='job_a', since='2025-01-01T00:00:00Z')[0]['source'] == 'nodejs'
+
+    def test_rollover_keeps_entries_readable(self, temp_directory):
+        """Test rolled segments stay indexed and old ones are pruned."""
+        store = JobLogStore(str(temp_directory / 'jobs'), max_bytes=1024, backup_count=2)
+        for i in range(60):
+            store.append('job_a', make_line('job_a', i))
+
+        assert store.segment_path('job_a', 1).exists() is False
+        indexes = [e['details']['index'] for e in store.query(limit=1000, job_id='job_a', newest_first=False)]
+        assert indexes == list(range(indexes[0], 60))
+        assert indexes[0] > 0
+        store.close()
+
+    def test_archived_jobs_drop_out_of_index(self, store):
+        """Test jobs whose segment was moved away are forgotten on the next search."""
+        store.append('job_a', make_line('job_a', 0))
+        store.append('job_b', make_line('job_b', 1))
+        store.segment_path('job_a').unlink()
+
+        assert [e['job_id'] for e in store.query(limit=10)] == ['job_b']
+        assert store.stats()['indexed_jobs'] == 1
+
+    def test_appends_are_indexed_in_one_batch(self, store):
+        """Test appends only write lines and flush_index indexes every pending job at once."""
+        for i in range(20):
+            store.append('job_a', make_line('job_a', i))
+            store.append('job_b', make_line('job_b', i))
+        assert store.stats()['indexed_entries'] == 0
+
+        transactions = []
+        store._connect().set_trace_callback(lambda sql: transactions.append(sql) if sql.startswith('BEGIN') else None)
+        assert store.flush_index() == 40
+        assert transactions == ['BEGIN IMMEDIATE']
+        assert store.flush_index() == 0
+        assert store.stats() == {**store.stats(), 'indexed_jobs': 2, 'indexed_entries': 40}
+
+    def test_to_epoch(self):
+        """Test time filter conversion treats naive values as UTC."""
+        assert to_epoch('1970-01-01T00:01:00') == 60.0
+        assert to_epoch('1970-01-01T00:01:00Z') == 60.0
+        assert to_epoch(12) == 12.0
+        assert to_epoch(None) is None
@@ -0,0 +1,102 @@
+"""
+Unit Tests for StreamGank Job Logger
+
+Tests the background writer thread, the LRU/idle-bounded segment handler cache
+and read-your-writes behaviour of the log queries.
+"""
+
+import time
+import logging
+import threading
+import pytest
+
+from utils.job_logger import JobLogger
+
+
+@pytest.fixture
+def job_logger(temp_directory):
+    job_logger = JobLogger(str(temp_directory / 'logs'), max_open_files=2, idle_timeout=60)
+    yield job_logger
+    job_logger.close()
+
+
+class TestJobLogger:
+    """Test queued job logging."""
+
+    def test_writes_happen_on_writer_thread(self, job_logger, monkeypatch):
+        """Test workflow threads only enqueue and reads see queued writes."""
+        writer_threads = set()
+        original_append = job_logger.log_store.append
+
+        def recording_append(*args, **kwargs):
+            writer_threads.add(threading.current_thread().name)
+            return original_append(*args, **kwargs)
+
+        monkeypatch.setattr(job_logger.log_store, 'append', recording_append)
+        job_logger.log_step_start('job_a', 1, 'Database Extraction')
+        job_logger.log_step_complete('job_a', 1, 'Database Extraction', 1.5)
+
+        logs = job_logger.get_job_logs('job_a')
+        assert [entry['event_type'] for entry in logs] == ['job_started', 'step_start', 'step_complete']
+        assert writer_threads == {'job-log-writer'}
+
+    def test_handler_cache_is_lru_bounded(self, job_logger):
+        """Test only max_open_files segments stay open while all jobs keep logging."""
+        for job_id in ('job_a', 'job_b', 'job_c', 'job_a'):
+            job_logger.log_job_event(job_id, 'step_start', f"{job_id} working")
+        job_logger.flush()
+
+        assert list(job_logger.dispatcher.handlers) == ['job_c', 'job_a']
+        assert job_logger.dispatcher.stats['evicted_lru'] == 2
+        assert [e['message'] for e in job_logger.get_job_logs('job_a')] == [
+            'Job logging initialized', 'job_a working', 'job_a working'
+        ]
+
+    def test_idle_handlers_are_closed(self, job_logger):
+        """Test segments unused for idle_timeout seconds are closed."""
+        job_logger.log_job_event('job_a', 'step_start', 'working')
+        job_logger.flush()
+        handler = job_logger.dispatcher.handlers['job_a']
+        handler.last_used = time.monotonic() - 120
+
+        assert job_logger.dispatcher.close_idle() == 1
+        assert handler.stream is None
+        assert job_logger.dispatcher.handlers == {}
+
+    def test_logs_inline_after_close(self, job_logger):
+        """Test events logged after shutdown are still written."""
+        job_logger.close()
+        job_logger.log_job_event('job_a', 'workflow_failed', 'late failure', level='error')
+
+        assert job_logger.search_logs(level='error')[0]['message'] == 'late failure'
+
+    def test_archive_closes_segment(self, job_logger):
+        """Test archiving writes pending records and drops the job from the cache."""
+        job_logger.log_job_event('job_a', 'workflow_complete', 'done')
+
+        assert job_logger.archive_job_logs('job_a')
+        assert 'job_a' not in job_logger.dispatcher.handlers
+        assert job_logger.get_job_logs('job_a') == []
+
+    def test_archive_moves_rolled_segments(self, job_logger):
+        """Test archiving moves the rolled .log.N segments along with the active one."""
+        job_logger.log_store.max_bytes = 1024
+        for index in range(40):
+            job_logger.log_job_event('job_a', 'step_start', f"working {index}")
+        job_logger.flush()
+        assert len(job_logger.log_store.list_segments('job_a')) > 1
+
+        assert job_logger.archive_job_logs('job_a')
+        assert list(job_logger.job_logs_dir.glob('job_a.log*')) == []
+        archived = sorted(path.name for path in job_logger.archived_logs_dir.iterdir())
+        assert len(archived) > 1 and all(name.startswith('job_a_') for name in archived)
+
+    def test_get_job_logger_returns_logger(self, job_logger):
+        """Test the per-job logger is a plain Logger whose records land in the job's log."""
+        logger = job_logger.get_job_logger('job_a')
+        assert isinstance(logger, logging.Logger)
+
+        logger.warning('raw warning line')
+        assert [entry['message'] for entry in job_logger.get_job_logs('job_a')] == [
+            'Job logging initialized', 'raw warning line'
+        ]
@@ -0,0 +1,133 @@
+"""
+Unit Tests for StreamGank Mapping Registry
+
+Tests the precompiled genre/platform/content type tables: folded lookups,
+reverse lookups used when parsing URLs, immutability, and that url_builder
+and database filters produce the same values as before.
+"""
+
+import pytest
+
+from config.constants import US_GENRE_MAPPING, FR_GENRE_MAPPING
+from database.filters import apply_content_filters, apply_filters, apply_genre_filters
+from utils import url_builder
+from utils.mapping_registry import MAPPING_REGISTRY, MappingTable, normalize_key
+
+
+class RecordingQuery:
+    """Query stand-in that records eq()/in_() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def eq(self, column, value):
+        self.calls.append(('eq', column, value))
+        return self
+
+    def in_(self, column, values):
+        self.calls.append(('in', column, values))
+        return self
+
+
+class TestMappingTable:
+    """Test the compiled lookup indexes."""
+
+    def test_normalize_key(self):
+        assert normalize_key('  Mystère   &  Thriller ') == 'mystere & thriller'
+        assert normalize_key('ÉMISSION') == 'emission'
+
+    def test_folded_lookups(self):
+        genres = MAPPING_REGISTRY.genres('FR')
+        assert genres.canonical('mystere & thriller') == 'Mystère & Thriller'
+        assert genres.resolve('COMÉDIE') == 'Com%C3%A9die'
+        assert genres.resolve('Unknown', 'Unknown') == 'Unknown'
+        assert MAPPING_REGISTRY.platforms.resolve('prime video') == 'amazon'
+        assert MAPPING_REGISTRY.content_types.resolve('serie') == 'Série'
+
+    def test_reverse_lookups(self):
+        assert MAPPING_REGISTRY.platforms.reverse('amazon') == 'Prime Video'
+        assert MAPPING_REGISTRY.genres('US').reverse('Mystery+%26+Thriller') == 'Mystery & Thriller'
+        # parse_qs hands back decoded values
+        assert MAPPING_REGISTRY.genres('US').reverse('Mystery & Thriller') == 'Mystery & Thriller'
+        assert MAPPING_REGISTRY.genres('FR').reverse('Family,Action & Aventure') == 'Action & Aventure'
+        assert MAPPING_REGISTRY.content_types.reverse('Série') == 'Série'
+        assert MAPPING_REGISTRY.platforms.reverse('unknown') is None
+
+    def test_first_entry_wins(self):
+        table = MappingTable('test', {'Série': 'Série', 'Serie': 'Série'})
+        assert table.canonical('SERIE') == 'Série'
+        assert table.canonical('Serie') == 'Serie'
+        assert table.reverse('Série') == 'Série'
+
+    def test_country_fallback(self):
+        assert MAPPING_REGISTRY.genres('DE') is MAPPING_REGISTRY.genres('US')
+        assert MAPPING_REGISTRY.genres(None) is MAPPING_REGISTRY.genres('US')
+        assert MAPPING_REGISTRY.genres('fr') is MAPPING_REGISTRY.genres('FR')
+
+    def test_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            MAPPING_REGISTRY.platforms.mapping['Netflix'] = 'other'
+
+
+class TestUrlBuilder:
+    """Test url_builder on top of the registry."""
+
+    def test_getters_return_independent_copies(self):
+        mapping = url_builder.get_genre_mapping_by_country('FR')
+        assert mapping == FR_GENRE_MAPPING
+        mapping['Horreur'] = 'changed'
+        assert url_builder.get_genre_mapping_by_country('FR')['Horreur'] == FR_GENRE_MAPPING['Horreur']
+        assert url_builder.get_genre_mapping_by_country('IT') == US_GENRE_MAPPING
+        assert isinstance(url_builder.get_platform_mapping(), dict)
+
+    def test_build_url(self):
+        url = url_builder.build_streamgank_url('US', 'Horror', 'Netflix', 'Film')
+        assert url == 'https://streamgank.com/?country=US&genres=Horror&platforms=netflix&type=Film'
+
+        url = url_builder.build_streamgank_url('FR', 'mystère & thriller', 'Crunchyroll', 'Serie')
+        assert url == ('https://streamgank.com/?country=FR&genres=Myst%C3%A8re+%26+Thriller'
+                       '&platforms=crunchyroll&type=S%C3%A9rie')
+
+    def test_validation_is_exact(self):
+        assert url_builder.validate_genre('Horror')
+        assert url_builder.validate_genre('Comédie', 'FR')
+        assert not url_builder.validate_genre('Comédie', 'US')
+        assert url_builder.validate_platform('Netflix')
+        assert url_builder.validate_content_type('Série')
+        assert not url_builder.validate_content_type('Podcast')
+
+        # URL building folds case and accents, validation only accepts the mapping keys
+        assert not url_builder.validate_genre('horror')
+        assert not url_builder.validate_platform('netflix')
+        for content_type in ('Movies', 'movies', 'TV Shows', 'Séries'):
+            assert not url_builder.validate_content_type(content_type)
+        assert not url_builder.validate_genre(None)
+
+    def test_extract_filters_round_trip(self):
+        url = url_builder.build_streamgank_url('US', 'Action & Adventure', 'Prime Video', 'Série')
+        assert url_builder.extract_filters_from_url(url) == {
+            'country': 'US',
+            'genre': 'Action & Adventure',
+            'platform': 'Prime Video',
+            'content_type': 'Série'
+        }
+
+    def test_corrections_use_canonical_names(self):
+        result = url_builder.build_advanced_streamgank_url({'country': 'US', 'genre': 'horror', 'platform': 'hbo'})
+        assert result['applied_corrections'] == ['Genre corrected: horror → Horror', 'Platform corrected: hbo → Max']
+        assert result['primary_url'] == 'https://streamgank.com/?country=US&genres=Horror&platforms=max'
+
+
+class TestDatabaseFilters:
+    """Test database filters on top of the registry."""
+
+    def test_normalization(self):
+        query = apply_filters(RecordingQuery(), content_type='Movies', country='US', platform=['Prime', 'Netflix'],
+                              genre='Horror')
+        assert ('eq', 'content_type', 'Film') in query.calls
+        assert ('in', 'movie_localizations.platform_name', ['Amazon Prime Video', 'Netflix']) in query.calls
+
+        assert apply_content_filters(RecordingQuery(), 'TV Show').calls == [('eq', 'content_type', 'Série')]
+        assert apply_genre_filters(RecordingQuery(), 'Sci-Fi').calls == [('eq', 'movie_genres.genre', 'Science-Fiction')]
+        # Unknown values pass through unchanged
+        assert apply_genre_filters(RecordingQuery(), 'Anime').calls == [('eq', 'movie_genres.genre', 'Anime')]
@@ -0,0 +1,150 @@
+"""
+Unit Tests for StreamGank Media Executor
+
+Tests slot limits, priority ordering, queue-independent timeouts, job
+cancellation, metrics and ffmpeg -threads injection. Commands are small
+Python processes standing in for ffmpeg/ffprobe.
+"""
+
+import sys
+import time
+import threading
+import subprocess
+
+import pytest
+
+from utils.media_executor import (MediaExecutor, MediaJobCancelled, _apply_thread_limit,
+                                  get_media_job, reset_media_job, set_media_job)
+
+
+def python_cmd(code: str):
+    return [sys.executable, '-c', code]
+
+
+def wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def executor():
+    return MediaExecutor(max_concurrent=1, priorities={'final': 0, 'intermediate': 10, 'analysis': 20})
+
+
+def hold_slot(executor, seconds: float = 0.5, **kwargs):
+    """Occupy the only slot from a background thread."""
+    thread = threading.Thread(target=executor.run,
+                              args=(python_cmd(f'import time; time.sleep({seconds})'),), kwargs=kwargs)
+    thread.start()
+    wait_until(lambda: executor.stats()['running'] == 1)
+    return thread
+
+
+class TestMediaExecutor:
+    """Test scheduling and execution."""
+
+    def test_run_returns_completed_process(self, executor):
+        result = executor.run(python_cmd('print("probe")'), priority='analysis', capture_output=True, text=True)
+        assert result.returncode == 0
+        assert result.stdout.strip() == 'probe'
+
+        failed = executor.run(python_cmd('import sys; sys.exit(3)'), priority='final')
+        assert failed.returncode == 3
+        with pytest.raises(subprocess.CalledProcessError):
+            executor.run(python_cmd('import sys; sys.exit(1)'), check=True)
+
+        stats = executor.stats()
+        assert stats['by_priority']['analysis']['ok'] == 1
+        assert stats['by_priority']['final']['failed'] == 1
+        assert sum(metrics['calls'] for metrics in stats['by_executable'].values()) == 3
+
+    def test_final_encodes_start_before_probes(self, executor):
+        blocker = hold_slot(executor)
+        order = []
+
+        def run(priority):
+            executor.run(python_cmd('pass'), priority=priority)
+            order.append(priority)
+
+        probe = threading.Thread(target=run, args=('analysis',))
+        probe.start()
+        wait_until(lambda: executor.stats()['queued'] == 1)
+        encode = threading.Thread(target=run, args=('final',))
+        encode.start()
+        wait_until(lambda: executor.stats()['queued'] == 2)
+
+        for thread in (blocker, probe, encode):
+            thread.join(timeout=10)
+        assert order == ['final', 'analysis']
+
+    def test_timeout_excludes_queue_time(self, executor):
+        blocker = hold_slot(executor, seconds=0.6)
+        result = executor.run(python_cmd('pass'), timeout=0.5)
+        blocker.join(timeout=10)
+        assert result.returncode == 0
+        assert executor.stats()['by_priority']['analysis']['max_wait_seconds'] > 0
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            executor.run(python_cmd('import time; time.sleep(5)'), timeout=0.2)
+        assert executor.stats()['by_priority']['analysis']['timeout'] == 1
+
+    def test_cancel_job_kills_running_and_queued_commands(self, executor):
+        errors = []
+
+        def run(seconds):
+            try:
+                executor.run(python_cmd(f'import time; time.sleep({seconds})'), job_id='job-1')
+            except MediaJobCancelled as e:
+                errors.append(e)
+
+        running = threading.Thread(target=run, args=(30,))
+        running.start()
+        wait_until(lambda: executor.stats()['running'] == 1)
+        queued = threading.Thread(target=run, args=(0,))
+        queued.start()
+        wait_until(lambda: executor.stats()['queued'] == 1)
+
+        started = time.monotonic()
+        assert executor.cancel_job('job-1') == 1
+        running.join(timeout=10)
+        queued.join(timeout=10)
+
+        assert len(errors) == 2
+        assert time.monotonic() - started < 5
+        with pytest.raises(MediaJobCancelled):
+            executor.run(python_cmd('pass'), job_id='job-1')
+        # Other jobs keep running
+        assert executor.run(python_cmd('pass'), job_id='job-2').returncode == 0
+        assert executor.stats()['by_priority']['analysis']['cancelled'] == 3
+
+    def test_context_job_id(self, executor):
+        outer = set_media_job('job-outer')
+        token = set_media_job('job-ctx')
+        try:
+            assert get_media_job() == 'job-ctx'
+            executor.cancel_job('job-ctx')
+            with pytest.raises(MediaJobCancelled):
+                executor.run(python_cmd('pass'))
+        finally:
+            reset_media_job(token)
+        assert get_media_job() == 'job-outer'
+        reset_media_job(outer)
+        assert get_media_job() is None
+
+
+class TestThreadLimit:
+    """Test the single place that sets ffmpeg -threads."""
+
+    def test_inserted_before_output(self, monkeypatch):
+        monkeypatch.setenv('FFMPEG_THREADS', '3')
+        cmd = _apply_thread_limit(['ffmpeg', '-i', 'in.mp4', '-c:v', 'libx264', 'out.mp4'])
+        assert cmd[-3:] == ['-threads', '3', 'out.mp4']
+
+    def test_left_alone(self):
+        for cmd in (['ffmpeg', '-version'],
+                    ['ffmpeg', '-i', 'in.mp4', '-threads', '1', 'out.mp4'],
+                    ['ffmpeg', '-hide_banner', '-i', 'in.mp4'],
+                    ['ffprobe', '-v', 'quiet', 'in.mp4']):
+            assert _apply_thread_limit(cmd) == cmd
@@ -0,0 +1,131 @@
+"""
+Unit Tests for StreamGank Single-Pass Media Analysis
+
+Tests metadata parsing, per-second timelines and segment scoring from one
+ffmpeg pass instead of one process per candidate segment.
+"""
+
+import math
+import pytest
+from unittest.mock import Mock, patch
+
+from video import clip_processor
+from video.clip_processor import (
+    _build_media_timelines,
+    _parse_metadata_frames,
+    _filter_segments_by_audio,
+    _score_segments_by_motion,
+    _scan_full_highlight_audio,
+    _timeline_mean_volume
+)
+from utils.media_executor import MediaJobCancelled
+
+
+def analysis_output(levels_db, cuts_at=(), fps=4):
+    """Synthetic ffmpeg output: 100ms audio frames on stdout, scene scores on stderr."""
+    stdout, stderr = [], []
+    for frame, level in enumerate(levels_db):
+        for tenth in range(10):
+            pts = frame + tenth / 10
+            stdout.append(f"frame:{frame * 10 + tenth} pts:{int(pts * 48000)} pts_time:{pts:g}")
+            stdout.append(f"lavfi.r128.M={'-inf' if level is None else level - 3}")
+            stdout.append(f"lavfi.astats.Overall.RMS_level={'-inf' if level is None else level}")
+    for frame in range(len(levels_db) * fps):
+        pts = frame / fps
+        score = 0.8 if any(abs(pts - cut) < 1e-9 for cut in cuts_at) else 0.02
+        stderr.append(f"[Parsed_metadata_7 @ 0x5581] frame:{frame}    pts:{frame}    pts_time:{pts:g}")
+        stderr.append(f"[Parsed_metadata_7 @ 0x5581] lavfi.scene_score={score:.6f}")
+    return Mock(returncode=0, stdout="\n".join(stdout), stderr="\n".join(stderr))
+
+
+@pytest.fixture
+def trailer(temp_directory, monkeypatch):
+    monkeypatch.setattr(clip_processor, '_timeline_cache', clip_processor.OrderedDict())
+    path = temp_directory / 'trailer.mp4'
+    path.write_bytes(b'mp4')
+    return str(path)
+
+
+class TestTimelines:
+    """Test parsing and aggregation."""
+
+    def test_parse_stdout_and_log_formats(self):
+        """Test both metadata print formats yield (pts_time, values) frames."""
+        frames = _parse_metadata_frames(
+            "frame:0 pts:0 pts_time:0\nlavfi.r128.M=-20.5\n"
+            "[Parsed_metadata_2 @ 0x1] frame:1 pts:1 pts_time:0.04\n[Parsed_metadata_2 @ 0x1] lavfi.scene_score=0.5\n"
+        )
+        assert frames == [(0.0, {'lavfi.r128.M': '-20.5'}), (0.04, {'lavfi.scene_score': '0.5'})]
+
+    def test_per_second_aggregation(self):
+        """Test energy-averaged RMS, silence floor and scene cut counts per second."""
+        output = analysis_output([-20, -30], cuts_at=(1.25, 1.5))
+        timelines = _build_media_timelines(_parse_metadata_frames(output.stdout), _parse_metadata_frames(output.stderr))
+
+        assert timelines['seconds'] == 2
+        assert timelines['rms_db'] == [pytest.approx(-20), pytest.approx(-30)]
+        assert timelines['loudness_lufs'] == [pytest.approx(-23), pytest.approx(-33)]
+        assert timelines['scene_cuts'] == [0, 2]
+        assert timelines['scene_score'][1] == pytest.approx(0.8)
+
+        silent = analysis_output([None])
+        timelines = _build_media_timelines(_parse_metadata_frames(silent.stdout), [])
+        assert timelines['rms_db'] == timelines['loudness_lufs'] == [clip_processor.SILENCE_FLOOR_DB]
+
+
+class TestSegmentScoring:
+    """Test every scorer reads the same single analysis pass."""
+
+    def test_segments_scored_from_one_pass(self, trailer):
+        """Test audio filtering and motion scoring run ffmpeg once for all segments."""
+        levels = [-15] * 10 + [-60] * 10 + [-25] * 10
+        segments = [{'id': i, 'start': start, 'duration': 7, 'audio_score': 0}
+                    for i, start in enumerate(range(0, 23, 3))]
+
+        with patch('video.clip_processor.run_media_command',
+                   return_value=analysis_output(levels, cuts_at=(22.0, 23.0, 24.0, 25.0, 26.0, 27.0))) as mock_run:
+            kept = _filter_segments_by_audio(trailer, [dict(s) for s in segments])
+            kept_starts = [s['start'] for s in kept]
+            scored = _score_segments_by_motion(trailer, kept)
+
+        assert mock_run.call_count == 1
+        assert kept_starts == [0, 3, 6, 9, 18, 21]   # 12s and 15s windows are mostly silent
+        assert scored[0]['start'] == 21 and scored[0]['motion_score'] == 1.0
+        assert [s['audio_score'] for s in scored if s['start'] == 0] == [0.75]
+
+    def test_window_volume_weights_partial_seconds(self, trailer):
+        """Test fractional windows weight the seconds they overlap."""
+        with patch('video.clip_processor.run_media_command', return_value=analysis_output([-10, -40])):
+            mean = _timeline_mean_volume(trailer, 0.5, 2.0)
+
+        expected = 10 * math.log10((0.5 * 10 ** -1 + 1.0 * 10 ** -4) / 1.5)
+        assert mean == pytest.approx(expected)
+
+    def test_zero_silence_scan_uses_timelines(self, trailer):
+        """Test the full-highlight scan rejects windows containing silence without extra ffmpeg runs."""
+        levels = [-12] * 12 + [-80] * 3 + [-12] * 10
+        with patch('video.clip_processor.run_media_command', return_value=analysis_output(levels)) as mock_run:
+            assert _scan_full_highlight_audio(trailer, 0, 9) == 40
+            assert _scan_full_highlight_audio(trailer, 8, 9) is None
+
+        assert mock_run.call_count == 1
+
+    def test_falls_back_to_per_segment_analysis(self, trailer):
+        """Test a failed analysis pass (e.g. no audio stream) keeps the per-segment path."""
+        failed = Mock(returncode=1, stdout='', stderr='Stream specifier a:0 matches no streams')
+        volumedetect = Mock(returncode=0, stdout='', stderr='mean_volume: -12.0 dB')
+
+        with patch('video.clip_processor.run_media_command', side_effect=[failed, volumedetect, volumedetect]) as mock_run:
+            kept = _filter_segments_by_audio(trailer, [{'id': 1, 'start': 0, 'duration': 7}, {'id': 2, 'start': 3, 'duration': 7}])
+
+        assert [s['audio_score'] for s in kept] == [0.75, 0.75]
+        assert mock_run.call_count == 3
+
+    def test_cancelled_job_is_not_treated_as_failed_analysis(self, trailer):
+        """Test a cancelled job stops instead of caching no timelines and falling back per segment."""
+        with patch('video.clip_processor.run_media_command', side_effect=MediaJobCancelled('job_a')) as mock_run:
+            with pytest.raises(MediaJobCancelled):
+                _filter_segments_by_audio(trailer, [{'id': 1, 'start': 0, 'duration': 7}])
+
+        assert mock_run.call_count == 1
+        assert not clip_processor._timeline_cache
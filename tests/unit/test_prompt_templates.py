@@ -0,0 +1,101 @@
+"""
+Unit Tests for StreamGank Prompt Template Caching
+
+Tests memoized template rendering per (template id, genre, platform),
+per-movie field substitution, cached token estimates and the pre-flight
+estimate used by script generation.
+"""
+
+import pytest
+
+from ai import prompt_templates
+from ai.prompt_templates import (GENRE_CUSTOMIZATIONS, customize_prompt_for_genre, estimate_script_generation_tokens,
+                                 estimate_tokens, get_hook_prompt_template, get_intro_prompt_template,
+                                 get_prompt_template)
+
+MOVIES = [{'title': 'Alien'}, {'title': 'The Thing'}, {'title': 'It Follows'}]
+
+
+class TestTemplateCache:
+    """Test memoized template rendering."""
+
+    def test_templates_are_built_once(self):
+        first = get_prompt_template('hook', 'Horror', 'TikTok')
+        assert get_prompt_template('hook', 'Horror', 'TikTok') is first
+        assert get_prompt_template('hook', 'Comedy', 'TikTok') is not first
+        assert prompt_templates.get_prompt_cache_stats()['hits'] >= 1
+
+    def test_genre_customizations_computed_once(self):
+        assert prompt_templates._generate_dynamic_genre_customizations() is GENRE_CUSTOMIZATIONS
+
+    def test_unknown_template(self):
+        with pytest.raises(KeyError):
+            get_prompt_template('outro')
+
+
+class TestRendering:
+    """Test that only per-movie fields are substituted."""
+
+    def test_hook_prompt(self):
+        movie = {'title': 'Price of $5 {Fear}', 'year': 2023, 'imdb_score': 7.5, 'genres': ['Horror']}
+        system_prompt, user_prompt = get_hook_prompt_template(movie, 'Horror', 'TikTok')
+
+        assert 'GENRE SPECIALIZATION - HORROR' in system_prompt
+        assert 'PLATFORM OPTIMIZATION - TIKTOK' in system_prompt
+        assert user_prompt.startswith('Create a viral hook sentence for this movie:\n\nMovie: Price of $5 {Fear}\n'
+                                      'Year: 2023\nIMDb Score: 7.5/10\nGenres: Horror\nPlatform: TikTok\n\n')
+        assert '"This horror masterpiece"' in user_prompt
+        assert '$' not in get_hook_prompt_template({'title': 'Plain'}, 'Horror')[1]
+
+    def test_intro_and_genre_requirements(self):
+        system_prompt, user_prompt = get_intro_prompt_template('Horror', 'Netflix', 'Movies')
+        assert 'GENRE FOCUS - HORROR' in system_prompt
+        assert 'showcasing top Horror Movies from Netflix' in user_prompt
+        assert get_intro_prompt_template('Horror', 'Netflix', 'Movies')[1] == user_prompt
+
+        assert customize_prompt_for_genre('Base', 'Comedy').startswith('Base\n\nGENRE-SPECIFIC REQUIREMENTS:')
+        assert customize_prompt_for_genre('Base', 'Unknown') == 'Base'
+
+    def test_script_hook_slots(self):
+        template = get_prompt_template('script_hook', 'Horror', 'Netflix')
+        prompt = template.render(title='Alien')
+        assert prompt.startswith('Create a powerful movie hook for this Horror movie: Alien')
+        assert 'Movie: Alien\nGenre: Horror' in prompt
+
+
+class TestTokenEstimates:
+    """Test cached token estimates and pre-flight checks."""
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens('') == 0
+        assert estimate_tokens('abcd') == 1
+        assert estimate_tokens('abcde') == 2
+
+    def test_template_estimates_match_rendered_prompt(self):
+        template = get_prompt_template('script_hook_timed', 'Horror', 'Netflix')
+        rendered = template.render(title='It Follows')
+        assert abs(template.estimate_tokens(title='It Follows') - estimate_tokens(rendered)) <= 2
+        assert template.max_tokens == 70
+
+        # script_hook has the title twice
+        template = get_prompt_template('script_hook', 'Horror', 'Netflix')
+        rendered = template.render(title='A Very Long Title ' * 5)
+        assert abs(template.estimate_tokens(title='A Very Long Title ' * 5) - estimate_tokens(rendered)) <= 3
+
+    def test_preflight_estimate(self):
+        estimate = estimate_script_generation_tokens(MOVIES, 'Horror', 'Netflix', 'Film',
+                                                     max_tokens={'script_intro': 30})
+        assert [request['template_id'] for request in estimate['requests']] == [
+            'script_intro', 'script_hook', 'script_hook_timed', 'script_hook_timed']
+        assert estimate['completion_tokens'] == 30 + 50 + 70 + 70
+        assert estimate['prompt_tokens'] == sum(request['prompt_tokens'] for request in estimate['requests'])
+        assert estimate['total_tokens'] == estimate['prompt_tokens'] + estimate['completion_tokens']
+
+        # n candidates per timed hook multiply its completion budget
+        with_candidates = estimate_script_generation_tokens(MOVIES, 'Horror', 'Netflix', 'Film',
+                                                            max_tokens={'script_intro': 30}, hook_candidates=3)
+        assert with_candidates['completion_tokens'] == 30 + 50 + 3 * 70 * 2
+        assert with_candidates['prompt_tokens'] == estimate['prompt_tokens']
+
+        intro = get_prompt_template('script_intro', 'Horror', 'Netflix', 'Film')
+        assert estimate['requests'][0]['prompt_tokens'] == estimate_tokens(intro.render())
@@ -0,0 +1,77 @@
+"""
+Unit Tests for StreamGank API Rate Limiter
+
+Tests token-bucket bursts, blocking waits, timeouts and per-service limiters.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleep()."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch('utils.rate_limiter.time', clock):
+        yield clock
+
+
+class TestRateLimiter:
+    """Test token bucket behaviour."""
+
+    def test_burst_then_steady_rate(self, clock):
+        """Test burst requests pass immediately and later ones are spaced by the rate."""
+        limiter = RateLimiter(rate=2.0, burst=3, name='creatomate')
+
+        for _ in range(3):
+            assert limiter.acquire() is True
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+        stats = limiter.stats()
+        assert stats['acquired'] == 5 and stats['waited'] == 2
+        assert stats['wait_seconds'] == pytest.approx(1.0)
+
+    def test_timeout_gives_up(self, clock):
+        """Test acquire returns False when no token frees up in time."""
+        limiter = RateLimiter(rate=0.1, burst=1)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=2.0) is False
+        assert sum(clock.sleeps) == pytest.approx(2.0)
+
+    def test_unlimited_without_rate(self, clock):
+        """Test services without requests_per_second are never delayed."""
+        limiter = RateLimiter(rate=None)
+
+        assert all(limiter.acquire() for _ in range(100))
+        assert clock.sleeps == []
+
+    def test_limiters_are_shared_per_service(self, monkeypatch):
+        """Test get_rate_limiter builds one limiter per service from API settings."""
+        monkeypatch.setattr(rate_limiter, '_limiters', {})
+
+        creatomate = get_rate_limiter('creatomate')
+        assert creatomate is get_rate_limiter('creatomate')
+        assert creatomate.rate == 2.0 and creatomate.burst == 4
+        assert get_rate_limiter('unknown_service').rate is None
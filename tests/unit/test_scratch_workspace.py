@@ -0,0 +1,151 @@
+"""
+Unit Tests for StreamGank Scratch Workspace
+
+Tests tmpfs/disk root selection, spill-over, per-job quotas, context-scoped
+scratch directories and cleanup of finished and orphaned job workspaces.
+Both roots are plain directories; free space is patched per test.
+"""
+
+import os
+import json
+import threading
+
+import pytest
+
+from utils import scratch_workspace
+from utils.scratch_workspace import (OWNER_FILE, ScratchQuotaExceeded, ScratchWorkspaceManager,
+                                     check_scratch_quota, create_scratch_temp_dir, get_scratch_dir,
+                                     get_scratch_workspace)
+
+MB = 1024**2
+
+
+def set_free_space(monkeypatch, free_bytes: int):
+    monkeypatch.setattr(scratch_workspace, 'get_available_space', lambda directory: {'free_bytes': free_bytes})
+
+
+def write_bytes(directory: str, name: str, size: int) -> str:
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+    return path
+
+
+@pytest.fixture
+def manager(temp_directory):
+    return ScratchWorkspaceManager(tmpfs_dir=str(temp_directory / 'shm'), disk_dir=str(temp_directory / 'disk'),
+                                   job_quota_bytes=10 * MB, min_free_bytes=1 * MB)
+
+
+class TestRootSelection:
+    """Test where a job's scratch space is allocated."""
+
+    def test_tmpfs_when_quota_fits(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 100 * MB)
+        workspace = manager.open('job-1')
+        assert workspace.backend == 'tmpfs'
+        assert workspace.subdir('temp_clips').startswith(manager.tmpfs_dir)
+
+    def test_disk_when_tmpfs_is_short(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 5 * MB)
+        workspace = manager.open('job-1')
+        assert workspace.backend == 'disk'
+        assert workspace.subdir('temp_clips').startswith(manager.disk_dir)
+
+    def test_quota_of_other_tmpfs_jobs_is_reserved(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 15 * MB)
+        assert manager.open('job-1').backend == 'tmpfs'
+        assert manager.open('job-2').backend == 'disk'
+        assert manager.open('job-1') is manager.get('job-1')
+
+    def test_tmpfs_disabled(self, temp_directory):
+        manager = ScratchWorkspaceManager(tmpfs_dir='', disk_dir=str(temp_directory / 'disk'), job_quota_bytes=0)
+        assert manager.open('job-1').backend == 'disk'
+
+    def test_new_directories_spill_to_disk(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 100 * MB)
+        workspace = manager.open('job-1')
+        frames = workspace.subdir('scroll_frames')
+
+        set_free_space(monkeypatch, MB // 2)
+        assert workspace.subdir('temp_clips').startswith(manager.disk_dir)
+        # Existing directories stay where they are
+        assert workspace.subdir('scroll_frames') == frames
+
+
+class TestQuotaAndCleanup:
+    """Test per-job limits and deterministic removal."""
+
+    def test_quota_exceeded(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 100 * MB)
+        workspace = manager.open('job-1')
+        write_bytes(workspace.subdir('temp_trailers'), 'trailer.mp4', 8 * MB)
+
+        assert workspace.check_quota() // MB == 8  # Plus the small owner marker
+        with pytest.raises(ScratchQuotaExceeded):
+            workspace.check_quota(incoming_bytes=3 * MB)
+        write_bytes(workspace.subdir('temp_trailers'), 'second.mp4', 3 * MB)
+        with pytest.raises(ScratchQuotaExceeded):
+            workspace.subdir('temp_clips')
+
+    def test_job_workspace_context_removes_everything(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 100 * MB)
+        with manager.job_workspace('job-1') as workspace:
+            clips = get_scratch_dir('temp_clips')
+            write_bytes(clips, 'clip.mp4', MB)
+            poster_dir = create_scratch_temp_dir('poster_')
+            assert get_scratch_workspace() is workspace
+            assert poster_dir.startswith(workspace.tmpfs_root)
+            assert check_scratch_quota() // MB == 1
+
+        assert not os.path.exists(workspace.tmpfs_root)
+        assert not os.path.exists(workspace.disk_root)
+        assert get_scratch_workspace() is None
+        assert manager.stats()['bytes_freed'] // MB == 1
+        assert manager.close('job-1') == 0
+
+    def test_workspace_is_visible_in_copied_contexts_only(self, manager, monkeypatch):
+        import contextvars
+        set_free_space(monkeypatch, 100 * MB)
+        seen = {}
+
+        with manager.job_workspace('job-1') as workspace:
+            context = contextvars.copy_context()
+            threads = [threading.Thread(target=context.run, args=(lambda: seen.update(copied=get_scratch_workspace()),)),
+                       threading.Thread(target=lambda: seen.update(plain=get_scratch_workspace()))]
+            for thread in threads:
+                thread.start()
+                thread.join()
+
+        assert seen == {'copied': workspace, 'plain': None}
+
+    def test_outside_a_job_uses_legacy_directories(self, temp_directory, monkeypatch):
+        monkeypatch.chdir(temp_directory)
+        assert get_scratch_dir('temp_clips') == 'temp_clips'
+        assert os.path.isdir(temp_directory / 'temp_clips')
+        assert check_scratch_quota(10**12) == 0
+
+
+class TestStaleSweep:
+    """Test recovery of workspaces left behind by crashed processes."""
+
+    def _orphan(self, base: str, name: str, pid: int) -> str:
+        root = os.path.join(base, name)
+        os.makedirs(root)
+        with open(os.path.join(root, OWNER_FILE), 'w') as f:
+            json.dump({'pid': pid, 'job_id': name}, f)
+        return root
+
+    def test_removes_dead_and_restarted_owners(self, manager, monkeypatch):
+        set_free_space(monkeypatch, 100 * MB)
+        active = manager.open('running-job')
+        dead = self._orphan(manager.disk_dir, 'crashed-job', pid=2**22 + 1)
+        restarted = self._orphan(manager.tmpfs_dir, 'same-pid-job', pid=os.getpid())
+        alive = self._orphan(manager.disk_dir, 'other-worker-job', pid=os.getppid())
+        unmarked = os.path.join(manager.disk_dir, 'not-a-workspace')
+        os.makedirs(unmarked)
+
+        assert manager.sweep_stale() == 2
+        assert not os.path.exists(dead) and not os.path.exists(restarted)
+        assert os.path.exists(alive) and os.path.exists(unmarked)
+        assert os.path.exists(active.tmpfs_root)
@@ -0,0 +1,107 @@
+"""
+Unit Tests for StreamGank Script Duration Pre-Validation
+
+Tests local candidate selection, deterministic trim/pad of near misses and
+that timed hooks are accepted from one n>1 request without retry round trips.
+The OpenAI client is replaced by a recording fake.
+"""
+
+import sys
+import types
+
+import pytest
+
+from ai.script_validator import estimate_spoken_duration, fit_script_to_word_range, select_script_candidate
+
+
+def words(count: int, word: str = 'terror') -> str:
+    return ' '.join([word] * count) + '.'
+
+
+class TestCandidateSelection:
+    """Test local duration checks."""
+
+    def test_estimate_spoken_duration(self):
+        assert estimate_spoken_duration(words(27)) == 9.0
+
+    def test_first_fitting_candidate_wins(self):
+        picked = select_script_candidate([words(12), words(26), words(30)], 8, 11)
+        assert picked['index'] == 1
+        assert picked['adjustment'] is None
+        assert picked['script'] == words(26)
+
+    def test_trims_long_near_miss(self):
+        script = ' '.join(['word'] * 32) + ' and the end.'
+        picked = select_script_candidate([words(60), script], 8, 11)
+        assert picked['index'] == 1
+        assert picked['adjustment'] == 'trimmed'
+        assert picked['original_words'] == 35
+        # Cut at 33 words, dangling 'and' dropped
+        assert picked['script'] == ' '.join(['word'] * 32) + '.'
+
+    def test_pads_short_near_miss(self):
+        picked = select_script_candidate([words(21)], 8, 11)
+        assert picked['adjustment'] == 'padded'
+        assert picked['script'] == words(21) + ' Stream it tonight.'
+        assert picked['words'] == 24
+
+    def test_closest_near_miss_is_repaired(self):
+        picked = select_script_candidate([words(20), words(35)], 8, 11)
+        assert picked['index'] == 1
+        assert picked['words'] == 33
+
+    def test_deterministic(self):
+        candidates = [words(22), words(36)]
+        assert select_script_candidate(candidates, 8, 11) == select_script_candidate(candidates, 8, 11)
+
+    def test_nothing_usable(self):
+        assert select_script_candidate([words(10), words(50)], 8, 11) is None
+        assert select_script_candidate([words(21)], 8, 11, max_adjust_words=0) is None
+        assert fit_script_to_word_range(words(10), 24, 33) == words(10)
+
+
+class FakeCompletions:
+    """Records chat.completions.create calls and returns queued choices."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        texts = self.replies.pop(0)
+        choices = [types.SimpleNamespace(message=types.SimpleNamespace(content=text)) for text in texts]
+        return types.SimpleNamespace(choices=choices)
+
+
+@pytest.fixture
+def fake_openai(monkeypatch, temp_directory):
+    completions = FakeCompletions([])
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+    monkeypatch.setitem(sys.modules, 'openai', types.SimpleNamespace(OpenAI=lambda api_key: client))
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.chdir(temp_directory)
+    return completions
+
+
+class TestTimedHookGeneration:
+    """Test n>1 candidate generation in the clean script generator."""
+
+    def test_no_retry_round_trips(self, fake_openai):
+        from ai.clean_script_generator import generate_clean_video_scripts
+
+        fake_openai.replies = [
+            ['Get ready for the best horror on Netflix right now'],
+            ['Alien will terrify you'],
+            [words(40), words(27), words(28)],  # movie2: second candidate fits
+            [words(15), words(22), words(50)]   # movie3: 22 words padded to 24
+        ]
+        movies = [{'title': 'Alien'}, {'title': 'The Thing'}, {'title': 'It Follows'}]
+
+        _, _, scripts = generate_clean_video_scripts(movies, genre='Horror', platform='Netflix', content_type='Film')
+
+        assert len(fake_openai.calls) == 4
+        assert fake_openai.calls[2]['n'] == 3
+        assert 'n' not in fake_openai.calls[1]
+        assert scripts['movie2'] == words(27)
+        assert scripts['movie3'] == words(22) + ' Watch tonight.'
@@ -0,0 +1,186 @@
+"""
+Unit Tests for StreamGank Workflow Tracing
+
+Tests span nesting, resource counters and the Chrome trace / OTLP JSON exporters.
+"""
+
+import contextvars
+import json
+import sys
+import pytest
+
+from utils.tracing import Tracer, run_traced_subprocess, get_tracer
+
+
+@pytest.fixture
+def tracer():
+    """Enabled tracer independent of the global instance."""
+    return Tracer(enabled=True)
+
+
+def run_job(tracer, *span_names, root=None):
+    """Record finished child spans under a job's (still open) root span in the job's own context."""
+    def job():
+        span = root or tracer.start_span('workflow', 'workflow')
+        for name in span_names:
+            tracer.start_span(name, 'http', parent=span).end()
+        return span
+    return contextvars.copy_context().run(job)
+
+
+class TestSpans:
+    """Test span lifecycle and counters."""
+
+    def test_nested_spans_roll_up_bytes_and_retries(self, tracer):
+        """Test children share the trace and counters propagate to ancestors."""
+        with tracer.span('workflow', 'workflow', job_id='job_1') as root:
+            with tracer.span('Step 3: Asset Preparation', 'step') as step:
+                with tracer.span('HTTP GET api.vizard.ai', 'http') as request:
+                    request.add_bytes(2048)
+                    request.add_retry()
+
+        assert step.parent is root and request.parent is step
+        assert request.trace_id == root.trace_id
+        assert root.bytes_transferred == step.bytes_transferred == 2048
+        assert root.retries == 1
+        assert root.wall_time >= step.wall_time >= request.wall_time
+        assert [span.name for span in tracer.get_spans(root.trace_id)] == [
+            'workflow', 'Step 3: Asset Preparation', 'HTTP GET api.vizard.ai'
+        ]
+
+        summary = tracer.summarize(root.trace_id)
+        assert summary['http'] == {**summary['http'], 'count': 1, 'bytes': 2048, 'retries': 1}
+
+    def test_exception_marks_span_failed(self, tracer):
+        """Test errors are recorded and re-raised."""
+        with pytest.raises(RuntimeError):
+            with tracer.span('upload', 'cloudinary'):
+                raise RuntimeError('quota exceeded')
+
+        span = tracer.get_spans()[0]
+        assert span.status == 'error'
+        assert span.error == 'quota exceeded'
+
+    def test_ending_parent_closes_open_children(self, tracer):
+        """Test manually started spans left open are finished as 'unfinished'."""
+        root = tracer.start_span('workflow', 'workflow')
+        child = tracer.start_span('Step 5: HeyGen Processing', 'step')
+        root.end(status='error', error='timeout')
+
+        assert child.finished and child.status == 'unfinished'
+        assert root.status == 'error'
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test disabled tracing hands out no-op spans."""
+        tracer = Tracer(enabled=False)
+        with tracer.span('workflow') as span:
+            span.add_bytes(10)
+
+        assert span.trace_id is None
+        assert tracer.get_spans() == []
+
+
+class TestTraceBuffer:
+    """Test the bounded in-memory span buffer."""
+
+    def test_full_buffer_evicts_finished_unexported_trace(self):
+        """Test a finished trace nobody exported makes room for live jobs."""
+        tracer = Tracer(enabled=True, max_spans=3)
+        abandoned = run_job(tracer, 'HTTP GET heygen')
+        contextvars.copy_context().run(abandoned.end)
+
+        live = run_job(tracer, 'HTTP GET a', 'HTTP GET b', 'HTTP GET c')
+
+        assert tracer.get_spans(abandoned.trace_id) == []
+        assert len(tracer.get_spans(live.trace_id)) == 3
+        assert tracer.stats() == {'traces': 1, 'spans': 3, 'dropped_spans': 0, 'evicted_traces': 1}
+
+    def test_live_traces_are_kept_until_orphaned(self):
+        """Test spans of running jobs are only evicted once idle past orphan_seconds."""
+        tracer = Tracer(enabled=True, max_spans=2, orphan_seconds=3600)
+        running = run_job(tracer, 'HTTP GET a', 'HTTP GET b')
+
+        other = run_job(tracer, 'HTTP GET c')
+        assert tracer.stats()['dropped_spans'] == 1
+        assert len(tracer.get_spans(running.trace_id)) == 2
+
+        tracer.orphan_seconds = 0
+        run_job(tracer, 'HTTP GET d', root=other)
+        assert tracer.get_spans(running.trace_id) == []
+        assert [span.name for span in tracer.get_spans(other.trace_id)] == ['HTTP GET d']
+
+    def test_clear_one_trace_frees_its_spans(self, tracer):
+        """Test exporting a job (which clears its trace) releases buffer space."""
+        with tracer.span('workflow', 'workflow') as first:
+            pass
+        with tracer.span('workflow', 'workflow') as second:
+            pass
+
+        tracer.clear(first.trace_id)
+        assert tracer.get_spans() == [second]
+        assert tracer.stats()['spans'] == 1
+
+
+class TestExport:
+    """Test file exporters."""
+
+    def test_chrome_trace_export(self, tracer, temp_directory):
+        """Test complete events carry resource metrics in args."""
+        with tracer.span('workflow', 'workflow') as root:
+            with tracer.span('ffprobe', 'ffmpeg', command='ffprobe clip.mp4'):
+                pass
+
+        path = tracer.export(str(temp_directory / 'job.trace.json'), root.trace_id, 'chrome')
+        with open(path, 'r', encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+
+        complete = [event for event in events if event['ph'] == 'X']
+        assert [event['name'] for event in complete] == ['workflow', 'ffprobe']
+        assert complete[1]['args']['parent_span_id'] == root.span_id
+        assert {'cpu_time_ms', 'peak_rss_mb', 'bytes_transferred', 'retries', 'command'} <= set(complete[1]['args'])
+        assert any(event['ph'] == 'M' for event in events)
+
+    def test_otel_export(self, tracer, temp_directory):
+        """Test OTLP/JSON layout, ids and attribute encoding."""
+        with tracer.span('workflow', 'workflow', num_movies=3) as root:
+            with tracer.span('HTTP POST api.heygen.com', 'http'):
+                pass
+
+        path = tracer.export(str(temp_directory / 'job.otel.json'), root.trace_id, 'otel')
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+
+        spans = document['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert len(spans[0]['traceId']) == 32 and len(spans[0]['spanId']) == 16
+        assert spans[1]['parentSpanId'] == spans[0]['spanId']
+        assert spans[1]['kind'] == 3
+        assert {'key': 'num_movies', 'value': {'intValue': '3'}} in spans[0]['attributes']
+        assert int(spans[0]['endTimeUnixNano']) >= int(spans[0]['startTimeUnixNano'])
+
+    def test_unknown_format(self, tracer, temp_directory):
+        """Test unsupported export formats are rejected."""
+        with pytest.raises(ValueError):
+            tracer.export(str(temp_directory / 'x.json'), format='zipkin')
+
+
+class TestSubprocessSpans:
+    """Test subprocess instrumentation."""
+
+    def test_run_traced_subprocess(self, temp_directory):
+        """Test the span records return code and output file size."""
+        output_file = temp_directory / 'out.bin'
+        tracer = get_tracer()
+
+        with tracer.span('workflow', 'workflow') as root:
+            result = run_traced_subprocess(
+                [sys.executable, '-c', 'import sys; open(sys.argv[1], "wb").write(b"x" * 100)', str(output_file)],
+                capture_output=True
+            )
+
+        spans = tracer.get_spans(root.trace_id)
+        tracer.clear(root.trace_id)
+
+        assert result.returncode == 0
+        assert spans[1].category == 'subprocess'
+        assert spans[1].attributes['returncode'] == 0
+        assert spans[1].attributes['output_bytes'] == 100
@@ -0,0 +1,185 @@
+"""
+Unit Tests for StreamGank Cloudinary Upload Deduplication
+
+Tests the content digest, the upload manifest, the deduplicated upload path
+used by the poster and clip uploaders, and the concurrent batch uploader.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils.upload_manifest import UploadManifest, compute_upload_digest
+
+
+@pytest.fixture
+def manifest(temp_directory, monkeypatch):
+    manifest = UploadManifest(str(temp_directory / 'manifest'))
+    monkeypatch.setattr('utils.upload_manifest._manifest', manifest)
+    return manifest
+
+
+@pytest.fixture
+def cloudinary_env(monkeypatch):
+    for name in ('CLOUDINARY_CLOUD_NAME', 'CLOUDINARY_API_KEY', 'CLOUDINARY_API_SECRET'):
+        monkeypatch.setenv(name, 'test')
+
+
+def write_file(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def fake_upload(file_path, public_id, **options):
+    if hasattr(file_path, 'read'):
+        while file_path.read(1024):
+            pass
+    return {'public_id': public_id, 'secure_url': f"https://res.cloudinary.com/{public_id}.jpg",
+            'resource_type': options.get('resource_type', 'image'), 'width': 1080, 'height': 1920}
+
+
+class TestUploadDigest:
+    """Test content digests."""
+
+    def test_digest_depends_on_bytes_and_output_options(self, temp_directory):
+        """Test labels do not change the digest but transformations do."""
+        poster = write_file(temp_directory / 'a.jpg', b'poster bytes')
+        copy = write_file(temp_directory / 'b.jpg', b'poster bytes')
+
+        base = compute_upload_digest(poster, {'quality': 'auto', 'tags': ['x']})
+        assert base == compute_upload_digest(copy, {'quality': 'auto', 'tags': ['y'], 'context': {'a': 1}})
+        assert base != compute_upload_digest(poster, {'quality': 'auto:best'})
+
+
+class TestUploadManifest:
+    """Test manifest persistence."""
+
+    def test_record_lookup_and_forget(self, manifest, temp_directory):
+        """Test recorded uploads are found, counted and dropped on delete."""
+        poster = write_file(temp_directory / 'a.jpg', b'x' * 2048)
+        manifest.record('abc', fake_upload(poster, 'posters/a_abc'), poster)
+
+        assert manifest.lookup('abc')['secure_url'] == 'https://res.cloudinary.com/posters/a_abc.jpg'
+        assert manifest.lookup('missing') is None
+        assert manifest.stats()['skipped_uploads'] == 1
+
+        assert manifest.forget_public_id('posters/a_abc') == 1
+        assert manifest.lookup('abc') is None
+
+
+class TestDeduplicatedUploads:
+    """Test the uploaders skip unchanged content."""
+
+    @patch('media.cloudinary_uploader.cloudinary.uploader.upload', side_effect=fake_upload)
+    def test_unchanged_poster_is_uploaded_once(self, mock_upload, manifest, cloudinary_env, temp_directory):
+        """Test the second upload of identical bytes never reaches Cloudinary."""
+        from media.cloudinary_uploader import upload_poster_to_cloudinary
+
+        poster = write_file(temp_directory / 'poster.jpg', b'poster bytes')
+        first = upload_poster_to_cloudinary(poster, 'The Matrix', '42')
+        second = upload_poster_to_cloudinary(poster, 'The Matrix', '42')
+
+        assert first == second
+        assert mock_upload.call_count == 1
+        options = mock_upload.call_args[1]
+        assert options['overwrite'] is False and 'invalidate' not in options
+        assert options['public_id'].startswith('enhanced_posters/The_Matrix_42_')
+
+    @patch('media.cloudinary_uploader.cloudinary.uploader.upload', side_effect=fake_upload)
+    def test_changed_content_gets_new_public_id(self, mock_upload, manifest, cloudinary_env, temp_directory):
+        """Test new bytes produce a new URL instead of overwriting the old one."""
+        from media.cloudinary_uploader import upload_poster_to_cloudinary
+
+        poster = temp_directory / 'poster.jpg'
+        first = upload_poster_to_cloudinary(write_file(poster, b'v1'), 'Alien', '7')
+        second = upload_poster_to_cloudinary(write_file(poster, b'v2'), 'Alien', '7')
+
+        assert first != second
+        assert mock_upload.call_count == 2
+
+    @patch('media.cloudinary_uploader.cloudinary.uploader.upload', side_effect=fake_upload)
+    def test_batch_upload_keyed_by_path(self, mock_upload, manifest, cloudinary_env, temp_directory):
+        """Test concurrent batch uploads share the manifest and keep path keys."""
+        from media.cloudinary_uploader import batch_upload_assets
+
+        paths = [write_file(temp_directory / f"poster_{i}.png", f"poster {i}".encode()) for i in range(5)]
+        results = batch_upload_assets(paths + paths[:1], folder='backfill')
+
+        assert sorted(results) == sorted(paths)
+        assert mock_upload.call_count == 5
+        assert batch_upload_assets(paths, folder='backfill') == results
+        assert mock_upload.call_count == 5
+
+
+class TestConcurrentBatchUpload:
+    """Test the bounded-pool batch uploader."""
+
+    @pytest.fixture(autouse=True)
+    def fast_retries(self, monkeypatch):
+        from config.settings import WORKFLOW_SETTINGS
+        monkeypatch.setitem(WORKFLOW_SETTINGS, 'upload_retry_backoff', 0)
+
+    def test_retries_progress_and_report(self, manifest, cloudinary_env, temp_directory):
+        """Test failed uploads are retried and bytes are reported per file."""
+        from media.cloudinary_uploader import upload_assets_concurrently
+
+        paths = [write_file(temp_directory / f"poster_{i}.jpg", bytes([i]) * 3000) for i in range(4)]
+        attempts = {}
+
+        def flaky_upload(file_path, public_id, **options):
+            attempts[file_path.name] = attempts.get(file_path.name, 0) + 1
+            if file_path.name == paths[0] and attempts[file_path.name] == 1:
+                raise ConnectionError('reset by peer')
+            return fake_upload(file_path, public_id, **options)
+
+        progress = []
+        with patch('media.cloudinary_uploader.cloudinary.uploader.upload', side_effect=flaky_upload):
+            outcome = upload_assets_concurrently(
+                paths, folder='backfill', max_workers=2,
+                progress_callback=lambda path, sent, total: progress.append((path, sent, total))
+            )
+
+        assert sorted(outcome['results']) == sorted(paths)
+        assert outcome['failed'] == {}
+        report = outcome['report']
+        assert report['uploaded'] == 4 and report['retries'] == 1 and report['workers'] == 2
+        assert report['bytes_uploaded'] == report['bytes_total'] == 12000
+        assert {(path, sent, total) for path, sent, total in progress if sent == total} == {(p, 3000, 3000) for p in paths}
+
+        with patch('media.cloudinary_uploader.cloudinary.uploader.upload', side_effect=flaky_upload):
+            again = upload_assets_concurrently(paths, folder='backfill')
+        assert again['report']['deduplicated'] == 4
+        assert again['report']['bytes_uploaded'] == 0
+
+    def test_large_files_are_sent_in_parts(self, manifest, cloudinary_env, temp_directory, monkeypatch):
+        """Test files above upload_chunk_size use upload_large with part-level progress."""
+        from config.settings import WORKFLOW_SETTINGS
+        from media.cloudinary_uploader import upload_assets_concurrently
+
+        monkeypatch.setitem(WORKFLOW_SETTINGS, 'upload_chunk_size', 1000)
+        clip = write_file(temp_directory / 'clip.mp4', b'v' * 2500)
+
+        def fake_upload_large(reader, chunk_size, **options):
+            while reader.read(chunk_size):
+                pass
+            return fake_upload(reader, **options)
+
+        progress = []
+        with patch('media.cloudinary_uploader.cloudinary.uploader.upload_large', side_effect=fake_upload_large):
+            outcome = upload_assets_concurrently([clip], progress_callback=lambda *event: progress.append(event[1]))
+
+        assert clip in outcome['results']
+        assert progress == [1000, 2000, 2500]
+
+    @patch('media.cloudinary_uploader.cloudinary.uploader.upload', return_value={})
+    def test_exhausted_retries_are_reported(self, mock_upload, manifest, cloudinary_env, temp_directory):
+        """Test assets failing every attempt end up in 'failed', not in the results."""
+        from media.cloudinary_uploader import upload_assets_concurrently
+
+        poster = write_file(temp_directory / 'poster.png', b'png')
+        notes = write_file(temp_directory / 'notes.txt', b'text')
+        outcome = upload_assets_concurrently([poster, notes], max_attempts=2)
+
+        assert outcome['results'] == {}
+        assert set(outcome['failed']) == {poster, notes}
+        assert mock_upload.call_count == 2
+        assert outcome['report']['retries'] == 1
@@ -0,0 +1,141 @@
+"""
+Unit Tests for StreamGank Webhook Delivery Queue
+
+Tests coalescing, batching, retry/backoff, stale-update dropping and
+shutdown flushing against an in-memory transport.
+"""
+
+import threading
+import pytest
+
+from utils.webhook_queue import WebhookDeliveryQueue, is_critical_update
+
+
+def make_update(step_number, status, sequence, job_id='job_1'):
+    return {
+        'job_id': job_id,
+        'step_number': step_number,
+        'status': status,
+        'sequence': sequence,
+        'step_key': f"{job_id}_{step_number}_{status}_{sequence}"
+    }
+
+
+class FakeServer:
+    """Transport recording requests; fails the first `failures` calls."""
+
+    def __init__(self, failures=0, batch_status=200):
+        self.failures = failures
+        self.batch_status = batch_status
+        self.requests = []
+        self.delivered = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, body, timeout):
+        with self.lock:
+            self.requests.append((url, body))
+            if self.failures > 0:
+                self.failures -= 1
+                raise ConnectionError('server down')
+            if url.endswith('/batch'):
+                if self.batch_status != 200:
+                    return self.batch_status, None
+                self.delivered.extend(body['updates'])
+                return 200, {'success': True, 'results': [
+                    {'step_key': u['step_key'], 'status_code': 200} for u in body['updates']
+                ]}
+            self.delivered.append(body)
+            return 200, {'success': True}
+
+
+@pytest.fixture
+def settings():
+    return {'batch_interval': 0.05, 'backoff_base': 0.01, 'backoff_max': 0.05,
+            'max_attempts': 3, 'shutdown_flush_timeout': 2}
+
+
+class TestWebhookDeliveryQueue:
+    """Test background delivery behaviour."""
+
+    def test_coalesces_and_batches_in_order(self, settings):
+        """Test superseded step states are dropped and the rest go in one batch."""
+        server = FakeServer()
+        queue = WebhookDeliveryQueue('http://gui', settings, transport=server)
+
+        queue.enqueue(make_update(0, 'started', 1))
+        queue.enqueue(make_update(1, 'started', 2))
+        queue.enqueue(make_update(1, 'completed', 3))
+        queue.enqueue(make_update(2, 'started', 4))
+        assert queue.flush(2)
+
+        assert [u['sequence'] for u in server.delivered] == [1, 3, 4]
+        assert queue.stats['coalesced'] == 1
+        assert server.requests[0][0] == 'http://gui/api/webhooks/step-update/batch'
+        queue.close()
+
+    def test_retries_with_backoff(self, settings):
+        """Test failed deliveries are retried until the server accepts them."""
+        server = FakeServer(failures=2)
+        queue = WebhookDeliveryQueue('http://gui', settings, transport=server)
+
+        queue.enqueue(make_update(3, 'completed', 1))
+        assert queue.flush(2)
+
+        assert [u['sequence'] for u in server.delivered] == [1]
+        assert queue.stats['retries'] == 2
+        queue.close()
+
+    def test_falls_back_to_single_endpoint(self, settings):
+        """Test servers without the batch route still receive every update."""
+        server = FakeServer(batch_status=404)
+        queue = WebhookDeliveryQueue('http://gui', dict(settings, batch_interval=0.2), transport=server)
+
+        queue.enqueue(make_update(4, 'started', 1))
+        queue.enqueue(make_update(5, 'started', 2))
+        assert queue.flush(2)
+
+        assert [u['sequence'] for u in server.delivered] == [1, 2]
+        assert all(url.endswith('/step-update') for url, _ in server.requests[1:])
+        queue.close()
+
+    def test_drops_stale_but_keeps_critical_updates(self, settings):
+        """Test queue pressure drops intermediate states, never failures."""
+        gate = threading.Event()
+        server = FakeServer()
+
+        def slow_transport(url, body, timeout):
+            gate.wait(2)
+            return server(url, body, timeout)
+
+        queue = WebhookDeliveryQueue('http://gui', dict(settings, max_pending=3, batch_interval=0),
+                                     transport=slow_transport)
+        queue.enqueue(make_update(1, 'started', 1))  # picked up by the worker, held at the gate
+        for sequence, step in enumerate((2, 3, 4, 5), start=2):
+            queue.enqueue(make_update(step, 'started', sequence))
+        queue.enqueue(make_update(5, 'failed', 10))
+        gate.set()
+        assert queue.flush(2)
+
+        delivered = [u['sequence'] for u in server.delivered]
+        assert 10 in delivered
+        assert queue.stats['dropped_stale'] >= 1
+        assert delivered == sorted(delivered)
+        queue.close()
+
+    def test_close_flushes_and_rejects_new_updates(self, settings):
+        """Test shutdown delivers pending updates then refuses new ones."""
+        server = FakeServer()
+        queue = WebhookDeliveryQueue('http://gui', dict(settings, batch_interval=5), transport=server)
+
+        queue.enqueue(make_update(8, 'completed', 1))
+        assert queue.close(2)
+
+        assert [u['sequence'] for u in server.delivered] == [1]
+        assert queue.enqueue(make_update(0, 'started', 2)) is False
+
+    def test_critical_updates(self):
+        """Test which updates are protected from coalescing and dropping."""
+        assert is_critical_update(make_update(3, 'failed', 1))
+        assert is_critical_update(make_update(7, 'creatomate_ready', 1))
+        assert is_critical_update(make_update(8, 'completed', 1))
+        assert not is_critical_update(make_update(3, 'started', 1))
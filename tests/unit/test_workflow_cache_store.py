@@ -0,0 +1,147 @@
+"""
+Unit Tests for StreamGank Workflow Cache Store
+
+Tests the indexed, sharded cache backend and the test_data_cache functions
+that read and write through it.
+"""
+
+import json
+import pytest
+
+from utils.workflow_cache_store import (
+    WorkflowCacheStore,
+    normalize_cache_params,
+    build_cache_key,
+    WORKFLOW_META_RECORD
+)
+from utils import test_data_cache
+
+
+@pytest.fixture
+def cache_store(temp_directory):
+    """Cache store rooted in a temporary directory."""
+    store = WorkflowCacheStore(base_dir=str(temp_directory / 'cache_store'), shard_count=4)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def sample_workflow():
+    """Workflow results in the layout produced by run_full_workflow."""
+    return {
+        'workflow_id': 'workflow_123',
+        'parameters': {'country': 'US', 'genre': 'Horror', 'platform': 'Netflix', 'content_type': 'Movies'},
+        'steps_completed': ['database_extraction', 'script_generation'],
+        'step_1_database_extraction': {'raw_movies': [{'title': 'Movie 1'}], 'movies_found': 1},
+        'step_2_script_generation': {
+            'combined_script': 'Intro. Movie one.',
+            'individual_scripts': {'intro': 'Intro.', 'movie1': 'Movie one.'}
+        }
+    }
+
+
+class TestCacheKeys:
+    """Test parameter normalization."""
+
+    def test_normalize_matches_legacy_filenames(self):
+        """Test keys follow the workflow_*.json naming."""
+        params = normalize_cache_params('US', 'Action & Adventure', 'Disney+', 'TV Shows', 'auto')
+
+        assert params == ('us', 'disney', 'action_and_adventure', 'tv_shows', 'auto')
+        assert build_cache_key(params) == 'us_disney_action_and_adventure_tv_shows_auto'
+
+
+class TestWorkflowCacheStore:
+    """Test the SQLite-backed store."""
+
+    def test_save_and_load_workflow(self, cache_store, sample_workflow):
+        """Test a workflow round-trips through per-step records."""
+        params = normalize_cache_params('US', 'Horror', 'Netflix')
+        cache_store.save_workflow(params, sample_workflow)
+
+        assert cache_store.load_workflow(params) == sample_workflow
+        assert cache_store.get_record(params, 'step_1_database_extraction')['movies_found'] == 1
+
+    def test_unchanged_steps_are_not_rewritten(self, cache_store, sample_workflow):
+        """Test incremental saves only write changed records."""
+        params = normalize_cache_params('US', 'Horror', 'Netflix')
+        first = cache_store.save_workflow(params, sample_workflow)
+
+        sample_workflow['step_3_asset_preparation'] = {'enhanced_posters': {'Movie 1': 'url'}}
+        sample_workflow['steps_completed'].append('asset_preparation')
+        second = cache_store.save_workflow(params, sample_workflow)
+
+        assert first == {'written': 3, 'unchanged': 0}
+        # New step + metadata record changed, steps 1 and 2 untouched
+        assert second == {'written': 2, 'unchanged': 2}
+
+    def test_stats_track_inserts_updates_and_deletes(self, cache_store, sample_workflow):
+        """Test trigger-maintained counters."""
+        cache_store.save_workflow(normalize_cache_params('US', 'Horror', 'Netflix'), sample_workflow)
+        cache_store.save_workflow(normalize_cache_params('FR', 'Horreur', 'Netflix'), sample_workflow)
+
+        stats = cache_store.stats()
+        assert stats['total_records'] == 6
+        assert stats['data_types'][WORKFLOW_META_RECORD]['count'] == 2
+
+        deleted = cache_store.delete(country='fr')
+        stats = cache_store.stats()
+        assert deleted == 3
+        assert stats['total_records'] == 3
+        assert stats['total_size_bytes'] == sum(r['size_bytes'] for r in cache_store.list_records())
+
+    def test_missing_key_returns_none(self, cache_store):
+        """Test reads on an empty store don't create shards."""
+        params = normalize_cache_params('US', 'Comedy', 'Max')
+
+        assert cache_store.get_record(params, 'step_2_script_generation') is None
+        assert cache_store.load_workflow(params) is None
+        assert not cache_store.base_dir.exists()
+
+    def test_json_export_import_round_trip(self, cache_store, sample_workflow, temp_directory):
+        """Test the legacy JSON format stays usable for import/export."""
+        params = normalize_cache_params('US', 'Horror', 'Netflix')
+        cache_store.save_workflow(params, sample_workflow)
+
+        export_path = str(temp_directory / 'workflow_us_netflix_horror_movies_auto.json')
+        cache_store.export_json_file(params, export_path)
+        with open(export_path, 'r', encoding='utf-8') as f:
+            exported = json.load(f)
+        assert exported['data'] == sample_workflow
+
+        cache_store.delete()
+        assert cache_store.import_json_file(export_path) == params
+        assert cache_store.load_workflow(params) == sample_workflow
+
+
+class TestTestDataCacheIntegration:
+    """Test test_data_cache functions on top of the store."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, temp_directory, monkeypatch):
+        monkeypatch.chdir(temp_directory)
+        monkeypatch.setenv('WORKFLOW_CACHE_DIR', str(temp_directory / 'cache_store'))
+
+    def test_save_then_load_step(self, monkeypatch, sample_workflow):
+        """Test development saves are readable in local mode."""
+        monkeypatch.setenv('APP_ENV', 'development')
+        assert test_data_cache.save_workflow_result(sample_workflow, 'US', 'Horror', 'Netflix')
+
+        monkeypatch.setenv('APP_ENV', 'local')
+        scripts = test_data_cache.load_test_data('script_result', 'US', 'Horror', 'Netflix')
+
+        assert scripts['individual_scripts']['movie1'] == 'Movie one.'
+        assert test_data_cache.load_test_data('heygen', 'US', 'Horror', 'Netflix') is None
+
+    def test_legacy_json_file_is_imported_on_first_read(self, monkeypatch, temp_directory, sample_workflow):
+        """Test existing workflow_*.json files keep working."""
+        legacy_dir = temp_directory / 'test_output'
+        legacy_dir.mkdir()
+        with open(legacy_dir / 'workflow_us_netflix_horror_movies_auto.json', 'w', encoding='utf-8') as f:
+            json.dump({'data': sample_workflow}, f)
+
+        monkeypatch.setenv('APP_ENV', 'local')
+        scripts = test_data_cache.load_test_data('script_result', 'US', 'Horror', 'Netflix')
+
+        assert scripts['combined_script'] == 'Intro. Movie one.'
+        assert test_data_cache.get_cache_stats()['total_files'] == 3
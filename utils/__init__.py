@@ -11,10 +11,12 @@ Modules:
     - file_utils: File operations and cleanup utilities
 """
 
-from .url_builder import *
-from .validators import *
+# Submodules load on first attribute access, so importing one utils module
+# (or a quick CLI path) no longer imports every dependency of the package
+from .lazy_imports import lazy_package
+
+_SUBMODULES = ('url_builder', 'validators', 'file_utils')
 # formatters module removed - functions were bloated 1-liner utilities
-from .file_utils import *
 
 __all__ = [
     # URL Builder
@@ -39,4 +41,25 @@ __all__ = [
     'cleanup_temp_files',
     'get_temp_filename',
     'safe_file_operation'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'build_streamgank_url': 'url_builder',
+    'get_genre_mapping_by_country': 'url_builder',
+    'get_platform_mapping_by_country': 'url_builder',
+    'get_available_genres_for_country': 'url_builder',
+    'get_all_mappings_for_country': 'url_builder',
+    'validate_movie_data': 'validators',
+    'validate_script_data': 'validators',
+    'validate_api_response': 'validators',
+    'is_valid_url': 'validators',
+    'is_valid_genre': 'validators',
+    'is_valid_platform': 'validators',
+    'ensure_directory': 'file_utils',
+    'cleanup_temp_files': 'file_utils',
+    'get_temp_filename': 'file_utils',
+    'safe_file_operation': 'file_utils'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
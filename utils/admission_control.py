@@ -0,0 +1,445 @@
+"""
+StreamGank Job Admission Control
+
+Starts a workflow job only when the machine has the disk and memory for its
+peak usage. Worker processes (one main.py per queued job) and batch jobs
+(threads in one process) reserve resources in a shared SQLite ledger, so
+concurrent jobs no longer run the box out of disk mid-encode or wake the OOM
+killer during trailer analysis.
+
+Features:
+- Peak disk/RAM estimate per job from trailer durations and step configuration
+- Headroom = measured free space - reserve - resources promised to running jobs
+- Container-aware memory (cgroup v1/v2 limits, /proc/meminfo MemAvailable)
+- Cross-process ledger with dead-owner cleanup (crashed workers never leak reservations)
+- A job that is alone on the machine is always admitted (waiting cannot help it)
+- Metrics: queue wait times, waiting/active jobs, timeouts and current headroom
+
+Usage:
+    requirements = estimate_job_requirements(num_movies=3, skip_scroll_video=False)
+    ticket = get_admission_controller().admit(job_id, requirements)
+    ...
+    get_admission_controller().release(job_id)
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Job Admission Control
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import get_admission_settings, get_scroll_settings, get_workflow_settings
+from utils.file_utils import get_available_space
+from utils.scratch_workspace import pid_alive
+
+logger = logging.getLogger(__name__)
+
+MB = 1024**2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    job_id TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    disk_bytes INTEGER NOT NULL,
+    ram_bytes INTEGER NOT NULL,
+    admitted_timestamp REAL NOT NULL
+);
+"""
+
+_MEMINFO_PATH = '/proc/meminfo'
+
+# (limit file, usage file) per cgroup version - the first readable pair wins
+_CGROUP_MEMORY_FILES = (
+    ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory.current'),
+    ('/sys/fs/cgroup/memory/memory.limit_in_bytes', '/sys/fs/cgroup/memory/memory.usage_in_bytes')
+)
+
+
+class AdmissionTimeout(Exception):
+    """Raised when a job waited longer than max_wait_seconds for resources."""
+
+
+# =============================================================================
+# RESOURCE MEASUREMENT
+# =============================================================================
+
+def get_memory_info() -> Dict[str, Any]:
+    """
+    Get available memory, honouring container (cgroup) limits.
+
+    Returns:
+        dict: {'total_bytes', 'available_bytes', 'source'} - values are None when unknown
+    """
+    info = {'total_bytes': None, 'available_bytes': None, 'source': None}
+
+    try:
+        with open(_MEMINFO_PATH, 'r') as f:
+            meminfo = {line.split(':')[0]: int(line.split()[1]) * 1024 for line in f if line.split()[1:]}
+        info['total_bytes'] = meminfo.get('MemTotal')
+        info['available_bytes'] = meminfo.get('MemAvailable', meminfo.get('MemFree'))
+        info['source'] = 'meminfo'
+    except (OSError, ValueError, IndexError):
+        pass
+
+    for limit_file, usage_file in _CGROUP_MEMORY_FILES:
+        try:
+            with open(limit_file, 'r') as f:
+                limit = f.read().strip()
+            with open(usage_file, 'r') as f:
+                usage = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+        # 'max' (v2) or a near-2^63 value (v1) means no container limit
+        if limit == 'max' or int(limit) >= 2**60:
+            break
+        cgroup_available = max(0, int(limit) - usage)
+        if info['available_bytes'] is None or cgroup_available < info['available_bytes']:
+            info.update(total_bytes=int(limit), available_bytes=cgroup_available, source='cgroup')
+        break
+
+    return info
+
+
+def _existing_path(path: str) -> str:
+    """Nearest existing ancestor of a path (statvfs needs an existing directory)."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path) and os.path.dirname(path) != path:
+        path = os.path.dirname(path)
+    return path
+
+
+# =============================================================================
+# REQUIREMENT ESTIMATION
+# =============================================================================
+
+def estimate_job_requirements(num_movies: int = 3,
+                              trailer_durations: Optional[List[float]] = None,
+                              skip_scroll_video: bool = False,
+                              completed_steps: Iterable[str] = (),
+                              settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Estimate a workflow job's peak disk and memory usage.
+
+    Disk adds up everything kept in the job's scratch workspace until the job
+    ends (trailers, highlight encodes, posters, scroll frames). Memory is the
+    base process plus the heavier of the two media phases: parallel trailer
+    analysis/encoding (one thread per movie) or browser scroll capture.
+
+    Args:
+        num_movies (int): Movies in the job
+        trailer_durations (List[float]): Known trailer lengths in seconds (missing ones use the default)
+        skip_scroll_video (bool): Scroll video step is skipped
+        completed_steps (Iterable[str]): Steps already done (resumed jobs), e.g. 'asset_preparation'
+        settings (Dict): Model coefficients (default: ADMISSION_SETTINGS)
+
+    Returns:
+        Dict[str, Any]: {'disk_bytes', 'ram_bytes', 'trailer_seconds', 'breakdown': {...}}
+    """
+    settings = settings or get_admission_settings()
+    completed_steps = set(completed_steps or ())
+
+    durations = [float(d) for d in (trailer_durations or [])[:num_movies] if d]
+    durations += [float(settings['default_trailer_seconds'])] * (num_movies - len(durations))
+
+    breakdown = {'assets_disk_bytes': 0, 'scroll_disk_bytes': 0,
+                 'assets_ram_bytes': 0, 'scroll_ram_bytes': 0,
+                 'base_ram_bytes': int(settings['base_ram_mb'] * MB)}
+
+    if 'asset_preparation' not in completed_steps:
+        mb_per_second = settings['trailer_mb_per_second'] + settings['clip_mb_per_second']
+        breakdown['assets_disk_bytes'] = int((sum(durations) * mb_per_second + settings['poster_mb'] * num_movies) * MB)
+        breakdown['assets_ram_bytes'] = int((sum(durations) * settings['analysis_ram_mb_per_second']
+                                             + settings['ffmpeg_ram_mb'] * num_movies) * MB)
+
+    if not skip_scroll_video and 'scroll_generation' not in completed_steps:
+        frames = get_scroll_settings().get('total_frames', 240)
+        breakdown['scroll_disk_bytes'] = int(frames * settings['scroll_frame_mb'] * MB)
+        breakdown['scroll_ram_bytes'] = int((settings['browser_ram_mb'] + settings['ffmpeg_ram_mb']) * MB)
+
+    return {
+        'disk_bytes': breakdown['assets_disk_bytes'] + breakdown['scroll_disk_bytes'],
+        'ram_bytes': breakdown['base_ram_bytes'] + max(breakdown['assets_ram_bytes'], breakdown['scroll_ram_bytes']),
+        'trailer_seconds': sum(durations) if 'asset_preparation' not in completed_steps else 0.0,
+        'breakdown': breakdown
+    }
+
+
+# =============================================================================
+# ADMISSION CONTROLLER
+# =============================================================================
+
+class AdmissionController:
+    """
+    Admits jobs against measured headroom and a shared reservation ledger.
+
+    Reservations are conservative: a running job's full estimate stays
+    reserved until it ends, even after part of it shows up as used space.
+    Ledger errors are logged and the job is admitted - a broken ledger must
+    never stop the workflow itself.
+    """
+
+    def __init__(self, ledger_dir: str = None, scratch_dir: str = None, settings: Dict[str, Any] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            ledger_dir (str): Directory holding admission.sqlite3 (default: ADMISSION_LEDGER_DIR or settings)
+            scratch_dir (str): Directory whose filesystem holds job media (default: the scratch disk root)
+            settings (Dict): Admission settings (default: ADMISSION_SETTINGS)
+        """
+        self.settings = settings or get_admission_settings()
+        self.enabled = os.getenv('ADMISSION_CONTROL', str(self.settings.get('enabled', True))).lower() not in ('0', 'false', 'no')
+        self.ledger_dir = Path(ledger_dir or os.getenv('ADMISSION_LEDGER_DIR', self.settings.get('ledger_dir', 'docker_volumes/admission')))
+        self.db_path = self.ledger_dir / 'admission.sqlite3'
+        self.scratch_dir = scratch_dir or os.getenv(
+            'SCRATCH_DISK_DIR', get_workflow_settings().get('scratch_disk_dir', 'docker_volumes/scratch'))
+
+        self._local = threading.local()
+        self._condition = threading.Condition()
+        self._held = set()
+        self._waiting = 0
+        self._metrics = {'admitted': 0, 'admitted_after_wait': 0, 'forced': 0, 'timeouts': 0,
+                         'total_wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.ledger_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Headroom
+    # -------------------------------------------------------------------------
+
+    def _live_reservations(self, conn: sqlite3.Connection) -> List[Tuple[str, int, int, int]]:
+        """Reservations of running jobs; rows of dead owners are deleted."""
+        rows = conn.execute('SELECT job_id, pid, disk_bytes, ram_bytes FROM reservations').fetchall()
+        live = []
+        own_pid = os.getpid()
+        for job_id, pid, disk_bytes, ram_bytes in rows:
+            # Same PID but not held here = left by an earlier process that reused our PID
+            stale = (pid == own_pid and job_id not in self._held) or (pid != own_pid and not pid_alive(pid))
+            if stale:
+                conn.execute('DELETE FROM reservations WHERE job_id = ?', (job_id,))
+                logger.info(f"🧹 Admission: dropped reservation of finished worker (job {job_id}, pid {pid})")
+            else:
+                live.append((job_id, pid, disk_bytes, ram_bytes))
+        return live
+
+    def _headroom(self, reservations: List[Tuple[str, int, int, int]]) -> Dict[str, Any]:
+        disk_free = get_available_space(_existing_path(self.scratch_dir))['free_bytes']
+        memory = get_memory_info()
+        disk_reserved = sum(row[2] for row in reservations)
+        ram_reserved = sum(row[3] for row in reservations)
+
+        ram_headroom = None
+        if memory['available_bytes'] is not None:
+            ram_headroom = memory['available_bytes'] - self.settings['ram_reserve_bytes'] - ram_reserved
+
+        return {
+            'disk_free_bytes': disk_free,
+            'disk_reserved_bytes': disk_reserved,
+            'disk_headroom_bytes': disk_free - self.settings['disk_reserve_bytes'] - disk_reserved,
+            'ram_available_bytes': memory['available_bytes'],
+            'ram_reserved_bytes': ram_reserved,
+            'ram_headroom_bytes': ram_headroom,
+            'memory_source': memory['source'],
+            'active_jobs': len(reservations)
+        }
+
+    def headroom(self) -> Dict[str, Any]:
+        """
+        Get current resource headroom (free minus reserve minus running jobs' reservations).
+
+        Returns:
+            Dict[str, Any]: Disk and RAM free/reserved/headroom bytes and active job count
+        """
+        if not self.db_path.exists():
+            return self._headroom([])  # No job has been admitted on this machine yet
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                reservations = self._live_reservations(conn)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except Exception as e:
+            logger.warning(f"⚠️ Admission ledger unavailable: {str(e)}")
+            reservations = []
+        return self._headroom(reservations)
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    def try_admit(self, job_id: str, requirements: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Reserve resources for a job if they fit right now.
+
+        Args:
+            job_id (str): Job identifier
+            requirements (Dict): Output of estimate_job_requirements
+
+        Returns:
+            Tuple[bool, Dict]: (admitted, headroom before this job)
+        """
+        disk_needed = int(requirements.get('disk_bytes', 0))
+        ram_needed = int(requirements.get('ram_bytes', 0))
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                reservations = [row for row in self._live_reservations(conn) if row[0] != job_id]
+                headroom = self._headroom(reservations)
+                fits = headroom['disk_headroom_bytes'] >= disk_needed and (
+                    headroom['ram_headroom_bytes'] is None or headroom['ram_headroom_bytes'] >= ram_needed)
+
+                if fits or not reservations:
+                    conn.execute(
+                        '''INSERT OR REPLACE INTO reservations (job_id, pid, disk_bytes, ram_bytes, admitted_timestamp)
+                           VALUES (?, ?, ?, ?, ?)''',
+                        (job_id, os.getpid(), disk_needed, ram_needed, time.time())
+                    )
+                    self._held.add(job_id)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except Exception as e:
+            logger.warning(f"⚠️ Admission ledger unavailable - admitting job {job_id}: {str(e)}")
+            return True, {}
+
+        if not fits and not reservations:
+            with self._condition:
+                self._metrics['forced'] += 1
+            logger.warning(f"⚠️ Job {job_id} exceeds current headroom but no other job is running - admitting anyway")
+        return fits or not reservations, headroom
+
+    def admit(self, job_id: str, requirements: Dict[str, Any], max_wait: float = None) -> Dict[str, Any]:
+        """
+        Block until the job's resources can be reserved.
+
+        Args:
+            job_id (str): Job identifier
+            requirements (Dict): Output of estimate_job_requirements
+            max_wait (float): Seconds to wait before giving up (default: settings, 0 = indefinitely)
+
+        Returns:
+            Dict[str, Any]: Admission ticket {'job_id', 'wait_seconds', 'requirements', 'headroom'}
+
+        Raises:
+            AdmissionTimeout: If resources did not free up within max_wait
+        """
+        if not self.enabled:
+            return {'job_id': job_id, 'wait_seconds': 0.0, 'requirements': requirements, 'headroom': {}}
+
+        if max_wait is None:
+            max_wait = self.settings.get('max_wait_seconds', 0)
+        poll_interval = self.settings.get('poll_interval', 5.0)
+        started = time.monotonic()
+        announced = False
+
+        with self._condition:
+            self._waiting += 1
+        try:
+            while True:
+                admitted, headroom = self.try_admit(job_id, requirements)
+                if admitted:
+                    break
+
+                elapsed = time.monotonic() - started
+                if not announced:
+                    logger.info(f"⏳ Job {job_id} waiting for resources: needs "
+                                f"{requirements['disk_bytes'] / MB:.0f}MB disk / {requirements['ram_bytes'] / MB:.0f}MB RAM, "
+                                f"headroom {headroom['disk_headroom_bytes'] / MB:.0f}MB disk / "
+                                f"{(headroom['ram_headroom_bytes'] or 0) / MB:.0f}MB RAM "
+                                f"({headroom['active_jobs']} job(s) running)")
+                    announced = True
+                if max_wait and elapsed >= max_wait:
+                    with self._condition:
+                        self._metrics['timeouts'] += 1
+                    raise AdmissionTimeout(f"Job {job_id} waited {elapsed:.0f}s for disk/memory headroom")
+
+                # Releases in this process wake us early; other workers are seen on the next poll
+                remaining = max_wait - elapsed if max_wait else poll_interval
+                with self._condition:
+                    self._condition.wait(timeout=max(0.01, min(poll_interval, remaining)))
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+        wait_seconds = time.monotonic() - started
+        with self._condition:
+            self._metrics['admitted'] += 1
+            self._metrics['admitted_after_wait'] += int(announced)
+            self._metrics['total_wait_seconds'] += wait_seconds
+            self._metrics['max_wait_seconds'] = max(self._metrics['max_wait_seconds'], wait_seconds)
+
+        if announced:
+            logger.info(f"🚦 Job {job_id} admitted after waiting {wait_seconds:.1f}s")
+        return {'job_id': job_id, 'wait_seconds': wait_seconds, 'requirements': requirements, 'headroom': headroom}
+
+    def release(self, job_id: str) -> bool:
+        """
+        Return a job's reserved resources.
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            bool: True if a reservation was removed
+        """
+        removed = False
+        try:
+            cursor = self._connect().execute('DELETE FROM reservations WHERE job_id = ? AND pid = ?',
+                                             (job_id, os.getpid()))
+            removed = cursor.rowcount > 0
+        except Exception as e:
+            logger.warning(f"⚠️ Admission ledger: failed to release job {job_id}: {str(e)}")
+
+        with self._condition:
+            self._held.discard(job_id)
+            self._condition.notify_all()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get admission metrics and current headroom.
+
+        Returns:
+            Dict[str, Any]: Wait-time metrics, waiting/active job counts and headroom
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            waiting = self._waiting
+        metrics['average_wait_seconds'] = metrics['total_wait_seconds'] / metrics['admitted'] if metrics['admitted'] else 0.0
+        return {'enabled': self.enabled, 'waiting': waiting, **metrics, 'headroom': self.headroom()}
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_controller = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the global admission controller instance."""
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController()
+    return _controller
@@ -0,0 +1,305 @@
+"""
+StreamGank Job Checkpoint Store
+
+Persists each workflow step's outputs per job ID so a failed job can be
+resumed at its first incomplete step (python main.py --resume <job_id>)
+instead of repeating paid OpenAI, Vizard and HeyGen calls.
+
+Unlike utils.test_data_cache, checkpoints are written in every APP_ENV,
+including production, and are keyed by job rather than by parameters.
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Resumable Job Checkpoints
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = os.path.join('docker_volumes', 'checkpoints')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    workflow_id TEXT,
+    parameters TEXT NOT NULL,
+    status TEXT NOT NULL,
+    steps_completed TEXT NOT NULL DEFAULT '[]',
+    error TEXT,
+    failed_step INTEGER,
+    created_timestamp REAL NOT NULL,
+    updated_timestamp REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS step_checkpoints (
+    job_id TEXT NOT NULL,
+    step_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    saved_timestamp REAL NOT NULL,
+    PRIMARY KEY (job_id, step_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, updated_timestamp);
+"""
+
+# Job statuses that can be resumed
+RESUMABLE_STATUSES = ('running', 'failed', 'heygen_timeout')
+
+
+class JobCheckpointStore:
+    """
+    SQLite store for per-job workflow checkpoints.
+
+    One row per job (parameters and status) plus one row per completed
+    step_* section. All methods swallow and log storage errors - a broken
+    checkpoint store must never fail the workflow itself.
+    """
+
+    def __init__(self, checkpoint_dir: str = None):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            checkpoint_dir (str): Directory holding checkpoints.sqlite3 (default: CHECKPOINT_DIR or docker_volumes/checkpoints)
+        """
+        self.checkpoint_dir = Path(checkpoint_dir or os.getenv('CHECKPOINT_DIR', DEFAULT_CHECKPOINT_DIR))
+        self.db_path = self.checkpoint_dir / 'checkpoints.sqlite3'
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def start_job(self, job_id: str, parameters: Dict[str, Any], workflow_id: str = None) -> bool:
+        """
+        Register a job (or re-open an existing one for resume).
+
+        Args:
+            job_id (str): Job identifier
+            parameters (Dict): run_full_workflow arguments needed to resume the job
+            workflow_id (str): Workflow ID of the first run
+
+        Returns:
+            bool: True if recorded
+        """
+        try:
+            now = time.time()
+            self._connect().execute(
+                '''INSERT INTO jobs (job_id, workflow_id, parameters, status, created_timestamp, updated_timestamp)
+                   VALUES (?, ?, ?, 'running', ?, ?)
+                   ON CONFLICT (job_id) DO UPDATE SET
+                    status = 'running', error = NULL, failed_step = NULL,
+                    updated_timestamp = excluded.updated_timestamp''',
+                (job_id, workflow_id, json.dumps(parameters, ensure_ascii=False), now, now)
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to register job {job_id}: {str(e)}")
+            return False
+
+    def save_checkpoint(self, job_id: str, workflow_results: Dict[str, Any]) -> int:
+        """
+        Persist the completed step_* sections of a workflow in one transaction.
+
+        Steps whose payload is unchanged since the last checkpoint are skipped.
+
+        Args:
+            job_id (str): Job identifier
+            workflow_results (Dict): Workflow results as built by run_full_workflow
+
+        Returns:
+            int: Number of step records written
+        """
+        try:
+            conn = self._connect()
+            now = time.time()
+            written = 0
+
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                existing = dict(conn.execute(
+                    'SELECT step_key, payload_hash FROM step_checkpoints WHERE job_id = ?', (job_id,)
+                ).fetchall())
+
+                for step_key, step_data in workflow_results.items():
+                    if not step_key.startswith('step_') or not step_data:
+                        continue
+
+                    payload = json.dumps(step_data, ensure_ascii=False, separators=(',', ':'), default=str)
+                    payload_hash = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+                    if existing.get(step_key) == payload_hash:
+                        continue
+
+                    conn.execute(
+                        '''INSERT INTO step_checkpoints (job_id, step_key, payload, payload_hash, saved_timestamp)
+                           VALUES (?, ?, ?, ?, ?)
+                           ON CONFLICT (job_id, step_key) DO UPDATE SET
+                            payload = excluded.payload,
+                            payload_hash = excluded.payload_hash,
+                            saved_timestamp = excluded.saved_timestamp''',
+                        (job_id, step_key, payload, payload_hash, now)
+                    )
+                    written += 1
+
+                conn.execute(
+                    'UPDATE jobs SET steps_completed = ?, updated_timestamp = ? WHERE job_id = ?',
+                    (json.dumps(workflow_results.get('steps_completed', [])), now, job_id)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+            if written:
+                logger.debug(f"💾 Checkpoint saved for job {job_id}: {written} step(s) updated")
+            return written
+
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to save checkpoint for job {job_id}: {str(e)}")
+            return 0
+
+    def mark_status(self, job_id: str, status: str, error: str = None, failed_step: int = None) -> bool:
+        """
+        Update a job's status ('running', 'completed', 'failed', 'heygen_timeout').
+
+        Returns:
+            bool: True if updated
+        """
+        try:
+            self._connect().execute(
+                'UPDATE jobs SET status = ?, error = ?, failed_step = ?, updated_timestamp = ? WHERE job_id = ?',
+                (status, error, failed_step, time.time(), job_id)
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to update status for job {job_id}: {str(e)}")
+            return False
+
+    def delete_job(self, job_id: str) -> bool:
+        """Remove a job and all its step checkpoints."""
+        try:
+            conn = self._connect()
+            conn.execute('DELETE FROM step_checkpoints WHERE job_id = ?', (job_id,))
+            conn.execute('DELETE FROM jobs WHERE job_id = ?', (job_id,))
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to delete job {job_id}: {str(e)}")
+            return False
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def load_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a job's parameters, status and stored step sections.
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            Dict: {'job_id', 'workflow_id', 'parameters', 'status', 'error', 'failed_step',
+                   'steps_completed', 'steps': {step_key: data}} or None if unknown
+        """
+        if not self.db_path.exists():
+            return None
+
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                '''SELECT workflow_id, parameters, status, steps_completed, error, failed_step
+                   FROM jobs WHERE job_id = ?''', (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            workflow_id, parameters, status, steps_completed, error, failed_step = row
+            steps = {
+                step_key: json.loads(payload)
+                for step_key, payload in conn.execute(
+                    'SELECT step_key, payload FROM step_checkpoints WHERE job_id = ?', (job_id,)
+                ).fetchall()
+            }
+
+            return {
+                'job_id': job_id,
+                'workflow_id': workflow_id,
+                'parameters': json.loads(parameters),
+                'status': status,
+                'error': error,
+                'failed_step': failed_step,
+                'steps_completed': json.loads(steps_completed),
+                'steps': steps
+            }
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to load checkpoint for job {job_id}: {str(e)}")
+            return None
+
+    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List checkpointed jobs, newest first.
+
+        Args:
+            status (str): Optional status filter
+            limit (int): Maximum results
+
+        Returns:
+            List[Dict]: Job summaries
+        """
+        if not self.db_path.exists():
+            return []
+
+        query = 'SELECT job_id, status, steps_completed, failed_step, updated_timestamp FROM jobs'
+        values: List[Any] = []
+        if status:
+            query += ' WHERE status = ?'
+            values.append(status)
+        query += ' ORDER BY updated_timestamp DESC LIMIT ?'
+        values.append(limit)
+
+        try:
+            return [
+                {
+                    'job_id': job_id,
+                    'status': job_status,
+                    'steps_completed': json.loads(steps_completed),
+                    'failed_step': failed_step,
+                    'updated_timestamp': updated_timestamp,
+                    'resumable': job_status in RESUMABLE_STATUSES
+                }
+                for job_id, job_status, steps_completed, failed_step, updated_timestamp
+                in self._connect().execute(query, values).fetchall()
+            ]
+        except Exception as e:
+            logger.warning(f"⚠️ Checkpoint store: failed to list jobs: {str(e)}")
+            return []
+
+
+# Global checkpoint store instance
+_checkpoint_store = None
+
+def get_checkpoint_store() -> JobCheckpointStore:
+    """Get global job checkpoint store instance"""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = JobCheckpointStore()
+    return _checkpoint_store
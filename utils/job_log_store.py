@@ -0,0 +1,652 @@
+"""
+StreamGank Indexed Job Log Store
+
+Storage backend behind utils.job_logger. Every job keeps writing its append-only
+JSON-lines segment in docker_volumes/logs/jobs/<job_id>.log (the format the
+Node.js GUI reads and writes), and a compact SQLite index records where each
+line lives together with its timestamp, event type and level. Reads seek
+straight to the matching lines instead of parsing whole files.
+
+Features:
+- Append-only per-job segments with size-based rollover (<job_id>.log.<n>)
+- Index on (job_id, id), timestamp, event_type and level
+- Tail reads and reverse iteration without reading the rest of the file
+- Time-range, event, level and message filters, per job or across all jobs
+- Incremental catch-up of lines appended by other processes (Node.js logger)
+- Batched indexing: appended lines are indexed in one transaction per flush_index()
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Indexed Job Log Store
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # Roll segments over at 10MB
+DEFAULT_BACKUP_COUNT = 5  # Rolled segments kept per job
+INDEX_FILENAME = 'job_logs.sqlite3'
+
+# Segment 0 is always the active <job_id>.log file
+ACTIVE_SEGMENT = 0
+
+TimeValue = Union[float, int, str, datetime, None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_entries (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    byte_offset INTEGER NOT NULL,
+    byte_length INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    event_type TEXT NOT NULL,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_log_entries_job ON log_entries (job_id, id);
+CREATE INDEX IF NOT EXISTS idx_log_entries_job_ts ON log_entries (job_id, ts);
+CREATE INDEX IF NOT EXISTS idx_log_entries_ts ON log_entries (ts, id);
+CREATE INDEX IF NOT EXISTS idx_log_entries_event ON log_entries (event_type, ts);
+CREATE INDEX IF NOT EXISTS idx_log_entries_level ON log_entries (level, ts);
+
+CREATE TABLE IF NOT EXISTS log_segments (
+    job_id TEXT PRIMARY KEY,
+    indexed_bytes INTEGER NOT NULL DEFAULT 0,
+    next_segment INTEGER NOT NULL DEFAULT 1
+);
+"""
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def to_epoch(value: TimeValue) -> Optional[float]:
+    """
+    Convert a time filter value to epoch seconds.
+
+    Args:
+        value: Epoch seconds, datetime, or ISO 8601 string (naive values are UTC)
+
+    Returns:
+        float: Epoch seconds, or None when value is None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _entry_time(entry: Dict[str, Any]) -> float:
+    """Epoch seconds of a log entry (Python writes seconds, Node.js milliseconds)."""
+    process_time = entry.get('process_time')
+    if isinstance(process_time, (int, float)) and process_time > 0:
+        return process_time / 1000.0 if process_time > 1e11 else float(process_time)
+    try:
+        return to_epoch(entry.get('timestamp')) or 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _raw_entry(job_id: str, line: str) -> Dict[str, Any]:
+    """Entry used for lines that are not JSON (same shape as the legacy reader)."""
+    return {
+        'timestamp': datetime.utcnow().isoformat(),
+        'job_id': job_id,
+        'event_type': 'raw_log',
+        'level': 'info',
+        'message': line,
+        'details': {}
+    }
+
+# =============================================================================
+# STORE IMPLEMENTATION
+# =============================================================================
+
+class JobLogStore:
+    """
+    Append-only job log segments with a SQLite line index.
+
+    The .log files stay the source of truth; the index can always be rebuilt
+    from them (see reindex_job) and is brought up to date lazily before reads.
+    """
+
+    def __init__(self, job_logs_dir: str, index_path: str = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT):
+        """
+        Initialize the log store.
+
+        Args:
+            job_logs_dir (str): Directory holding the per-job segments
+            index_path (str): SQLite index file (default: <job_logs_dir>/../index/job_logs.sqlite3)
+            max_bytes (int): Active segment size that triggers a rollover
+            backup_count (int): Rolled segments kept per job
+        """
+        self.job_logs_dir = Path(job_logs_dir)
+        self.job_logs_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = Path(index_path) if index_path else self.job_logs_dir.parent / 'index' / INDEX_FILENAME
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._pending_jobs = set()  # Jobs with appended lines not yet indexed
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Connection management
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's index connection, creating the schema on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(str(self.index_path), timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+
+        self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close the calling thread's index connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local.conn = None
+
+    def segment_path(self, job_id: str, segment: int = ACTIVE_SEGMENT) -> Path:
+        """Path of a job's active (0) or rolled (n) segment."""
+        if segment == ACTIVE_SEGMENT:
+            return self.job_logs_dir / f"{job_id}.log"
+        return self.job_logs_dir / f"{job_id}.log.{segment}"
+
+    def list_segments(self, job_id: str) -> List[Tuple[int, Path]]:
+        """
+        Existing segments of a job, oldest rolled segment first and the active one last.
+
+        Returns:
+            List[Tuple[int, Path]]: (segment number, path) pairs
+        """
+        segments = []
+        for path in self.job_logs_dir.glob(f"{job_id}.log.*"):
+            suffix = path.name[len(f"{job_id}.log."):]
+            if suffix.isdigit():
+                segments.append((int(suffix), path))
+        segments.sort()
+
+        active = self.segment_path(job_id)
+        if active.exists():
+            segments.append((ACTIVE_SEGMENT, active))
+        return segments
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def open_segment(self, job_id: str):
+        """Open a job's active segment for appending (caller closes the handle)."""
+        return open(self.segment_path(job_id), 'ab')
+
+    def append(self, job_id: str, line: str, stream=None):
+        """
+        Append one log line to the job's active segment.
+
+        The line is only written here; indexing is batched by flush_index()
+        (and reads catch up on their own), so an index failure never loses
+        log data - the next sync picks the line up again.
+
+        Args:
+            job_id (str): Job identifier
+            line (str): Serialized log entry (without trailing newline)
+            stream: Open handle from open_segment() to write through (kept open);
+                    None opens and closes the segment for this line only
+
+        Returns:
+            The handle to use for the next append (replaced after a rollover), or None
+        """
+        data = (line.rstrip('\n') + '\n').encode('utf-8')
+        path = self.segment_path(job_id)
+
+        with self._write_lock:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+                if stream is not None:
+                    # Segment was moved away (archived) - start a fresh one
+                    stream.close()
+                    stream = self.open_segment(job_id)
+
+            if size and size + len(data) > self.max_bytes:
+                if stream is not None:
+                    stream.close()
+                self._rollover(job_id)
+                if stream is not None:
+                    stream = self.open_segment(job_id)
+
+            if stream is None:
+                with open(path, 'ab') as f:
+                    f.write(data)
+            else:
+                stream.write(data)
+                stream.flush()
+
+            self._pending_jobs.add(job_id)
+
+        return stream
+
+    def flush_index(self) -> int:
+        """
+        Index every line appended since the last flush in a single transaction.
+
+        Returns:
+            int: Number of lines indexed
+        """
+        with self._write_lock:
+            job_ids = sorted(self._pending_jobs)
+            self._pending_jobs.clear()
+        if not job_ids:
+            return 0
+
+        try:
+            return self.sync_jobs(job_ids)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"❌ Failed to index log lines for {len(job_ids)} job(s): {str(e)}")
+            return 0
+
+    def _rollover(self, job_id: str) -> None:
+        """Move the active segment to the next rolled slot and prune old segments."""
+        self.sync_job(job_id)
+        conn = self._connect()
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT next_segment FROM log_segments WHERE job_id = ?', (job_id,)).fetchone()
+            segment = row[0] if row else 1
+
+            os.replace(self.segment_path(job_id), self.segment_path(job_id, segment))
+            conn.execute('UPDATE log_entries SET segment = ? WHERE job_id = ? AND segment = ?',
+                         (segment, job_id, ACTIVE_SEGMENT))
+            conn.execute(
+                '''INSERT INTO log_segments (job_id, indexed_bytes, next_segment) VALUES (?, 0, ?)
+                   ON CONFLICT (job_id) DO UPDATE SET indexed_bytes = 0, next_segment = excluded.next_segment''',
+                (job_id, segment + 1)
+            )
+
+            oldest_kept = segment - self.backup_count + 1
+            conn.execute('DELETE FROM log_entries WHERE job_id = ? AND segment != ? AND segment < ?',
+                         (job_id, ACTIVE_SEGMENT, oldest_kept))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        for old_segment in range(max(1, oldest_kept - self.backup_count), oldest_kept):
+            try:
+                self.segment_path(job_id, old_segment).unlink()
+            except FileNotFoundError:
+                pass
+
+        logger.debug(f"🔄 Rolled log segment {segment} for job {job_id}")
+
+    # -------------------------------------------------------------------------
+    # Index maintenance
+    # -------------------------------------------------------------------------
+
+    def sync_job(self, job_id: str) -> int:
+        """
+        Index lines appended to a job's active segment since the last sync.
+
+        Only the unindexed tail of the file is read. A segment that shrank
+        (replaced or truncated outside this store) is re-indexed from scratch.
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            int: Number of lines indexed
+        """
+        return self.sync_jobs([job_id])
+
+    def sync_jobs(self, job_ids: List[str]) -> int:
+        """
+        Index the new lines of several jobs in one transaction.
+
+        Args:
+            job_ids (List[str]): Job identifiers
+
+        Returns:
+            int: Number of lines indexed
+        """
+        conn = self._connect()
+        sizes = {}
+        for job_id in job_ids:
+            try:
+                size = self.segment_path(job_id).stat().st_size
+            except FileNotFoundError:
+                size = 0
+            row = conn.execute('SELECT indexed_bytes FROM log_segments WHERE job_id = ?', (job_id,)).fetchone()
+            if row is None or row[0] != size:
+                sizes[job_id] = size
+        if not sizes:
+            return 0
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            indexed = sum(self._index_segment_tail(conn, job_id, size) for job_id, size in sizes.items())
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        return indexed
+
+    def _index_segment_tail(self, conn: sqlite3.Connection, job_id: str, size: int) -> int:
+        """Index the unindexed tail of a job's active segment (caller holds the transaction)."""
+        row = conn.execute('SELECT indexed_bytes FROM log_segments WHERE job_id = ?', (job_id,)).fetchone()
+        indexed_bytes = row[0] if row else 0
+
+        if size < indexed_bytes:
+            conn.execute('DELETE FROM log_entries WHERE job_id = ? AND segment = ?', (job_id, ACTIVE_SEGMENT))
+            indexed_bytes = 0
+
+        indexed = 0
+        if size > indexed_bytes:
+            with open(self.segment_path(job_id), 'rb') as f:
+                f.seek(indexed_bytes)
+                chunk = f.read(size - indexed_bytes)
+
+            end = chunk.rfind(b'\n') + 1  # Partial trailing lines wait for the next sync
+            rows = self._index_rows(job_id, chunk[:end], indexed_bytes)
+            conn.executemany(
+                '''INSERT INTO log_entries
+                   (job_id, segment, byte_offset, byte_length, ts, event_type, level, message)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                rows
+            )
+            indexed = len(rows)
+            indexed_bytes += end
+
+        conn.execute(
+            '''INSERT INTO log_segments (job_id, indexed_bytes) VALUES (?, ?)
+               ON CONFLICT (job_id) DO UPDATE SET indexed_bytes = excluded.indexed_bytes''',
+            (job_id, indexed_bytes)
+        )
+        return indexed
+
+    @staticmethod
+    def _index_rows(job_id: str, chunk: bytes, base_offset: int) -> List[Tuple]:
+        """Build index rows for the complete lines in a chunk of a segment."""
+        rows = []
+        offset = base_offset
+        for raw_line in chunk.split(b'\n')[:-1]:
+            length = len(raw_line) + 1
+            text = raw_line.decode('utf-8', errors='replace').strip()
+            if text:
+                try:
+                    entry = json.loads(text)
+                    if not isinstance(entry, dict):
+                        raise ValueError('log line is not an object')
+                except ValueError:
+                    entry = {'event_type': 'raw_log', 'level': 'info', 'message': text}
+                rows.append((
+                    job_id, ACTIVE_SEGMENT, offset, length, _entry_time(entry),
+                    str(entry.get('event_type') or ''), str(entry.get('level') or 'info'),
+                    str(entry.get('message') or '')
+                ))
+            offset += length
+        return rows
+
+    def sync_all(self) -> int:
+        """
+        Bring the index up to date for every job in the log directory.
+
+        Costs one stat() per active segment; only new bytes are parsed. Jobs
+        whose segments were moved away (archived) are dropped from the index.
+
+        Returns:
+            int: Number of lines indexed
+        """
+        conn = self._connect()
+        known = dict(conn.execute('SELECT job_id, indexed_bytes FROM log_segments').fetchall())
+
+        indexed = 0
+        present = set()
+        for path in self.job_logs_dir.glob('*.log'):
+            job_id = path.stem
+            present.add(job_id)
+            try:
+                if known.get(job_id) == path.stat().st_size:
+                    continue
+                indexed += self.sync_job(job_id)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ Could not index logs for job {job_id}: {str(e)}")
+
+        for job_id in set(known) - present:
+            if not any(self.job_logs_dir.glob(f"{job_id}.log.*")):
+                self.forget_job(job_id)
+
+        return indexed
+
+    def reindex_job(self, job_id: str) -> int:
+        """
+        Rebuild a job's index from its active segment.
+
+        Returns:
+            int: Number of lines indexed
+        """
+        self.forget_job(job_id)
+        return self.sync_job(job_id)
+
+    def forget_job(self, job_id: str) -> None:
+        """Drop a job from the index (its segment files are left untouched)."""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM log_entries WHERE job_id = ?', (job_id,))
+            conn.execute('DELETE FROM log_segments WHERE job_id = ?', (job_id,))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def _load_entries(self, rows: List[Tuple]) -> List[Dict[str, Any]]:
+        """Read the indexed lines from their segments, opening each segment once."""
+        handles = {}
+        entries = []
+        try:
+            for job_id, segment, byte_offset, byte_length in rows:
+                key = (job_id, segment)
+                if key not in handles:
+                    try:
+                        handles[key] = open(self.segment_path(job_id, segment), 'rb')
+                    except FileNotFoundError:
+                        handles[key] = None
+                handle = handles[key]
+                if handle is None:
+                    continue
+
+                handle.seek(byte_offset)
+                text = handle.read(byte_length).decode('utf-8', errors='replace').strip()
+                try:
+                    entry = json.loads(text)
+                    entries.append(entry if isinstance(entry, dict) else _raw_entry(job_id, text))
+                except ValueError:
+                    entries.append(_raw_entry(job_id, text))
+        finally:
+            for handle in handles.values():
+                if handle is not None:
+                    handle.close()
+        return entries
+
+    def iter_entries(self, job_id: str = None, event_type: str = None, level: str = None,
+                     message_contains: str = None, since: TimeValue = None, until: TimeValue = None,
+                     newest_first: bool = True, batch_size: int = 200) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate matching log entries, newest first by default.
+
+        Entries are fetched from the index in keyset-paginated batches, so
+        stopping early never touches the rest of the log.
+
+        Args:
+            job_id (str): Restrict to one job (ordered by append order); None searches all jobs (ordered by time)
+            event_type (str): Exact event type
+            level (str): Exact log level
+            message_contains (str): Case-insensitive message substring
+            since: Only entries at or after this time (epoch, datetime or ISO string)
+            until: Only entries at or before this time
+            newest_first (bool): Iterate from the end of the log backwards
+            batch_size (int): Index rows fetched per query
+
+        Yields:
+            Dict[str, Any]: Log entries as written to the segment
+        """
+        if job_id:
+            self.sync_job(job_id)
+        else:
+            self.sync_all()
+
+        clauses = []
+        values: List[Any] = []
+        for column, value in (('job_id', job_id), ('event_type', event_type), ('level', level)):
+            if value:
+                clauses.append(f"{column} = ?")
+                values.append(value)
+        if message_contains:
+            clauses.append('instr(lower(message), ?) > 0')
+            values.append(message_contains.lower())
+        if since is not None:
+            clauses.append('ts >= ?')
+            values.append(to_epoch(since))
+        if until is not None:
+            clauses.append('ts <= ?')
+            values.append(to_epoch(until))
+
+        direction = 'DESC' if newest_first else 'ASC'
+        compare = '<' if newest_first else '>'
+        order = f"id {direction}" if job_id else f"ts {direction}, id {direction}"
+
+        conn = self._connect()
+        cursor = None
+        while True:
+            page_clauses = list(clauses)
+            page_values = list(values)
+            if cursor is not None:
+                last_ts, last_id = cursor
+                if job_id:
+                    page_clauses.append(f"id {compare} ?")
+                    page_values.append(last_id)
+                else:
+                    page_clauses.append(f"(ts {compare} ? OR (ts = ? AND id {compare} ?))")
+                    page_values.extend([last_ts, last_ts, last_id])
+
+            where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ''
+            rows = conn.execute(
+                f'''SELECT id, ts, job_id, segment, byte_offset, byte_length FROM log_entries
+                    {where} ORDER BY {order} LIMIT ?''',
+                page_values + [batch_size]
+            ).fetchall()
+            if not rows:
+                return
+
+            yield from self._load_entries([row[2:] for row in rows])
+
+            if len(rows) < batch_size:
+                return
+            cursor = (rows[-1][1], rows[-1][0])
+
+    def query(self, limit: int = 100, **filters) -> List[Dict[str, Any]]:
+        """
+        Collect up to `limit` entries matching the filters of iter_entries().
+
+        Returns:
+            List[Dict]: Matching entries (newest first unless newest_first=False)
+        """
+        entries = []
+        if limit <= 0:
+            return entries
+        for entry in self.iter_entries(batch_size=min(max(limit, 1), 500), **filters):
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+        return entries
+
+    def tail(self, job_id: str, limit: int = 1000, since: TimeValue = None,
+             until: TimeValue = None) -> List[Dict[str, Any]]:
+        """
+        Last `limit` entries of a job in chronological order.
+
+        Args:
+            job_id (str): Job identifier
+            limit (int): Maximum number of entries
+            since: Optional lower time bound
+            until: Optional upper time bound
+
+        Returns:
+            List[Dict]: Entries, oldest first
+        """
+        entries = self.query(limit=limit, job_id=job_id, since=since, until=until)
+        entries.reverse()
+        return entries
+
+    def count(self, job_id: str = None) -> int:
+        """Number of indexed entries for a job (or all jobs)."""
+        conn = self._connect()
+        if job_id:
+            self.sync_job(job_id)
+            return conn.execute('SELECT COUNT(*) FROM log_entries WHERE job_id = ?', (job_id,)).fetchone()[0]
+        self.sync_all()
+        return conn.execute('SELECT COUNT(*) FROM log_entries').fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Index statistics (no segment files are read).
+
+        Returns:
+            Dict[str, Any]: Indexed jobs, entries and index file size
+        """
+        conn = self._connect()
+        jobs, entries = conn.execute(
+            'SELECT COUNT(*), (SELECT COUNT(*) FROM log_entries) FROM log_segments'
+        ).fetchone()
+        index_bytes = self.index_path.stat().st_size if self.index_path.exists() else 0
+        return {
+            'indexed_jobs': jobs,
+            'indexed_entries': entries,
+            'index_size_mb': round(index_bytes / 1024 / 1024, 2),
+            'index_path': str(self.index_path)
+        }
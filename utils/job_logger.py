@@ -1,30 +1,252 @@
 """
 Professional Job Logging System for StreamGank
 Provides structured, persistent logging for all job processes with rotation and archiving
+
+Job logs are append-only JSON-lines segments indexed by utils.job_log_store, so
+tail reads, time-range queries and cross-job searches never parse whole files.
 """
 
 import os
 import json
+import queue
+import atexit
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Any, Optional
+from logging.handlers import RotatingFileHandler, QueueHandler
+from typing import Dict, List, Any, Optional, Iterator
+
+from utils.job_log_store import JobLogStore, TimeValue
+
+
+class _JobIdFilter(logging.Filter):
+    """Stamps records with the job they belong to (routing key of JobLogDispatchHandler)"""
+    
+    def __init__(self, job_id: str):
+        super().__init__()
+        self.job_id = job_id
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.job_id = self.job_id
+        return True
+
+
+class JobLogStoreHandler(logging.Handler):
+    """Logging handler appending formatted records to a job's indexed log segment"""
+    
+    def __init__(self, store: JobLogStore, job_id: str):
+        super().__init__()
+        self.store = store
+        self.job_id = job_id
+        self.stream = None
+        self.last_used = time.monotonic()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self.store.open_segment(self.job_id)
+            self.stream = self.store.append(self.job_id, self.format(record), self.stream)
+            self.last_used = time.monotonic()
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+
+class JobLogDispatchHandler(logging.Handler):
+    """
+    Routes queued records to per-job segment handlers
+    Open handlers live in an LRU cache bounded by max_open_files and are closed
+    after idle_timeout seconds without writes
+    """
+    
+    def __init__(self, store: JobLogStore, max_open_files: int = 64, idle_timeout: float = 300,
+                 on_new_job=None):
+        """
+        Args:
+            store (JobLogStore): Segment store to write through
+            max_open_files (int): Maximum simultaneously open job segments
+            idle_timeout (float): Seconds after which an unused segment is closed
+            on_new_job (callable): job_id -> log line written first to a brand-new segment
+        """
+        super().__init__()
+        self.store = store
+        self.max_open_files = max(1, max_open_files)
+        self.idle_timeout = idle_timeout
+        self.on_new_job = on_new_job
+        self.handlers: "OrderedDict[str, JobLogStoreHandler]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.stats = {'opened': 0, 'evicted_lru': 0, 'evicted_idle': 0}
+    
+    def _get_handler(self, job_id: str) -> JobLogStoreHandler:
+        """Get the cached handler for a job, opening one (and evicting the LRU entry) if needed"""
+        evicted = []
+        with self._cache_lock:
+            handler = self.handlers.get(job_id)
+            if handler is not None:
+                self.handlers.move_to_end(job_id)
+                return handler
+            
+            is_new_job = not self.store.segment_path(job_id).exists()
+            handler = JobLogStoreHandler(self.store, job_id)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.handlers[job_id] = handler
+            self.stats['opened'] += 1
+            
+            while len(self.handlers) > self.max_open_files:
+                _, old_handler = self.handlers.popitem(last=False)
+                evicted.append(old_handler)
+                self.stats['evicted_lru'] += 1
+        
+        for old_handler in evicted:
+            old_handler.close()
+        
+        if is_new_job and self.on_new_job is not None:
+            handler.handle(logging.makeLogRecord({'msg': self.on_new_job(job_id), 'levelno': logging.INFO}))
+        return handler
+    
+    def emit(self, record: logging.LogRecord):
+        job_id = getattr(record, 'job_id', None)
+        if not job_id:
+            return
+        self._get_handler(job_id).handle(record)
+    
+    def close_idle(self) -> int:
+        """
+        Close handlers that have not written for idle_timeout seconds
+        
+        Returns:
+            int: Number of handlers closed
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._cache_lock:
+            idle = [job_id for job_id, handler in self.handlers.items() if handler.last_used < cutoff]
+            closing = [self.handlers.pop(job_id) for job_id in idle]
+            self.stats['evicted_idle'] += len(closing)
+        
+        for handler in closing:
+            handler.close()
+        return len(closing)
+    
+    def close_job(self, job_id: str):
+        """Close and forget the handler of one job"""
+        with self._cache_lock:
+            handler = self.handlers.pop(job_id, None)
+        if handler is not None:
+            handler.close()
+    
+    def close(self):
+        with self._cache_lock:
+            handlers = list(self.handlers.values())
+            self.handlers.clear()
+        for handler in handlers:
+            handler.close()
+        super().close()
+
+
+class JobLogWriter:
+    """
+    Single background thread draining the job log queue (QueueListener style)
+    Workflow threads only enqueue records; all disk and index I/O happens here.
+    Lines are indexed in one transaction per batch: whenever the queue runs dry,
+    before a flush marker is released, or every index_batch_size records
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, log_queue: queue.Queue, dispatcher: JobLogDispatchHandler, sweep_interval: float = 30,
+                 index_batch_size: int = 500):
+        self.queue = log_queue
+        self.dispatcher = dispatcher
+        self.sweep_interval = sweep_interval
+        self.index_batch_size = max(1, index_batch_size)
+        self._thread = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='job-log-writer', daemon=True)
+        self._thread.start()
+    
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def _run(self):
+        last_sweep = time.monotonic()
+        unindexed = 0
+        while True:
+            try:
+                item = self.queue.get(timeout=self.sweep_interval)
+            except queue.Empty:
+                item = None
+            
+            if item is self._STOP:
+                self.dispatcher.store.flush_index()
+                break
+            if isinstance(item, threading.Event):
+                self.dispatcher.store.flush_index()
+                unindexed = 0
+                item.set()  # Flush marker - everything queued before it is written and indexed
+            elif item is not None:
+                try:
+                    self.dispatcher.handle(item)
+                except Exception:
+                    pass  # Handler errors are reported by logging.Handler.handleError
+                unindexed += 1
+                if unindexed >= self.index_batch_size or self.queue.empty():
+                    self.dispatcher.store.flush_index()
+                    unindexed = 0
+            
+            if time.monotonic() - last_sweep >= self.sweep_interval:
+                self.dispatcher.close_idle()
+                last_sweep = time.monotonic()
+    
+    def flush(self, timeout: float = 5) -> bool:
+        """
+        Wait until every record queued so far has been written
+        
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        if not self.is_alive():
+            return True
+        marker = threading.Event()
+        self.queue.put(marker)
+        return marker.wait(timeout)
+    
+    def stop(self, timeout: float = 10):
+        """Write remaining records and stop the thread"""
+        if self.is_alive():
+            self.queue.put(self._STOP)
+            self._thread.join(timeout)
 
 
 class JobLogger:
     """
     Professional logging system for job processes
-    Features: File persistence, JSON structure, log rotation, search capabilities
+    Features: File persistence, JSON structure, log rotation, search capabilities,
+    bounded open-file cache and a background writer thread
     """
     
-    def __init__(self, base_log_dir: str = "docker_volumes/logs"):
+    def __init__(self, base_log_dir: str = "docker_volumes/logs", max_open_files: int = 64,
+                 idle_timeout: float = 300, flush_timeout: float = 5):
         """
         Initialize job logger with file persistence
         
         Args:
             base_log_dir (str): Base directory for log files
+            max_open_files (int): LRU bound on simultaneously open job log segments
+            idle_timeout (float): Seconds before an unused job log segment is closed
+            flush_timeout (float): Seconds reads wait for queued writes to land
         """
         self.base_log_dir = Path(base_log_dir)
         self.base_log_dir.mkdir(parents=True, exist_ok=True)
@@ -44,8 +266,30 @@ class JobLogger:
         # Configure system logger
         self.system_logger = self._setup_system_logger()
         
-        # Active job loggers cache
-        self.job_loggers = {}
+        # Indexed segment store backing job log reads and writes
+        self.log_store = JobLogStore(
+            self.job_logs_dir,
+            index_path=self.base_log_dir / "index" / "job_logs.sqlite3",
+            max_bytes=self.max_bytes,
+            backup_count=self.backup_count
+        )
+        
+        # Per-job segment handlers (LRU + idle timeout), fed by one writer thread
+        self.flush_timeout = flush_timeout
+        self.dispatcher = JobLogDispatchHandler(
+            self.log_store,
+            max_open_files=max_open_files,
+            idle_timeout=idle_timeout,
+            on_new_job=self._job_started_line
+        )
+        self.log_queue = queue.Queue()
+        self.writer = JobLogWriter(self.log_queue, self.dispatcher, sweep_interval=min(30, max(1, idle_timeout / 2)))
+        self.writer.start()
+        
+        # One shared logger for all jobs - records carry their job_id. It is not
+        # registered with logging.getLogger, so job IDs never accumulate there
+        self.events_logger = logging.Logger("streamgank_job_events", logging.INFO)
+        self.events_logger.addHandler(QueueHandler(self.log_queue))
         
         self.system_logger.info("JobLogger initialized successfully")
     
@@ -71,7 +315,11 @@ class JobLogger:
     
     def get_job_logger(self, job_id: str) -> logging.Logger:
         """
-        Get or create a dedicated logger for a specific job
+        Get a logger writing to a specific job's log
+        
+        The logger is not registered with logging.getLogger (nothing is kept
+        per job); its records are stamped with the job_id and written by the
+        writer thread.
         
         Args:
             job_id (str): Unique job identifier
@@ -79,33 +327,42 @@ class JobLogger:
         Returns:
             logging.Logger: Configured job logger
         """
-        if job_id not in self.job_loggers:
-            logger = logging.getLogger(f"job_{job_id}")
-            logger.setLevel(logging.INFO)
-            
-            # Create log file for this job
-            job_log_file = self.job_logs_dir / f"{job_id}.log"
-            
-            handler = RotatingFileHandler(
-                job_log_file,
-                maxBytes=self.max_bytes,
-                backupCount=self.backup_count
-            )
-            
-            # JSON formatter for structured logging
-            formatter = logging.Formatter('%(message)s')
-            handler.setFormatter(formatter)
-            
-            logger.addHandler(handler)
-            self.job_loggers[job_id] = logger
-            
-            # Log job start
-            self.log_job_event(job_id, "job_started", "Job logging initialized", {
-                'log_file': str(job_log_file),
+        logger = logging.Logger(f"job_{job_id}", logging.INFO)
+        logger.addFilter(_JobIdFilter(job_id))
+        logger.addHandler(QueueHandler(self.log_queue))
+        return logger
+    
+    def _job_started_line(self, job_id: str) -> str:
+        """First entry of a new job log segment"""
+        return json.dumps({
+            'timestamp': datetime.utcnow().isoformat(),
+            'job_id': job_id,
+            'event_type': 'job_started',
+            'level': 'info',
+            'message': 'Job logging initialized',
+            'details': {
+                'log_file': str(self.log_store.segment_path(job_id)),
                 'timestamp': datetime.utcnow().isoformat()
-            })
+            },
+            'process_time': time.time()
+        }, ensure_ascii=False)
+    
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait for queued job log writes to reach disk
         
-        return self.job_loggers[job_id]
+        Args:
+            timeout (float): Maximum seconds to wait (default: flush_timeout)
+            
+        Returns:
+            bool: True if everything queued was written
+        """
+        return self.writer.flush(self.flush_timeout if timeout is None else timeout)
+    
+    def close(self):
+        """Write queued records, stop the writer thread and close all job segments"""
+        self.writer.stop()
+        self.dispatcher.close()
     
     def log_job_event(self, job_id: str, event_type: str, message: str, 
                      details: Dict[str, Any] = None, level: str = "info"):
@@ -119,8 +376,6 @@ class JobLogger:
             details (Dict): Additional structured data
             level (str): Log level (info, warning, error, debug)
         """
-        logger = self.get_job_logger(job_id)
-        
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'job_id': job_id,
@@ -134,15 +389,18 @@ class JobLogger:
         # Log as JSON for structured parsing
         log_line = json.dumps(log_entry, ensure_ascii=False)
         
-        # Log at appropriate level
-        if level == "error":
-            logger.error(log_line)
-        elif level == "warning":
-            logger.warning(log_line)
-        elif level == "debug":
-            logger.debug(log_line)
-        else:
-            logger.info(log_line)
+        # Queue for the writer thread; written inline once the writer has stopped
+        levelno = {
+            "error": logging.ERROR,
+            "warning": logging.WARNING,
+            "debug": logging.DEBUG
+        }.get(level, logging.INFO)
+        if self.writer.is_alive():
+            self.events_logger.log(levelno, log_line, extra={'job_id': job_id})
+        elif levelno >= self.events_logger.level:
+            self.dispatcher.handle(self.events_logger.makeRecord(
+                self.events_logger.name, levelno, __file__, 0, log_line, None, None, extra={'job_id': job_id}
+            ))
         
         # Also log to system logger for monitoring
         self.system_logger.info(f"Job {job_id[-8:]}: {event_type} - {message}")
@@ -226,51 +484,46 @@ class JobLogger:
             "error"
         )
     
-    def get_job_logs(self, job_id: str, limit: int = 1000) -> List[Dict[str, Any]]:
+    def get_job_logs(self, job_id: str, limit: int = 1000, since: TimeValue = None,
+                     until: TimeValue = None) -> List[Dict[str, Any]]:
         """
-        Retrieve logs for a specific job
+        Retrieve the most recent logs for a specific job
         
         Args:
             job_id (str): Job identifier
             limit (int): Maximum number of log entries to return
+            since: Only entries at or after this time (epoch, datetime or ISO string)
+            until: Only entries at or before this time
             
         Returns:
-            List[Dict]: List of log entries
+            List[Dict]: Last `limit` log entries, oldest first
         """
-        job_log_file = self.job_logs_dir / f"{job_id}.log"
-        
-        if not job_log_file.exists():
-            return []
-        
-        logs = []
+        self.flush()
         try:
-            with open(job_log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            log_entry = json.loads(line)
-                            logs.append(log_entry)
-                        except json.JSONDecodeError:
-                            # Handle non-JSON log lines
-                            logs.append({
-                                'timestamp': datetime.utcnow().isoformat(),
-                                'job_id': job_id,
-                                'event_type': 'raw_log',
-                                'level': 'info',
-                                'message': line,
-                                'details': {}
-                            })
+            return self.log_store.tail(job_id, limit, since=since, until=until)
         except Exception as e:
             self.system_logger.error(f"Failed to read logs for job {job_id}: {str(e)}")
             return []
+    
+    def iter_job_logs(self, job_id: str, newest_first: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate a job's logs lazily, newest first by default
         
-        # Return most recent logs first, limited
-        return logs[-limit:]
+        Args:
+            job_id (str): Job identifier
+            newest_first (bool): Walk the log backwards from the end
+            **filters: event_type, level, message_contains, since, until
+            
+        Yields:
+            Dict: Log entries
+        """
+        self.flush()
+        return self.log_store.iter_entries(job_id=job_id, newest_first=newest_first, **filters)
     
     def search_logs(self, job_id: str = None, event_type: str = None, 
                    level: str = None, message_contains: str = None,
-                   limit: int = 100) -> List[Dict[str, Any]]:
+                   limit: int = 100, since: TimeValue = None,
+                   until: TimeValue = None) -> List[Dict[str, Any]]:
         """
         Search logs with filters
         
@@ -280,35 +533,26 @@ class JobLogger:
             level (str): Filter by log level
             message_contains (str): Filter by message content
             limit (int): Maximum results
+            since: Only entries at or after this time (epoch, datetime or ISO string)
+            until: Only entries at or before this time
             
         Returns:
-            List[Dict]: Filtered log entries
+            List[Dict]: Filtered log entries, newest first
         """
-        if job_id:
-            # Search specific job
-            logs = self.get_job_logs(job_id)
-        else:
-            # Search all jobs (this could be expensive)
-            logs = []
-            for log_file in self.job_logs_dir.glob("*.log"):
-                job_logs = self.get_job_logs(log_file.stem)
-                logs.extend(job_logs)
-        
-        # Apply filters
-        filtered_logs = []
-        for log in logs:
-            if event_type and log.get('event_type') != event_type:
-                continue
-            if level and log.get('level') != level:
-                continue
-            if message_contains and message_contains.lower() not in log.get('message', '').lower():
-                continue
-            
-            filtered_logs.append(log)
-        
-        # Sort by timestamp (newest first) and limit
-        filtered_logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return filtered_logs[:limit]
+        self.flush()
+        try:
+            return self.log_store.query(
+                limit=limit,
+                job_id=job_id,
+                event_type=event_type,
+                level=level,
+                message_contains=message_contains,
+                since=since,
+                until=until
+            )
+        except Exception as e:
+            self.system_logger.error(f"Failed to search logs: {str(e)}")
+            return []
     
     def archive_job_logs(self, job_id: str) -> bool:
         """
@@ -321,26 +565,24 @@ class JobLogger:
             bool: Success status
         """
         try:
-            job_log_file = self.job_logs_dir / f"{job_id}.log"
+            # Write pending records and close the job's segment handler
+            self.flush()
+            self.dispatcher.close_job(job_id)
             
-            if not job_log_file.exists():
+            segments = self.log_store.list_segments(job_id)
+            if not segments:
                 return False
             
-            # Create archive filename with timestamp
-            archive_filename = f"{job_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.log"
-            archive_path = self.archived_logs_dir / archive_filename
-            
-            # Move log file to archive
-            job_log_file.rename(archive_path)
+            # Archive filenames share a timestamp; rolled segments keep their number
+            archive_stem = f"{job_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+            for segment, segment_path in segments:
+                suffix = f".{segment}.log" if segment else ".log"
+                segment_path.rename(self.archived_logs_dir / f"{archive_stem}{suffix}")
             
-            # Remove from active loggers cache
-            if job_id in self.job_loggers:
-                # Close handler
-                for handler in self.job_loggers[job_id].handlers:
-                    handler.close()
-                del self.job_loggers[job_id]
+            # Drop the job from the index once all of its segments are moved
+            self.log_store.forget_job(job_id)
             
-            self.system_logger.info(f"Archived logs for job {job_id} to {archive_filename}")
+            self.system_logger.info(f"Archived {len(segments)} log segment(s) for job {job_id} as {archive_stem}")
             return True
             
         except Exception as e:
@@ -350,10 +592,13 @@ class JobLogger:
     def get_log_stats(self) -> Dict[str, Any]:
         """Get logging system statistics"""
         return {
-            'active_job_loggers': len(self.job_loggers),
+            'active_job_loggers': len(self.dispatcher.handlers),
+            'handler_cache': dict(self.dispatcher.stats),
+            'queued_records': self.log_queue.qsize(),
             'active_log_files': len(list(self.job_logs_dir.glob("*.log"))),
             'archived_log_files': len(list(self.archived_logs_dir.glob("*.log"))),
             'total_log_size_mb': sum(f.stat().st_size for f in self.job_logs_dir.glob("*.log")) / (1024 * 1024),
+            'index': self.log_store.stats(),
             'base_log_dir': str(self.base_log_dir),
             'log_dirs': {
                 'jobs': str(self.job_logs_dir),
@@ -386,12 +631,21 @@ class JobLogger:
 
 # Global job logger instance
 _job_logger = None
+_job_logger_lock = threading.Lock()
 
 def get_job_logger() -> JobLogger:
     """Get global job logger instance"""
     global _job_logger
     if _job_logger is None:
-        _job_logger = JobLogger()
+        with _job_logger_lock:
+            if _job_logger is None:
+                from config.settings import LOGGING_SETTINGS
+                _job_logger = JobLogger(
+                    max_open_files=LOGGING_SETTINGS.get('job_log_max_open_files', 64),
+                    idle_timeout=LOGGING_SETTINGS.get('job_log_idle_timeout', 300),
+                    flush_timeout=LOGGING_SETTINGS.get('job_log_flush_timeout', 5)
+                )
+                atexit.register(_job_logger.close)
     return _job_logger
 
 
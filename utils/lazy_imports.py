@@ -0,0 +1,138 @@
+"""
+StreamGank Lazy Imports
+
+Deferred loading for package exports and heavy third-party dependencies, so
+quick CLI paths (--check-creatomate, --job-status) and worker cold starts
+only pay for the modules they actually use.
+
+Features:
+- PEP 562 package attributes: `from video import X` loads only the submodule defining X
+- Wildcard-compatible fallback search for names not in the export map
+- Module proxies (numpy, cv2, PIL, ...) imported on first attribute access
+- Thread-safe, one-time resolution
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Lazy Import Architecture
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+_import_lock = threading.RLock()
+
+
+class LazyModule:
+    """
+    Stand-in for a module (or one of its attributes) that is imported on first use.
+
+    Usage:
+        np = lazy_import('numpy')                # np.mean(...) imports numpy
+        VideoFileClip = lazy_import('moviepy.editor', 'VideoFileClip')
+    """
+
+    def __init__(self, module_name: str, attribute: str = None):
+        self.__dict__['_lazy_module_name'] = module_name
+        self.__dict__['_lazy_attribute'] = attribute
+        self.__dict__['_lazy_target'] = None
+
+    def _resolve(self) -> Any:
+        target = self.__dict__['_lazy_target']
+        if target is None:
+            with _import_lock:
+                target = self.__dict__['_lazy_target']
+                if target is None:
+                    target = importlib.import_module(self.__dict__['_lazy_module_name'])
+                    if self.__dict__['_lazy_attribute']:
+                        target = getattr(target, self.__dict__['_lazy_attribute'])
+                    self.__dict__['_lazy_target'] = target
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._resolve())
+
+    def __repr__(self) -> str:
+        name = self.__dict__['_lazy_module_name']
+        if self.__dict__['_lazy_attribute']:
+            name = f"{name}.{self.__dict__['_lazy_attribute']}"
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: str = None) -> LazyModule:
+    """
+    Defer importing a module until it is first used.
+
+    Args:
+        module_name (str): Absolute module name ('numpy', 'PIL.Image', ...)
+        attribute (str): Optional module attribute to stand in for (a class or function)
+
+    Returns:
+        LazyModule: Proxy forwarding attribute access and calls to the real object
+    """
+    return LazyModule(module_name, attribute)
+
+
+def lazy_package(package_name: str, package_globals: Dict[str, Any], exports: Dict[str, str],
+                 submodules: Sequence[str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 __getattr__/__dir__ for a package that used to wildcard-import its submodules.
+
+    Names in `exports` load only their submodule, and submodule names load that
+    submodule. Any other public name is looked up in `submodules` from last to
+    first, matching which submodule won when the package ran `from .a import *`
+    / `from .b import *` in order. Resolved names are cached in the package
+    namespace.
+
+    Args:
+        package_name (str): The package's __name__
+        package_globals (Dict): The package's globals()
+        exports (Dict[str, str]): Exported name -> submodule defining it
+        submodules (Sequence[str]): Submodules the package used to import, in original order
+
+    Returns:
+        Tuple: (__getattr__, __dir__) to assign in the package __init__
+    """
+    def _load(submodule: str):
+        return importlib.import_module(f'.{submodule}', package_name)
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        with _import_lock:
+            if name in package_globals:
+                return package_globals[name]
+
+            if name in exports:
+                value = getattr(_load(exports[name]), name)
+            elif name in submodules or importlib.util.find_spec(f'{package_name}.{name}') is not None:
+                value = _load(name)
+            elif not name.startswith('_'):
+                for submodule in reversed(submodules):
+                    module = _load(submodule)
+                    if hasattr(module, name):
+                        value = getattr(module, name)
+                        break
+                else:
+                    raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+            else:
+                raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+            package_globals[name] = value
+            return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports) | set(submodules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,201 @@
+"""
+StreamGank Mapping Registry
+
+Genre, platform and content type lookup tables compiled once at import.
+URL building, URL parsing, validation and database filters all read the
+same immutable tables instead of rebuilding dictionaries on every call.
+
+Features:
+- Read-only tables (MappingProxyType) shared by url_builder and database.filters
+- Normalized-key index: lookups fold case, accents and extra whitespace ('mystere & thriller')
+- Reverse index: URL/database value -> display name, including URL-decoded values
+- Per-country genre tables with a US default, resolved with one dictionary hit
+
+Usage:
+    genres = MAPPING_REGISTRY.genres('FR')
+    genres.resolve('comédie')          # 'Com%C3%A9die'
+    genres.reverse('Comédie')          # 'Comédie'
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Precompiled Mapping Registry
+"""
+
+import unicodedata
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from config.constants import (US_GENRE_MAPPING, FR_GENRE_MAPPING, STREAMGANK_PLATFORM_PARAMS,
+                              URL_CONTENT_TYPE_MAPPING, CONTENT_TYPE_MAPPING, DATABASE_PLATFORM_NAMES,
+                              DATABASE_GENRE_ALIASES)
+
+DEFAULT_COUNTRY = 'US'
+
+
+@lru_cache(maxsize=1024)
+def normalize_key(value: str) -> str:
+    """
+    Fold a lookup key: accents removed, case folded, whitespace collapsed.
+
+    Args:
+        value (str): Raw key ('Mystère  & Thriller')
+
+    Returns:
+        str: Normalized key ('mystere & thriller')
+    """
+    decomposed = unicodedata.normalize('NFKD', str(value))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
+
+
+class MappingTable:
+    """
+    One immutable display name -> value table with its lookup indexes.
+
+    When several names fold to the same key, or several names share a value,
+    the first name in the source mapping wins.
+    """
+
+    __slots__ = ('name', 'mapping', 'names', '_normalized', '_reverse', '_reverse_normalized')
+
+    def __init__(self, name: str, mapping: Mapping[str, str]):
+        """
+        Compile the table.
+
+        Args:
+            name (str): Table name for diagnostics ('genres:US', 'platforms', ...)
+            mapping (Mapping): Display name -> URL/database value
+        """
+        normalized: Dict[str, str] = {}
+        reverse: Dict[str, str] = {}
+        reverse_normalized: Dict[str, str] = {}
+        for display_name, value in mapping.items():
+            normalized.setdefault(normalize_key(display_name), display_name)
+            reverse.setdefault(value, display_name)
+            reverse_normalized.setdefault(normalize_key(unquote_plus(value)), display_name)
+            # Display names are valid reverse keys too (parse_qs decodes 'Action+%26+Adventure')
+            reverse_normalized.setdefault(normalize_key(display_name), display_name)
+
+        self.name = name
+        self.mapping = MappingProxyType(dict(mapping))
+        self.names: Tuple[str, ...] = tuple(mapping)
+        self._normalized = MappingProxyType(normalized)
+        self._reverse = MappingProxyType(reverse)
+        self._reverse_normalized = MappingProxyType(reverse_normalized)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.mapping
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+    def __repr__(self) -> str:
+        return f"<MappingTable {self.name} ({len(self.mapping)} entries)>"
+
+    def canonical(self, key: Optional[str]) -> Optional[str]:
+        """
+        Get the display name a key refers to (exact match first, then folded).
+
+        Args:
+            key (str): User or database input
+
+        Returns:
+            str: Display name as listed in the table, None if unknown
+        """
+        if not key:
+            return None
+        if key in self.mapping:
+            return key
+        return self._normalized.get(normalize_key(key))
+
+    def resolve(self, key: Optional[str], default: Optional[str] = None) -> Optional[str]:
+        """
+        Map a key to its URL/database value.
+
+        Args:
+            key (str): User or database input
+            default (str): Returned when the key is unknown
+
+        Returns:
+            str: Mapped value, or default
+        """
+        display_name = self.canonical(key)
+        return self.mapping[display_name] if display_name is not None else default
+
+    def reverse(self, value: Optional[str]) -> Optional[str]:
+        """
+        Map a URL/database value (raw or URL-decoded) back to its display name.
+
+        Args:
+            value (str): Value as found in a URL or a database row
+
+        Returns:
+            str: Display name, None if unknown
+        """
+        if not value:
+            return None
+        if value in self._reverse:
+            return self._reverse[value]
+        return self._reverse_normalized.get(normalize_key(unquote_plus(value)))
+
+
+class MappingRegistry:
+    """All StreamGank lookup tables, compiled once."""
+
+    __slots__ = ('_genres', 'countries', 'platforms', 'content_types', 'database_content_types',
+                 'database_platforms', 'database_genres')
+
+    def __init__(self,
+                 genres_by_country: Mapping[str, Mapping[str, str]],
+                 platforms: Mapping[str, str],
+                 content_types: Mapping[str, str],
+                 database_content_types: Mapping[str, str],
+                 database_platforms: Mapping[str, str],
+                 database_genres: Mapping[str, str]):
+        """
+        Compile every table.
+
+        Args:
+            genres_by_country (Mapping): Country code -> genre display name -> URL value
+            platforms (Mapping): Platform display name -> URL parameter
+            content_types (Mapping): Content type input -> URL `type=` value
+            database_content_types (Mapping): Content type input -> movies.content_type
+            database_platforms (Mapping): Platform input -> movie_localizations.platform_name
+            database_genres (Mapping): Genre alias -> movie_genres.genre
+        """
+        self._genres = MappingProxyType({
+            country: MappingTable(f'genres:{country}', mapping) for country, mapping in genres_by_country.items()
+        })
+        self.countries: Tuple[str, ...] = tuple(genres_by_country)
+        self.platforms = MappingTable('platforms', platforms)
+        self.content_types = MappingTable('content_types', content_types)
+        self.database_content_types = MappingTable('database_content_types', database_content_types)
+        self.database_platforms = MappingTable('database_platforms', database_platforms)
+        self.database_genres = MappingTable('database_genres', database_genres)
+
+    def genres(self, country_code: Optional[str] = None) -> MappingTable:
+        """
+        Get the genre table for a country (countries without their own table use US genres).
+
+        Args:
+            country_code (str): Country code (US, FR, ...)
+
+        Returns:
+            MappingTable: Genre table
+        """
+        table = self._genres.get(country_code)
+        if table is None and country_code:
+            table = self._genres.get(country_code.upper())
+        return table or self._genres[DEFAULT_COUNTRY]
+
+
+# Built at import - every consumer shares these tables
+MAPPING_REGISTRY = MappingRegistry(
+    genres_by_country={'US': US_GENRE_MAPPING, 'FR': FR_GENRE_MAPPING},
+    platforms=STREAMGANK_PLATFORM_PARAMS,
+    content_types=URL_CONTENT_TYPE_MAPPING,
+    database_content_types=CONTENT_TYPE_MAPPING,
+    database_platforms=DATABASE_PLATFORM_NAMES,
+    database_genres=DATABASE_GENRE_ALIASES
+)
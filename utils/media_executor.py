@@ -0,0 +1,371 @@
+"""
+StreamGank Media Executor
+
+Process-wide governor for ffmpeg/ffprobe. Every media command in the system
+runs through run_media_command(), which waits for one of a fixed number of
+process slots, so concurrent jobs share the machine instead of oversubscribing
+CPU and memory until timeouts fire.
+
+Features:
+- Bounded slots (VIDEO_SETTINGS['ffmpeg_max_concurrent'], auto-sized from cores / ffmpeg threads)
+- Priority queue: final encodes get free slots before intermediates and analysis probes
+- Timeouts count running time only - time spent queued never expires a command
+- Per-priority and per-executable metrics (calls, failures, timeouts, run/wait seconds)
+- Job-scoped cancellation: queued commands are dropped, running processes are killed
+- The single place that sets ffmpeg -threads (get_ffmpeg_threads())
+- Trace spans per command (same attributes as run_traced_subprocess)
+
+Usage:
+    result = run_media_command(cmd, priority='final', capture_output=True, text=True, timeout=180)
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Media Execution Governor
+"""
+
+import os
+import heapq
+import logging
+import itertools
+import threading
+import subprocess
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from config.settings import get_video_settings, get_ffmpeg_threads
+from utils.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRIORITIES = {'final': 0, 'intermediate': 10, 'analysis': 20}
+
+# Job the current context works for (set by run_full_workflow, copied into worker threads)
+_current_media_job: ContextVar[Optional[str]] = ContextVar('streamgank_media_job', default=None)
+
+
+class MediaJobCancelled(Exception):
+    """Raised when a media command belongs to a cancelled job."""
+
+
+def set_media_job(job_id: Optional[str]):
+    """
+    Tag media commands started from this context with a job ID.
+
+    Args:
+        job_id (str): Job identifier used by cancel_job()
+
+    Returns:
+        Token: ContextVar token (pass to reset_media_job to restore the previous job)
+    """
+    return _current_media_job.set(job_id)
+
+
+def reset_media_job(token) -> None:
+    """Restore the media job that was current before set_media_job() returned token."""
+    _current_media_job.reset(token)
+
+
+def get_media_job() -> Optional[str]:
+    """Get the job ID media commands from this context are tagged with."""
+    return _current_media_job.get()
+
+
+def _default_concurrency() -> int:
+    try:
+        configured = int(os.getenv('FFMPEG_MAX_CONCURRENT', get_video_settings().get('ffmpeg_max_concurrent', 0)))
+    except (TypeError, ValueError):
+        configured = 0
+    if configured > 0:
+        return configured
+    return max(1, (os.cpu_count() or 1) // get_ffmpeg_threads())
+
+
+def _apply_thread_limit(cmd: List[str]) -> List[str]:
+    """Add -threads before the output of ffmpeg encodes that don't set it."""
+    if not cmd or not os.path.basename(str(cmd[0])).startswith('ffmpeg'):
+        return cmd
+    if '-threads' in cmd or '-version' in cmd or len(cmd) < 3 or cmd[-2] == '-i':
+        return cmd  # Already set, or no output file (info/version calls)
+    return cmd[:-1] + ['-threads', str(get_ffmpeg_threads()), cmd[-1]]
+
+
+class _MediaTicket:
+    """One media command waiting for or holding a slot."""
+
+    __slots__ = ('job_id', 'process', 'cancelled')
+
+    def __init__(self, job_id: Optional[str]):
+        self.job_id = job_id
+        self.process = None
+        self.cancelled = False
+
+
+class MediaExecutor:
+    """
+    Priority-ordered slot gate for ffmpeg/ffprobe processes.
+
+    Commands run on the caller's thread; the executor only decides when a
+    process may start and keeps track of it for metrics and cancellation.
+    """
+
+    def __init__(self, max_concurrent: int = None, priorities: Dict[str, int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrent (int): Processes allowed at once (default: _default_concurrency())
+            priorities (Dict[str, int]): Priority name -> rank, lower first (default: VIDEO_SETTINGS['ffmpeg_priorities'])
+        """
+        self.max_concurrent = max(1, max_concurrent or _default_concurrency())
+        self.priorities = priorities or get_video_settings().get('ffmpeg_priorities', DEFAULT_PRIORITIES)
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._running = set()
+        self._cancelled_jobs = set()
+        self._shutdown = False
+        self._metrics = {'by_priority': {}, 'by_executable': {}}
+
+    # -------------------------------------------------------------------------
+    # Slots
+    # -------------------------------------------------------------------------
+
+    def _acquire(self, ticket: _MediaTicket, rank: int):
+        with self._condition:
+            entry = (rank, next(self._sequence), ticket)
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    if ticket.cancelled or self._shutdown or ticket.job_id in self._cancelled_jobs:
+                        raise MediaJobCancelled(f"Media job {ticket.job_id} cancelled")
+                    if self._waiting[0] is entry and len(self._running) < self.max_concurrent:
+                        break
+                    self._condition.wait()
+                heapq.heappop(self._waiting)
+                self._running.add(ticket)
+            except BaseException:
+                if entry in self._waiting:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                raise
+            finally:
+                # The next waiter may be able to start too
+                self._condition.notify_all()
+
+    def _release(self, ticket: _MediaTicket):
+        with self._condition:
+            self._running.discard(ticket)
+            ticket.process = None
+            self._condition.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    def run(self, cmd: List[str], priority: str = 'analysis', timeout: float = None, check: bool = False,
+            input: Any = None, capture_output: bool = False, job_id: str = None,
+            **popen_kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a media command once a slot is free (subprocess.run semantics).
+
+        Args:
+            cmd (List[str]): ffmpeg/ffprobe command
+            priority (str): Key of the priority table ('final', 'intermediate', 'analysis')
+            timeout (float): Seconds the process may run (queue time excluded)
+            check (bool): Raise CalledProcessError on a non-zero exit
+            input: Data sent to stdin
+            capture_output (bool): Capture stdout and stderr
+            job_id (str): Job the command belongs to (default: the context's media job)
+            **popen_kwargs: Passed to subprocess.Popen (text, stdout, stderr, cwd, ...)
+
+        Returns:
+            subprocess.CompletedProcess: Finished process
+
+        Raises:
+            MediaJobCancelled: If the job was cancelled before or while the command ran
+            subprocess.TimeoutExpired: If the process ran longer than timeout
+        """
+        cmd = _apply_thread_limit([str(arg) for arg in cmd])
+        rank = self.priorities.get(priority, max(self.priorities.values(), default=0))
+        ticket = _MediaTicket(job_id if job_id is not None else get_media_job())
+        executable = os.path.basename(cmd[0]) if cmd else 'subprocess'
+
+        if capture_output:
+            popen_kwargs['stdout'] = subprocess.PIPE
+            popen_kwargs['stderr'] = subprocess.PIPE
+        if input is not None:
+            popen_kwargs['stdin'] = subprocess.PIPE
+
+        queued_at = time.monotonic()
+        try:
+            self._acquire(ticket, rank)
+        except MediaJobCancelled:
+            self._record(priority, executable, 'cancelled', 0.0, time.monotonic() - queued_at)
+            raise
+        started_at = time.monotonic()
+        wait_seconds = started_at - queued_at
+        outcome = 'failed'
+
+        try:
+            with subprocess.Popen(cmd, **popen_kwargs) as process:
+                with self._condition:
+                    ticket.process = process
+                    if ticket.cancelled:
+                        process.kill()
+                try:
+                    stdout, stderr = process.communicate(input, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    outcome = 'timeout'
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                except BaseException:
+                    process.kill()
+                    raise
+
+            if ticket.cancelled:
+                outcome = 'cancelled'
+                raise MediaJobCancelled(f"Media job {ticket.job_id} cancelled while running {executable}")
+
+            outcome = 'ok' if process.returncode == 0 else 'failed'
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        finally:
+            self._release(ticket)
+            self._record(priority, executable, outcome, time.monotonic() - started_at, wait_seconds)
+
+        if wait_seconds >= 1.0:
+            logger.debug(f"⏳ {executable} ({priority}) waited {wait_seconds:.1f}s for a media slot")
+        if check:
+            result.check_returncode()
+        return result
+
+    # -------------------------------------------------------------------------
+    # Cancellation
+    # -------------------------------------------------------------------------
+
+    def cancel_job(self, job_id: str) -> int:
+        """
+        Cancel a job's media work: queued commands raise, running processes are killed,
+        later commands for the job fail immediately.
+
+        Args:
+            job_id (str): Job to cancel
+
+        Returns:
+            int: Number of processes killed
+        """
+        with self._condition:
+            self._cancelled_jobs.add(job_id)
+            killed = self._cancel_tickets(lambda ticket: ticket.job_id == job_id)
+            self._condition.notify_all()
+        logger.warning(f"🛑 Media commands cancelled for job {job_id} ({killed} process(es) killed)")
+        return killed
+
+    def cancel_all(self) -> int:
+        """
+        Kill every running process and refuse new commands (process shutdown).
+
+        Returns:
+            int: Number of processes killed
+        """
+        with self._condition:
+            self._shutdown = True
+            killed = self._cancel_tickets(lambda ticket: True)
+            self._condition.notify_all()
+        if killed:
+            logger.warning(f"🛑 Media executor shut down ({killed} process(es) killed)")
+        return killed
+
+    def _cancel_tickets(self, matches) -> int:
+        killed = 0
+        for ticket in list(self._running) + [entry[2] for entry in self._waiting]:
+            if matches(ticket):
+                ticket.cancelled = True
+                if ticket.process is None:
+                    # Holds a slot but has not started yet - run() kills it as soon as it does
+                    killed += ticket in self._running
+                elif ticket.process.poll() is None:
+                    ticket.process.kill()
+                    killed += 1
+        return killed
+
+    def forget_job(self, job_id: str):
+        """Drop a finished job from the cancelled set."""
+        with self._condition:
+            self._cancelled_jobs.discard(job_id)
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def _record(self, priority: str, executable: str, outcome: str, run_seconds: float, wait_seconds: float):
+        with self._condition:
+            for group, key in (('by_priority', priority), ('by_executable', executable)):
+                metrics = self._metrics[group].setdefault(key, {
+                    'calls': 0, 'ok': 0, 'failed': 0, 'timeout': 0, 'cancelled': 0,
+                    'run_seconds': 0.0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0
+                })
+                metrics['calls'] += 1
+                metrics[outcome] += 1
+                metrics['run_seconds'] += run_seconds
+                metrics['wait_seconds'] += wait_seconds
+                metrics['max_wait_seconds'] = max(metrics['max_wait_seconds'], wait_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Executor statistics.
+
+        Returns:
+            Dict[str, Any]: Slot usage plus per-priority and per-executable counters
+        """
+        with self._condition:
+            def rounded(groups):
+                return {key: {name: round(value, 2) if isinstance(value, float) else value
+                              for name, value in metrics.items()}
+                        for key, metrics in groups.items()}
+            return {
+                'max_concurrent': self.max_concurrent,
+                'running': len(self._running),
+                'queued': len(self._waiting),
+                'cancelled_jobs': sorted(job for job in self._cancelled_jobs if job),
+                'by_priority': rounded(self._metrics['by_priority']),
+                'by_executable': rounded(self._metrics['by_executable'])
+            }
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_media_executor() -> MediaExecutor:
+    """Get the global media executor instance."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = MediaExecutor()
+                logger.info(f"🎛️ Media executor: {_executor.max_concurrent} concurrent ffmpeg/ffprobe process(es)")
+    return _executor
+
+
+def run_media_command(cmd: List[str], priority: str = 'analysis', **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg/ffprobe command on the global executor inside a trace span.
+
+    Args:
+        cmd (List[str]): Command and arguments
+        priority (str): 'final', 'intermediate' or 'analysis'
+        **kwargs: MediaExecutor.run arguments (timeout, capture_output, text, check, ...)
+
+    Returns:
+        subprocess.CompletedProcess: Finished process
+    """
+    executable = os.path.basename(str(cmd[0])) if cmd else 'subprocess'
+    command_line = ' '.join(str(arg) for arg in cmd)
+    with trace_span(executable, 'ffmpeg', command=command_line[:500], priority=priority) as span:
+        result = get_media_executor().run(cmd, priority=priority, **kwargs)
+        span.set_attribute('returncode', result.returncode)
+        output_file = str(cmd[-1]) if len(cmd) > 1 else ''
+        if result.returncode == 0 and not output_file.startswith('-') and os.path.isfile(output_file):
+            span.set_attribute('output_bytes', os.path.getsize(output_file))
+        return result
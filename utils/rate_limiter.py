@@ -0,0 +1,143 @@
+"""
+StreamGank API Rate Limiter
+
+Token-bucket rate limiting shared by every thread that calls the same external
+API, so concurrent submissions (batch renders, parallel HeyGen generation) stay
+under the provider's request rate instead of tripping 429 responses.
+
+Features:
+- Thread-safe token bucket (steady rate + burst capacity)
+- One limiter per service, configured from API_SETTINGS
+  (requests_per_second / burst); services without a rate are unlimited
+- Blocking acquire with optional timeout
+- Wait statistics for batch throughput reports
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Shared API Rate Limits
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from config.settings import get_api_config
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`; each request
+    takes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1, name: str = 'default'):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (float): Requests per second (None or <= 0 disables limiting)
+            burst (int): Requests allowed back-to-back after an idle period
+            name (str): Service name for logging
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.burst = max(1, int(burst or 1))
+        self.name = name
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._stats = {'acquired': 0, 'waited': 0, 'wait_seconds': 0.0}
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1, timeout: float = None) -> bool:
+        """
+        Take tokens, waiting for the bucket to refill if needed.
+
+        Args:
+            tokens (int): Tokens to take (one per request)
+            timeout (float): Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if acquired, False if the timeout expired first
+        """
+        if self.rate is None:
+            with self._lock:
+                self._stats['acquired'] += 1
+            return True
+
+        tokens = min(tokens, self.burst)
+        start = time.monotonic()
+        waited = False
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self._stats['acquired'] += 1
+                    if waited:
+                        self._stats['waited'] += 1
+                        self._stats['wait_seconds'] += now - start
+                    return True
+                delay = (tokens - self._tokens) / self.rate
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    logger.warning(f"⏳ {self.name} rate limit: no request slot within {timeout:.1f}s")
+                    return False
+                delay = min(delay, remaining)
+
+            if not waited:
+                logger.debug(f"⏳ {self.name} rate limit reached, waiting {delay:.2f}s")
+            waited = True
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Limiter statistics.
+
+        Returns:
+            Dict[str, Any]: Configuration plus acquired/waited counts and total wait time
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'requests_per_second': self.rate,
+                'burst': self.burst,
+                'acquired': self._stats['acquired'],
+                'waited': self._stats['waited'],
+                'wait_seconds': round(self._stats['wait_seconds'], 2)
+            }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> RateLimiter:
+    """
+    Get the process-wide limiter for an API service.
+
+    Args:
+        service (str): API_SETTINGS service name ('creatomate', 'heygen', ...)
+
+    Returns:
+        RateLimiter: Shared limiter (unlimited when the service has no requests_per_second)
+    """
+    limiter = _limiters.get(service)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(service)
+            if limiter is None:
+                config = get_api_config(service)
+                limiter = RateLimiter(config.get('requests_per_second'), config.get('burst', 1), name=service)
+                _limiters[service] = limiter
+    return limiter
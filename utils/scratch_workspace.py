@@ -0,0 +1,505 @@
+"""
+StreamGank Scratch Workspace
+
+Per-job scratch space for temporary media (downloaded trailers, highlight
+clips, scroll frames, poster cards). Every directory a job writes temp media
+to lives under one job root, so the whole tree is removed in one place when
+the job ends - instead of best-effort pattern cleanup in the working directory.
+
+Features:
+- RAM-backed scratch on tmpfs (/dev/shm) when it has room for the job quota, disk fallback otherwise
+- Spill-over: new scratch directories move to disk once tmpfs headroom runs low mid-job
+- Per-job byte quota (ScratchQuotaExceeded when a job outgrows it)
+- Deterministic cleanup on job end, interpreter exit and SIGTERM
+- Crash recovery: job roots left by dead processes are swept on startup
+- Context-scoped current workspace (copied into worker threads like the media job ID)
+
+Usage:
+    with get_scratch_manager().job_workspace(job_id):
+        clips_dir = get_scratch_dir('temp_clips')
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Scratch Workspace Manager
+"""
+
+import os
+import json
+import time
+import atexit
+import shutil
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from config.settings import get_workflow_settings
+from utils.file_utils import get_available_space, get_directory_size
+
+logger = logging.getLogger(__name__)
+
+OWNER_FILE = '.owner.json'
+
+# Workspace of the job the current context works for (set by run_full_workflow)
+_current_workspace: ContextVar[Optional['JobWorkspace']] = ContextVar('streamgank_scratch_workspace', default=None)
+
+
+class ScratchQuotaExceeded(Exception):
+    """Raised when a job's scratch usage exceeds its byte quota."""
+
+
+def _safe_name(value: str) -> str:
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in str(value)) or 'job'
+
+
+def pid_alive(pid: int) -> bool:
+    """Whether a process with this PID exists (a process we may not signal counts as alive)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+# =============================================================================
+# JOB WORKSPACE
+# =============================================================================
+
+class JobWorkspace:
+    """
+    Scratch directories of one job.
+
+    The workspace starts on tmpfs or disk (chosen by the manager). Directories
+    requested after tmpfs free space drops below the headroom are created
+    under the disk root instead, so a large job never fills RAM.
+    """
+
+    def __init__(self, job_id: str, tmpfs_root: Optional[str], disk_root: str,
+                 quota_bytes: int = 0, min_free_bytes: int = 0):
+        """
+        Initialize the workspace.
+
+        Args:
+            job_id (str): Job the workspace belongs to
+            tmpfs_root (str): Job root on tmpfs, None when the job starts on disk
+            disk_root (str): Job root on disk (created on first use)
+            quota_bytes (int): Maximum scratch bytes for the job (0 = unlimited)
+            min_free_bytes (int): tmpfs free space below which new directories go to disk
+        """
+        self.job_id = job_id
+        self.tmpfs_root = tmpfs_root
+        self.disk_root = disk_root
+        self.quota_bytes = quota_bytes
+        self.min_free_bytes = min_free_bytes
+        self.created_at = time.time()
+        self.closed = False
+        self._dirs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> str:
+        """'tmpfs' when the job started in RAM, otherwise 'disk'."""
+        return 'tmpfs' if self.tmpfs_root else 'disk'
+
+    @property
+    def roots(self) -> List[str]:
+        return [root for root in (self.tmpfs_root, self.disk_root) if root]
+
+    def _tmpfs_has_room(self) -> bool:
+        if not self.tmpfs_root:
+            return False
+        return get_available_space(self.tmpfs_root)['free_bytes'] >= self.min_free_bytes
+
+    def subdir(self, name: str) -> str:
+        """
+        Get (and create) a named scratch directory for this job.
+
+        The same name always returns the same directory for the life of the job.
+
+        Args:
+            name (str): Directory name ('temp_clips', 'scroll_frames', ...)
+
+        Returns:
+            str: Absolute directory path
+
+        Raises:
+            ScratchQuotaExceeded: If the job is already over its quota
+        """
+        if self.closed:
+            raise RuntimeError(f"Scratch workspace for job {self.job_id} is closed")
+
+        self.check_quota()
+        with self._lock:
+            path = self._dirs.get(name)
+            if path is None:
+                root = self.tmpfs_root if self._tmpfs_has_room() else self.disk_root
+                if self.tmpfs_root and root == self.disk_root:
+                    logger.warning(f"⚠️ tmpfs headroom low - scratch '{name}' for job {self.job_id} spills to disk")
+                path = os.path.join(root, _safe_name(name))
+                self._dirs[name] = path
+            os.makedirs(path, exist_ok=True)
+            return path
+
+    def usage_bytes(self) -> int:
+        """Bytes currently stored in the job's scratch roots."""
+        return sum(get_directory_size(root) for root in self.roots if os.path.isdir(root))
+
+    def check_quota(self, incoming_bytes: int = 0) -> int:
+        """
+        Check the job's scratch usage against its quota.
+
+        Args:
+            incoming_bytes (int): Bytes about to be written
+
+        Returns:
+            int: Current usage in bytes
+
+        Raises:
+            ScratchQuotaExceeded: If usage plus incoming bytes exceeds the quota
+        """
+        usage = self.usage_bytes()
+        if self.quota_bytes and usage + incoming_bytes > self.quota_bytes:
+            raise ScratchQuotaExceeded(
+                f"Job {self.job_id} scratch usage {(usage + incoming_bytes) / 1024**2:.1f}MB "
+                f"exceeds quota {self.quota_bytes / 1024**2:.1f}MB"
+            )
+        return usage
+
+    def cleanup(self) -> int:
+        """
+        Remove every scratch directory of the job.
+
+        Returns:
+            int: Bytes freed
+        """
+        with self._lock:
+            if self.closed:
+                return 0
+            self.closed = True
+            freed = 0
+            for root in self.roots:
+                if os.path.isdir(root):
+                    freed += get_directory_size(root)
+                    shutil.rmtree(root, ignore_errors=True)
+            self._dirs.clear()
+            return freed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'backend': self.backend,
+            'usage_bytes': self.usage_bytes(),
+            'quota_bytes': self.quota_bytes,
+            'directories': dict(self._dirs),
+            'age_seconds': round(time.time() - self.created_at, 1)
+        }
+
+
+# =============================================================================
+# WORKSPACE MANAGER
+# =============================================================================
+
+class ScratchWorkspaceManager:
+    """
+    Allocates per-job scratch workspaces and guarantees they are removed.
+
+    A job starts on tmpfs only if tmpfs free space, minus the quota already
+    promised to other tmpfs jobs in this process, covers its quota plus the
+    configured headroom.
+    """
+
+    def __init__(self, tmpfs_dir: Optional[str] = None, disk_dir: Optional[str] = None,
+                 job_quota_bytes: Optional[int] = None, min_free_bytes: Optional[int] = None):
+        """
+        Initialize the manager.
+
+        Args:
+            tmpfs_dir (str): RAM-backed scratch root ('' disables tmpfs; default: SCRATCH_TMPFS_DIR or settings)
+            disk_dir (str): Disk scratch root (default: SCRATCH_DISK_DIR or settings)
+            job_quota_bytes (int): Per-job quota in bytes (default: settings)
+            min_free_bytes (int): tmpfs headroom in bytes (default: settings)
+        """
+        settings = get_workflow_settings()
+        if tmpfs_dir is None:
+            tmpfs_dir = os.getenv('SCRATCH_TMPFS_DIR', settings.get('scratch_tmpfs_dir', '/dev/shm/streamgank'))
+        if disk_dir is None:
+            disk_dir = os.getenv('SCRATCH_DISK_DIR', settings.get('scratch_disk_dir', 'docker_volumes/scratch'))
+
+        self.tmpfs_dir = os.path.abspath(tmpfs_dir) if tmpfs_dir else None
+        self.disk_dir = os.path.abspath(disk_dir)
+        self.job_quota_bytes = settings.get('scratch_job_quota_bytes', 0) if job_quota_bytes is None else job_quota_bytes
+        self.min_free_bytes = settings.get('scratch_min_free_bytes', 0) if min_free_bytes is None else min_free_bytes
+        self._workspaces: Dict[str, JobWorkspace] = {}
+        self._lock = threading.Lock()
+        self._metrics = {'opened': 0, 'tmpfs': 0, 'disk': 0, 'closed': 0, 'bytes_freed': 0, 'stale_removed': 0}
+
+    # -------------------------------------------------------------------------
+    # Allocation
+    # -------------------------------------------------------------------------
+
+    def _tmpfs_usable(self) -> bool:
+        if not self.tmpfs_dir:
+            return False
+        try:
+            os.makedirs(self.tmpfs_dir, exist_ok=True)
+            return os.access(self.tmpfs_dir, os.W_OK)
+        except OSError:
+            return False
+
+    def _tmpfs_has_room(self) -> bool:
+        if not self._tmpfs_usable():
+            return False
+        free = get_available_space(self.tmpfs_dir)['free_bytes']
+        promised = sum(ws.quota_bytes for ws in self._workspaces.values() if ws.tmpfs_root)
+        return free - promised >= self.job_quota_bytes + self.min_free_bytes
+
+    def open(self, job_id: str) -> JobWorkspace:
+        """
+        Create the scratch workspace for a job (returns the existing one if already open).
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            JobWorkspace: The job's workspace
+        """
+        with self._lock:
+            workspace = self._workspaces.get(job_id)
+            if workspace:
+                return workspace
+
+            name = _safe_name(job_id)
+            tmpfs_root = os.path.join(self.tmpfs_dir, name) if self._tmpfs_has_room() else None
+            disk_root = os.path.join(self.disk_dir, name)
+            workspace = JobWorkspace(job_id, tmpfs_root, disk_root, self.job_quota_bytes, self.min_free_bytes)
+
+            # Owner markers let a later process recognise roots orphaned by a crash
+            owner = json.dumps({'pid': os.getpid(), 'job_id': job_id, 'created_at': workspace.created_at})
+            for root in workspace.roots:
+                os.makedirs(root, exist_ok=True)
+                with open(os.path.join(root, OWNER_FILE), 'w', encoding='utf-8') as f:
+                    f.write(owner)
+
+            self._workspaces[job_id] = workspace
+            self._metrics['opened'] += 1
+            self._metrics[workspace.backend] += 1
+
+        logger.info(f"🗂️ Scratch workspace for job {job_id}: {workspace.backend} "
+                    f"({workspace.tmpfs_root or workspace.disk_root})")
+        return workspace
+
+    def get(self, job_id: str) -> Optional[JobWorkspace]:
+        """Get an open workspace by job ID."""
+        with self._lock:
+            return self._workspaces.get(job_id)
+
+    def close(self, job_id: str) -> int:
+        """
+        Remove a job's scratch workspace.
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            int: Bytes freed (0 if the job had no open workspace)
+        """
+        with self._lock:
+            workspace = self._workspaces.pop(job_id, None)
+        if not workspace:
+            return 0
+
+        try:
+            freed = workspace.cleanup()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not clean scratch workspace for job {job_id}: {str(e)}")
+            return 0
+
+        with self._lock:
+            self._metrics['closed'] += 1
+            self._metrics['bytes_freed'] += freed
+        logger.info(f"🧹 Scratch workspace for job {job_id} removed ({freed / 1024**2:.1f}MB freed)")
+        return freed
+
+    def close_all(self) -> int:
+        """Remove every open workspace (interpreter exit / termination)."""
+        with self._lock:
+            job_ids = list(self._workspaces)
+        return sum(self.close(job_id) for job_id in job_ids)
+
+    @contextmanager
+    def job_workspace(self, job_id: str) -> Iterator[JobWorkspace]:
+        """
+        Open a job workspace, make it current for this context and remove it on exit.
+
+        Args:
+            job_id (str): Job identifier
+
+        Yields:
+            JobWorkspace: The job's workspace
+        """
+        workspace = self.open(job_id)
+        token = _current_workspace.set(workspace)
+        try:
+            yield workspace
+        finally:
+            _current_workspace.reset(token)
+            self.close(job_id)
+
+    # -------------------------------------------------------------------------
+    # Crash recovery
+    # -------------------------------------------------------------------------
+
+    def sweep_stale(self) -> int:
+        """
+        Remove job roots whose owning process is gone.
+
+        A root belongs to a dead job if its owner PID no longer runs, or if the
+        PID is this process but the job is not open here (a restarted container
+        often reuses the same PID).
+
+        Returns:
+            int: Number of job roots removed
+        """
+        removed = 0
+        with self._lock:
+            active = {root for ws in self._workspaces.values() for root in ws.roots}
+
+        for base in (self.tmpfs_dir, self.disk_dir):
+            if not base or not os.path.isdir(base):
+                continue
+            for entry in os.listdir(base):
+                root = os.path.join(base, entry)
+                marker = os.path.join(root, OWNER_FILE)
+                if root in active or not os.path.isfile(marker):
+                    continue
+                try:
+                    with open(marker, 'r', encoding='utf-8') as f:
+                        pid = int(json.load(f).get('pid', 0))
+                except (OSError, ValueError, TypeError):
+                    pid = 0
+                if pid and pid != os.getpid() and pid_alive(pid):
+                    continue
+                shutil.rmtree(root, ignore_errors=True)
+                removed += 1
+
+        if removed:
+            with self._lock:
+                self._metrics['stale_removed'] += removed
+            logger.info(f"🧹 Removed {removed} orphaned scratch workspace(s)")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Get workspace usage and allocation metrics."""
+        with self._lock:
+            workspaces = list(self._workspaces.values())
+            metrics = dict(self._metrics)
+        tmpfs_free = get_available_space(self.tmpfs_dir)['free_bytes'] if self._tmpfs_usable() else 0
+        return {
+            'tmpfs_dir': self.tmpfs_dir,
+            'disk_dir': self.disk_dir,
+            'tmpfs_free_bytes': tmpfs_free,
+            'job_quota_bytes': self.job_quota_bytes,
+            'active': [ws.stats() for ws in workspaces],
+            **metrics
+        }
+
+
+# =============================================================================
+# CURRENT WORKSPACE HELPERS
+# =============================================================================
+
+def set_scratch_workspace(workspace: Optional[JobWorkspace]):
+    """
+    Make a workspace current for this context (and threads that copy it).
+
+    Args:
+        workspace (JobWorkspace): Workspace, or None to clear
+
+    Returns:
+        Token: ContextVar token
+    """
+    return _current_workspace.set(workspace)
+
+
+def get_scratch_workspace() -> Optional[JobWorkspace]:
+    """Get the workspace of the job this context works for (None outside a job)."""
+    workspace = _current_workspace.get()
+    return workspace if workspace and not workspace.closed else None
+
+
+def get_scratch_dir(name: str) -> str:
+    """
+    Get a scratch directory for temp media.
+
+    Inside a job this is a directory in the job's workspace; outside a job
+    (CLI tools, tests) it is the legacy relative directory of the same name.
+
+    Args:
+        name (str): Directory name ('temp_trailers', 'temp_clips', ...)
+
+    Returns:
+        str: Existing directory path
+    """
+    workspace = get_scratch_workspace()
+    if workspace:
+        return workspace.subdir(name)
+    os.makedirs(name, exist_ok=True)
+    return name
+
+
+def create_scratch_temp_dir(prefix: str = 'streamgank_') -> str:
+    """
+    Create a unique temporary directory (tempfile.mkdtemp inside the job workspace when one is active).
+
+    Args:
+        prefix (str): Directory name prefix
+
+    Returns:
+        str: Path to the new directory
+    """
+    workspace = get_scratch_workspace()
+    return tempfile.mkdtemp(prefix=prefix, dir=workspace.subdir('tmp') if workspace else None)
+
+
+def check_scratch_quota(incoming_bytes: int = 0) -> int:
+    """
+    Check the current job's scratch quota (no-op outside a job).
+
+    Args:
+        incoming_bytes (int): Bytes about to be written
+
+    Returns:
+        int: Current usage in bytes
+
+    Raises:
+        ScratchQuotaExceeded: If the job would exceed its quota
+    """
+    workspace = get_scratch_workspace()
+    return workspace.check_quota(incoming_bytes) if workspace else 0
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_scratch_manager() -> ScratchWorkspaceManager:
+    """Get the global scratch workspace manager (sweeps orphaned workspaces on first use)."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                manager = ScratchWorkspaceManager()
+                try:
+                    manager.sweep_stale()
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not sweep orphaned scratch workspaces: {str(e)}")
+                atexit.register(manager.close_all)
+                _manager = manager
+    return _manager
@@ -0,0 +1,116 @@
+"""
+StreamGank Shared Work Deduplication
+
+Single-flight cache for expensive, deterministic work that several jobs in
+the same process may ask for at once - e.g. the same trailer appearing in two
+genre lists, or two jobs needing the same scroll video. The first caller
+computes the value; concurrent callers with the same key wait for it; later
+callers get the stored result.
+
+Failed computations (exceptions or None results) are never stored, so the
+next caller retries.
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Batch Work Deduplication
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SharedWorkCache:
+    """Thread-safe single-flight result cache keyed by hashable work keys."""
+
+    def __init__(self, name: str):
+        """
+        Initialize shared work cache.
+
+        Args:
+            name (str): Name used in logs and stats (e.g. 'trailer_clips')
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._results: Dict[Hashable, Any] = {}
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for key, computing it at most once at a time.
+
+        Args:
+            key (Hashable): Work identity (e.g. trailer URL)
+            compute (Callable): Zero-argument function producing the result
+
+        Returns:
+            Any: Result of compute() for this key
+        """
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                logger.info(f"♻️ [{self.name}] Reusing shared result for {key}")
+                return self._results[key]
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            logger.info(f"⏳ [{self.name}] Waiting for in-flight work on {key}")
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if result is not None:
+                self._results[key] = result
+        future.set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            return {'name': self.name, 'hits': self.hits, 'misses': self.misses, 'stored': len(self._results)}
+
+    def clear(self) -> None:
+        """Drop stored results (in-flight work is unaffected)."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global shared work caches
+_shared_caches: Dict[str, SharedWorkCache] = {}
+_shared_caches_lock = threading.Lock()
+
+def get_shared_work_cache(name: str) -> SharedWorkCache:
+    """Get (or create) the process-wide shared work cache with this name"""
+    with _shared_caches_lock:
+        if name not in _shared_caches:
+            _shared_caches[name] = SharedWorkCache(name)
+        return _shared_caches[name]
+
+
+def get_shared_work_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for every shared work cache."""
+    with _shared_caches_lock:
+        caches = list(_shared_caches.values())
+    return {cache.name: cache.stats() for cache in caches}
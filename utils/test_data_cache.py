@@ -7,20 +7,20 @@ expensive operations during development and testing.
 Features:
 - Save/load script generation results
 - Save/load asset generation results (posters, clips)
-- Standardized file naming based on parameters
-- JSON serialization with UTF-8 encoding
-- Automatic directory creation
+- Standardized cache keys based on parameters
+- Indexed per-step storage (see utils.workflow_cache_store)
+- Import/export of legacy workflow_*.json files
 
 Author: StreamGank Development Team
 Version: 1.0.0 - Test Data Caching System
 """
 
 import os
-import json
 import logging
-import re
 import time
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
+
+from utils.workflow_cache_store import get_workflow_cache_store, normalize_cache_params, build_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -131,35 +131,82 @@ def is_production_mode() -> bool:
 
 def get_test_data_path(data_type: str, country: str, genre: str, platform: str, content_type: str = "Movies", template: str = "auto") -> str:
     """
-    Generate standardized path for test data files.
-    
+    Generate standardized path for exported test data files.
+
     Args:
         data_type (str): Type of data ('script_result', 'movie_data', 'assets', etc.)
         country (str): Country parameter
-        genre (str): Genre parameter  
+        genre (str): Genre parameter
         platform (str): Platform parameter
         content_type (str): Content type parameter (Movies, TV Shows, All)
         template (str): Template parameter (auto, horror, action, etc.)
-        
+
     Returns:
         str: Path to test data file
     """
-    # Create safe filename from parameters - Format: Workflow_Country_Platform_Genre_Type_Template
-    safe_country = country.replace(' ', '_').lower()
-    safe_genre = genre.replace(' ', '_').replace('&', 'and').lower()
-    safe_platform = platform.replace(' ', '_').lower()
-    safe_content_type = content_type.replace(' ', '_').lower()
-    safe_template = template.replace(' ', '_').lower()
-    
-    # New format: workflow_country_platform_genre_type_template.json
-    filename = f"{data_type}_{safe_country}_{safe_platform}_{safe_genre}_{safe_content_type}_{safe_template}.json"
+    # Same normalization as the cache store key - Format: workflow_country_platform_genre_type_template
+    params = normalize_cache_params(country, genre, platform, content_type, template)
+    filename = f"{data_type}_{build_cache_key(params)}.json"
     return os.path.join('test_output', filename)
 
 
+def _legacy_workflow_paths(country: str, genre: str, platform: str, content_type: str, template: str) -> List[str]:
+    """
+    Candidate legacy workflow_*.json paths for a parameter set.
+
+    Older saves used a looser filename cleaning than the loader, so both
+    spellings are checked when importing.
+    """
+    paths = [get_test_data_path('workflow', country, genre, platform, content_type, template)]
+
+    loose_name = "workflow_{}_{}_{}_{}_{}.json".format(
+        country.replace(' ', '_').lower(),
+        platform.replace(' ', '_').lower(),
+        genre.replace(' ', '_').replace('&', 'and').lower(),
+        content_type.replace(' ', '_').lower(),
+        template.replace(' ', '_').lower()
+    )
+    loose_path = os.path.join('test_output', loose_name)
+    if loose_path not in paths:
+        paths.append(loose_path)
+
+    return paths
+
+
+def _import_legacy_workflow(params: tuple, country: str, genre: str, platform: str, content_type: str, template: str) -> bool:
+    """
+    Import a legacy workflow JSON file into the cache store if one exists for these parameters.
+
+    Returns:
+        bool: True if a file was imported
+    """
+    store = get_workflow_cache_store()
+
+    for legacy_path in _legacy_workflow_paths(country, genre, platform, content_type, template):
+        if not os.path.exists(legacy_path):
+            continue
+
+        try:
+            file_params = store.import_json_file(legacy_path)
+            # Files without metadata are imported under the requested key
+            if file_params != params:
+                workflow_data = store.load_workflow(file_params) if file_params else None
+                if workflow_data:
+                    store.save_workflow(params, workflow_data)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to import legacy workflow file {legacy_path}: {str(e)}")
+
+    return False
+
+
 def save_test_data(data: Any, data_type: str, country: str, genre: str, platform: str, content_type: str = "Movies", template: str = "auto") -> str:
     """
-    Save test data to test_output directory based on environment.
-    
+    Save test data to the workflow cache store based on environment.
+
+    Workflow data is stored one record per step, so incremental saves only
+    rewrite the steps that changed. Other data types are stored as a single record.
+
     Args:
         data: Data to save (must be JSON serializable)
         data_type (str): Type of data being saved
@@ -168,9 +215,9 @@ def save_test_data(data: Any, data_type: str, country: str, genre: str, platform
         platform (str): Platform parameter
         content_type (str): Content type parameter (Movies, TV Shows, All)
         template (str): Template parameter (auto, horror, action, etc.)
-        
+
     Returns:
-        str: Path where data was saved, empty string if failed or not saved
+        str: Cache store location where data was saved, empty string if failed or not saved
     """
     try:
         # Check if we should save results based on environment
@@ -178,197 +225,163 @@ def save_test_data(data: Any, data_type: str, country: str, genre: str, platform
             app_env = get_app_env()
             logger.info(f"💼 Results not saved for APP_ENV='{app_env}' (production mode)")
             return ""  # Don't save in production mode
-        # Ensure test_output directory exists
-        os.makedirs('test_output', exist_ok=True)
-        
-        file_path = get_test_data_path(data_type, country, genre, platform, content_type, template)
-        
-        # Add metadata to the saved data
-        data_with_metadata = {
-            'data': data,
-            'metadata': {
-                'data_type': data_type,
-                'parameters': {
-                    'country': country,
-                    'genre': genre,
-                    'platform': platform,
-                    'content_type': content_type,
-                    'template': template
-                },
-                'saved_timestamp': time.time(),
-                'saved_datetime': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+
+        store = get_workflow_cache_store()
+        params = normalize_cache_params(country, genre, platform, content_type, template)
+
+        if data_type == 'workflow':
+            result = store.save_workflow(params, data)
+        else:
+            # Add metadata to the saved data
+            data_with_metadata = {
+                'data': data,
+                'metadata': {
+                    'data_type': data_type,
+                    'parameters': {
+                        'country': country,
+                        'genre': genre,
+                        'platform': platform,
+                        'content_type': content_type,
+                        'template': template
+                    },
+                    'saved_timestamp': time.time(),
+                    'saved_datetime': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+                }
             }
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data_with_metadata, f, indent=2, ensure_ascii=False)
-        
+            result = store.put_records(params, {data_type: data_with_metadata})
+
+        location = f"{store.base_dir}#{build_cache_key(params)}/{data_type}"
         app_env = get_app_env()
-        logger.info(f"💾 Saved {data_type} test data to: {file_path} (APP_ENV='{app_env}')")
-        return file_path
-        
+        logger.info(f"💾 Saved {data_type} test data to: {location} ({result['written']} written, {result['unchanged']} unchanged, APP_ENV='{app_env}')")
+        return location
+
     except Exception as e:
         logger.error(f"❌ Error saving test data: {str(e)}")
         return ""
 
 
+# Step record and field projection for each cached data type
+WORKFLOW_STEP_SOURCES = {
+    'script_result': 'step_2_script_generation',
+    'assets': 'step_3_asset_preparation',
+    'heygen': 'step_4_heygen_creation',
+    'heygen_urls': 'step_5_heygen_processing',
+    'scroll_video': 'step_6_scroll_generation',
+    'creatomate': 'step_7_creatomate_assembly'
+}
+
+
+def extract_step_data(data_type: str, step_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract the fields a workflow step consumes from a cached step record.
+
+    Args:
+        data_type (str): Cached data type
+        step_data (Dict): Stored step record
+
+    Returns:
+        Dict: Projected data or None if the record is unusable
+    """
+    if data_type == 'script_result':
+        # ✅ VALIDATION: Check if script data is actually populated
+        combined_script = step_data.get('combined_script', '')
+        individual_scripts = step_data.get('individual_scripts', {})
+
+        if not combined_script and not individual_scripts:
+            logger.warning(f"❌ INCOMPLETE CACHE: Script data exists but is empty - treating as cache miss")
+            if is_local_mode():
+                logger.error(f"💡 LOCAL MODE: Run with APP_ENV=development to regenerate complete script data")
+            return None
+
+        return {
+            'combined_script': combined_script,
+            'script_file_path': step_data.get('script_file_path', ''),
+            'individual_scripts': individual_scripts
+        }
+
+    elif data_type == 'assets':
+        return {
+            'enhanced_posters': step_data.get('enhanced_posters', {}),
+            'dynamic_clips': step_data.get('dynamic_clips', {}),
+            'movie_covers': step_data.get('movie_covers', []),
+            'movie_clips': step_data.get('movie_clips', []),
+            'background_music_url': step_data.get('background_music_url', ''),
+            'background_music_info': step_data.get('background_music_info', {})
+        }
+
+    elif data_type == 'heygen':
+        return {
+            'video_ids': step_data.get('heygen_video_ids', {}),
+            'template_id': step_data.get('template_id_used', ''),
+            'submitted_at': step_data.get('submitted_at', {})
+        }
+
+    elif data_type == 'heygen_urls':
+        return {
+            'video_urls': step_data.get('heygen_video_urls', {}),
+            'video_durations': step_data.get('heygen_video_durations', {})
+        }
+
+    elif data_type == 'scroll_video':
+        return {
+            'scroll_video_url': step_data.get('scroll_video_url')
+        }
+
+    elif data_type == 'creatomate':
+        return {
+            'render_id': step_data.get('creatomate_id', '')
+        }
+
+    return None
+
+
 def try_load_from_workflow(data_type: str, country: str, genre: str, platform: str, content_type: str = "Movies", template: str = "auto") -> Optional[Any]:
     """
-    Try to extract specific data from existing workflow files as fallback.
-    
+    Try to extract specific data from the cached workflow for these parameters.
+
+    Reads a single step record from the cache store index. Legacy
+    workflow_*.json files are imported into the store on first access.
+
     Args:
-        data_type (str): Type of data to extract
+        data_type (str): Type of data to extract ('workflow' returns the full workflow)
         country (str): Country parameter
-        genre (str): Genre parameter  
+        genre (str): Genre parameter
         platform (str): Platform parameter
         content_type (str): Content type parameter (Movies, TV Shows, All)
         template (str): Template parameter (auto, horror, action, etc.)
-        
+
     Returns:
         Any: Extracted data or None if not found
     """
     try:
-        # Construct workflow file path using new format - workflow_country_platform_genre_type_template.json
-        country_clean = re.sub(r'[^\w\s-]', '', country.strip()).replace(' ', '_').lower()
-        genre_clean = genre.strip().replace('&', 'and').replace(' ', '_').lower()
-        genre_clean = re.sub(r'[^\w-]', '', genre_clean)  # Clean after replacements
-        platform_clean = re.sub(r'[^\w\s-]', '', platform.strip()).replace(' ', '_').lower()
-        content_type_clean = content_type.replace(' ', '_').lower()
-        template_clean = template.replace(' ', '_').lower()
-        
-        workflow_filename = f"workflow_{country_clean}_{platform_clean}_{genre_clean}_{content_type_clean}_{template_clean}.json"
-        workflow_path = os.path.join('test_output', workflow_filename)
-        
-        logger.info(f"🔍 CONSTRUCTED filename: {workflow_filename}")
-        logger.info(f"   Parameters: country='{country}' -> '{country_clean}', genre='{genre}' -> '{genre_clean}', platform='{platform}' -> '{platform_clean}', content_type='{content_type}' -> '{content_type_clean}', template='{template}' -> '{template_clean}'")
-        logger.info(f"🔍 WORKFLOW FALLBACK: Looking for {data_type} in {workflow_filename}")
-        
-        if not os.path.exists(workflow_path):
-            logger.warning(f"❌ WORKFLOW FILE NOT FOUND: {workflow_path}")
+        store = get_workflow_cache_store()
+        params = normalize_cache_params(country, genre, platform, content_type, template)
+        cache_key = build_cache_key(params)
+
+        logger.info(f"🔍 WORKFLOW CACHE: Looking for {data_type} under key '{cache_key}'")
+
+        if not store.has_key(params) and not _import_legacy_workflow(params, country, genre, platform, content_type, template):
+            logger.warning(f"❌ WORKFLOW CACHE MISS: No cached workflow for '{cache_key}'")
             return None
-            
-        with open(workflow_path, 'r', encoding='utf-8') as f:
-            workflow_file = json.load(f)
-        
-        # Handle the actual structure with "data" wrapper
-        if isinstance(workflow_file, dict) and 'data' in workflow_file:
-            workflow_data = workflow_file['data']
-            logger.info(f"✅ Found workflow data structure with 'data' wrapper")
-        else:
-            workflow_data = workflow_file
-            logger.info(f"✅ Using direct workflow data structure")
-        
-        logger.info(f"🔍 Available keys in workflow_data: {list(workflow_data.keys()) if isinstance(workflow_data, dict) else 'Not a dict'}")
-        
-        # Extract specific data based on type - NEW ORGANIZED STEP STRUCTURE ONLY
-        if data_type == 'script_result':
-            logger.info(f"🔍 Looking for script_result data...")
-            # Check if script data exists in step 2
-            if 'step_2_script_generation' in workflow_data:
-                step_data = workflow_data['step_2_script_generation']
-                logger.info(f"✅ FOUND script data in step_2_script_generation!")
-                
-                # ✅ VALIDATION: Check if script data is actually populated
-                combined_script = step_data.get('combined_script', '')
-                individual_scripts = step_data.get('individual_scripts', {})
-                
-                if not combined_script and not individual_scripts:
-                    logger.warning(f"❌ INCOMPLETE CACHE: Script data exists but is empty - treating as cache miss")
-                    logger.warning(f"   Combined script length: {len(combined_script)}")
-                    logger.warning(f"   Individual scripts count: {len(individual_scripts)}")
-                    if is_local_mode():
-                        logger.error(f"💡 LOCAL MODE: Run with APP_ENV=development to regenerate complete script data")
-                    return None
-                
-                result = {
-                    'combined_script': combined_script,
-                    'script_file_path': step_data.get('script_file_path', ''),
-                    'individual_scripts': individual_scripts
-                }
-                logger.info(f"✅ RETURNING script data with {len(result['individual_scripts'])} individual scripts")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_2_script_generation' found in workflow data")
-                
-        elif data_type == 'assets':
-            logger.info(f"🔍 Looking for assets data...")
-            # Check if asset data exists in step 3
-            if 'step_3_asset_preparation' in workflow_data:
-                step_data = workflow_data['step_3_asset_preparation']
-                logger.info(f"✅ FOUND asset data in step_3_asset_preparation!")
-                result = {
-                    'enhanced_posters': step_data.get('enhanced_posters', {}),
-                    'dynamic_clips': step_data.get('dynamic_clips', {}),
-                    'movie_covers': step_data.get('movie_covers', []),
-                    'movie_clips': step_data.get('movie_clips', []),
-                    'background_music_url': step_data.get('background_music_url', ''),
-                    'background_music_info': step_data.get('background_music_info', {})
-                }
-                logger.info(f"✅ RETURNING asset data with {len(result['enhanced_posters'])} posters and {len(result['dynamic_clips'])} clips")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_3_asset_preparation' found in workflow data")
-                
-        elif data_type == 'heygen':
-            logger.info(f"🔍 Looking for heygen data...")
-            # Check if heygen data exists in step 4
-            if 'step_4_heygen_creation' in workflow_data:
-                step_data = workflow_data['step_4_heygen_creation']
-                logger.info(f"✅ FOUND heygen data in step_4_heygen_creation!")
-                result = {
-                    'video_ids': step_data.get('heygen_video_ids', {}),
-                    'template_id': step_data.get('template_id_used', '')
-                }
-                logger.info(f"✅ RETURNING heygen data with {len(result['video_ids'])} video IDs")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_4_heygen_creation' found in workflow data")
-                
-        elif data_type == 'heygen_urls':
-            logger.info(f"🔍 Looking for heygen URLs data...")
-            # Check if heygen URLs exist in step 5
-            if 'step_5_heygen_processing' in workflow_data:
-                step_data = workflow_data['step_5_heygen_processing']
-                logger.info(f"✅ FOUND heygen URLs in step_5_heygen_processing!")
-                result = {
-                    'video_urls': step_data.get('heygen_video_urls', {})
-                }
-                logger.info(f"✅ RETURNING heygen URLs with {len(result['video_urls'])} URLs")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_5_heygen_processing' found in workflow data")
-                
-        elif data_type == 'scroll_video':
-            logger.info(f"🔍 Looking for scroll video data...")
-            # Check if scroll video exists in step 6
-            if 'step_6_scroll_generation' in workflow_data:
-                step_data = workflow_data['step_6_scroll_generation']
-                logger.info(f"✅ FOUND scroll video in step_6_scroll_generation!")
-                result = {
-                    'scroll_video_url': step_data.get('scroll_video_url')
-                }
-                logger.info(f"✅ RETURNING scroll video URL")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_6_scroll_generation' found in workflow data")
-                
-        elif data_type == 'creatomate':
-            logger.info(f"🔍 Looking for creatomate data...")
-            # Check if creatomate data exists in step 7
-            if 'step_7_creatomate_assembly' in workflow_data:
-                step_data = workflow_data['step_7_creatomate_assembly']
-                logger.info(f"✅ FOUND creatomate data in step_7_creatomate_assembly!")
-                result = {
-                    'render_id': step_data.get('creatomate_id', '')
-                }
-                logger.info(f"✅ RETURNING creatomate render ID")
-                return result
-            else:
-                logger.warning(f"❌ No 'step_7_creatomate_assembly' found in workflow data")
-        
-        logger.warning(f"❌ No data found for type '{data_type}' in workflow file")
-        return None
-            
+
+        if data_type == 'workflow':
+            return store.load_workflow(params)
+
+        step_key = WORKFLOW_STEP_SOURCES.get(data_type)
+        if not step_key:
+            logger.warning(f"❌ No workflow step mapping for data type '{data_type}'")
+            return None
+
+        step_data = store.get_record(params, step_key)
+        if not step_data:
+            logger.warning(f"❌ No '{step_key}' found in cached workflow")
+            return None
+
+        result = extract_step_data(data_type, step_data)
+        if result is not None:
+            logger.info(f"✅ FOUND {data_type} data in {step_key}")
+        return result
+
     except Exception as e:
         logger.error(f"❌ EXCEPTION in try_load_from_workflow({data_type}): {str(e)}")
         import traceback
@@ -378,11 +391,10 @@ def try_load_from_workflow(data_type: str, country: str, genre: str, platform: s
 
 def load_test_data(data_type: str, country: str, genre: str, platform: str, content_type: str = "Movies", template: str = "auto") -> Optional[Any]:
     """
-    Load test data from unified workflow files in test_output directory.
-    
-    NEW ARCHITECTURE: All data is saved in single workflow files.
-    Direct extraction from workflow_*.json files based on data_type.
-    
+    Load test data from the workflow cache store.
+
+    Direct single-record lookup based on data_type.
+
     Args:
         data_type (str): Type of data to load
         country (str): Country parameter
@@ -390,9 +402,9 @@ def load_test_data(data_type: str, country: str, genre: str, platform: str, cont
         platform (str): Platform parameter
         content_type (str): Content type parameter (Movies, TV Shows, All)
         template (str): Template parameter (auto, horror, action, etc.)
-        
+
     Returns:
-        Any: Loaded data or None if file doesn't exist, loading fails, or cache disabled
+        Any: Loaded data or None if not cached, loading fails, or cache disabled
     """
     try:
         # Check if caching should be used based on environment
@@ -400,25 +412,24 @@ def load_test_data(data_type: str, country: str, genre: str, platform: str, cont
             app_env = get_app_env()
             logger.info(f"🚫 Cache disabled for APP_ENV='{app_env}' - will generate fresh data")
             return None
-        
+
         app_env = get_app_env()
-        logger.info(f"🔍 Loading {data_type} from workflow file for APP_ENV='{app_env}'")
-        
-        # Load directly from workflow file (new unified system)
+        logger.info(f"🔍 Loading {data_type} from workflow cache for APP_ENV='{app_env}'")
+
         workflow_data = try_load_from_workflow(data_type, country, genre, platform, content_type, template)
         if workflow_data:
-            logger.info(f"✅ Loaded {data_type} from workflow file")
+            logger.info(f"✅ Loaded {data_type} from workflow cache")
             return workflow_data
-        
+
         # If no workflow data found
         if is_local_mode():
             logger.error(f"❌ LOCAL MODE: No workflow data found for {data_type}")
             logger.error(f"   💡 Run with APP_ENV=development first to generate and save workflow data")
         else:
             logger.info(f"📁 No workflow data found for {data_type} - will generate fresh")
-        
+
         return None
-        
+
     except Exception as e:
         logger.error(f"❌ Error loading test data: {str(e)}")
         import traceback
@@ -426,62 +437,38 @@ def load_test_data(data_type: str, country: str, genre: str, platform: str, cont
         return None
 
 
-def clear_test_data(data_type: Optional[str] = None, country: Optional[str] = None, 
+def clear_test_data(data_type: Optional[str] = None, country: Optional[str] = None,
                    genre: Optional[str] = None, platform: Optional[str] = None) -> int:
     """
-    Clear test data files based on filters.
-    
+    Clear cached test data based on filters.
+
+    A data_type of 'workflow' removes every record belonging to matching workflows.
+
     Args:
         data_type (str, optional): Specific data type to clear
         country (str, optional): Specific country to clear
-        genre (str, optional): Specific genre to clear  
+        genre (str, optional): Specific genre to clear
         platform (str, optional): Specific platform to clear
-        
+
     Returns:
-        int: Number of files deleted
+        int: Number of records deleted
     """
     try:
-        if not os.path.exists('test_output'):
-            logger.info("📁 No test_output directory found")
-            return 0
-        
-        files_deleted = 0
-        
-        for filename in os.listdir('test_output'):
-            if not filename.endswith('.json'):
-                continue
-            
-            # Parse filename to check filters
-            parts = filename.replace('.json', '').split('_')
-            if len(parts) < 4:
-                continue
-            
-            file_data_type = parts[0]
-            file_country = parts[1]
-            file_genre = '_'.join(parts[2:-1])  # Handle multi-word genres
-            file_platform = parts[-1]
-            
-            # Check if file matches filters
-            should_delete = True
-            
-            if data_type and file_data_type != data_type.lower():
-                should_delete = False
-            if country and file_country != country.replace(' ', '_').lower():
-                should_delete = False
-            if genre and file_genre != genre.replace(' ', '_').replace('&', 'and').lower():
-                should_delete = False
-            if platform and file_platform != platform.replace(' ', '_').lower():
-                should_delete = False
-            
-            if should_delete:
-                file_path = os.path.join('test_output', filename)
-                os.remove(file_path)
-                files_deleted += 1
-                logger.info(f"🗑️ Deleted test data: {filename}")
-        
-        logger.info(f"✅ Cleared {files_deleted} test data files")
-        return files_deleted
-        
+        country_clean, platform_clean, genre_clean, _, _ = normalize_cache_params(
+            country or '', genre or '', platform or ''
+        )
+        record_type = None if data_type == 'workflow' else data_type
+
+        records_deleted = get_workflow_cache_store().delete(
+            data_type=record_type,
+            country=country_clean or None,
+            genre=genre_clean or None,
+            platform=platform_clean or None
+        )
+
+        logger.info(f"✅ Cleared {records_deleted} cached test data records")
+        return records_deleted
+
     except Exception as e:
         logger.error(f"❌ Error clearing test data: {str(e)}")
         return 0
@@ -489,67 +476,105 @@ def clear_test_data(data_type: Optional[str] = None, country: Optional[str] = No
 
 def list_test_data() -> Dict[str, Any]:
     """
-    List all available test data files with their metadata.
-    
+    List all cached test data records with their metadata.
+
+    Reads only the store index - payloads are never decoded.
+
     Returns:
-        Dict: Information about available test data files
+        Dict: Information about cached test data records
     """
     try:
-        if not os.path.exists('test_output'):
-            return {'files': [], 'total_count': 0, 'total_size_mb': 0}
-        
         files_info = []
         total_size = 0
-        
-        for filename in os.listdir('test_output'):
-            if not filename.endswith('.json'):
-                continue
-            
-            file_path = os.path.join('test_output', filename)
-            file_size = os.path.getsize(file_path)
-            total_size += file_size
-            
-            # Try to load metadata
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                metadata = data.get('metadata', {}) if isinstance(data, dict) and 'metadata' in data else {}
-                
-                file_info = {
-                    'filename': filename,
-                    'size_bytes': file_size,
-                    'size_mb': round(file_size / 1024 / 1024, 2),
-                    'data_type': metadata.get('data_type', 'unknown'),
-                    'parameters': metadata.get('parameters', {}),
-                    'saved_datetime': metadata.get('saved_datetime', 'unknown')
-                }
-                
-                files_info.append(file_info)
-                
-            except Exception:
-                # If we can't load the file, just add basic info
-                file_info = {
-                    'filename': filename,
-                    'size_bytes': file_size,
-                    'size_mb': round(file_size / 1024 / 1024, 2),
-                    'data_type': 'unknown',
-                    'parameters': {},
-                    'saved_datetime': 'unknown'
-                }
-                files_info.append(file_info)
-        
+
+        for record in get_workflow_cache_store().list_records():
+            total_size += record['size_bytes']
+            files_info.append({
+                'filename': f"{record['cache_key']}/{record['data_type']}",
+                'size_bytes': record['size_bytes'],
+                'size_mb': round(record['size_bytes'] / 1024 / 1024, 2),
+                'data_type': record['data_type'],
+                'parameters': record['parameters'],
+                'saved_datetime': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['saved_timestamp']))
+            })
+
         return {
             'files': files_info,
             'total_count': len(files_info),
             'total_size_mb': round(total_size / 1024 / 1024, 2)
         }
-        
+
     except Exception as e:
         logger.error(f"❌ Error listing test data: {str(e)}")
         return {'files': [], 'total_count': 0, 'total_size_mb': 0, 'error': str(e)}
 
 
+def export_workflow_json(country: str, genre: str, platform: str, content_type: str = "Movies", template: str = "auto") -> str:
+    """
+    Export a cached workflow to its legacy workflow_*.json file in test_output.
+
+    Args:
+        country (str): Country parameter
+        genre (str): Genre parameter
+        platform (str): Platform parameter
+        content_type (str): Content type parameter (Movies, TV Shows, All)
+        template (str): Template parameter (auto, horror, action, etc.)
+
+    Returns:
+        str: Path written, empty string if the workflow is not cached
+    """
+    try:
+        params = normalize_cache_params(country, genre, platform, content_type, template)
+        file_path = get_test_data_path('workflow', country, genre, platform, content_type, template)
+        written = get_workflow_cache_store().export_json_file(params, file_path, parameters={
+            'country': country,
+            'genre': genre,
+            'platform': platform,
+            'content_type': content_type,
+            'template': template
+        })
+
+        if written:
+            logger.info(f"📤 Exported cached workflow to: {written}")
+        else:
+            logger.warning(f"❌ No cached workflow to export for '{build_cache_key(params)}'")
+        return written
+
+    except Exception as e:
+        logger.error(f"❌ Error exporting workflow JSON: {str(e)}")
+        return ""
+
+
+def import_workflow_json_files(directory: str = 'test_output') -> int:
+    """
+    Import every legacy workflow_*.json file in a directory into the cache store.
+
+    Args:
+        directory (str): Directory containing workflow JSON files
+
+    Returns:
+        int: Number of files imported
+    """
+    if not os.path.isdir(directory):
+        return 0
+
+    store = get_workflow_cache_store()
+    imported = 0
+
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('workflow_') and filename.endswith('.json')):
+            continue
+
+        try:
+            if store.import_json_file(os.path.join(directory, filename)):
+                imported += 1
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to import {filename}: {str(e)}")
+
+    logger.info(f"📥 Imported {imported} workflow JSON files from {directory}")
+    return imported
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS FOR SPECIFIC DATA TYPES
 # =============================================================================
@@ -707,25 +732,23 @@ def get_cache_stats() -> Dict[str, Any]:
     """
     Get statistics about the test data cache.
     
+    Served from the store's maintained counters - no records are read.
+    
     Returns:
         Dict: Cache statistics and information
     """
-    cache_info = list_test_data()
+    store = get_workflow_cache_store()
+    stats = store.stats()
     
-    # Group by data type
-    data_types = {}
-    for file_info in cache_info['files']:
-        data_type = file_info['data_type']
-        if data_type not in data_types:
-            data_types[data_type] = {'count': 0, 'size_mb': 0}
-        
-        data_types[data_type]['count'] += 1
-        data_types[data_type]['size_mb'] += file_info['size_mb']
+    data_types = {
+        data_type: {'count': info['count'], 'size_mb': info['size_mb']}
+        for data_type, info in stats['data_types'].items()
+    }
     
     return {
-        'total_files': cache_info['total_count'],
-        'total_size_mb': cache_info['total_size_mb'],
+        'total_files': stats['total_records'],
+        'total_size_mb': stats['total_size_mb'],
         'data_types': data_types,
-        'cache_directory': 'test_output',
-        'cache_available': os.path.exists('test_output')
-    }
\ No newline at end of file
+        'cache_directory': stats['cache_directory'],
+        'cache_available': stats['total_records'] > 0
+    }
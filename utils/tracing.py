@@ -0,0 +1,637 @@
+"""
+StreamGank Workflow Tracing
+
+Lightweight in-process tracing for run_full_workflow and its sub-operations
+(HTTP requests, ffmpeg/ffprobe calls, OpenAI calls, Playwright captures).
+Spans are exported to local files only - there is no network exporter.
+
+Features:
+- Nested spans via contextvars (thread-safe, one trace per job)
+- Wall time, thread CPU time, child-process CPU time and peak RSS per span
+- Bytes transferred and retry counters (rolled up into parent spans)
+- Chrome trace JSON export (chrome://tracing, Perfetto)
+- OpenTelemetry OTLP/JSON export (otel-collector file receiver, Jaeger import)
+- Bounded span buffer that evicts finished-but-unexported and orphaned traces first
+- No-op spans when tracing is disabled
+
+Usage:
+    with trace_span("upload", category="cloudinary", file=path) as span:
+        ...
+        span.add_bytes(size)
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Step Tracing
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import secrets
+import threading
+import functools
+import subprocess
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from config.settings import LOGGING_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Currently active span in this context (thread / copied context)
+_current_span: ContextVar[Optional['Span']] = ContextVar('streamgank_current_span', default=None)
+
+# ru_maxrss is kilobytes on Linux, bytes on macOS
+_RSS_UNIT_BYTES = 1 if sys.platform == 'darwin' else 1024
+
+
+def _rusage_snapshot() -> Dict[str, float]:
+    """Peak RSS (bytes) and accumulated CPU seconds for this process and its children."""
+    if resource is None:
+        return {'peak_rss': 0, 'children_peak_rss': 0, 'children_cpu': 0.0}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {
+        'peak_rss': own.ru_maxrss * _RSS_UNIT_BYTES,
+        'children_peak_rss': children.ru_maxrss * _RSS_UNIT_BYTES,
+        'children_cpu': children.ru_utime + children.ru_stime
+    }
+
+
+# =============================================================================
+# SPANS
+# =============================================================================
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Wall time is measured with perf_counter, CPU time with thread_time (the
+    span's own thread), and child CPU time from RUSAGE_CHILDREN deltas, which
+    captures ffmpeg/ffprobe work. Peak RSS is the process high-water mark when
+    the span ends.
+    """
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str,
+                 parent: Optional['Span'] = None, attributes: Dict[str, Any] = None):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = secrets.token_hex(8)
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+
+        self.thread_id = threading.get_ident()
+        self.thread_name = threading.current_thread().name
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.child_cpu_time = 0.0
+        self.peak_rss_bytes = 0
+        self.children_peak_rss_bytes = 0
+        self.bytes_transferred = 0
+        self.retries = 0
+        self.status = 'ok'
+        self.error: Optional[str] = None
+
+        self._children: List['Span'] = []
+        self._start_perf = time.perf_counter()
+        self._start_cpu = time.thread_time()
+        self._start_usage = _rusage_snapshot()
+        self._lock = threading.Lock()
+
+        if parent is not None:
+            with parent._lock:
+                parent._children.append(self)
+
+    @property
+    def finished(self) -> bool:
+        return self.end_time_ns is not None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value attribute to the span."""
+        self.attributes[key] = value
+
+    def add_bytes(self, count: int) -> None:
+        """Record bytes transferred (also counted on every ancestor span)."""
+        span = self
+        while span is not None:
+            with span._lock:
+                span.bytes_transferred += int(count or 0)
+            span = span.parent
+
+    def add_retry(self, count: int = 1) -> None:
+        """Record a retry (also counted on every ancestor span)."""
+        span = self
+        while span is not None:
+            with span._lock:
+                span.retries += count
+            span = span.parent
+
+    def end(self, status: str = None, error: str = None) -> None:
+        """
+        Finish the span. Open child spans are finished first with status 'unfinished'.
+
+        Args:
+            status (str): 'ok', 'error' or 'unfinished' (default: current status)
+            error (str): Error message for failed spans
+        """
+        if self.finished:
+            return
+
+        with self._lock:
+            open_children = [child for child in self._children if not child.finished]
+        for child in open_children:
+            child.end(status='unfinished')
+
+        usage = _rusage_snapshot()
+        self.wall_time = time.perf_counter() - self._start_perf
+        if threading.get_ident() == self.thread_id:
+            self.cpu_time = time.thread_time() - self._start_cpu
+        self.child_cpu_time = max(0.0, usage['children_cpu'] - self._start_usage['children_cpu'])
+        self.peak_rss_bytes = usage['peak_rss']
+        self.children_peak_rss_bytes = usage['children_peak_rss']
+        if status:
+            self.status = status
+        if error:
+            self.error = error
+        self.end_time_ns = self.start_time_ns + int(self.wall_time * 1e9)
+
+        if _current_span.get() is self:
+            _current_span.set(self.parent)
+
+        self.tracer._record(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary form used by exporters and summaries."""
+        return {
+            'name': self.name,
+            'category': self.category,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_span_id': self.parent.span_id if self.parent else None,
+            'thread_id': self.thread_id,
+            'thread_name': self.thread_name,
+            'start_time_ns': self.start_time_ns,
+            'end_time_ns': self.end_time_ns,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'child_cpu_time': self.child_cpu_time,
+            'peak_rss_bytes': self.peak_rss_bytes,
+            'children_peak_rss_bytes': self.children_peak_rss_bytes,
+            'bytes_transferred': self.bytes_transferred,
+            'retries': self.retries,
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes
+        }
+
+
+class _NoopSpan:
+    """Span stand-in used when tracing is disabled."""
+
+    trace_id = None
+    span_id = None
+    finished = True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_bytes(self, count: int) -> None:
+        pass
+
+    def add_retry(self, count: int = 1) -> None:
+        pass
+
+    def end(self, status: str = None, error: str = None) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+# =============================================================================
+# TRACER
+# =============================================================================
+
+class Tracer:
+    """Collects finished spans in memory and exports them per trace."""
+
+    def __init__(self, enabled: bool = None, max_spans: int = None, orphan_seconds: float = None):
+        """
+        Initialize tracer.
+
+        Args:
+            enabled (bool): Record spans (default: TRACING_ENABLED env or LOGGING_SETTINGS['tracing_enabled'])
+            max_spans (int): Finished spans kept in memory; when full, finished or orphaned traces are evicted
+            orphan_seconds (float): Idle time after which an unexported trace counts as orphaned
+        """
+        if enabled is None:
+            env_value = os.getenv('TRACING_ENABLED')
+            enabled = (env_value.lower() in ('1', 'true', 'yes') if env_value is not None
+                       else LOGGING_SETTINGS.get('tracing_enabled', True))
+        self.enabled = enabled
+        self.max_spans = max_spans or LOGGING_SETTINGS.get('trace_max_spans', 20000)
+        self.orphan_seconds = (orphan_seconds if orphan_seconds is not None
+                               else LOGGING_SETTINGS.get('trace_orphan_seconds', 3600))
+        # trace_id -> finished spans, oldest trace first
+        self._traces: 'OrderedDict[str, List[Span]]' = OrderedDict()
+        self._last_recorded: Dict[str, float] = {}
+        self._root_finished: Set[str] = set()
+        self._span_count = 0
+        self._dropped = 0
+        self._evicted_traces = 0
+        self._lock = threading.Lock()
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            if self._span_count >= self.max_spans and not self._evict_trace(exclude=span.trace_id):
+                self._dropped += 1
+                return
+            self._traces.setdefault(span.trace_id, []).append(span)
+            self._last_recorded[span.trace_id] = time.monotonic()
+            if span.parent is None:
+                self._root_finished.add(span.trace_id)
+            self._span_count += 1
+
+    def _evict_trace(self, exclude: str) -> bool:
+        """
+        Drop the oldest trace nobody will export (caller holds the lock).
+
+        Traces whose root span already ended were finished but never exported
+        (e.g. an early return before export); traces idle for orphan_seconds
+        belong to jobs that are gone. Live traces are never evicted.
+
+        Returns:
+            bool: True if a trace was evicted
+        """
+        now = time.monotonic()
+        candidates = [trace_id for trace_id in self._traces if trace_id != exclude and trace_id in self._root_finished]
+        if not candidates:
+            candidates = [trace_id for trace_id in self._traces if trace_id != exclude
+                          and now - self._last_recorded.get(trace_id, now) >= self.orphan_seconds]
+        if not candidates:
+            return False
+
+        trace_id = candidates[0]
+        evicted = self._traces.pop(trace_id)
+        self._span_count -= len(evicted)
+        self._last_recorded.pop(trace_id, None)
+        self._root_finished.discard(trace_id)
+        self._evicted_traces += 1
+        logger.warning(f"⚠️ Trace buffer full - evicted unexported trace {trace_id} ({len(evicted)} spans)")
+        return True
+
+    # -------------------------------------------------------------------------
+    # Span creation
+    # -------------------------------------------------------------------------
+
+    def start_span(self, name: str, category: str = 'function',
+                   attributes: Dict[str, Any] = None, parent: Span = None):
+        """
+        Start a span and make it current in this context. Call span.end() to finish it.
+
+        Args:
+            name (str): Span name
+            category (str): Span category ('workflow', 'step', 'http', 'ffmpeg', 'openai', ...)
+            attributes (Dict): Initial attributes
+            parent (Span): Explicit parent (default: current span in this context)
+
+        Returns:
+            Span: Started span (a no-op span when tracing is disabled)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+
+        if parent is None:
+            parent = _current_span.get()
+        span = Span(self, name, category, parent=parent, attributes=attributes)
+        _current_span.set(span)
+        return span
+
+    @contextmanager
+    def span(self, name: str, category: str = 'function', **attributes) -> Iterator[Span]:
+        """Context manager form of start_span; exceptions mark the span as failed."""
+        span = self.start_span(name, category, attributes)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(status='error', error=str(e))
+            raise
+        else:
+            span.end()
+
+    # -------------------------------------------------------------------------
+    # Queries and export
+    # -------------------------------------------------------------------------
+
+    def get_spans(self, trace_id: str = None) -> List[Span]:
+        """Finished spans, optionally limited to one trace."""
+        with self._lock:
+            if trace_id:
+                spans = list(self._traces.get(trace_id, []))
+            else:
+                spans = [span for trace_spans in self._traces.values() for span in trace_spans]
+        return sorted(spans, key=lambda span: span.start_time_ns)
+
+    def clear(self, trace_id: str = None) -> None:
+        """Drop finished spans (all, or only one trace)."""
+        with self._lock:
+            if trace_id:
+                self._span_count -= len(self._traces.pop(trace_id, []))
+                self._last_recorded.pop(trace_id, None)
+                self._root_finished.discard(trace_id)
+            else:
+                self._traces.clear()
+                self._last_recorded.clear()
+                self._root_finished.clear()
+                self._span_count = 0
+                self._dropped = 0
+                self._evicted_traces = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Buffered traces/spans and how many spans or traces were dropped."""
+        with self._lock:
+            return {
+                'traces': len(self._traces),
+                'spans': self._span_count,
+                'dropped_spans': self._dropped,
+                'evicted_traces': self._evicted_traces
+            }
+
+    def summarize(self, trace_id: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate spans by category.
+
+        Returns:
+            Dict[str, Dict]: {category: {'count', 'wall_time', 'cpu_time', 'child_cpu_time', 'bytes', 'retries'}}
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for span in self.get_spans(trace_id):
+            entry = summary.setdefault(span.category, {
+                'count': 0, 'wall_time': 0.0, 'cpu_time': 0.0, 'child_cpu_time': 0.0, 'bytes': 0, 'retries': 0
+            })
+            entry['count'] += 1
+            entry['wall_time'] += span.wall_time
+            entry['cpu_time'] += span.cpu_time
+            entry['child_cpu_time'] += span.child_cpu_time
+            # Leaf totals only - parents already include their children's bytes/retries
+            if not span._children:
+                entry['bytes'] += span.bytes_transferred
+                entry['retries'] += span.retries
+        return summary
+
+    def to_chrome_trace(self, trace_id: str = None) -> Dict[str, Any]:
+        """
+        Build a Chrome trace (Trace Event Format) document.
+
+        Returns:
+            Dict[str, Any]: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        thread_names: Dict[int, str] = {}
+
+        for span in self.get_spans(trace_id):
+            thread_names[span.thread_id] = span.thread_name
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': span.start_time_ns / 1000,
+                'dur': span.wall_time * 1e6,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': {
+                    'span_id': span.span_id,
+                    'parent_span_id': span.parent.span_id if span.parent else None,
+                    'status': span.status,
+                    'error': span.error,
+                    'cpu_time_ms': round(span.cpu_time * 1000, 3),
+                    'child_cpu_time_ms': round(span.child_cpu_time * 1000, 3),
+                    'peak_rss_mb': round(span.peak_rss_bytes / (1024 * 1024), 1),
+                    'children_peak_rss_mb': round(span.children_peak_rss_bytes / (1024 * 1024), 1),
+                    'bytes_transferred': span.bytes_transferred,
+                    'retries': span.retries,
+                    **span.attributes
+                }
+            })
+
+        for tid, thread_name in thread_names.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def to_otel_json(self, trace_id: str = None, service_name: str = 'streamgank') -> Dict[str, Any]:
+        """
+        Build an OpenTelemetry OTLP/JSON ExportTraceServiceRequest document.
+
+        Returns:
+            Dict[str, Any]: {'resourceSpans': [...]}
+        """
+        otel_spans = []
+        for span in self.get_spans(trace_id):
+            attributes = {
+                'streamgank.category': span.category,
+                'streamgank.thread': span.thread_name,
+                'streamgank.cpu_time_s': span.cpu_time,
+                'streamgank.child_cpu_time_s': span.child_cpu_time,
+                'process.peak_rss_bytes': span.peak_rss_bytes,
+                'process.children_peak_rss_bytes': span.children_peak_rss_bytes,
+                'streamgank.bytes_transferred': span.bytes_transferred,
+                'streamgank.retries': span.retries,
+                **span.attributes
+            }
+            otel_span = {
+                'traceId': span.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': 3 if span.category == 'http' else 1,  # CLIENT / INTERNAL
+                'startTimeUnixNano': str(span.start_time_ns),
+                'endTimeUnixNano': str(span.end_time_ns),
+                'attributes': [_otel_attribute(key, value) for key, value in attributes.items() if value is not None],
+                'status': {'code': 2, 'message': span.error or ''} if span.status == 'error' else {'code': 1}
+            }
+            if span.parent:
+                otel_span['parentSpanId'] = span.parent.span_id
+            otel_spans.append(otel_span)
+
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': [
+                    _otel_attribute('service.name', service_name),
+                    _otel_attribute('process.pid', os.getpid())
+                ]},
+                'scopeSpans': [{
+                    'scope': {'name': 'streamgank.tracing', 'version': '1.0.0'},
+                    'spans': otel_spans
+                }]
+            }]
+        }
+
+    def export(self, path: str, trace_id: str = None, format: str = 'chrome') -> str:
+        """
+        Write a trace file.
+
+        Args:
+            path (str): Output file path
+            trace_id (str): Only export this trace (default: all spans)
+            format (str): 'chrome' or 'otel'
+
+        Returns:
+            str: Path written
+        """
+        if format == 'chrome':
+            document = self.to_chrome_trace(trace_id)
+        elif format == 'otel':
+            document = self.to_otel_json(trace_id)
+        else:
+            raise ValueError(f"Unknown trace format: {format} (expected 'chrome' or 'otel')")
+
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, default=str)
+        return str(output_path)
+
+
+def _otel_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode one attribute as an OTLP/JSON KeyValue."""
+    if isinstance(value, bool):
+        encoded = {'boolValue': value}
+    elif isinstance(value, int):
+        encoded = {'intValue': str(value)}
+    elif isinstance(value, float):
+        encoded = {'doubleValue': value}
+    else:
+        encoded = {'stringValue': value if isinstance(value, str) else json.dumps(value, default=str)}
+    return {'key': key, 'value': encoded}
+
+
+# =============================================================================
+# MODULE-LEVEL HELPERS
+# =============================================================================
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer() -> Tracer:
+    """Get global tracer instance"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+
+def current_span():
+    """Get the active span in this context (a no-op span if none)."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+def trace_span(name: str, category: str = 'function', **attributes):
+    """Context manager for a span on the global tracer."""
+    return get_tracer().span(name, category, **attributes)
+
+
+def record_bytes(count: int) -> None:
+    """Add transferred bytes to the active span."""
+    current_span().add_bytes(count)
+
+
+def record_retry(count: int = 1) -> None:
+    """Count a retry on the active span."""
+    current_span().add_retry(count)
+
+
+def traced(name: str = None, category: str = 'function') -> Callable:
+    """Decorator that runs the function inside a span (named after the function by default)."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_call(name: str, func: Callable, *args, category: str = 'function', **kwargs) -> Any:
+    """Call func(*args, **kwargs) inside a span."""
+    with trace_span(name, category):
+        return func(*args, **kwargs)
+
+
+def run_traced_subprocess(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() inside a span named after the executable (ffmpeg, ffprobe, ...).
+
+    The span records the return code and, when the last argument is an output
+    file, its size. Child CPU time is captured by the span's rusage delta.
+
+    Args:
+        cmd (List[str]): Command and arguments
+        **kwargs: Passed through to subprocess.run
+
+    Returns:
+        subprocess.CompletedProcess: Result of subprocess.run
+    """
+    executable = os.path.basename(str(cmd[0])) if cmd else 'subprocess'
+    command_line = ' '.join(str(arg) for arg in cmd)
+    with trace_span(executable, 'ffmpeg' if executable.startswith('ff') else 'subprocess',
+                    command=command_line[:500]) as span:
+        result = subprocess.run(cmd, **kwargs)
+        span.set_attribute('returncode', result.returncode)
+        output_file = str(cmd[-1]) if len(cmd) > 1 else ''
+        if result.returncode == 0 and not output_file.startswith('-') and os.path.isfile(output_file):
+            span.set_attribute('output_bytes', os.path.getsize(output_file))
+        return result
+
+
+def export_job_trace(span: Span, job_id: str, output_dir: str = None, formats: List[str] = None) -> List[str]:
+    """
+    Export one job's trace and drop its spans from memory.
+
+    Args:
+        span (Span): Root span of the job's trace
+        job_id (str): Job identifier used in file names
+        output_dir (str): Target directory (default: TRACE_EXPORT_DIR env or LOGGING_SETTINGS['trace_export_dir'])
+        formats (List[str]): Any of 'chrome', 'otel' (default: LOGGING_SETTINGS['trace_export_formats'])
+
+    Returns:
+        List[str]: Files written (empty when tracing is disabled or export fails)
+    """
+    tracer = get_tracer()
+    if not tracer.enabled or span.trace_id is None:
+        return []
+
+    output_dir = output_dir or os.getenv('TRACE_EXPORT_DIR', LOGGING_SETTINGS.get('trace_export_dir', ''))
+    formats = formats or LOGGING_SETTINGS.get('trace_export_formats', ['chrome'])
+    suffixes = {'chrome': 'trace.json', 'otel': 'otel.json'}
+
+    written = []
+    try:
+        if output_dir:
+            for trace_format in formats:
+                path = Path(output_dir) / f"{job_id}.{suffixes[trace_format]}"
+                written.append(tracer.export(str(path), span.trace_id, trace_format))
+    except Exception as e:
+        logger.warning(f"⚠️ Trace export failed for job {job_id}: {str(e)}")
+    finally:
+        tracer.clear(span.trace_id)
+    return written
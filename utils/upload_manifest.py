@@ -0,0 +1,209 @@
+"""
+StreamGank Upload Manifest
+
+Local record of every asset uploaded to Cloudinary, keyed by a digest of the
+file bytes plus the upload options that shape the stored asset. Uploaders check
+it before sending anything: identical content is never uploaded twice, and the
+digest doubles as the public_id suffix so a URL always refers to the same bytes
+(no overwrite, no CDN invalidation).
+
+Features:
+- Streaming SHA-256 content digest (1MB blocks) combined with the upload profile
+- SQLite manifest mapping digest -> public_id / secure_url / asset metadata
+- Hit counters for dedup reporting
+- Entries dropped when the asset is deleted from Cloudinary
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Upload Deduplication Manifest
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_DIR = os.path.join('docker_volumes', 'upload_manifest')
+
+# Upload options that only label the asset - they never change the stored bytes
+NON_CONTENT_OPTIONS = ('public_id', 'tags', 'context', 'overwrite', 'invalidate', 'chunk_size')
+
+# Upload result fields kept in the manifest
+RESULT_FIELDS = ('public_id', 'secure_url', 'resource_type', 'format', 'width', 'height',
+                 'duration', 'bytes', 'version')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    digest TEXT PRIMARY KEY,
+    public_id TEXT NOT NULL,
+    secure_url TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    result TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    source_path TEXT,
+    created_timestamp REAL NOT NULL,
+    last_hit_timestamp REAL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_uploads_public_id ON uploads (public_id);
+"""
+
+
+def compute_upload_digest(file_path: str, upload_options: Dict[str, Any] = None) -> str:
+    """
+    Digest of a file's bytes and the content-affecting upload options.
+
+    Args:
+        file_path (str): File to upload
+        upload_options (Dict): Cloudinary upload kwargs (labels like tags/context are ignored)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+
+    profile = {key: value for key, value in (upload_options or {}).items() if key not in NON_CONTENT_OPTIONS}
+    digest.update(json.dumps(profile, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class UploadManifest:
+    """
+    SQLite manifest of uploaded assets.
+
+    Storage errors are logged and treated as cache misses - a broken manifest
+    only costs a re-upload, never a failed workflow.
+    """
+
+    def __init__(self, manifest_dir: str = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_dir (str): Directory holding uploads.sqlite3 (default: UPLOAD_MANIFEST_DIR or docker_volumes/upload_manifest)
+        """
+        self.manifest_dir = Path(manifest_dir or os.getenv('UPLOAD_MANIFEST_DIR', DEFAULT_MANIFEST_DIR))
+        self.db_path = self.manifest_dir / 'uploads.sqlite3'
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.manifest_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a previous upload of the same content and count the hit.
+
+        Args:
+            digest (str): Output of compute_upload_digest()
+
+        Returns:
+            Dict[str, Any]: Stored upload result, or None if the content was never uploaded
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute('SELECT result FROM uploads WHERE digest = ?', (digest,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                'UPDATE uploads SET hit_count = hit_count + 1, last_hit_timestamp = ? WHERE digest = ?',
+                (time.time(), digest)
+            )
+            return json.loads(row[0])
+        except Exception as e:
+            logger.warning(f"⚠️ Upload manifest lookup failed: {str(e)}")
+            return None
+
+    def record(self, digest: str, upload_result: Dict[str, Any], source_path: str = None) -> bool:
+        """
+        Store a successful upload.
+
+        Args:
+            digest (str): Output of compute_upload_digest()
+            upload_result (Dict): Cloudinary upload response
+            source_path (str): Local file that was uploaded
+
+        Returns:
+            bool: True if recorded
+        """
+        try:
+            result = {field: upload_result.get(field) for field in RESULT_FIELDS if upload_result.get(field) is not None}
+            size_bytes = os.path.getsize(source_path) if source_path and os.path.exists(source_path) else 0
+            self._connect().execute(
+                '''INSERT INTO uploads (digest, public_id, secure_url, resource_type, result, size_bytes,
+                                        source_path, created_timestamp)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (digest) DO UPDATE SET
+                    public_id = excluded.public_id, secure_url = excluded.secure_url,
+                    result = excluded.result, source_path = excluded.source_path''',
+                (digest, result.get('public_id', ''), result.get('secure_url', ''),
+                 result.get('resource_type', ''), json.dumps(result), size_bytes, source_path, time.time())
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Upload manifest record failed: {str(e)}")
+            return False
+
+    def forget_public_id(self, public_id: str) -> int:
+        """
+        Drop entries pointing at a deleted asset.
+
+        Returns:
+            int: Number of entries removed
+        """
+        try:
+            return self._connect().execute('DELETE FROM uploads WHERE public_id = ?', (public_id,)).rowcount
+        except Exception as e:
+            logger.warning(f"⚠️ Upload manifest cleanup failed: {str(e)}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Manifest statistics.
+
+        Returns:
+            Dict[str, Any]: Entry count, skipped uploads and bytes not re-sent
+        """
+        try:
+            entries, hits, saved = self._connect().execute(
+                'SELECT COUNT(*), COALESCE(SUM(hit_count), 0), COALESCE(SUM(hit_count * size_bytes), 0) FROM uploads'
+            ).fetchone()
+            return {
+                'entries': entries,
+                'skipped_uploads': hits,
+                'bytes_saved_mb': round(saved / 1024 / 1024, 2),
+                'manifest_path': str(self.db_path)
+            }
+        except Exception as e:
+            logger.warning(f"⚠️ Upload manifest stats failed: {str(e)}")
+            return {'entries': 0, 'skipped_uploads': 0, 'bytes_saved_mb': 0.0, 'manifest_path': str(self.db_path)}
+
+
+_manifest = None
+_manifest_lock = threading.Lock()
+
+
+def get_upload_manifest() -> UploadManifest:
+    """Get the global upload manifest instance."""
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                _manifest = UploadManifest()
+    return _manifest
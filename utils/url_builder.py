@@ -5,12 +5,14 @@ This module provides functions for building StreamGank URLs with proper
 country-specific mappings for genres, platforms, and content types.
 
 The URL builder supports localized parameters and ensures proper formatting
-for StreamGank's filtering system.
+for StreamGank's filtering system. Lookups go through the precompiled
+tables in utils.mapping_registry; the get_*_mapping() helpers return copies.
 """
 
 import logging
+import urllib.parse
 from typing import Dict, Optional, List, Tuple
-from config.constants import US_GENRE_MAPPING, FR_GENRE_MAPPING, PLATFORM_MAPPING, CONTENT_TYPES
+from utils.mapping_registry import MAPPING_REGISTRY
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +38,8 @@ def get_genre_mapping_by_country(country_code: str) -> Dict[str, str]:
     """
     logger.debug(f"Getting genre mapping for country: {country_code}")
     
-    # Return country-specific genre mapping with proper URL encoding
-    if country_code == 'FR':
-        return FR_GENRE_MAPPING.copy()
-    else:
-        # Default to US mapping for all other countries
-        return US_GENRE_MAPPING.copy()
+    # Country-specific genre table (US mapping for all other countries)
+    return dict(MAPPING_REGISTRY.genres(country_code).mapping)
 
 
 def get_available_genres_for_country(country_code: str) -> list:
@@ -54,8 +52,7 @@ def get_available_genres_for_country(country_code: str) -> list:
     Returns:
         list: Available genre names
     """
-    genre_mapping = get_genre_mapping_by_country(country_code)
-    return list(genre_mapping.keys())
+    return list(MAPPING_REGISTRY.genres(country_code).names)
 
 # =============================================================================
 # PLATFORM MAPPING FUNCTIONS
@@ -69,18 +66,7 @@ def get_platform_mapping() -> Dict[str, str]:
         dict: Platform name to URL parameter mapping
     """
     # Base platform mapping (consistent across most countries)
-    base_platforms = {
-        'Netflix': 'netflix',
-        'Prime Video': 'amazon',
-        'Apple TV+': 'apple',
-        'Disney+': 'disney',
-        'Max': 'max',
-        'Hulu': 'hulu',
-        'Paramount+': 'paramount',
-        'Free': 'free'
-    }
-    
-    return base_platforms
+    return dict(MAPPING_REGISTRY.platforms.mapping)
 
 
 def get_platform_mapping_by_country(country_code: str) -> Dict[str, str]:
@@ -117,16 +103,7 @@ def get_content_type_mapping() -> Dict[str, str]:
         >>> mapping.get('Émission') # Returns 'Série' (French TV show term)
     """
     # Universal content type mapping (supports both French and English terms)
-    return {
-        'Film': 'Film',
-        'Movie': 'Film',
-        'Série': 'Série',  # Keep French accent for proper URL encoding
-        'Serie': 'Série',   # Map Serie input to Série for URL encoding
-        'Series': 'Série',  # Map English Series to Série for URL encoding
-        'TV Show': 'Série',
-        'TV Series': 'Série',
-        'Émission': 'Série'  # French TV show term
-    }
+    return dict(MAPPING_REGISTRY.content_types.mapping)
 
 
 def get_content_type_mapping_by_country(country_code: str) -> Dict[str, str]:
@@ -184,27 +161,23 @@ def build_streamgank_url(country: Optional[str] = None,
     
     # Add genre parameter with proper mapping
     if genre:
-        # Use US-only genre mapping (restored for proper URL formatting)
-        genre_mapping = get_genre_mapping_by_country(country)
-        streamgank_genre = genre_mapping.get(genre, genre)
+        # Country-specific genre table (case/accent-insensitive lookup)
+        streamgank_genre = MAPPING_REGISTRY.genres(country).resolve(genre, genre)
         url_params.append(f"genres={streamgank_genre}")
         logger.debug(f"Genre mapped: {genre} -> {streamgank_genre}")
     
     # Add platform parameter with proper mapping  
     if platform:
-        # Use country-specific platform mapping
-        platform_mapping = get_platform_mapping()
-        streamgank_platform = platform_mapping.get(platform, platform.lower())
+        # Platform parameters are the same in every country
+        streamgank_platform = MAPPING_REGISTRY.platforms.resolve(platform, platform.lower())
         url_params.append(f"platforms={streamgank_platform}")
         logger.debug(f"Platform mapped: {platform} -> {streamgank_platform}")
     
     # Add content type parameter with proper mapping
     if content_type:
         # Use universal content type mapping (same across all countries)
-        type_mapping = get_content_type_mapping()
-        streamgank_type = type_mapping.get(content_type, content_type)
+        streamgank_type = MAPPING_REGISTRY.content_types.resolve(content_type, content_type)
         # URL encode to handle accents (e.g., "Série" -> "S%C3%A9rie")
-        import urllib.parse
         encoded_type = urllib.parse.quote(streamgank_type)
         url_params.append(f"type={encoded_type}")
         logger.debug(f"Content type mapped: {content_type} -> {streamgank_type} -> {encoded_type}")
@@ -255,8 +228,7 @@ def validate_genre(genre: str, country_code: str = 'US') -> bool:
     Returns:
         bool: True if genre is valid
     """
-    genre_mapping = get_genre_mapping_by_country(country_code)
-    return genre in genre_mapping
+    return genre in MAPPING_REGISTRY.genres(country_code)
 
 
 def validate_platform(platform: str, country_code: str = 'US') -> bool:
@@ -270,8 +242,7 @@ def validate_platform(platform: str, country_code: str = 'US') -> bool:
     Returns:
         bool: True if platform is valid
     """
-    platform_mapping = get_platform_mapping_by_country(country_code)
-    return platform in platform_mapping
+    return platform in MAPPING_REGISTRY.platforms
 
 
 def validate_content_type(content_type: str) -> bool:
@@ -284,8 +255,7 @@ def validate_content_type(content_type: str) -> bool:
     Returns:
         bool: True if content type is valid
     """
-    mapping = get_content_type_mapping()
-    return content_type in mapping
+    return content_type in MAPPING_REGISTRY.content_types
 
 
 def get_available_platforms_for_country(country_code: str) -> List[str]:
@@ -308,9 +278,8 @@ def get_available_platforms_for_country(country_code: str) -> List[str]:
     """
     logger.debug(f"Getting available platforms for country: {country_code}")
     
-    # Get platform mapping for the country
-    platform_mapping = get_platform_mapping_by_country(country_code)
-    available_platforms = list(platform_mapping.keys())
+    # Platform names are the same for every country
+    available_platforms = list(MAPPING_REGISTRY.platforms.names)
     
     logger.debug(f"Found {len(available_platforms)} platforms for {country_code}")
     return available_platforms
@@ -506,27 +475,23 @@ def extract_filters_from_url(url: str) -> Dict[str, str]:
             filters['country'] = params['country'][0]
         
         if 'genres' in params:
-            filters['genre'] = params['genres'][0]
+            genre_param = params['genres'][0]
+            
+            # Reverse map genre parameter to display name (per-country table)
+            genre_table = MAPPING_REGISTRY.genres(filters.get('country'))
+            filters['genre'] = genre_table.reverse(genre_param) or genre_param
         
         if 'platforms' in params:
-            filters['platform'] = params['platforms'][0]
+            platform_param = params['platforms'][0]
             
             # Reverse map platform parameter to display name
-            platform_mapping = get_platform_mapping()
-            for display_name, url_param in platform_mapping.items():
-                if url_param == filters['platform']:
-                    filters['platform'] = display_name
-                    break
+            filters['platform'] = MAPPING_REGISTRY.platforms.reverse(platform_param) or platform_param
         
         if 'type' in params:
-            filters['content_type'] = params['type'][0]
+            type_param = params['type'][0]
             
             # Reverse map content type parameter
-            content_mapping = get_content_type_mapping()
-            for display_name, url_param in content_mapping.items():
-                if url_param == filters['content_type']:
-                    filters['content_type'] = display_name
-                    break
+            filters['content_type'] = MAPPING_REGISTRY.content_types.reverse(type_param) or type_param
         
         logger.debug(f"Extracted filters from URL: {filters}")
         return filters
@@ -573,7 +538,7 @@ def validate_streamgank_url(url: str) -> Dict[str, any]:
         
         # Validate individual parameters
         if 'genre' in filters:
-            if not validate_genre(filters['genre']):
+            if not validate_genre(filters['genre'], filters.get('country', 'US')):
                 validation['warnings'].append(f"Genre '{filters['genre']}' may not be supported")
         
         if 'platform' in filters:
@@ -618,9 +583,14 @@ def _validate_and_correct_params(filters: Dict[str, str]) -> Tuple[Dict[str, str
     try:
         # Validate and correct genre
         if 'genre' in filters and filters['genre']:
-            if not validate_genre(filters['genre']):
+            canonical_genre = MAPPING_REGISTRY.genres(filters.get('country')).canonical(filters['genre'])
+            if canonical_genre is not None:
+                if canonical_genre != filters['genre']:
+                    corrected_filters['genre'] = canonical_genre
+                    corrections.append(f"Genre corrected: {filters['genre']} → {canonical_genre}")
+            else:
                 # Try to find a close match
-                available_genres = get_available_genres_for_country('US')
+                available_genres = get_available_genres_for_country(filters.get('country', 'US'))
                 for genre in available_genres:
                     if genre.lower() in filters['genre'].lower() or filters['genre'].lower() in genre.lower():
                         corrected_filters['genre'] = genre
@@ -631,7 +601,12 @@ def _validate_and_correct_params(filters: Dict[str, str]) -> Tuple[Dict[str, str
         
         # Validate and correct platform
         if 'platform' in filters and filters['platform']:
-            if not validate_platform(filters['platform']):
+            canonical_platform = MAPPING_REGISTRY.platforms.canonical(filters['platform'])
+            if canonical_platform is not None:
+                if canonical_platform != filters['platform']:
+                    corrected_filters['platform'] = canonical_platform
+                    corrections.append(f"Platform corrected: {filters['platform']} → {canonical_platform}")
+            else:
                 # Try common platform name variations
                 platform_corrections = {
                     'amazon': 'Prime Video',
@@ -1,17 +1,35 @@
 """
 Webhook Client for Real-time Step Updates
 Sends step completion notifications to Node.js server for real-time frontend updates
+
+Updates are handed to a background delivery queue (utils.webhook_queue) by
+default, so a slow or unreachable GUI server never delays the workflow.
+Set WEBHOOK_ASYNC=false to send inline instead.
 """
 
 import requests
 import os
 import time
-import json
 import logging
+import threading
 from typing import Dict, Any, Optional
 
+from config.settings import get_webhook_settings
+from utils.webhook_queue import get_webhook_queue
+
 logger = logging.getLogger(__name__)
 
+# Strictly increasing sequence numbers (ms resolution) so the server's ordering check never sees ties
+_sequence_lock = threading.Lock()
+_last_sequence = 0
+
+
+def _next_sequence() -> int:
+    global _last_sequence
+    with _sequence_lock:
+        _last_sequence = max(_last_sequence + 1, int(time.time() * 1000))
+        return _last_sequence
+
 
 class WebhookClient:
     """Client for sending real-time webhook notifications during workflow execution"""
@@ -26,8 +44,12 @@ class WebhookClient:
         """
         self.base_url = base_url or os.getenv('WEBHOOK_BASE_URL', 'http://localhost:3000')
         self.job_id = job_id or os.getenv('JOB_ID')
-        self.session = requests.Session()
-        self.session.timeout = 5  # 5 second timeout for webhook calls
+        self.settings = get_webhook_settings()
+        
+        async_env = os.getenv('WEBHOOK_ASYNC')
+        self.async_delivery = (async_env.lower() not in ('0', 'false', 'no') if async_env is not None
+                               else self.settings.get('async_delivery', True))
+        self.session = None  # Only used for inline delivery
         
         # Remove trailing slash
         if self.base_url.endswith('/'):
@@ -50,16 +72,15 @@ class WebhookClient:
             details (Dict): Additional step details
             
         Returns:
-            bool: True if webhook sent successfully, False otherwise
+            bool: True if the webhook was queued (async) or sent successfully (inline)
         """
         if not self.job_id:
             logger.warning("No job_id set for webhook client - skipping webhook")
             return False
         
-        webhook_url = f"{self.base_url}/api/webhooks/step-update"
-        
         # Generate unique step tracking key for accuracy
-        step_key = f"{self.job_id}_{step_number}_{status}_{int(time.time() * 1000)}"
+        sequence = _next_sequence()
+        step_key = f"{self.job_id}_{step_number}_{status}_{sequence}"
         
         payload = {
             'job_id': self.job_id,
@@ -70,29 +91,44 @@ class WebhookClient:
             'details': details or {},
             'timestamp': time.time(),
             'step_key': step_key,  # ✅ NEW: Unique tracking key
-            'sequence': int(time.time() * 1000),  # ✅ NEW: Microsecond sequence for ordering
+            'sequence': sequence,  # ✅ Strictly increasing for server-side ordering
             'workflow_stage': f"step_{step_number}_{status}"  # ✅ NEW: Clear stage identifier
         }
         
+        if self.async_delivery:
+            queued = get_webhook_queue(self.base_url).enqueue(payload)
+            if queued:
+                logger.info(f"📡 Queued webhook: Step {step_number} {status} for job {self.job_id}")
+            else:
+                logger.warning(f"⚠️ Webhook queue closed - dropped step {step_number} {status}")
+            return queued
+        
+        return self._post_now(payload)
+    
+    def _post_now(self, payload: Dict[str, Any]) -> bool:
+        """Send one step update inline on the calling thread (WEBHOOK_ASYNC=false)."""
+        step_number = payload['step_number']
+        webhook_url = f"{self.base_url}{self.settings['step_endpoint']}"
+        
+        if self.session is None:
+            self.session = requests.Session()
+        
         try:
-            logger.info(f"📡 Sending webhook: Step {step_number} {status} for job {self.job_id}")
-            logger.debug(f"   Webhook URL: {webhook_url}")
-            logger.debug(f"   Payload: {json.dumps(payload, indent=2)}")
+            logger.info(f"📡 Sending webhook: Step {step_number} {payload['status']} for job {self.job_id}")
             
             response = self.session.post(
                 webhook_url, 
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                headers={'Content-Type': 'application/json'},
+                timeout=self.settings['request_timeout']
             )
             
             if response.status_code == 200:
                 logger.info(f"✅ Webhook sent successfully: Step {step_number}")
-                logger.debug(f"   Response: {response.text}")
                 return True
             else:
-                logger.warning(f"⚠️ Webhook returned status {response.status_code}: {response.text}")
+                logger.warning(f"⚠️ Webhook returned status {response.status_code}: {response.text[:200]}")
                 logger.warning(f"   URL: {webhook_url}")
-                logger.warning(f"   Payload: {json.dumps(payload, indent=2)}")
                 return False
                 
         except requests.exceptions.ConnectionError as e:
@@ -113,6 +149,20 @@ class WebhookClient:
             logger.error(f"   URL: {webhook_url}")
             return False
     
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait for queued webhooks to be delivered (no-op for inline delivery).
+        
+        Args:
+            timeout (float): Maximum seconds to wait (default: WEBHOOK_SETTINGS['shutdown_flush_timeout'])
+            
+        Returns:
+            bool: True if nothing is left pending
+        """
+        if not self.async_delivery:
+            return True
+        return get_webhook_queue(self.base_url).flush(timeout)
+    
     def send_workflow_started(self, total_steps: int = 7) -> bool:
         """Send workflow started notification"""
         return self.send_step_update(
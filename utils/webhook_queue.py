@@ -0,0 +1,379 @@
+"""
+StreamGank Webhook Delivery Queue
+
+Background delivery of step-update webhooks to the Node.js GUI server so the
+workflow thread never waits on HTTP. Used by utils.webhook_client.WebhookClient
+when WEBHOOK_SETTINGS['async_delivery'] is enabled.
+
+Features:
+- Single daemon worker per webhook base URL
+- Coalescing: a newer update for the same (job, step) replaces a pending one
+- Batching via POST {batch_endpoint} {"updates": [...]}, falling back to the
+  single step-update endpoint on servers without the batch route
+- Retry with exponential backoff, keeping updates in sequence order
+- Stale intermediate updates dropped when the queue is over max_pending;
+  critical updates (workflow start/complete/failed, creatomate_ready) are kept
+- Flush on shutdown (atexit) with a bounded timeout
+
+Batch endpoint contract:
+    Request:  {"updates": [<step-update payload>, ...]}   (sorted by 'sequence')
+    Response: {"success": bool, "processed": int,
+               "results": [{"step_key": str, "status_code": int, ...}, ...]}
+    Updates whose result has status_code >= 500 are retried; 404/405 on the
+    batch route switches the queue to single-update delivery.
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Async Webhook Delivery
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from config.settings import get_webhook_settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses that must reach the server even under pressure
+CRITICAL_STATUSES = ('failed', 'creatomate_ready')
+
+# Workflow started (0) / completed (8) pseudo-steps
+CRITICAL_STEPS = (0, 8)
+
+# transport(url, json_body, timeout) -> (status_code, parsed JSON body or None)
+Transport = Callable[[str, Dict[str, Any], float], Tuple[int, Optional[Dict[str, Any]]]]
+
+
+def is_critical_update(payload: Dict[str, Any]) -> bool:
+    """Whether an update may never be coalesced away or dropped."""
+    return payload.get('status') in CRITICAL_STATUSES or payload.get('step_number') in CRITICAL_STEPS
+
+
+class _PendingUpdate:
+    """One queued webhook payload and its delivery state."""
+
+    __slots__ = ('payload', 'key', 'critical', 'attempts', 'in_flight')
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.payload = payload
+        self.key = (payload.get('job_id'), payload.get('step_number'))
+        self.critical = is_critical_update(payload)
+        self.attempts = 0
+        self.in_flight = False
+
+
+class WebhookDeliveryQueue:
+    """
+    Ordered, coalescing, batched webhook delivery on a background thread.
+    """
+
+    def __init__(self, base_url: str, settings: Dict[str, Any] = None, transport: Transport = None):
+        """
+        Initialize delivery queue.
+
+        Args:
+            base_url (str): Webhook server base URL (no trailing slash)
+            settings (Dict): Overrides for WEBHOOK_SETTINGS
+            transport (Transport): HTTP POST function (default: requests.Session)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.settings = {**get_webhook_settings(), **(settings or {})}
+        self._transport = transport or self._http_post
+        self._session = None
+
+        self._pending: List[_PendingUpdate] = []
+        self._coalesce_index: Dict[Tuple[Any, Any], _PendingUpdate] = {}
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._close_deadline = 0.0
+        self._retry_at = 0.0
+        self._batch_supported = True
+
+        self.stats = {
+            'enqueued': 0,
+            'delivered': 0,
+            'coalesced': 0,
+            'dropped_stale': 0,
+            'dropped_failed': 0,
+            'retries': 0,
+            'requests': 0
+        }
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def enqueue(self, payload: Dict[str, Any]) -> bool:
+        """
+        Queue a step-update payload for delivery. Never blocks on the network.
+
+        Args:
+            payload (Dict): Step-update payload (see WebhookClient.send_step_update)
+
+        Returns:
+            bool: False if the queue is already shut down
+        """
+        entry = _PendingUpdate(payload)
+
+        with self._cond:
+            if self._closed:
+                return False
+
+            existing = self._coalesce_index.get(entry.key)
+            if existing is not None and not existing.in_flight and not existing.critical and not entry.critical:
+                # Newer state for the same step supersedes the pending one; re-append to keep sequence order
+                self._pending.remove(existing)
+                self.stats['coalesced'] += 1
+
+            self._pending.append(entry)
+            self._coalesce_index[entry.key] = entry
+            self.stats['enqueued'] += 1
+
+            self._drop_stale_locked()
+            self._ensure_worker_locked()
+            self._cond.notify_all()
+        return True
+
+    def _drop_stale_locked(self) -> None:
+        overflow = len(self._pending) - self.settings['max_pending']
+        if overflow <= 0:
+            return
+
+        for entry in list(self._pending):
+            if overflow <= 0:
+                break
+            if entry.critical or entry.in_flight:
+                continue
+            self._remove_locked(entry)
+            self.stats['dropped_stale'] += 1
+            overflow -= 1
+
+    def _remove_locked(self, entry: _PendingUpdate) -> None:
+        self._pending.remove(entry)
+        if self._coalesce_index.get(entry.key) is entry:
+            del self._coalesce_index[entry.key]
+
+    def _ensure_worker_locked(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='webhook-delivery', daemon=True)
+            self._worker.start()
+
+    # -------------------------------------------------------------------------
+    # Shutdown
+    # -------------------------------------------------------------------------
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queued update is delivered or dropped.
+
+        Args:
+            timeout (float): Maximum seconds to wait (default: shutdown_flush_timeout)
+
+        Returns:
+            bool: True if the queue drained in time
+        """
+        timeout = self.settings['shutdown_flush_timeout'] if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> bool:
+        """
+        Stop accepting updates and deliver what is pending (bounded by timeout).
+
+        Returns:
+            bool: True if nothing was left undelivered
+        """
+        timeout = self.settings['shutdown_flush_timeout'] if timeout is None else timeout
+        with self._cond:
+            if self._closed:
+                return not self._pending
+            self._closed = True
+            self._close_deadline = time.monotonic() + timeout
+            # Don't sit out a long backoff at exit - retry right away until the deadline
+            self._retry_at = 0.0
+            worker = self._worker
+            self._cond.notify_all()
+
+        if worker is not None:
+            worker.join(timeout + 1)
+
+        with self._cond:
+            if self._pending:
+                logger.warning(f"⚠️ Webhook queue closed with {len(self._pending)} undelivered update(s)")
+                self.stats['dropped_failed'] += len(self._pending)
+                self._pending.clear()
+                self._coalesce_index.clear()
+                return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _next_batch(self) -> Optional[List[_PendingUpdate]]:
+        """Block until a batch is due; None when the worker should exit."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._closed and (not self._pending or now >= self._close_deadline):
+                    return None
+                if self._pending and now >= self._retry_at:
+                    break
+
+                timeout = self._retry_at - now if self._pending else None
+                if self._closed:
+                    remaining = self._close_deadline - now
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                self._cond.wait(timeout)
+
+            # Let closely spaced updates (step completed + next step started) share a request
+            collect_until = time.monotonic() + self.settings['batch_interval']
+            while not self._closed and len(self._pending) < self.settings['max_batch_size']:
+                remaining = collect_until - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._pending[:self.settings['max_batch_size']]
+            for entry in batch:
+                entry.in_flight = True
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                delivered, failed = self._deliver(batch)
+            except Exception as e:
+                logger.warning(f"⚠️ Webhook delivery error: {str(e)}")
+                delivered, failed = [], batch
+
+            self._complete(batch, delivered, failed)
+
+    def _complete(self, batch: List[_PendingUpdate], delivered: List[_PendingUpdate],
+                  failed: List[_PendingUpdate]) -> None:
+        with self._cond:
+            for entry in batch:
+                entry.in_flight = False
+
+            for entry in delivered:
+                self._remove_locked(entry)
+                self.stats['delivered'] += 1
+
+            retry_attempt = 0
+            for entry in failed:
+                entry.attempts += 1
+                if entry.attempts >= self.settings['max_attempts']:
+                    self._remove_locked(entry)
+                    self.stats['dropped_failed'] += 1
+                    logger.warning(f"⚠️ Webhook dropped after {entry.attempts} attempts: "
+                                   f"job {entry.key[0]} step {entry.key[1]} {entry.payload.get('status')}")
+                else:
+                    retry_attempt = max(retry_attempt, entry.attempts)
+
+            if retry_attempt:
+                delay = min(self.settings['backoff_max'], self.settings['backoff_base'] * 2 ** (retry_attempt - 1))
+                self._retry_at = time.monotonic() + delay
+                self.stats['retries'] += 1
+                logger.info(f"🔄 Webhook delivery failed - retrying in {delay:.1f}s")
+            else:
+                self._retry_at = 0.0
+
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Delivery
+    # -------------------------------------------------------------------------
+
+    def _deliver(self, batch: List[_PendingUpdate]) -> Tuple[List[_PendingUpdate], List[_PendingUpdate]]:
+        """
+        Send a batch. Returns (delivered, failed); entries in neither list stay queued unattempted.
+        """
+        timeout = self.settings['request_timeout']
+
+        if self._batch_supported and len(batch) > 1:
+            url = f"{self.base_url}{self.settings['batch_endpoint']}"
+            try:
+                self.stats['requests'] += 1
+                status_code, body = self._transport(url, {'updates': [entry.payload for entry in batch]}, timeout)
+            except Exception as e:
+                logger.warning(f"⚠️ Webhook batch request failed: {str(e)}")
+                return [], batch
+
+            if status_code in (404, 405):
+                logger.info("📡 Webhook server has no batch endpoint - using single updates")
+                self._batch_supported = False
+            elif 200 <= status_code < 300:
+                results = (body or {}).get('results') or []
+                retry_keys = {result.get('step_key') for result in results if result.get('status_code', 200) >= 500}
+                failed = [entry for entry in batch if entry.payload.get('step_key') in retry_keys]
+                return [entry for entry in batch if entry not in failed], failed
+            else:
+                logger.warning(f"⚠️ Webhook batch returned status {status_code}")
+                return [], batch
+
+        # Single-update delivery, stopping at the first failure to preserve order
+        url = f"{self.base_url}{self.settings['step_endpoint']}"
+        delivered = []
+        for entry in batch:
+            try:
+                self.stats['requests'] += 1
+                status_code, _ = self._transport(url, entry.payload, timeout)
+            except Exception as e:
+                logger.warning(f"⚠️ Webhook request failed: {str(e)}")
+                return delivered, [entry]
+            if status_code >= 500 or status_code in (408, 429):
+                logger.warning(f"⚠️ Webhook returned status {status_code}")
+                return delivered, [entry]
+            # 2xx, or a 4xx the server will never accept - either way don't resend
+            delivered.append(entry)
+        return delivered, []
+
+    def _http_post(self, url: str, body: Dict[str, Any], timeout: float) -> Tuple[int, Optional[Dict[str, Any]]]:
+        if self._session is None:
+            self._session = requests.Session()
+        response = self._session.post(url, json=body, timeout=timeout)
+        try:
+            parsed = response.json()
+        except ValueError:
+            parsed = None
+        return response.status_code, parsed
+
+
+# Global delivery queues (one per webhook base URL)
+_queues: Dict[str, WebhookDeliveryQueue] = {}
+_queues_lock = threading.Lock()
+
+def get_webhook_queue(base_url: str) -> WebhookDeliveryQueue:
+    """Get the process-wide delivery queue for a webhook base URL"""
+    base_url = base_url.rstrip('/')
+    with _queues_lock:
+        queue = _queues.get(base_url)
+        if queue is None:
+            queue = WebhookDeliveryQueue(base_url)
+            _queues[base_url] = queue
+        return queue
+
+
+@atexit.register
+def shutdown_webhook_queues(timeout: float = None) -> None:
+    """Flush and close every delivery queue (registered with atexit)."""
+    with _queues_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    for queue in queues:
+        queue.close(timeout)
@@ -0,0 +1,538 @@
+"""
+StreamGank Workflow Cache Store
+
+This module provides the indexed storage backend behind utils.test_data_cache.
+Workflow results used to live in one pretty-printed workflow_*.json file per
+parameter combination, which was re-read for every step lookup and rewritten in
+full on every incremental save. The store keeps one record per step instead.
+
+Features:
+- SQLite shards selected by a stable hash of the normalized parameter key
+- Records indexed on (cache_key, data_type) - step lookups are single row reads
+- Atomic per-step upserts; unchanged steps are detected by hash and skipped
+- Trigger-maintained counters so cache statistics never scan the records
+- Import/export of the legacy workflow_*.json format
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Indexed Workflow Cache Store
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_CACHE_DIR = os.path.join('test_output', 'cache_store')
+DEFAULT_SHARD_COUNT = 8
+
+# Record holding the non-step fields of a workflow (parameters, status, timings)
+WORKFLOW_META_RECORD = '_workflow_meta'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_records (
+    cache_key TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    country TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    genre TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    template TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    saved_timestamp REAL NOT NULL,
+    PRIMARY KEY (cache_key, data_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cache_records_type ON cache_records (data_type);
+
+CREATE TABLE IF NOT EXISTS cache_stats (
+    data_type TEXT PRIMARY KEY,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_cache_records_insert AFTER INSERT ON cache_records
+BEGIN
+    INSERT OR IGNORE INTO cache_stats (data_type, record_count, total_bytes) VALUES (NEW.data_type, 0, 0);
+    UPDATE cache_stats SET record_count = record_count + 1, total_bytes = total_bytes + NEW.size_bytes
+    WHERE data_type = NEW.data_type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cache_records_update AFTER UPDATE ON cache_records
+BEGIN
+    UPDATE cache_stats SET total_bytes = total_bytes - OLD.size_bytes + NEW.size_bytes
+    WHERE data_type = NEW.data_type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cache_records_delete AFTER DELETE ON cache_records
+BEGIN
+    UPDATE cache_stats SET record_count = record_count - 1, total_bytes = total_bytes - OLD.size_bytes
+    WHERE data_type = OLD.data_type;
+END;
+"""
+
+# =============================================================================
+# KEY NORMALIZATION
+# =============================================================================
+
+def normalize_cache_params(country: str, genre: str, platform: str,
+                           content_type: str = "Movies", template: str = "auto") -> Tuple[str, str, str, str, str]:
+    """
+    Normalize workflow parameters into the tuple used as cache key.
+
+    Uses the same cleaning rules as the legacy workflow_*.json filenames so
+    imported files and fresh saves resolve to the same key.
+
+    Args:
+        country (str): Country parameter
+        genre (str): Genre parameter
+        platform (str): Platform parameter
+        content_type (str): Content type parameter (Movies, TV Shows, All)
+        template (str): Template parameter (auto, horror, action, etc.)
+
+    Returns:
+        Tuple[str, str, str, str, str]: (country, platform, genre, content_type, template)
+    """
+    country_clean = re.sub(r'[^\w\s-]', '', (country or '').strip()).replace(' ', '_').lower()
+    genre_clean = (genre or '').strip().replace('&', 'and').replace(' ', '_').lower()
+    genre_clean = re.sub(r'[^\w-]', '', genre_clean)
+    platform_clean = re.sub(r'[^\w\s-]', '', (platform or '').strip()).replace(' ', '_').lower()
+    content_type_clean = (content_type or 'Movies').replace(' ', '_').lower()
+    template_clean = (template or 'auto').replace(' ', '_').lower()
+
+    return (country_clean, platform_clean, genre_clean, content_type_clean, template_clean)
+
+
+def build_cache_key(params: Tuple[str, str, str, str, str]) -> str:
+    """
+    Build the string cache key for a normalized parameter tuple.
+
+    Args:
+        params (Tuple): Output of normalize_cache_params()
+
+    Returns:
+        str: Cache key in the legacy filename layout (country_platform_genre_type_template)
+    """
+    return '_'.join(params)
+
+
+def _serialize_payload(data: Any) -> Tuple[str, str]:
+    """Serialize a record payload compactly and return (payload, sha1 hash)."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+    return payload, hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+# =============================================================================
+# STORE IMPLEMENTATION
+# =============================================================================
+
+class WorkflowCacheStore:
+    """
+    Sharded SQLite store for cached workflow steps.
+
+    Every (parameter key, data type) pair is one row. Workflows are saved as one
+    row per step_* section plus a metadata row, so incremental saves only touch
+    the steps that actually changed.
+    """
+
+    def __init__(self, base_dir: str = None, shard_count: int = None):
+        """
+        Initialize the cache store.
+
+        Args:
+            base_dir (str): Directory holding the shard databases (default: WORKFLOW_CACHE_DIR or test_output/cache_store)
+            shard_count (int): Number of shard databases (default: WORKFLOW_CACHE_SHARDS or 8)
+        """
+        self.base_dir = Path(base_dir or os.getenv('WORKFLOW_CACHE_DIR', DEFAULT_CACHE_DIR))
+        self.shard_count = max(1, int(shard_count or os.getenv('WORKFLOW_CACHE_SHARDS', DEFAULT_SHARD_COUNT)))
+        self._local = threading.local()
+        self._initialized_shards = set()
+        self._init_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Connection management
+    # -------------------------------------------------------------------------
+
+    def _shard_path(self, shard_index: int) -> Path:
+        return self.base_dir / f"shard_{shard_index:02d}.sqlite3"
+
+    def _shard_for_key(self, cache_key: str) -> int:
+        # crc32 is stable across processes, unlike hash()
+        return zlib.crc32(cache_key.encode('utf-8')) % self.shard_count
+
+    def _connect(self, shard_index: int) -> sqlite3.Connection:
+        """Get this thread's connection to a shard, creating the schema on first use."""
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get(shard_index)
+        if conn is not None:
+            return conn
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._shard_path(shard_index)), timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+
+        with self._init_lock:
+            if shard_index not in self._initialized_shards:
+                conn.executescript(_SCHEMA)
+                self._initialized_shards.add(shard_index)
+
+        connections[shard_index] = conn
+        return conn
+
+    def _existing_shards(self) -> List[int]:
+        """Indexes of shards that exist on disk (read paths never create empty shards)."""
+        return [i for i in range(self.shard_count) if self._shard_path(i).exists()]
+
+    def close(self):
+        """Close the calling thread's shard connections."""
+        connections = getattr(self._local, 'connections', None) or {}
+        for conn in connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local.connections = {}
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def put_records(self, params: Tuple[str, str, str, str, str], records: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Atomically upsert several records for one parameter key.
+
+        Records whose serialized payload hash matches the stored row are skipped,
+        so re-saving a workflow after one step only rewrites that step.
+
+        Args:
+            params (Tuple): Normalized parameter tuple
+            records (Dict[str, Any]): Mapping of data_type -> JSON-serializable payload
+
+        Returns:
+            Dict[str, int]: {'written': n, 'unchanged': m}
+        """
+        cache_key = build_cache_key(params)
+        conn = self._connect(self._shard_for_key(cache_key))
+        now = time.time()
+        written = 0
+        unchanged = 0
+
+        serialized = {data_type: _serialize_payload(data) for data_type, data in records.items()}
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            existing = dict(conn.execute(
+                'SELECT data_type, payload_hash FROM cache_records WHERE cache_key = ?', (cache_key,)
+            ).fetchall())
+
+            for data_type, (payload, payload_hash) in serialized.items():
+                if existing.get(data_type) == payload_hash:
+                    unchanged += 1
+                    continue
+
+                conn.execute(
+                    '''INSERT INTO cache_records
+                       (cache_key, data_type, country, platform, genre, content_type, template,
+                        payload, payload_hash, size_bytes, saved_timestamp)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (cache_key, data_type) DO UPDATE SET
+                        payload = excluded.payload,
+                        payload_hash = excluded.payload_hash,
+                        size_bytes = excluded.size_bytes,
+                        saved_timestamp = excluded.saved_timestamp''',
+                    (cache_key, data_type, *params, payload, payload_hash, len(payload.encode('utf-8')), now)
+                )
+                written += 1
+
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        logger.debug(f"💾 Cache store {cache_key}: {written} record(s) written, {unchanged} unchanged")
+        return {'written': written, 'unchanged': unchanged}
+
+    def save_workflow(self, params: Tuple[str, str, str, str, str], workflow_data: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Save a workflow result as one record per step_* section plus a metadata record.
+
+        Args:
+            params (Tuple): Normalized parameter tuple
+            workflow_data (Dict[str, Any]): Workflow results as built by run_full_workflow
+
+        Returns:
+            Dict[str, int]: {'written': n, 'unchanged': m}
+        """
+        records = {key: value for key, value in workflow_data.items() if key.startswith('step_')}
+        records[WORKFLOW_META_RECORD] = {
+            key: value for key, value in workflow_data.items() if not key.startswith('step_')
+        }
+        return self.put_records(params, records)
+
+    def delete(self, data_type: Optional[str] = None, country: Optional[str] = None,
+               genre: Optional[str] = None, platform: Optional[str] = None) -> int:
+        """
+        Delete records matching all given (already normalized) filters.
+
+        Returns:
+            int: Number of records deleted
+        """
+        clauses = []
+        values = []
+        for column, value in (('data_type', data_type), ('country', country),
+                              ('genre', genre), ('platform', platform)):
+            if value:
+                clauses.append(f"{column} = ?")
+                values.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        deleted = 0
+        for shard_index in self._existing_shards():
+            conn = self._connect(shard_index)
+            deleted += conn.execute(f'DELETE FROM cache_records {where}', values).rowcount
+        return deleted
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def get_record(self, params: Tuple[str, str, str, str, str], data_type: str) -> Optional[Any]:
+        """
+        Read a single record.
+
+        Args:
+            params (Tuple): Normalized parameter tuple
+            data_type (str): Record type (e.g. 'step_2_script_generation')
+
+        Returns:
+            Any: Decoded payload or None if not stored
+        """
+        cache_key = build_cache_key(params)
+        shard_index = self._shard_for_key(cache_key)
+        if not self._shard_path(shard_index).exists():
+            return None
+
+        row = self._connect(shard_index).execute(
+            'SELECT payload FROM cache_records WHERE cache_key = ? AND data_type = ?', (cache_key, data_type)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def has_key(self, params: Tuple[str, str, str, str, str]) -> bool:
+        """Check whether any record exists for a parameter key."""
+        cache_key = build_cache_key(params)
+        shard_index = self._shard_for_key(cache_key)
+        if not self._shard_path(shard_index).exists():
+            return False
+
+        row = self._connect(shard_index).execute(
+            'SELECT 1 FROM cache_records WHERE cache_key = ? LIMIT 1', (cache_key,)
+        ).fetchone()
+        return row is not None
+
+    def load_workflow(self, params: Tuple[str, str, str, str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Reassemble a full workflow dict from its step records.
+
+        Returns:
+            Dict[str, Any]: Workflow data in the legacy layout, or None if not stored
+        """
+        cache_key = build_cache_key(params)
+        shard_index = self._shard_for_key(cache_key)
+        if not self._shard_path(shard_index).exists():
+            return None
+
+        rows = self._connect(shard_index).execute(
+            'SELECT data_type, payload FROM cache_records WHERE cache_key = ?', (cache_key,)
+        ).fetchall()
+
+        workflow_data = {}
+        for data_type, payload in rows:
+            decoded = json.loads(payload)
+            if data_type == WORKFLOW_META_RECORD:
+                workflow_data.update(decoded)
+            elif data_type.startswith('step_'):
+                workflow_data[data_type] = decoded
+
+        return workflow_data or None
+
+    def list_records(self) -> List[Dict[str, Any]]:
+        """
+        List record metadata from the index without decoding any payloads.
+
+        Returns:
+            List[Dict]: One entry per record
+        """
+        entries = []
+        for shard_index in self._existing_shards():
+            rows = self._connect(shard_index).execute(
+                '''SELECT cache_key, data_type, country, platform, genre, content_type, template,
+                          size_bytes, saved_timestamp FROM cache_records'''
+            ).fetchall()
+            for (cache_key, data_type, country, platform, genre, content_type,
+                 template, size_bytes, saved_timestamp) in rows:
+                entries.append({
+                    'cache_key': cache_key,
+                    'data_type': data_type,
+                    'parameters': {
+                        'country': country,
+                        'platform': platform,
+                        'genre': genre,
+                        'content_type': content_type,
+                        'template': template
+                    },
+                    'size_bytes': size_bytes,
+                    'saved_timestamp': saved_timestamp
+                })
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Aggregate statistics from the trigger-maintained counters.
+
+        Cost is proportional to shards x data types, never to the number of records.
+
+        Returns:
+            Dict[str, Any]: Totals plus per-data-type counts and sizes
+        """
+        data_types: Dict[str, Dict[str, Any]] = {}
+        total_records = 0
+        total_bytes = 0
+
+        for shard_index in self._existing_shards():
+            rows = self._connect(shard_index).execute(
+                'SELECT data_type, record_count, total_bytes FROM cache_stats WHERE record_count > 0'
+            ).fetchall()
+            for data_type, record_count, size_bytes in rows:
+                entry = data_types.setdefault(data_type, {'count': 0, 'size_bytes': 0})
+                entry['count'] += record_count
+                entry['size_bytes'] += size_bytes
+                total_records += record_count
+                total_bytes += size_bytes
+
+        for entry in data_types.values():
+            entry['size_mb'] = round(entry['size_bytes'] / 1024 / 1024, 2)
+
+        return {
+            'total_records': total_records,
+            'total_size_bytes': total_bytes,
+            'total_size_mb': round(total_bytes / 1024 / 1024, 2),
+            'data_types': data_types,
+            'shard_count': self.shard_count,
+            'cache_directory': str(self.base_dir)
+        }
+
+    # -------------------------------------------------------------------------
+    # Legacy JSON import / export
+    # -------------------------------------------------------------------------
+
+    def import_json_file(self, file_path: str) -> Optional[Tuple[str, str, str, str, str]]:
+        """
+        Import a legacy workflow_*.json file (with or without the 'data' wrapper).
+
+        Parameters are taken from the file's metadata block when present.
+
+        Args:
+            file_path (str): Path to the JSON file
+
+        Returns:
+            Tuple: Normalized parameters the file was imported under, or None on failure
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            file_data = json.load(f)
+
+        if isinstance(file_data, dict) and 'data' in file_data:
+            workflow_data = file_data['data']
+            parameters = file_data.get('metadata', {}).get('parameters', {})
+        else:
+            workflow_data = file_data
+            parameters = {}
+
+        if not isinstance(workflow_data, dict):
+            logger.warning(f"⚠️ Skipping {file_path}: workflow data is not a dict")
+            return None
+
+        if not parameters:
+            parameters = workflow_data.get('parameters', {})
+
+        params = normalize_cache_params(
+            parameters.get('country', ''),
+            parameters.get('genre', ''),
+            parameters.get('platform', ''),
+            parameters.get('content_type', 'Movies'),
+            parameters.get('template', 'auto')
+        )
+        self.save_workflow(params, workflow_data)
+        logger.info(f"📥 Imported {os.path.basename(file_path)} into cache store as {build_cache_key(params)}")
+        return params
+
+    def export_json_file(self, params: Tuple[str, str, str, str, str], file_path: str,
+                         parameters: Dict[str, str] = None) -> str:
+        """
+        Export a stored workflow to the legacy workflow_*.json format.
+
+        Args:
+            params (Tuple): Normalized parameter tuple
+            file_path (str): Destination file path
+            parameters (Dict[str, str]): Original (un-normalized) parameters for the metadata block
+
+        Returns:
+            str: Path written, empty string if the workflow is not stored
+        """
+        workflow_data = self.load_workflow(params)
+        if workflow_data is None:
+            return ""
+
+        country, platform, genre, content_type, template = params
+        file_data = {
+            'data': workflow_data,
+            'metadata': {
+                'data_type': 'workflow',
+                'parameters': parameters or {
+                    'country': country,
+                    'genre': genre,
+                    'platform': platform,
+                    'content_type': content_type,
+                    'template': template
+                },
+                'saved_timestamp': time.time(),
+                'saved_datetime': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+            }
+        }
+
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(file_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, file_path)
+        return file_path
+
+
+# Global store instance
+_cache_store = None
+_cache_store_lock = threading.Lock()
+
+def get_workflow_cache_store() -> WorkflowCacheStore:
+    """Get global workflow cache store instance (recreated if WORKFLOW_CACHE_DIR changes)"""
+    global _cache_store
+    base_dir = Path(os.getenv('WORKFLOW_CACHE_DIR', DEFAULT_CACHE_DIR))
+    with _cache_store_lock:
+        if _cache_store is None or _cache_store.base_dir != base_dir:
+            _cache_store = WorkflowCacheStore(base_dir=str(base_dir))
+        return _cache_store
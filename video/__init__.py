@@ -11,10 +11,11 @@ Modules:
     - video_processor: Video processing utilities and duration analysis
 """
 
-from .creatomate_client import *
-from .scroll_generator import *
-from .composition_builder import *
-from .video_processor import *
+# Submodules load on first attribute access, so importing one video module
+# (or a quick CLI path) no longer imports every dependency of the package
+from utils.lazy_imports import lazy_package
+
+_SUBMODULES = ('creatomate_client', 'scroll_generator', 'composition_builder', 'video_processor')
 
 __all__ = [
     # Creatomate Integration
@@ -41,4 +42,21 @@ __all__ = [
     'calculate_video_durations',
     'validate_video_urls',
     'process_video_metadata'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'create_creatomate_video': 'creatomate_client',
+    'check_render_status': 'creatomate_client',
+    'wait_for_completion': 'creatomate_client',
+    'send_creatomate_request': 'creatomate_client',
+    'get_creatomate_video_url': 'creatomate_client',
+    'generate_scroll_video': 'scroll_generator',
+    'create_scroll_video_from_url': 'scroll_generator',
+    'build_video_composition': 'composition_builder',
+    'create_poster_timing': 'composition_builder',
+    'calculate_video_durations': 'video_processor',
+    'validate_video_urls': 'video_processor'
+}
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS, _SUBMODULES)
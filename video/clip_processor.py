@@ -7,6 +7,8 @@ TikTok/Instagram Reels format.
 Features:
 - Trailer download and processing
 - 18-second highlight clip extraction with professional fade outro
+- Single-pass highlight composition (seeked inputs + one filtergraph, no temp clips)
+- Single-pass loudness/scene analysis (per-second timelines shared by all segment scoring)
 - Portrait format conversion (9:16)
 - Cloudinary upload and optimization
 - Multiple transformation modes
@@ -23,18 +25,26 @@ import tempfile
 import re
 import time
 import json
-from typing import Dict, List, Optional, Any
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import requests
 import cloudinary
 import cloudinary.uploader
 import yt_dlp
 import concurrent.futures
+import contextvars
 import threading
 from datetime import datetime
 
-from config.settings import get_video_settings, get_api_config
+from config.settings import get_video_settings, get_api_config, get_encoding_args
 from utils.validators import is_valid_url
+from utils.http_session import get_http_session
+from utils.shared_work import get_shared_work_cache
+from utils.tracing import run_traced_subprocess, trace_span, record_retry
+from utils.media_executor import MediaJobCancelled, run_media_command
+from utils.scratch_workspace import get_scratch_dir, check_scratch_quota
 from utils.file_utils import ensure_directory, cleanup_temp_files
 
 logger = logging.getLogger(__name__)
@@ -72,12 +82,11 @@ def process_movie_trailers_to_clips(movie_data: List[Dict], max_movies: int = 3,
     logger.info("🎯 Output: Dual-highlight clips with fade transitions in 9:16 portrait format")
     
     clip_urls = {}
-    temp_dirs = ["temp_trailers", "temp_clips"]
+    temp_dirs = []
     
     try:
-        # Create temporary directories
-        for temp_dir in temp_dirs:
-            ensure_directory(temp_dir)
+        # Create temporary directories (inside the job's scratch workspace when a job is running)
+        temp_dirs = [get_scratch_dir("temp_trailers"), get_scratch_dir("temp_clips")]
         
         # Get video settings  
         video_settings = get_video_settings()
@@ -262,17 +271,9 @@ def _process_single_trailer_intelligent(movie_data: Dict, trailer_url: str, tran
             logger.error(f"❌ No suitable segments found for {title}")
             return None
         
-        # Step 6: Extract individual highlight clips
-        logger.info("✂️ Step 6/8: Extracting individual highlight clips...")
-        highlight_clips = _extract_highlight_clips(downloaded_trailer, best_segments)
-        if not highlight_clips or len(highlight_clips) == 0:
-            logger.error(f"❌ Failed to extract any highlight clips for {title}")
-            return None
-        
-        # Step 7: Compose with professional transitions and fade outro (adaptive for 1 or 2 clips)
-        clip_count = len(highlight_clips)
-        logger.info(f"🎭 Step 7/8: Composing {clip_count} clip(s) with professional transitions and outro...")
-        final_clip = _compose_highlights_with_transitions(highlight_clips, title, movie_id, transform_mode)
+        # Steps 6-7: Extract and compose with transitions and fade outro in one pass (adaptive for 1 or 2 clips)
+        logger.info(f"🎭 Step 6-7/8: Composing {len(best_segments)} highlight(s) with professional transitions and outro...")
+        final_clip = _compose_highlights_from_source(downloaded_trailer, best_segments, title, movie_id, transform_mode)
         if not final_clip:
             logger.error(f"❌ Failed to compose final clip for {title}")
             return None
@@ -295,7 +296,7 @@ def _process_single_trailer_intelligent(movie_data: Dict, trailer_url: str, tran
         return None
 
 
-def _download_youtube_trailer(trailer_url: str, output_dir: str = "temp_trailers") -> Optional[str]:
+def _download_youtube_trailer(trailer_url: str, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Download YouTube trailer video using yt-dlp with cloud server optimization.
     
@@ -303,13 +304,14 @@ def _download_youtube_trailer(trailer_url: str, output_dir: str = "temp_trailers
     
     Args:
         trailer_url (str): YouTube trailer URL
-        output_dir (str): Directory to save downloaded video
+        output_dir (str): Directory to save downloaded video (default: job scratch temp_trailers)
         
     Returns:
         str: Path to downloaded video file or None if failed
     """
     try:
-        # Create output directory
+        # Create output directory (the job's scratch workspace by default)
+        output_dir = output_dir or get_scratch_dir("temp_trailers")
         os.makedirs(output_dir, exist_ok=True)
         
         # Extract video ID for consistent naming
@@ -359,6 +361,8 @@ def _download_youtube_trailer(trailer_url: str, output_dir: str = "temp_trailers
                 if video_id in file and file.endswith(('.mp4', '.webm', '.mkv')):
                     downloaded_path = os.path.join(output_dir, file)
                     logger.info(f"✅ Successfully downloaded: {downloaded_path}")
+                    # Trailers are the largest scratch files - stop here if the job is over its quota
+                    check_scratch_quota()
                     return downloaded_path
         
         logger.error(f"❌ Could not find downloaded file for video ID: {video_id}")
@@ -478,7 +482,7 @@ def _extract_youtube_video_id(url: str) -> Optional[str]:
     return None
 
 
-def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir: str = "temp_clips") -> Optional[str]:
+def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Extract a highlight clip from a video and convert to CINEMATIC PORTRAIT format (9:16).
     
@@ -493,13 +497,14 @@ def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
     Args:
         video_path (str): Path to the source video file (typically landscape YouTube trailer)
         start_time (int): Start time in seconds (default: 30s to skip intros)
-        output_dir (str): Directory to save the cinematic portrait highlight clip
+        output_dir (str): Directory to save the cinematic portrait highlight clip (default: job scratch temp_clips)
         
     Returns:
         str: Path to the extracted CINEMATIC PORTRAIT highlight clip or None if failed
     """
     try:
-        # Create output directory
+        # Create output directory (the job's scratch workspace by default)
+        output_dir = output_dir or get_scratch_dir("temp_clips")
         os.makedirs(output_dir, exist_ok=True)
         
         # Generate output filename
@@ -519,14 +524,6 @@ def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
             '-i', video_path,           # Input file
             '-ss', str(start_time),     # Start time
             '-t', '18',                 # Enhanced: 18 seconds duration
-            '-c:v', 'libx264',         # Video codec
-            '-c:a', 'aac',             # Audio codec
-            '-crf', '15',              # Ultra-high quality for social media
-            '-preset', 'slow',         # Better compression efficiency
-            '-profile:v', 'high',      # H.264 high profile for better quality
-            '-level:v', '4.0',         # H.264 level 4.0 for high resolution
-            '-movflags', '+faststart', # Optimize for web streaming
-            '-pix_fmt', 'yuv420p',     # Ensure compatibility
             # Enhanced: Complex filter with cinematic background + professional fade outro
             '-filter_complex', 
             '[0:v]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,gblur=sigma=20[blurred];'
@@ -534,16 +531,16 @@ def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
             '[blurred][scaled]overlay=(W-w)/2:(H-h)/2,unsharp=5:5:1.0:5:5:0.3,eq=contrast=1.1:brightness=0.05:saturation=1.2,'
             'fade=out:st=17:d=1',  # Professional video fade-out: starts at 17s, lasts 1s for snappy ending
             '-af', 'afade=out:st=17:d=1',  # Enhanced: Matching audio fade-out for professional finish
-            '-r', '30',                # 30 FPS for smooth playback
-            '-maxrate', '4000k',       # Higher bitrate for premium quality
-            '-bufsize', '8000k',       # Larger buffer size
+            # Final quality, 30 FPS, higher bitrate cap for premium quality
+            *get_encoding_args('final', frame_rate=30, maxrate='4000k', bufsize='8000k'),
             '-y',                       # Overwrite output file
             output_path
         ]
         
         # Run FFmpeg command
-        result = subprocess.run(
+        result = run_media_command(
             ffmpeg_cmd, 
+            priority='final',
             capture_output=True, 
             text=True,
             timeout=60  # 60 second timeout
@@ -559,6 +556,8 @@ def _extract_second_highlight(video_path: str, start_time: int = 30, output_dir:
             logger.error(f"❌ FFmpeg error: {result.stderr}")
             return None
             
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"❌ FFmpeg timeout while processing: {video_path}")
         return None
@@ -583,7 +582,7 @@ def _download_direct_video(video_url: str, output_path: str) -> bool:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(video_url, headers=headers, stream=True, timeout=60)
+        response = get_http_session().get(video_url, headers=headers, stream=True, timeout=60)
         response.raise_for_status()
         
         with open(output_path, 'wb') as f:
@@ -619,6 +618,8 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
         target_resolution = video_settings.get('target_resolution', (1080, 1920))
         target_fps = video_settings.get('target_fps', 60)
         video_bitrate = video_settings.get('video_bitrate', '2M')
+        # The clip is uploaded and re-encoded by Cloudinary/Creatomate
+        encoding_args = get_encoding_args('intermediate', crf=23, audio_bitrate='128k')
         
         # Calculate start time (skip first 30 seconds, take middle section)
         start_offset = video_settings.get('clip_start_offset', 30)
@@ -631,13 +632,7 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
                 '-ss', str(start_offset),  # Start offset
                 '-t', str(duration),       # Duration
                 '-vf', f'scale={target_resolution[0]}:{target_resolution[1]}:force_original_aspect_ratio=decrease,pad={target_resolution[0]}:{target_resolution[1]}:(ow-iw)/2:(oh-ih)/2,fps={target_fps}',
-                '-c:v', 'libx264',
-                '-preset', 'medium',
-                '-crf', '23',
-                '-b:v', video_bitrate,
-                '-c:a', 'aac',
-                '-b:a', '128k',
-                '-movflags', '+faststart',
+                *get_encoding_args('intermediate', crf=23, video_bitrate=video_bitrate, audio_bitrate='128k'),
                 '-y',  # Overwrite output
                 output_path
             ]
@@ -648,10 +643,7 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
                 '-ss', str(start_offset),
                 '-t', str(duration),
                 '-vf', f'scale={target_resolution[0]}:{target_resolution[1]}:force_original_aspect_ratio=decrease',
-                '-c:v', 'libx264',
-                '-preset', 'medium',
-                '-crf', '23',
-                '-c:a', 'aac',
+                *encoding_args,
                 '-y',
                 output_path
             ]
@@ -660,16 +652,13 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
                 'ffmpeg', '-i', input_path,
                 '-ss', str(start_offset),
                 '-t', str(duration),
-                '-c:v', 'libx264',
-                '-preset', 'medium',
-                '-crf', '23',
-                '-c:a', 'aac',
+                *encoding_args,
                 '-y',
                 output_path
             ]
         
         # Execute FFmpeg command
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
+        result = run_media_command(cmd, priority='intermediate', capture_output=True, text=True, timeout=180)
         
         if result.returncode == 0 and os.path.exists(output_path):
             # Verify output file size
@@ -684,6 +673,8 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
             logger.error(f"❌ FFmpeg failed: {result.stderr}")
             return False
             
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"❌ FFmpeg timeout for {input_path}")
         return False
@@ -692,7 +683,108 @@ def _extract_highlight_clip(input_path: str, output_path: str, duration: int,
         return False
 
 
-def _upload_clip_to_cloudinary(clip_path: str, movie_title: str, movie_id: str, transform_mode: str = "youtube_shorts") -> Optional[str]:
+# YouTube Shorts optimized transformation modes (9:16 portrait - 1080x1920)
+CLIP_TRANSFORM_MODES = {
+    "fit": [
+        {"width": 1080, "height": 1920, "crop": "fit", "background": "black"},  # YouTube Shorts standard resolution
+        {"quality": "auto:best"},
+        {"format": "mp4"},
+        {"video_codec": "h264"},
+        {"bit_rate": "2000k"}  # High bitrate for crisp quality
+    ],
+    "smart_fit": [
+        {"width": 1080, "height": 1920, "crop": "fill", "gravity": "center"},  # Smart crop with center focus
+        {"quality": "auto:best"},
+        {"format": "mp4"},
+        {"video_codec": "h264"},
+        {"bit_rate": "2500k"},  # Even higher bitrate
+        {"flags": "progressive"}  # Progressive scan for smooth playbook
+    ],
+    "pad": [
+        {"width": 1080, "height": 1920, "crop": "pad", "background": "auto"},   # Smart padding with auto background
+        {"quality": "auto:best"},
+        {"format": "mp4"},
+        {"bit_rate": "2000k"}
+    ],
+    "scale": [
+        {"width": 1080, "height": 1920, "crop": "scale"},                      # Scale to fit (may distort)
+        {"quality": "auto:best"},
+        {"format": "mp4"},
+        {"bit_rate": "1800k"}
+    ],
+    "youtube_shorts": [
+        {"width": 1080, "height": 1920, "crop": "fill", "gravity": "center"},  # YouTube Shorts optimized
+        {"quality": "auto:best"},
+        {"format": "mp4"},
+        {"video_codec": "h264"},
+        {"bit_rate": "3000k"},  # Premium bitrate for YouTube Shorts quality
+        {"flags": "progressive"},
+        {"audio_codec": "aac"},
+        {"audio_frequency": 48000}  # High quality audio
+    ]
+}
+
+
+def _build_clip_upload_options(movie_title: str, movie_id: str, transform_mode: str = "youtube_shorts",
+                               trim_to: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Build the Cloudinary upload options shared by local and remote clip uploads.
+    
+    Args:
+        movie_title (str): Movie title for naming
+        movie_id (str): Movie ID for unique identification
+        transform_mode (str): Transformation mode - "fit", "pad", "scale", "smart_fit" or "youtube_shorts"
+        trim_to (float): Keep only the first N seconds (start_offset/end_offset), None keeps the full clip
+        
+    Returns:
+        Dict[str, Any]: Keyword arguments for cloudinary.uploader.upload / upload_large
+    """
+    # Create a clean filename from movie title
+    clean_title = re.sub(r'[^a-zA-Z0-9_-]', '_', movie_title.lower())
+    clean_title = re.sub(r'_+', '_', clean_title).strip('_')
+    
+    # Create unique public ID (just the filename, folder will handle the path)
+    public_id = f"{clean_title}_{movie_id}" if movie_id else f"{clean_title}"  # Clean filename without duration suffix
+    
+    # Get the transformation based on mode
+    transformation = list(CLIP_TRANSFORM_MODES.get(transform_mode, CLIP_TRANSFORM_MODES["youtube_shorts"]))
+    if trim_to:
+        # Incoming transformation: Cloudinary trims before storing, no local encode needed
+        transformation.insert(0, {"start_offset": "0", "end_offset": f"{trim_to:g}"})
+    
+    return {
+        'resource_type': "video",
+        'public_id': public_id,
+        'folder': "streamgank-reels/movie-clips",
+        'overwrite': True,
+        'quality': "auto",              # Automatic quality optimization
+        'format': "mp4",               # Ensure MP4 format
+        'video_codec': "h264",         # Use H.264 codec for compatibility
+        'audio_codec': "aac",          # Use AAC audio codec
+        'transformation': transformation
+    }
+
+
+def _log_clip_upload_result(upload_result: Dict[str, Any]) -> Optional[str]:
+    """Log the Cloudinary upload result and return its secure URL."""
+    cloudinary_url = upload_result.get('secure_url')
+    actual_public_id = upload_result.get('public_id')
+    folder_used = upload_result.get('folder')
+    
+    logger.info(f"✅ Successfully uploaded to Cloudinary: {cloudinary_url}")
+    logger.info(f"   📁 Actual folder: {folder_used}")
+    logger.info(f"   🆔 Actual public_id: {actual_public_id}")
+    logger.info(f"   🔗 Full URL path breakdown:")
+    logger.info(f"      - Base: https://res.cloudinary.com/dodod8s0v/")
+    logger.info(f"      - Resource: video/upload/")
+    logger.info(f"      - Version: v{upload_result.get('version', 'unknown')}/")
+    logger.info(f"      - Path: {actual_public_id}")
+    
+    return cloudinary_url
+
+
+def _upload_clip_to_cloudinary(clip_path: str, movie_title: str, movie_id: str, transform_mode: str = "youtube_shorts",
+                               chunked: bool = False) -> Optional[str]:
     """
     Upload a video clip to Cloudinary with optimized settings.
     
@@ -703,98 +795,72 @@ def _upload_clip_to_cloudinary(clip_path: str, movie_title: str, movie_id: str,
         movie_title (str): Movie title for naming
         movie_id (str): Movie ID for unique identification
         transform_mode (str): Transformation mode - "fit", "pad", "scale", or "auto"
+        chunked (bool): Send the file in clip_upload_chunk_size parts (cloudinary.uploader.upload_large)
         
     Returns:
         str: Cloudinary URL of uploaded clip or None if failed
     """
     try:
-        # Create a clean filename from movie title
-        clean_title = re.sub(r'[^a-zA-Z0-9_-]', '_', movie_title.lower())
-        clean_title = re.sub(r'_+', '_', clean_title).strip('_')
-        
-        # Create unique public ID (just the filename, folder will handle the path)
-        public_id = f"{clean_title}_{movie_id}" if movie_id else f"{clean_title}"  # Clean filename without duration suffix
+        options = _build_clip_upload_options(movie_title, movie_id, transform_mode)
         
         logger.info(f"☁️ Uploading clip to Cloudinary: {clip_path}")
         logger.info(f"   Movie: {movie_title}")
-        logger.info(f"   Public ID: {public_id}")
+        logger.info(f"   Public ID: {options['public_id']}")
         logger.info(f"   Transform mode: {transform_mode}")
         
-        # YouTube Shorts optimized transformation modes (9:16 portrait - 1080x1920)
-        transform_modes = {
-            "fit": [
-                {"width": 1080, "height": 1920, "crop": "fit", "background": "black"},  # YouTube Shorts standard resolution
-                {"quality": "auto:best"},
-                {"format": "mp4"},
-                {"video_codec": "h264"},
-                {"bit_rate": "2000k"}  # High bitrate for crisp quality
-            ],
-            "smart_fit": [
-                {"width": 1080, "height": 1920, "crop": "fill", "gravity": "center"},  # Smart crop with center focus
-                {"quality": "auto:best"},
-                {"format": "mp4"},
-                {"video_codec": "h264"},
-                {"bit_rate": "2500k"},  # Even higher bitrate
-                {"flags": "progressive"}  # Progressive scan for smooth playbook
-            ],
-            "pad": [
-                {"width": 1080, "height": 1920, "crop": "pad", "background": "auto"},   # Smart padding with auto background
-                {"quality": "auto:best"},
-                {"format": "mp4"},
-                {"bit_rate": "2000k"}
-            ],
-            "scale": [
-                {"width": 1080, "height": 1920, "crop": "scale"},                      # Scale to fit (may distort)
-                {"quality": "auto:best"},
-                {"format": "mp4"},
-                {"bit_rate": "1800k"}
-            ],
-            "youtube_shorts": [
-                {"width": 1080, "height": 1920, "crop": "fill", "gravity": "center"},  # YouTube Shorts optimized
-                {"quality": "auto:best"},
-                {"format": "mp4"},
-                {"video_codec": "h264"},
-                {"bit_rate": "3000k"},  # Premium bitrate for YouTube Shorts quality
-                {"flags": "progressive"},
-                {"audio_codec": "aac"},
-                {"audio_frequency": 48000}  # High quality audio
-            ]
-        }
+        # Upload to Cloudinary with video optimization (using selected transformation)
+        if chunked:
+            chunk_size = get_video_settings().get('clip_upload_chunk_size', 20 * 1024 * 1024)
+            logger.info(f"   📦 Chunked upload ({chunk_size // (1024 * 1024)}MB parts)")
+            upload_result = cloudinary.uploader.upload_large(clip_path, chunk_size=chunk_size, **options)
+        else:
+            upload_result = cloudinary.uploader.upload(clip_path, **options)
         
-        # Get the transformation based on mode
-        transformation = transform_modes.get(transform_mode, transform_modes["youtube_shorts"])
+        return _log_clip_upload_result(upload_result)
         
-        # Upload to Cloudinary with video optimization (using selected transformation)
-        upload_result = cloudinary.uploader.upload(
-            clip_path,
-            resource_type="video",
-            public_id=public_id,
-            folder="streamgank-reels/movie-clips",
-            overwrite=True,
-            quality="auto",              # Automatic quality optimization
-            format="mp4",               # Ensure MP4 format
-            video_codec="h264",         # Use H.264 codec for compatibility
-            audio_codec="aac",          # Use AAC audio codec
-            transformation=transformation
-        )
+    except Exception as e:
+        logger.error(f"❌ Error uploading {clip_path} to Cloudinary: {str(e)}")
+        return None
+
+
+def _upload_remote_clip_to_cloudinary(source_url: str, movie_title: str, movie_id: str,
+                                      transform_mode: str = "youtube_shorts", duration: Optional[float] = None,
+                                      max_duration: float = 20.0) -> Optional[str]:
+    """
+    Let Cloudinary fetch a clip by URL, trimming it server-side when too long.
+    
+    The clip bytes never pass through this container. Clips longer than
+    max_duration (or of unknown duration) get an end_offset incoming transformation.
+    
+    Args:
+        source_url (str): Publicly reachable clip URL (e.g. Vizard AI download URL)
+        movie_title (str): Movie title for naming
+        movie_id (str): Movie ID for unique identification
+        transform_mode (str): Cloudinary transformation mode
+        duration (float): Clip duration in seconds if known
+        max_duration (float): Maximum clip duration in seconds
+        
+    Returns:
+        str: Cloudinary URL of uploaded clip or None if failed
+    """
+    trim_to = max_duration if duration is None or duration > max_duration else None
+    
+    try:
+        options = _build_clip_upload_options(movie_title, movie_id, transform_mode, trim_to=trim_to)
         
-        cloudinary_url = upload_result.get('secure_url')
-        actual_public_id = upload_result.get('public_id')
-        folder_used = upload_result.get('folder')
+        logger.info(f"☁️ Remote upload to Cloudinary (server-side fetch): {movie_title}")
+        logger.info(f"   Public ID: {options['public_id']}")
+        if trim_to:
+            logger.info(f"   ✂️ Trimming remotely to {trim_to:.0f}s (start_offset/end_offset)")
         
-        logger.info(f"✅ Successfully uploaded to Cloudinary: {cloudinary_url}")
-        logger.info(f"   📁 Actual folder: {folder_used}")
-        logger.info(f"   🆔 Actual public_id: {actual_public_id}")
-        logger.info(f"   🔗 Full URL path breakdown:")
-        logger.info(f"      - Base: https://res.cloudinary.com/dodod8s0v/")
-        logger.info(f"      - Resource: video/upload/")
-        logger.info(f"      - Version: v{upload_result.get('version', 'unknown')}/")
-        logger.info(f"      - Path: {actual_public_id}")
+        with trace_span('Cloudinary remote clip upload', 'cloudinary', public_id=options['public_id'],
+                        trimmed=bool(trim_to)):
+            upload_result = cloudinary.uploader.upload(source_url, **options)
         
-        return cloudinary_url
+        return _log_clip_upload_result(upload_result)
         
     except Exception as e:
-        logger.error(f"❌ Error uploading {clip_path} to Cloudinary: {str(e)}")
+        logger.warning(f"⚠️ Remote upload failed for {movie_title}: {str(e)}")
         return None
 
 # =============================================================================
@@ -826,7 +892,7 @@ def _analyze_video_for_highlights(video_path: str, segment_duration: int = 7) ->
             '-of', 'csv=p=0', video_path
         ]
         
-        result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(duration_cmd, capture_output=True, text=True, timeout=30)
         if result.returncode != 0:
             logger.error(f"❌ Failed to get video duration: {result.stderr}")
             return []
@@ -864,6 +930,8 @@ def _analyze_video_for_highlights(video_path: str, segment_duration: int = 7) ->
         logger.info(f"   📋 Generated {len(segments)} potential highlight segments")
         return segments
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error analyzing video for highlights: {str(e)}")
         return []
@@ -892,20 +960,24 @@ def _filter_segments_by_audio(video_path: str, segments: List[Dict[str, Any]]) -
         
         for segment in segments:
             try:
-                # Extract audio levels for this segment using FFmpeg
-                audio_cmd = [
-                    'ffmpeg', '-i', video_path,
-                    '-ss', str(segment['start']),
-                    '-t', str(segment['duration']),
-                    '-af', 'volumedetect',
-                    '-f', 'null',
-                    '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-                ]
-                
-                result = subprocess.run(audio_cmd, capture_output=True, text=True, timeout=30)
-                
-                # Parse audio level from FFmpeg output
-                audio_score = _parse_audio_score(result.stderr)
+                # Score from the single-pass timelines, per-segment volumedetect only as fallback
+                mean_volume = _timeline_mean_volume(video_path, segment['start'], segment['start'] + segment['duration'])
+                if mean_volume is not None:
+                    audio_score = _audio_score_from_volume(mean_volume)
+                else:
+                    audio_cmd = [
+                        'ffmpeg', '-i', video_path,
+                        '-ss', str(segment['start']),
+                        '-t', str(segment['duration']),
+                        '-af', 'volumedetect',
+                        '-f', 'null',
+                        '-y', '/dev/null' if os.name != 'nt' else 'NUL'
+                    ]
+                    
+                    result = run_media_command(audio_cmd, capture_output=True, text=True, timeout=30)
+                    
+                    # Parse audio level from FFmpeg output
+                    audio_score = _parse_audio_score(result.stderr)
                 segment['audio_score'] = audio_score
                 
                 # Only keep segments with decent audio (avoid silent parts)
@@ -915,6 +987,8 @@ def _filter_segments_by_audio(video_path: str, segments: List[Dict[str, Any]]) -
                 else:
                     logger.debug(f"   ❌ Segment {segment['id']}: {segment['start']:.1f}s (too quiet: {audio_score:.2f})")
                 
+            except MediaJobCancelled:
+                raise
             except Exception as e:
                 logger.debug(f"   ⚠️ Segment {segment['id']}: Audio analysis failed: {str(e)}")
                 continue
@@ -922,6 +996,8 @@ def _filter_segments_by_audio(video_path: str, segments: List[Dict[str, Any]]) -
         logger.info(f"   🎵 Kept {len(scored_segments)}/{len(segments)} segments with good audio")
         return scored_segments
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error filtering segments by audio: {str(e)}")
         return segments  # Return original segments if audio analysis fails
@@ -943,19 +1019,7 @@ def _parse_audio_score(ffmpeg_stderr: str) -> float:
         mean_volume_match = re.search(r'mean_volume:\s*(-?\d+\.?\d*)\s*dB', ffmpeg_stderr)
         
         if mean_volume_match:
-            mean_volume = float(mean_volume_match.group(1))
-            # Convert dB to normalized score (typical range -60dB to 0dB)
-            # -60dB = 0.0, -20dB = 0.5, -10dB = 0.75, 0dB = 1.0
-            if mean_volume >= -10:
-                return 1.0
-            elif mean_volume >= -20:
-                return 0.75
-            elif mean_volume >= -30:
-                return 0.5
-            elif mean_volume >= -45:
-                return 0.3
-            else:
-                return 0.1
+            return _audio_score_from_volume(float(mean_volume_match.group(1)))
         
         return 0.3  # Default moderate score if can't parse
         
@@ -963,6 +1027,30 @@ def _parse_audio_score(ffmpeg_stderr: str) -> float:
         return 0.3
 
 
+def _audio_score_from_volume(mean_volume: float) -> float:
+    """
+    Normalize a mean volume (dB) to an audio score (0-1).
+    
+    Args:
+        mean_volume (float): Mean volume in dB (volumedetect or timeline window)
+        
+    Returns:
+        float: Normalized audio score
+    """
+    # Convert dB to normalized score (typical range -60dB to 0dB)
+    # -60dB = 0.0, -20dB = 0.5, -10dB = 0.75, 0dB = 1.0
+    if mean_volume >= -10:
+        return 1.0
+    elif mean_volume >= -20:
+        return 0.75
+    elif mean_volume >= -30:
+        return 0.5
+    elif mean_volume >= -45:
+        return 0.3
+    else:
+        return 0.1
+
+
 def _score_segments_by_motion(video_path: str, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Analyze visual motion and scene activity in segments.
@@ -984,20 +1072,21 @@ def _score_segments_by_motion(video_path: str, segments: List[Dict[str, Any]]) -
         
         for segment in segments:
             try:
-                # Analyze scene changes and motion in this segment
-                motion_cmd = [
-                    'ffmpeg', '-i', video_path,
-                    '-ss', str(segment['start']),
-                    '-t', str(segment['duration']),
-                    '-vf', 'select=gt(scene\\,0.3),metadata=print:file=-',
-                    '-f', 'null',
-                    '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-                ]
-                
-                result = subprocess.run(motion_cmd, capture_output=True, text=True, timeout=45)
-                
-                # Count scene changes (more changes = more dynamic)
-                scene_changes = result.stderr.count('scene_score')
+                # Count scene changes (more changes = more dynamic) from the single-pass timelines
+                scene_changes = _timeline_scene_cuts(video_path, segment['start'], segment['start'] + segment['duration'])
+                if scene_changes is None:
+                    # Analyze scene changes and motion in this segment
+                    motion_cmd = [
+                        'ffmpeg', '-i', video_path,
+                        '-ss', str(segment['start']),
+                        '-t', str(segment['duration']),
+                        '-vf', 'select=gt(scene\\,0.3),metadata=print:file=-',
+                        '-f', 'null',
+                        '-y', '/dev/null' if os.name != 'nt' else 'NUL'
+                    ]
+                    
+                    result = run_media_command(motion_cmd, capture_output=True, text=True, timeout=45)
+                    scene_changes = result.stderr.count('scene_score')
                 
                 # Calculate motion score based on scene changes
                 motion_score = min(scene_changes / 5.0, 1.0)  # Normalize to 0-1
@@ -1009,6 +1098,8 @@ def _score_segments_by_motion(video_path: str, segments: List[Dict[str, Any]]) -
                 
                 logger.debug(f"   📊 Segment {segment['id']}: Motion={motion_score:.2f}, Final={segment['final_score']:.2f}")
                 
+            except MediaJobCancelled:
+                raise
             except Exception as e:
                 # Fallback scoring if motion analysis fails
                 segment['motion_score'] = 0.5  # Moderate default
@@ -1021,6 +1112,8 @@ def _score_segments_by_motion(video_path: str, segments: List[Dict[str, Any]]) -
         logger.info(f"   🏆 Top segment: {segments[0]['final_score']:.2f} score at {segments[0]['start']:.1f}s")
         return segments
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error scoring segments by motion: {str(e)}")
         return segments
@@ -1127,19 +1220,20 @@ def _ensure_minimum_segments(video_path: str, segments: List[Dict[str, Any]], ta
         return segments
 
 
-def _extract_highlight_clips(video_path: str, segments: List[Dict[str, Any]], output_dir: str = "temp_clips") -> List[str]:
+def _extract_highlight_clips(video_path: str, segments: List[Dict[str, Any]], output_dir: Optional[str] = None) -> List[str]:
     """
     Extract individual highlight clips from selected segments.
     
     Args:
         video_path (str): Path to source video
         segments (List[Dict]): Segments to extract
-        output_dir (str): Directory for extracted clips
+        output_dir (str): Directory for extracted clips (default: job scratch temp_clips)
         
     Returns:
         List[str]: Paths to extracted clip files
     """
     try:
+        output_dir = output_dir or get_scratch_dir("temp_clips")
         os.makedirs(output_dir, exist_ok=True)
         
         logger.info(f"✂️ Extracting {len(segments)} individual highlight clips...")
@@ -1151,21 +1245,16 @@ def _extract_highlight_clips(video_path: str, segments: List[Dict[str, Any]], ou
             try:
                 clip_path = os.path.join(output_dir, f"{video_name}_highlight_{i+1}.mp4")
                 
-                # Extract clip with high quality settings
+                # Lossless temp clip - it is re-encoded by the composition step right after
                 extract_cmd = [
                     'ffmpeg', '-i', video_path,
                     '-ss', str(segment['start']),
                     '-t', str(segment['duration']),
-                    '-c:v', 'libx264',
-                    '-crf', '18',  # High quality
-                    '-preset', 'medium',
-                    '-c:a', 'aac',
-                    '-b:a', '128k',
-                    '-movflags', '+faststart',
+                    *get_encoding_args('intermediate_lossless'),
                     '-y', clip_path
                 ]
                 
-                result = subprocess.run(extract_cmd, capture_output=True, text=True, timeout=60)
+                result = run_media_command(extract_cmd, priority='intermediate', capture_output=True, text=True, timeout=60)
                 
                 if result.returncode == 0 and os.path.exists(clip_path):
                     clip_paths.append(clip_path)
@@ -1173,6 +1262,8 @@ def _extract_highlight_clips(video_path: str, segments: List[Dict[str, Any]], ou
                 else:
                     logger.error(f"   ❌ Failed to extract clip {i+1}: {result.stderr}")
                     
+            except MediaJobCancelled:
+                raise
             except Exception as e:
                 logger.error(f"   ❌ Error extracting clip {i+1}: {str(e)}")
                 continue
@@ -1180,13 +1271,15 @@ def _extract_highlight_clips(video_path: str, segments: List[Dict[str, Any]], ou
         logger.info(f"   📁 Successfully extracted {len(clip_paths)} clips")
         return clip_paths
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error extracting highlight clips: {str(e)}")
         return []
 
 
 def _compose_highlights_with_transitions(clip_paths: List[str], title: str, movie_id: str, 
-                                       transform_mode: str, output_dir: str = "temp_clips") -> Optional[str]:
+                                       transform_mode: str, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Compose multiple highlight clips with SNAPPY PROFESSIONAL TRANSITIONS and effects.
     
@@ -1203,12 +1296,13 @@ def _compose_highlights_with_transitions(clip_paths: List[str], title: str, movi
         title (str): Movie title for naming
         movie_id (str): Movie ID for naming
         transform_mode (str): Transform mode for output format
-        output_dir (str): Output directory
+        output_dir (str): Output directory (default: job scratch temp_clips)
         
     Returns:
         str: Path to final composed clip with snappy 0.5s transitions or None if failed
     """
     try:
+        output_dir = output_dir or get_scratch_dir("temp_clips")
         clip_count = len(clip_paths)
         if clip_count == 0:
             logger.error("❌ No clips provided for composition")
@@ -1286,21 +1380,12 @@ def _compose_highlights_with_transitions(clip_paths: List[str], title: str, movi
             '-filter_complex', full_filter,
             '-filter_complex', audio_mix,
             '-map', '[vout]', '-map', '[aout]',
-            '-c:v', 'libx264',
-            '-crf', '15',  # Ultra-high quality
-            '-preset', 'slow',
-            '-profile:v', 'high',
-            '-level:v', '4.0',
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-r', '30',
-            '-movflags', '+faststart',
-            '-pix_fmt', 'yuv420p',
+            *get_encoding_args(HIGHLIGHT_STYLES['transitions']['profile'], **HIGHLIGHT_STYLES['transitions']['encoding']),
             '-y', output_path
         ]
         
         logger.info(f"   🎬 Creating professional composition with fade transitions...")
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, timeout=120)
+        result = run_media_command(ffmpeg_cmd, priority='final', capture_output=True, text=True, timeout=120)
         
         if result.returncode == 0 and os.path.exists(output_path):
             file_size = os.path.getsize(output_path)
@@ -1315,6 +1400,8 @@ def _compose_highlights_with_transitions(clip_paths: List[str], title: str, movi
             logger.info(f"   🔄 Attempting fallback: simple concatenation...")
             return _compose_simple_concatenation(clip_paths, output_path)
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error composing highlights with transitions: {str(e)}")
         return None
@@ -1348,7 +1435,7 @@ def _create_audio_optimized_highlights(video_path: str, title: str, movie_id: st
         
         # Step 1: Get actual video duration
         duration_cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', video_path]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(duration_cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode != 0:
             logger.error(f"❌ Cannot analyze video duration: {result.stderr}")
@@ -1365,6 +1452,8 @@ def _create_audio_optimized_highlights(video_path: str, title: str, movie_id: st
             logger.info(f"   🎬 DUAL HIGHLIGHT MODE: Creating 2 audio-optimized highlights")
             return _create_dual_audio_optimized_highlights(video_path, title, movie_id, transform_mode, total_duration)
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Audio-optimized processing failed: {str(e)}")
         # Fallback to enhanced system
@@ -1400,7 +1489,7 @@ def _create_enhanced_fallback_highlights(video_path: str, title: str, movie_id:
         
         # Step 1: Get actual video duration for adaptive positioning
         duration_cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', video_path]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=30)
+        result = run_media_command(duration_cmd, capture_output=True, text=True, timeout=30)
         
         if result.returncode != 0:
             logger.error(f"❌ Cannot get video duration: {result.stderr}")
@@ -1428,60 +1517,12 @@ def _create_enhanced_fallback_highlights(video_path: str, title: str, movie_id:
         # Step 3: Advanced content scoring - test multiple positions and pick best
         validated_positions = _select_best_content_positions(video_path, candidate_positions)
         
-        # Create temp directory
-        temp_dir = "temp_clips"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # Extract 2 smart segments
-        video_name = Path(video_path).stem
-        segment1_path = os.path.join(temp_dir, f"{video_name}_seg1.mp4")
-        segment2_path = os.path.join(temp_dir, f"{video_name}_seg2.mp4")
-        
-        # Extract segments at validated positions
-        cmd1 = [
-            'ffmpeg', '-i', video_path,
-            '-ss', str(validated_positions[0]),  # Smart position 1
-            '-t', '9',    # 9 seconds for perfect 18s final timing
-            '-c:v', 'libx264', '-crf', '18',
-            '-c:a', 'aac', '-b:a', '128k',
-            '-y', segment1_path
-        ]
-        
-        cmd2 = [
-            'ffmpeg', '-i', video_path,
-            '-ss', str(validated_positions[1]),  # Smart position 2  
-            '-t', '9',    # 9 seconds for perfect 18s final timing
-            '-c:v', 'libx264', '-crf', '18', 
-            '-c:a', 'aac', '-b:a', '128k',
-            '-y', segment2_path
-        ]
-        
-        logger.info(f"   ✂️ Extracting segment 1 at {validated_positions[0]:.1f}s (content-validated position)...")
-        result1 = subprocess.run(cmd1, capture_output=True, text=True, timeout=60)
-        
-        logger.info(f"   ✂️ Extracting segment 2 at {validated_positions[1]:.1f}s (content-validated position)...")
-        result2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=60)
-        
-        if result1.returncode != 0 or result2.returncode != 0:
-            logger.error(f"❌ Failed to extract segments")
-            return None
-        
-        if not os.path.exists(segment1_path) or not os.path.exists(segment2_path):
-            logger.error(f"❌ Segment files not created")
-            return None
-        
-        # Now compose them with enhanced transitions (reuse existing function)
-        clip_paths = [segment1_path, segment2_path]
+        # Compose 2 smart 9s segments (perfect 18s final timing) straight from the trailer
+        segments = [{'start': position, 'duration': 9} for position in validated_positions[:2]]
+        logger.info(f"   ✂️ Segments at {validated_positions[0]:.1f}s & {validated_positions[1]:.1f}s (content-validated positions)")
         logger.info("   🎭 Composing highlights with SNAPPY FADE TRANSITIONS...")
         logger.info("   ⚡ Adding fast 0.5s fade-out/fade-in transitions + professional effects")
-        final_clip = _compose_highlights_with_transitions(clip_paths, title, movie_id, transform_mode)
-        
-        # Clean up temp segments
-        try:
-            os.remove(segment1_path)
-            os.remove(segment2_path)
-        except:
-            pass
+        final_clip = _compose_highlights_from_source(video_path, segments, title, movie_id, transform_mode)
             
         if final_clip:
             # Upload to Cloudinary
@@ -1504,6 +1545,8 @@ def _create_enhanced_fallback_highlights(video_path: str, title: str, movie_id:
         
         return None
         
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Enhanced fallback failed: {str(e)}")
         return None
@@ -1762,17 +1805,7 @@ def _select_best_content_positions(video_path: str, candidates: List[Dict[str, f
                 confidence = candidate['confidence']
                 
                 # Quick 3-second audio test for each candidate
-                audio_cmd = [
-                    'ffmpeg', '-i', video_path,
-                    '-ss', str(position),
-                    '-t', '3',  # Quick test
-                    '-af', 'volumedetect',
-                    '-f', 'null',
-                    '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-                ]
-                
-                result = subprocess.run(audio_cmd, capture_output=True, text=True, timeout=15)
-                audio_score = _parse_audio_score(result.stderr)
+                audio_score = _window_audio_score(video_path, position, 3, timeout=15)
                 
                 # Combined score: strategy confidence + audio quality
                 final_score = (confidence * 0.6) + (audio_score * 0.4)
@@ -1848,19 +1881,9 @@ def _validate_content_positions(video_path: str, positions: List[float]) -> List
         validated_positions = []
         
         for i, position in enumerate(positions):
-            # Quick audio level test (5-second sample)
-            audio_cmd = [
-                'ffmpeg', '-i', video_path,
-                '-ss', str(position),
-                '-t', '5',  # Quick 5s sample
-                '-af', 'volumedetect',
-                '-f', 'null',
-                '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-            ]
-            
             try:
-                result = subprocess.run(audio_cmd, capture_output=True, text=True, timeout=20)
-                audio_score = _parse_audio_score(result.stderr)
+                # Quick audio level test (5-second sample)
+                audio_score = _window_audio_score(video_path, position, 5, timeout=20)
                 
                 # If audio is too low, try slight adjustments
                 if audio_score < 0.3:
@@ -1868,17 +1891,7 @@ def _validate_content_positions(video_path: str, positions: List[float]) -> List
                     # Try positions ±5 seconds
                     for offset in [5, -5, 10, -10]:
                         test_position = max(0, position + offset)
-                        test_cmd = [
-                            'ffmpeg', '-i', video_path,
-                            '-ss', str(test_position),
-                            '-t', '3',  # Even quicker test
-                            '-af', 'volumedetect',
-                            '-f', 'null',
-                            '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-                        ]
-                        
-                        test_result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=15)
-                        test_audio_score = _parse_audio_score(test_result.stderr)
+                        test_audio_score = _window_audio_score(video_path, test_position, 3, timeout=15)  # Even quicker test
                         
                         if test_audio_score > audio_score:
                             position = test_position
@@ -1906,7 +1919,7 @@ def _validate_content_positions(video_path: str, positions: List[float]) -> List
 
 
 def _compose_single_highlight_with_effects(clip_path: str, title: str, movie_id: str, 
-                                         transform_mode: str, output_dir: str = "temp_clips") -> Optional[str]:
+                                         transform_mode: str, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Compose a single highlight clip with PREMIUM CINEMATIC effects for short trailers.
     
@@ -1924,18 +1937,19 @@ def _compose_single_highlight_with_effects(clip_path: str, title: str, movie_id:
         title (str): Movie title for naming
         movie_id (str): Movie ID for naming
         transform_mode (str): Transform mode for output format
-        output_dir (str): Output directory
+        output_dir (str): Output directory (default: job scratch temp_clips)
         
     Returns:
         str: Path to processed single highlight or None if failed
     """
     try:
+        output_dir = output_dir or get_scratch_dir("temp_clips")
         logger.info(f"🎬 PREMIUM SINGLE HIGHLIGHT: Processing {title} with cinematic effects")
         logger.info(f"   ✨ Applying HDR-style color grading + advanced sharpening + dynamic effects")
         
         # Get clip duration for adaptive fade timing
         duration_cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', clip_path]
-        duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=15)
+        duration_result = run_media_command(duration_cmd, capture_output=True, text=True, timeout=15)
         
         if duration_result.returncode == 0:
             clip_duration = float(duration_result.stdout.strip())
@@ -1974,18 +1988,12 @@ def _compose_single_highlight_with_effects(clip_path: str, title: str, movie_id:
             # Audio fade effects to match video
             '-af', f'afade=in:st=0:d={fade_in_duration},afade=out:st={fade_out_start}:d={fade_out_duration}',
             # OPTIMIZED encoding for speed vs quality balance
-            '-c:v', 'libx264', '-crf', '16',  # Good quality, faster than CRF 12
-            '-preset', 'fast',  # Much faster than 'slower'
-            '-tune', 'film',  # Optimize for film-like content
-            '-profile:v', 'high', '-level:v', '4.1',
-            '-c:a', 'aac', '-b:a', '192k',  # Good audio quality, faster encoding
-            '-r', '30', '-maxrate', '3500k', '-bufsize', '7000k',  # Balanced bitrate
-            '-movflags', '+faststart', '-pix_fmt', 'yuv420p',
+            *get_encoding_args(HIGHLIGHT_STYLES['single']['profile'], **HIGHLIGHT_STYLES['single']['encoding']),
             '-y', output_path
         ]
         
         logger.info(f"   🎨 Applying optimized cinematic effects (fast preset for reliability)...")
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, timeout=180)  # Increased timeout to 3 minutes
+        result = run_media_command(ffmpeg_cmd, priority='final', capture_output=True, text=True, timeout=180)  # Increased timeout to 3 minutes
         
         if result.returncode == 0 and os.path.exists(output_path):
             file_size = os.path.getsize(output_path)
@@ -1998,6 +2006,8 @@ def _compose_single_highlight_with_effects(clip_path: str, title: str, movie_id:
             logger.error(f"   ❌ Single highlight processing failed: {result.stderr}")
             return None
             
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error composing single highlight: {str(e)}")
         return None
@@ -2027,13 +2037,11 @@ def _compose_simple_concatenation(clip_paths: List[str], output_path: str) -> Op
         # Simple concatenation command
         concat_cmd = [
             'ffmpeg', '-f', 'concat', '-safe', '0', '-i', concat_file,
-            '-c:v', 'libx264', '-crf', '18', '-preset', 'medium',
-            '-c:a', 'aac', '-b:a', '128k',
-            '-movflags', '+faststart',
+            *get_encoding_args('final', preset='medium', crf=18, video_profile=None, level=None, audio_bitrate='128k'),
             '-y', output_path
         ]
         
-        result = subprocess.run(concat_cmd, capture_output=True, text=True, timeout=120)
+        result = run_media_command(concat_cmd, priority='final', capture_output=True, text=True, timeout=120)
         
         # Cleanup
         if os.path.exists(concat_file):
@@ -2046,10 +2054,452 @@ def _compose_simple_concatenation(clip_paths: List[str], output_path: str) -> Op
             logger.error(f"   ❌ Simple concatenation failed: {result.stderr}")
             return None
             
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Error in simple concatenation: {str(e)}")
         return None
 
+# =============================================================================
+# SINGLE-PASS MEDIA ANALYSIS
+# =============================================================================
+
+# Scene score above which a frame counts as a cut (same threshold as the per-segment select filter)
+SCENE_CUT_THRESHOLD = 0.3
+
+# Level used for seconds without measurable audio (astats reports -inf for digital silence)
+SILENCE_FLOOR_DB = -120.0
+
+# Trailers whose timelines are kept in memory (keyed by path, size and mtime)
+TIMELINE_CACHE_SIZE = 8
+
+_timeline_cache: "OrderedDict[tuple, Optional[Dict[str, Any]]]" = OrderedDict()
+_timeline_cache_lock = threading.Lock()
+
+_PTS_TIME_PATTERN = re.compile(r'pts_time:\s*(-?[\d.]+)')
+_METADATA_PATTERN = re.compile(r'(lavfi\.[\w.]+)=(\S+)')
+
+
+def _build_media_analysis_command(video_path: str) -> List[str]:
+    """
+    Build the ffmpeg command measuring loudness, level and scene changes in one decode.
+    
+    Audio is cut into 100ms frames so ebur128 (momentary loudness) and astats
+    (RMS level) metadata line up on a fixed grid; it is printed to stdout. Scene
+    scores for every video frame are logged to stderr by the metadata filter.
+    """
+    audio_chain = (
+        "[0:a:0]aresample=48000,asetnsamples=n=4800:p=0,ebur128=metadata=1,"
+        "astats=metadata=1:reset=1:measure_perchannel=none:measure_overall=RMS_level,"
+        "ametadata=mode=print:file=-[aout]"
+    )
+    video_chain = "[0:v:0]scale=320:-2,select=gte(scene\\,0),metadata=mode=print:key=lavfi.scene_score[vout]"
+    return [
+        'ffmpeg', '-hide_banner', '-nostats', '-v', 'info',
+        '-i', video_path,
+        '-filter_complex', f"{audio_chain};{video_chain}",
+        '-map', '[aout]', '-map', '[vout]',
+        '-f', 'null', '-'
+    ]
+
+
+def _parse_metadata_frames(output: str) -> List[Tuple[float, Dict[str, str]]]:
+    """
+    Parse metadata/ametadata print output into (pts_time, {key: value}) frames.
+    
+    Works on both the stdout file format and the stderr log format
+    ("[Parsed_metadata_3 @ 0x...] lavfi.scene_score=0.41").
+    """
+    frames = []
+    for line in output.splitlines():
+        pts_match = _PTS_TIME_PATTERN.search(line)
+        if pts_match:
+            frames.append((float(pts_match.group(1)), {}))
+            continue
+        value_match = _METADATA_PATTERN.search(line)
+        if value_match and frames:
+            frames[-1][1][value_match.group(1)] = value_match.group(2)
+    return frames
+
+
+def _metadata_float(value: Optional[str]) -> float:
+    """Convert a metadata value to dB/LUFS, mapping -inf and unparsable values to the silence floor."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return SILENCE_FLOOR_DB
+    return number if math.isfinite(number) else SILENCE_FLOOR_DB
+
+
+def _build_media_timelines(audio_frames: List[Tuple[float, Dict[str, str]]],
+                           video_frames: List[Tuple[float, Dict[str, str]]]) -> Dict[str, Any]:
+    """
+    Aggregate per-frame measurements into per-second timelines.
+    
+    Returns:
+        Dict[str, Any]: seconds, rms_db (energy mean, comparable to volumedetect mean_volume),
+                        loudness_lufs (mean momentary loudness), scene_score (max per second)
+                        and scene_cuts (frames above SCENE_CUT_THRESHOLD per second)
+    """
+    last_time = max([t for t, _ in audio_frames] + [t for t, _ in video_frames] + [0.0])
+    seconds = int(last_time) + 1
+    energy = [0.0] * seconds
+    energy_frames = [0] * seconds
+    loudness_sum = [0.0] * seconds
+    loudness_frames = [0] * seconds
+    scene_score = [0.0] * seconds
+    scene_cuts = [0] * seconds
+    
+    for pts_time, values in audio_frames:
+        second = max(0, int(pts_time))
+        if 'lavfi.astats.Overall.RMS_level' in values:
+            energy[second] += 10 ** (_metadata_float(values['lavfi.astats.Overall.RMS_level']) / 10)
+            energy_frames[second] += 1
+        if 'lavfi.r128.M' in values:
+            loudness_sum[second] += _metadata_float(values['lavfi.r128.M'])
+            loudness_frames[second] += 1
+    
+    for pts_time, values in video_frames:
+        score = values.get('lavfi.scene_score')
+        if score is None:
+            continue
+        second = max(0, int(pts_time))
+        score = float(score)
+        scene_score[second] = max(scene_score[second], score)
+        if score > SCENE_CUT_THRESHOLD:
+            scene_cuts[second] += 1
+    
+    rms_db = [
+        max(SILENCE_FLOOR_DB, 10 * math.log10(energy[i] / energy_frames[i])) if energy_frames[i] and energy[i] > 0
+        else SILENCE_FLOOR_DB
+        for i in range(seconds)
+    ]
+    loudness = [loudness_sum[i] / loudness_frames[i] if loudness_frames[i] else SILENCE_FLOOR_DB for i in range(seconds)]
+    
+    return {
+        'seconds': seconds,
+        'rms_db': rms_db,
+        'loudness_lufs': loudness,
+        'scene_score': scene_score,
+        'scene_cuts': scene_cuts
+    }
+
+
+def _analyze_media_timelines(video_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Per-second loudness and scene-score timelines for a trailer, from one ffmpeg pass.
+    
+    Every candidate window (segment filtering, motion scoring, zero-silence scans,
+    position validation) is scored from these arrays, so analysis cost scales with
+    trailer length instead of trailer length x candidates. Results are cached per file.
+    
+    Args:
+        video_path (str): Path to the trailer
+        
+    Returns:
+        Dict[str, Any]: Timelines (see _build_media_timelines) or None if the pass failed
+                        (e.g. no audio stream) - callers then fall back to per-window ffmpeg runs
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    
+    key = (os.path.abspath(video_path), stat.st_size, stat.st_mtime)
+    with _timeline_cache_lock:
+        if key in _timeline_cache:
+            _timeline_cache.move_to_end(key)
+            return _timeline_cache[key]
+    
+    logger.info(f"📈 Single-pass loudness + scene analysis: {Path(video_path).name}")
+    start = time.time()
+    timelines = None
+    try:
+        result = run_media_command(_build_media_analysis_command(video_path),
+                                   capture_output=True, text=True, timeout=300)
+        if result.returncode == 0:
+            timelines = _build_media_timelines(
+                _parse_metadata_frames(result.stdout or ''),
+                _parse_metadata_frames(result.stderr or '')
+            )
+            logger.info(f"   📊 {timelines['seconds']}s of timelines in {time.time() - start:.1f}s "
+                        f"({sum(timelines['scene_cuts'])} scene cuts)")
+        else:
+            logger.warning(f"   ⚠️ Single-pass analysis failed, using per-window analysis: {(result.stderr or '')[-300:]}")
+    except MediaJobCancelled:
+        raise
+    except Exception as e:
+        logger.warning(f"   ⚠️ Single-pass analysis error, using per-window analysis: {str(e)}")
+    
+    with _timeline_cache_lock:
+        _timeline_cache[key] = timelines
+        while len(_timeline_cache) > TIMELINE_CACHE_SIZE:
+            _timeline_cache.popitem(last=False)
+    return timelines
+
+
+def _timeline_window(values: List[float], start: float, end: float) -> List[Tuple[float, float]]:
+    """(value, overlap weight in seconds) for each timeline second overlapping [start, end)."""
+    window = []
+    for second in range(max(0, int(start)), min(len(values), int(math.ceil(end)))):
+        overlap = min(end, second + 1) - max(start, second)
+        if overlap > 0:
+            window.append((values[second], overlap))
+    return window
+
+
+def _timeline_mean_volume(video_path: str, start: float, end: float) -> Optional[float]:
+    """
+    Mean volume (dB, volumedetect equivalent) of a window, from the cached timelines.
+    
+    Returns:
+        float: Energy-averaged RMS level or None if timelines are unavailable
+    """
+    timelines = _analyze_media_timelines(video_path)
+    if timelines is None:
+        return None
+    window = _timeline_window(timelines['rms_db'], start, end)
+    total = sum(weight for _, weight in window)
+    if total <= 0:
+        return SILENCE_FLOOR_DB
+    energy = sum(10 ** (level / 10) * weight for level, weight in window) / total
+    return max(SILENCE_FLOOR_DB, 10 * math.log10(energy)) if energy > 0 else SILENCE_FLOOR_DB
+
+
+def _window_audio_score(video_path: str, start: float, duration: float, timeout: int = 15) -> float:
+    """
+    Normalized audio score (0-1) of a window, from the timelines or a volumedetect run.
+    
+    Args:
+        video_path (str): Path to video file
+        start (float): Window start in seconds
+        duration (float): Window length in seconds
+        timeout (int): Timeout of the fallback ffmpeg run
+        
+    Returns:
+        float: Audio score as produced by _parse_audio_score
+    """
+    mean_volume = _timeline_mean_volume(video_path, start, start + duration)
+    if mean_volume is not None:
+        return _audio_score_from_volume(mean_volume)
+    
+    audio_cmd = [
+        'ffmpeg', '-i', video_path,
+        '-ss', str(start),
+        '-t', str(duration),
+        '-af', 'volumedetect',
+        '-f', 'null',
+        '-y', '/dev/null' if os.name != 'nt' else 'NUL'
+    ]
+    result = run_media_command(audio_cmd, capture_output=True, text=True, timeout=timeout)
+    return _parse_audio_score(result.stderr)
+
+
+def _timeline_scene_cuts(video_path: str, start: float, end: float) -> Optional[float]:
+    """
+    Scene cuts inside a window, from the cached timelines (partial seconds weighted).
+    
+    Returns:
+        float: Cut count or None if timelines are unavailable
+    """
+    timelines = _analyze_media_timelines(video_path)
+    if timelines is None:
+        return None
+    return sum(cuts * weight for cuts, weight in _timeline_window(timelines['scene_cuts'], start, end))
+
+
+# =============================================================================
+# SINGLE-PASS HIGHLIGHT COMPOSITION
+# =============================================================================
+
+# 9:16 cinematic frame: blurred fill background + centered original, sharpened
+_PORTRAIT_FRAME = (
+    "split=2[bg{i}src][fg{i}src];"
+    "[bg{i}src]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,gblur=sigma=20[bg{i}];"
+    "[fg{i}src]scale=1080:1920:force_original_aspect_ratio=decrease[fg{i}];"
+    "[bg{i}][fg{i}]overlay=(W-w)/2:(H-h)/2,unsharp=5:5:1.0:5:5:0.3,"
+)
+
+# Look and encoding per composition style - shared with the multi-step composers.
+# 'encoding' holds overrides of the ENCODING_PROFILES entry named by 'profile'.
+HIGHLIGHT_STYLES = {
+    'single': {
+        'eq': 'eq=contrast=1.15:brightness=0.08:saturation=1.25:gamma=0.98',
+        'first_fade_in': 0.5,
+        'outro_fade': 1.5,
+        'file_suffix': 'premium_highlight',
+        'profile': 'final',
+        'encoding': {
+            'crf': 16, 'preset': 'fast', 'tune': 'film', 'level': '4.1',
+            'frame_rate': 30, 'maxrate': '3500k', 'bufsize': '7000k'
+        }
+    },
+    'transitions': {
+        'eq': 'eq=contrast=1.1:brightness=0.05:saturation=1.2',
+        'first_fade_in': 0.3,
+        'transition_fade': 0.5,
+        'outro_fade': 1.0,
+        'file_suffix': 'enhanced_highlights',
+        'profile': 'final',
+        'encoding': {
+            'frame_rate': 30
+        }
+    }
+}
+
+
+def _build_highlight_filtergraph(durations: List[float], style: str) -> str:
+    """
+    Build one filtergraph turning seeked source inputs into the final 9:16 highlight.
+    
+    Input i is expected to be the source trailer opened with -ss/-t for segment i,
+    so every segment is decoded exactly once and nothing is written in between.
+    
+    Args:
+        durations (List[float]): Segment durations in input order
+        style (str): 'single' (premium grading, long outro fade) or 'transitions'
+                     (0.5s fade-out/fade-in between segments + 1s outro fade)
+        
+    Returns:
+        str: filter_complex graph with [vout] and [aout] outputs
+    """
+    settings = HIGHLIGHT_STYLES[style]
+    total = sum(durations)
+    count = len(durations)
+    parts = []
+    
+    for i, duration in enumerate(durations):
+        fade_in = settings['first_fade_in'] if i == 0 else settings.get('transition_fade', settings['first_fade_in'])
+        video = f"[{i}:v]" + _PORTRAIT_FRAME.format(i=i) + settings['eq'] + f",fps=30,setsar=1,format=yuv420p,fade=in:st=0:d={fade_in:g}"
+        audio = f"[{i}:a]aresample=48000,afade=in:st=0:d={fade_in:g}"
+        if i < count - 1:
+            fade_out = settings['transition_fade']
+            video += f",fade=out:st={duration - fade_out:g}:d={fade_out:g}"
+            audio += f",afade=out:st={duration - fade_out:g}:d={fade_out:g}"
+        parts.append(f"{video}[v{i}]")
+        parts.append(f"{audio}[a{i}]")
+    
+    outro = settings['outro_fade']
+    outro_start = max(0.0, total - outro)
+    joined = "".join(f"[v{i}][a{i}]" for i in range(count))
+    if count > 1:
+        parts.append(f"{joined}concat=n={count}:v=1:a=1[vcat][acat]")
+        video_label, audio_label = '[vcat]', '[acat]'
+    else:
+        video_label, audio_label = '[v0]', '[a0]'
+    parts.append(f"{video_label}trim=duration={total:g},fade=out:st={outro_start:g}:d={outro:g}[vout]")
+    parts.append(f"{audio_label}atrim=duration={total:g},afade=out:st={outro_start:g}:d={outro:g}[aout]")
+    
+    return ";".join(parts)
+
+
+def _build_single_pass_highlight_command(video_path: str, segments: List[Dict[str, float]],
+                                         output_path: str, style: str) -> List[str]:
+    """
+    Build the ffmpeg command composing highlight segments straight from the source.
+    
+    Args:
+        video_path (str): Source trailer
+        segments (List[Dict]): Segments with 'start' and 'duration' (seconds)
+        output_path (str): Final clip path
+        style (str): Key of HIGHLIGHT_STYLES
+        
+    Returns:
+        List[str]: ffmpeg argument list
+    """
+    cmd = ['ffmpeg', '-hide_banner']
+    for segment in segments:
+        # Input-side seek: decoding starts at the nearest keyframe, frames before 'start' are dropped
+        cmd.extend(['-ss', f"{segment['start']:.3f}", '-t', f"{segment['duration']:.3f}", '-i', video_path])
+    
+    cmd.extend([
+        '-filter_complex', _build_highlight_filtergraph([segment['duration'] for segment in segments], style),
+        '-map', '[vout]', '-map', '[aout]'
+    ])
+    cmd.extend(get_encoding_args(HIGHLIGHT_STYLES[style]['profile'], **HIGHLIGHT_STYLES[style]['encoding']))
+    cmd.extend(['-y', output_path])
+    return cmd
+
+
+def _render_highlights_single_pass(video_path: str, segments: List[Dict[str, float]], title: str,
+                                   movie_id: str, output_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Render the final 9:16 highlight in one decode/encode pass.
+    
+    Replaces extract-to-temp_clips + compose: segments are read with seek-accurate
+    -ss/-t inputs from the source trailer and go through a single filtergraph, so the
+    output is only one lossy generation away from the source.
+    
+    Args:
+        video_path (str): Source trailer
+        segments (List[Dict]): Segments with 'start' and 'duration' (1 = premium single, 2+ = transitions)
+        title (str): Movie title for naming
+        movie_id (str): Movie ID for naming
+        output_dir (str): Output directory (default: job scratch temp_clips)
+        
+    Returns:
+        str: Path to the final clip or None if ffmpeg failed
+    """
+    if not segments:
+        logger.error("❌ No segments provided for composition")
+        return None
+    
+    style = 'single' if len(segments) == 1 else 'transitions'
+    output_dir = output_dir or get_scratch_dir("temp_clips")
+    os.makedirs(output_dir, exist_ok=True)
+    clean_title = re.sub(r'[^a-zA-Z0-9_-]', '_', title.lower())
+    output_path = os.path.join(output_dir, f"{clean_title}_{movie_id}_{HIGHLIGHT_STYLES[style]['file_suffix']}.mp4")
+    
+    segment_list = ", ".join(f"{s['start']:.1f}s+{s['duration']:.1f}s" for s in segments)
+    logger.info(f"   ⚡ SINGLE-PASS COMPOSITION: {len(segments)} segment(s) [{segment_list}] → {style}")
+    
+    cmd = _build_single_pass_highlight_command(video_path, segments, output_path, style)
+    result = run_media_command(cmd, priority='final', capture_output=True, text=True, timeout=180)
+    
+    if result.returncode == 0 and os.path.exists(output_path):
+        logger.info(f"   ✨ Single-pass highlight ready: {output_path} ({os.path.getsize(output_path) // 1024}KB)")
+        return output_path
+    
+    logger.error(f"   ❌ Single-pass composition failed: {(result.stderr or '')[-500:]}")
+    return None
+
+
+def _compose_highlights_from_source(video_path: str, segments: List[Dict[str, float]], title: str,
+                                    movie_id: str, transform_mode: str) -> Optional[str]:
+    """
+    Compose highlight segments into the final clip, single-pass first.
+    
+    Falls back to the multi-step extract + compose path if the single-pass
+    graph fails (e.g. a trailer without an audio stream).
+    
+    Args:
+        video_path (str): Source trailer
+        segments (List[Dict]): Segments with 'start' and 'duration'
+        title (str): Movie title for naming
+        movie_id (str): Movie ID for naming
+        transform_mode (str): Transform mode for output format
+        
+    Returns:
+        str: Path to the final clip or None if failed
+    """
+    final_clip = _render_highlights_single_pass(video_path, segments, title, movie_id)
+    if final_clip:
+        return final_clip
+    
+    logger.info("   🔄 Falling back to multi-step extraction + composition...")
+    clip_paths = _extract_highlight_clips(video_path, segments)
+    if not clip_paths:
+        return None
+    
+    try:
+        return _compose_highlights_with_transitions(clip_paths, title, movie_id, transform_mode)
+    finally:
+        for clip_path in clip_paths:
+            try:
+                os.remove(clip_path)
+            except OSError:
+                pass
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -2100,9 +2550,11 @@ def get_clip_processing_stats() -> Dict[str, Any]:
 def _check_ffmpeg_available() -> bool:
     """Check if FFmpeg is available."""
     try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=5)
+        result = run_media_command(['ffmpeg', '-version'], 
+                                   capture_output=True, text=True, timeout=5)
         return result.returncode == 0
+    except MediaJobCancelled:
+        raise
     except:
         return False
 
@@ -2110,7 +2562,7 @@ def _check_ffmpeg_available() -> bool:
 def _check_ytdlp_available() -> bool:
     """Check if yt-dlp is available."""
     try:
-        result = subprocess.run(['yt-dlp', '--version'], 
+        result = run_traced_subprocess(['yt-dlp', '--version'], 
                               capture_output=True, text=True, timeout=5)
         return result.returncode == 0
     except:
@@ -2160,38 +2612,11 @@ def _create_single_audio_optimized_highlight(video_path: str, title: str, movie_
             effective_duration = total_duration - intro_skip - outro_skip - highlight_duration
             best_position = intro_skip + (effective_duration * 0.5)  # Middle fallback
         
-        # Extract the optimized highlight
-        temp_dir = "temp_clips"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        video_name = Path(video_path).stem
-        highlight_path = os.path.join(temp_dir, f"{video_name}_audio_optimized.mp4")
-        
-        # Extract with high quality
-        extract_cmd = [
-            'ffmpeg', '-i', video_path,
-            '-ss', str(best_position),
-            '-t', str(highlight_duration),
-            '-c:v', 'libx264', '-crf', '16',
-            '-c:a', 'aac', '-b:a', '192k',
-            '-y', highlight_path
-        ]
-        
-        logger.info(f"   ✂️ Extracting audio-optimized highlight: {best_position:.1f}s-{best_position + highlight_duration:.1f}s")
-        result = subprocess.run(extract_cmd, capture_output=True, text=True, timeout=60)
-        
-        if result.returncode != 0 or not os.path.exists(highlight_path):
-            logger.error(f"   ❌ Failed to extract highlight: {result.stderr}")
-            return None
-        
-        # Apply premium single highlight effects
-        final_clip = _compose_single_highlight_with_effects(highlight_path, title, movie_id, transform_mode)
-        
-        # Clean up temp file
-        try:
-            os.remove(highlight_path)
-        except:
-            pass
+        # Extract and apply premium single highlight effects in one pass
+        logger.info(f"   ✂️ Audio-optimized highlight: {best_position:.1f}s-{best_position + highlight_duration:.1f}s")
+        final_clip = _compose_highlights_from_source(
+            video_path, [{'start': best_position, 'duration': highlight_duration}], title, movie_id, transform_mode
+        )
         
         if final_clip:
             # Upload to Cloudinary
@@ -2272,47 +2697,16 @@ def _create_dual_audio_optimized_highlights(video_path: str, title: str, movie_i
             logger.warning("   ⚠️ No zero-silence position found for second highlight, using single highlight...")
             return _create_single_audio_optimized_highlight(video_path, title, movie_id, transform_mode, total_duration)
         
-        # Extract both highlights
-        temp_dir = "temp_clips"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        video_name = Path(video_path).stem
-        highlight1_path = os.path.join(temp_dir, f"{video_name}_highlight1.mp4")
-        highlight2_path = os.path.join(temp_dir, f"{video_name}_highlight2.mp4")
-        
-        logger.info(f"   ✂️ Extracting DUAL zero-silence highlights:")
+        logger.info(f"   ✂️ Composing DUAL zero-silence highlights:")
         logger.info(f"      Highlight 1: {first_position:.1f}s-{first_position + highlight_duration:.1f}s")
         logger.info(f"      Highlight 2: {second_position:.1f}s-{second_position + highlight_duration:.1f}s")
         
-        # Extract first highlight
-        extract_cmd1 = [
-            'ffmpeg', '-i', video_path, '-ss', str(first_position), '-t', str(highlight_duration),
-            '-c:v', 'libx264', '-crf', '16', '-c:a', 'aac', '-b:a', '192k', '-y', highlight1_path
+        # Compose with professional transitions in one pass from the source trailer
+        segments = [
+            {'start': first_position, 'duration': highlight_duration},
+            {'start': second_position, 'duration': highlight_duration}
         ]
-        
-        # Extract second highlight  
-        extract_cmd2 = [
-            'ffmpeg', '-i', video_path, '-ss', str(second_position), '-t', str(highlight_duration),
-            '-c:v', 'libx264', '-crf', '16', '-c:a', 'aac', '-b:a', '192k', '-y', highlight2_path
-        ]
-        
-        result1 = subprocess.run(extract_cmd1, capture_output=True, text=True, timeout=60)
-        result2 = subprocess.run(extract_cmd2, capture_output=True, text=True, timeout=60)
-        
-        if result1.returncode != 0 or result2.returncode != 0 or not os.path.exists(highlight1_path) or not os.path.exists(highlight2_path):
-            logger.error(f"   ❌ Failed to extract dual highlights")
-            return None
-        
-        # Compose with professional transitions (existing function handles dual clips)
-        clip_paths = [highlight1_path, highlight2_path]
-        final_clip = _compose_highlights_with_transitions(clip_paths, title, movie_id, transform_mode)
-        
-        # Clean up temp files
-        for temp_file in [highlight1_path, highlight2_path]:
-            try:
-                os.remove(temp_file)
-            except:
-                pass
+        final_clip = _compose_highlights_from_source(video_path, segments, title, movie_id, transform_mode)
         
         if final_clip:
             # Upload to Cloudinary
@@ -2510,19 +2904,22 @@ def _scan_full_highlight_audio(video_path: str, start_position: float, highlight
         scan_position = start_position
         
         while scan_position + window_size <= start_position + highlight_duration:
-            # Test this 3-second window
-            test_cmd = [
-                'ffmpeg', '-i', video_path,
-                '-ss', str(scan_position),
-                '-t', str(window_size),
-                '-af', 'volumedetect',
-                '-f', 'null',
-                '-y', '/dev/null' if os.name != 'nt' else 'NUL'
-            ]
-            
             try:
-                result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=15)
-                window_score = _parse_enhanced_audio_score(result.stderr)
+                # Test this 3-second window (timelines first, volumedetect run only as fallback)
+                mean_volume = _timeline_mean_volume(video_path, scan_position, scan_position + window_size)
+                if mean_volume is not None:
+                    window_score = _enhanced_audio_score_from_volume(mean_volume)
+                else:
+                    test_cmd = [
+                        'ffmpeg', '-i', video_path,
+                        '-ss', str(scan_position),
+                        '-t', str(window_size),
+                        '-af', 'volumedetect',
+                        '-f', 'null',
+                        '-y', '/dev/null' if os.name != 'nt' else 'NUL'
+                    ]
+                    result = run_media_command(test_cmd, capture_output=True, text=True, timeout=15)
+                    window_score = _parse_enhanced_audio_score(result.stderr)
                 
                 # ZERO TOLERANCE: Reject entire position if any window is silent
                 if window_score < -20:  # Stricter silence threshold
@@ -2532,6 +2929,8 @@ def _scan_full_highlight_audio(video_path: str, start_position: float, highlight
                 audio_scores.append(window_score)
                 logger.debug(f"       ✅ Window {scan_position:.1f}s: {window_score:.2f}")
                 
+            except MediaJobCancelled:
+                raise
             except subprocess.TimeoutExpired:
                 logger.debug(f"       ⏱️ Timeout at {scan_position:.1f}s")
                 return None  # Reject on timeout
@@ -2549,6 +2948,8 @@ def _scan_full_highlight_audio(video_path: str, start_position: float, highlight
         else:
             return None
             
+    except MediaJobCancelled:
+        raise
     except Exception as e:
         logger.error(f"❌ Full highlight scan failed: {str(e)}")
         return None
@@ -2579,26 +2980,7 @@ def _parse_enhanced_audio_score(ffmpeg_stderr: str) -> float:
         max_match = re.search(r'max_volume:\s*(-?\d+\.?\d*)\s*dB', ffmpeg_stderr)
         
         if mean_match and max_match:
-            mean_volume = float(mean_match.group(1))
-            max_volume = float(max_match.group(1))
-            
-            # ULTRA-STRICT scoring: Zero tolerance for silence
-            if mean_volume < -35:  # Silence/near-silence
-                return -100  # Automatic rejection
-            elif mean_volume < -30:  # Very quiet
-                return -50   # Heavy penalty
-            elif mean_volume < -25:  # Quiet
-                return -20   # Still penalized
-            elif mean_volume < -20:  # Low-moderate
-                return 0     # Neutral
-            elif mean_volume < -15:  # Moderate  
-                return 20    # Acceptable
-            elif mean_volume < -10:  # Good
-                return 40    # Good score
-            elif mean_volume < -5:   # Very good
-                return 60    # Very good score
-            else:  # Excellent
-                return 80    # Excellent score
+            return _enhanced_audio_score_from_volume(float(mean_match.group(1)))
         
         # Fallback if parsing fails
         return -50  # Conservative rejection
@@ -2607,6 +2989,35 @@ def _parse_enhanced_audio_score(ffmpeg_stderr: str) -> float:
         return -50  # Conservative rejection
 
 
+def _enhanced_audio_score_from_volume(mean_volume: float) -> float:
+    """
+    Zero-silence-tolerance score for a mean volume (dB).
+    
+    Args:
+        mean_volume (float): Mean volume in dB (volumedetect or timeline window)
+        
+    Returns:
+        float: Enhanced audio score (higher = better, <-20 = reject)
+    """
+    # ULTRA-STRICT scoring: Zero tolerance for silence
+    if mean_volume < -35:  # Silence/near-silence
+        return -100  # Automatic rejection
+    elif mean_volume < -30:  # Very quiet
+        return -50   # Heavy penalty
+    elif mean_volume < -25:  # Quiet
+        return -20   # Still penalized
+    elif mean_volume < -20:  # Low-moderate
+        return 0     # Neutral
+    elif mean_volume < -15:  # Moderate  
+        return 20    # Acceptable
+    elif mean_volume < -10:  # Good
+        return 40    # Good score
+    elif mean_volume < -5:   # Very good
+        return 60    # Very good score
+    else:  # Excellent
+        return 80    # Excellent score
+
+
 def _parse_sustained_audio_score(ffmpeg_stderr: str) -> float:
     """
     Parse sustained audio score from FFmpeg volumedetect output.
@@ -2915,7 +3326,7 @@ def process_movie_trailers_to_clips_vizard(movie_data: List[Dict], max_movies: i
                 }
                 
                 # Create project
-                project_response = requests.post(create_project_url, json=project_payload, headers=project_headers)
+                project_response = get_http_session().post(create_project_url, json=project_payload, headers=project_headers)
                 
                 if project_response.status_code != 200:
                     logger.error(f"❌ Vizard project creation failed for {title}: {project_response.status_code}")
@@ -2973,7 +3384,7 @@ def process_movie_trailers_to_clips_vizard(movie_data: List[Dict], max_movies: i
                     for query_retry in range(1, 4):  # Maximum 3 tries per polling attempt
                         try:
                             # Query project status
-                            query_response = requests.get(query_url, headers=project_headers, timeout=30)
+                            query_response = get_http_session().get(query_url, headers=project_headers, timeout=30)
                             
                             if query_response.status_code == 200:
                                 query_data = query_response.json()
@@ -3059,10 +3470,11 @@ def process_movie_trailers_to_clips_vizard(movie_data: List[Dict], max_movies: i
                                 break
                             
                             # Duration > 20 seconds - download and trim
-                            logger.info(f"   ✂️ Duration {duration_seconds:.1f}s > 20.0s - downloading for trimming...")
-                            logger.info(f"   📥 Downloading Vizard clip for Cloudinary upload...")
+                            logger.info(f"   ✂️ Duration {duration_seconds:.1f}s > 20.0s - trimming to 20.0s...")
+                            logger.info(f"   ☁️ Uploading Vizard clip to Cloudinary...")
                             cloudinary_url = _download_and_upload_vizard_clip(
-                                video_url, title, str(movie.get('id', i+1)), transform_mode
+                                video_url, title, str(movie.get('id', i+1)), transform_mode,
+                                duration=duration_seconds or None
                             )
                             
                             if cloudinary_url:
@@ -3242,6 +3654,7 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
                 project_attempt += 1
                 
                 if project_attempt > 1:
+                    record_retry()
                     logger.info(f"🔄 [Thread-{thread_id}] PROJECT RESTART #{project_attempt}/{max_project_attempts} for {movie_title}")
                     # Add delay before retry to prevent rate limiting
                     logger.info(f"⏰ [Thread-{thread_id}] Waiting 60 seconds before retry to prevent rate limiting...")
@@ -3269,7 +3682,7 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
                 }
                 
                 # Create project
-                project_response = requests.post(create_project_url, json=project_payload, headers=project_headers)
+                project_response = get_http_session().post(create_project_url, json=project_payload, headers=project_headers)
                 
                 if project_response.status_code != 200:
                     logger.error(f"❌ [Thread-{thread_id}] Vizard project creation failed for {movie_title}: {project_response.status_code}")
@@ -3322,7 +3735,7 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
                 
                     try:
                         # Query project status
-                        query_response = requests.get(query_url, headers=project_headers, timeout=30)
+                        query_response = get_http_session().get(query_url, headers=project_headers, timeout=30)
                         
                         if query_response.status_code != 200:
                             logger.warning(f"⚠️ [Thread-{thread_id}] Query failed: HTTP {query_response.status_code}")
@@ -3358,10 +3771,12 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
                                 
                                 logger.info(f"🏆 [Thread-{thread_id}] Best clip selected (viral score: {viral_score})")
                                 
-                                # Download and upload to Cloudinary
-                                logger.info(f"📥 [Thread-{thread_id}] Downloading and uploading to Cloudinary...")
+                                # Upload to Cloudinary (remote fetch, local download as fallback)
+                                logger.info(f"☁️ [Thread-{thread_id}] Uploading to Cloudinary...")
+                                duration_ms = best_clip.get('videoMsDuration')
                                 cloudinary_url = _download_and_upload_vizard_clip(
-                                    video_url, movie_title, str(movie.get('id', movie_index+1)), transform_mode
+                                    video_url, movie_title, str(movie.get('id', movie_index+1)), transform_mode,
+                                    duration=duration_ms / 1000 if duration_ms else None
                                 )
                                 
                                 if cloudinary_url:
@@ -3410,6 +3825,24 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
             logger.error(f"❌ [Thread-{thread_id}] Error processing {movie_title}: {str(e)}")
             return (movie_title, None)
     
+    def process_single_movie_shared(movie_info):
+        """
+        Deduplicate trailers across jobs in the same process (batch mode):
+        the same trailer URL is only sent to Vizard and uploaded once.
+        """
+        movie, movie_index = movie_info
+        movie_title = movie.get('title', f'Movie_{movie_index+1}')
+        trailer_url = movie.get('trailer_url', '')
+        if not trailer_url:
+            return process_single_movie_parallel(movie_info)
+        
+        with trace_span(f"vizard: {movie_title}", 'vizard', trailer_url=trailer_url):
+            cloudinary_url = get_shared_work_cache('vizard_trailer_clips').get_or_compute(
+                (trailer_url, transform_mode),
+                lambda: process_single_movie_parallel(movie_info)[1]
+            )
+        return (movie_title, cloudinary_url)
+    
     # PARALLEL EXECUTION: Process all movies simultaneously
     logger.info("🚀 Starting PARALLEL processing of all movies...")
     start_time = time.time()
@@ -3418,7 +3851,8 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_movies) as executor:
         # Submit all movies for parallel processing
         movie_futures = {
-            executor.submit(process_single_movie_parallel, (movie, i)): movie.get('title', f'Movie_{i+1}')
+            # Each worker runs in a copy of the caller's context so its spans join the job's trace
+            executor.submit(contextvars.copy_context().run, process_single_movie_shared, (movie, i)): movie.get('title', f'Movie_{i+1}')
             for i, movie in enumerate(movies_to_process)
         }
         
@@ -3459,23 +3893,47 @@ def process_movie_trailers_to_clips_vizard_parallel(movie_data: List[Dict], max_
 
 
 def _download_and_upload_vizard_clip(vizard_url: str, movie_title: str, movie_id: str, 
-                                    transform_mode: str = "youtube_shorts") -> Optional[str]:
+                                    transform_mode: str = "youtube_shorts",
+                                    duration: Optional[float] = None) -> Optional[str]:
     """
-    Download a video clip from Vizard AI and upload it to Cloudinary.
+    Upload a Vizard AI clip to Cloudinary.
     
-    This function downloads the processed clip from Vizard AI and uploads it to our
-    Cloudinary storage using the same path as the existing clip processor.
+    In 'remote' clip_upload_mode Cloudinary fetches the clip URL itself and trims
+    it with start_offset/end_offset. The local path - download, FFmpeg trim and
+    chunked upload - remains as the fallback and as the 'local' mode.
     
     Args:
         vizard_url (str): URL of the Vizard AI generated clip
         movie_title (str): Movie title for naming
         movie_id (str): Movie ID for unique identification
         transform_mode (str): Cloudinary transformation mode
+        duration (float): Clip duration in seconds from the Vizard response, if known
         
     Returns:
         str: Cloudinary URL of uploaded clip or None if failed
     """
+    video_settings = get_video_settings()
+    max_duration = float(video_settings.get('clip_max_duration', 20.0))
+    upload_mode = os.getenv('CLIP_UPLOAD_MODE', video_settings.get('clip_upload_mode', 'remote')).lower()
+    
+    # Clean the movie title to prevent Cloudinary errors with spaces/special characters
+    clean_movie_title = re.sub(r'[^a-zA-Z0-9_-]', '_', movie_title)
+    clean_movie_title = re.sub(r'_+', '_', clean_movie_title).strip('_')
+    
+    if upload_mode == 'remote':
+        logger.info(f"☁️ Uploading Vizard clip by URL: {movie_title}")
+        logger.info(f"   🔗 Source URL: {vizard_url}")
+        cloudinary_url = _upload_remote_clip_to_cloudinary(
+            vizard_url, clean_movie_title, movie_id, transform_mode, duration, max_duration
+        )
+        if cloudinary_url:
+            logger.info(f"   ✅ Successfully uploaded to Cloudinary: {movie_title}")
+            logger.info(f"   🔗 Cloudinary URL: {cloudinary_url}")
+            return cloudinary_url
+        logger.warning(f"   🔄 Falling back to local download and upload for: {movie_title}")
+    
     temp_file = None
+    processed_file = None
     try:
         logger.info(f"📥 Downloading Vizard clip: {movie_title}")
         logger.info(f"   🔗 Source URL: {vizard_url}")
@@ -3485,12 +3943,13 @@ def _download_and_upload_vizard_clip(vizard_url: str, movie_title: str, movie_id
         temp_file.close()
         
         # Download the video from Vizard AI
-        response = requests.get(vizard_url, stream=True, timeout=60)
+        response = get_http_session().get(vizard_url, stream=True, timeout=60)
         response.raise_for_status()
         
         # Write video data to temp file
+        chunk_size = video_settings.get('clip_download_chunk_size', 1024 * 1024)
         with open(temp_file.name, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=chunk_size):
                 if chunk:
                     f.write(chunk)
         
@@ -3498,19 +3957,16 @@ def _download_and_upload_vizard_clip(vizard_url: str, movie_title: str, movie_id
         logger.info(f"   📁 Downloaded: {file_size:,} bytes")
         
         # Check video duration and trim if necessary (>20 seconds → 20 seconds)
-        processed_file = _check_and_trim_clip_duration(temp_file.name, movie_title)
+        processed_file = _check_and_trim_clip_duration(temp_file.name, movie_title, max_duration, max_duration)
         if not processed_file:
             logger.error(f"   ❌ Failed to process clip duration for: {movie_title}")
             return None
         
-        # Clean the movie title to prevent Cloudinary errors with spaces/special characters
-        clean_movie_title = re.sub(r'[^a-zA-Z0-9_-]', '_', movie_title)
-        clean_movie_title = re.sub(r'_+', '_', clean_movie_title).strip('_')
-        
         # Upload to Cloudinary using existing function (same path: streamgank-reels/movie-clips)
         logger.info(f"   ☁️ Uploading to Cloudinary: streamgank-reels/movie-clips")
         logger.info(f"   📝 Original title: '{movie_title}' → Clean title: '{clean_movie_title}'")
-        cloudinary_url = _upload_clip_to_cloudinary(processed_file, clean_movie_title, movie_id, transform_mode)
+        cloudinary_url = _upload_clip_to_cloudinary(processed_file, clean_movie_title, movie_id, transform_mode,
+                                                    chunked=True)
         
         if cloudinary_url:
             logger.info(f"   ✅ Successfully uploaded to Cloudinary: {movie_title}")
@@ -3536,7 +3992,7 @@ def _download_and_upload_vizard_clip(vizard_url: str, movie_title: str, movie_id
                 logger.warning(f"   ⚠️ Could not clean up temp file: {str(e)}")
         
         # Clean up processed file if it's different from temp_file
-        if 'processed_file' in locals() and processed_file and processed_file != temp_file.name and os.path.exists(processed_file):
+        if processed_file and temp_file and processed_file != temp_file.name and os.path.exists(processed_file):
             try:
                 os.unlink(processed_file)
                 logger.debug(f"   🧹 Cleaned up processed file: {processed_file}")
@@ -3587,20 +4043,14 @@ def _check_and_trim_clip_duration(video_path: str, movie_title: str, max_duratio
         # PRODUCTION-OPTIMIZED FFmpeg command (tested & reliable)
         is_railway = os.getenv('RAILWAY_ENVIRONMENT') is not None
         
+        # Stream copy first: the cut starts at 0 (a keyframe), so only the end moves and
+        # the clip is re-encoded by Cloudinary anyway - no decode/encode needed here
         ffmpeg_cmd = [
             'ffmpeg',
             '-i', video_path,
-            '-ss', '0',          # Start from beginning (explicit)
             '-t', str(max_duration),  # Trim to EXACTLY 20 seconds
-            '-c:v', 'libx264',   # Reliable H.264 codec
-            '-c:a', 'copy',      # Copy audio (no re-encoding = FAST)
-            '-preset', 'ultrafast',  # Maximum speed for Railway
-            '-crf', '30',        # Balanced quality/speed (production tested)
-            '-movflags', '+faststart',  # Optimize for streaming
-            '-pix_fmt', 'yuv420p',  # Universal compatibility
+            *get_encoding_args('copy', faststart=True),
             '-avoid_negative_ts', 'make_zero',  # Fix timestamp issues
-            '-max_muxing_queue_size', '512' if is_railway else '1024',
-            '-threads', '1' if is_railway else '2',  # Railway: single thread, Local: dual thread
             '-y',               # Overwrite output file
             trimmed_path
         ]
@@ -3621,8 +4071,9 @@ def _check_and_trim_clip_duration(video_path: str, movie_title: str, max_duratio
         start_time = time.time()
         logger.info(f"   ✂️ Trimming to exactly {max_duration:.0f} seconds...")
         
-        result = subprocess.run(
+        result = run_media_command(
             ffmpeg_cmd,
+            priority='intermediate',
             capture_output=True,
             text=True,
             timeout=timeout
@@ -3647,29 +4098,40 @@ def _check_and_trim_clip_duration(video_path: str, movie_title: str, max_duratio
             logger.error(f"   ❌ FFmpeg failed (exit code {result.returncode})")
             logger.error(f"   📋 Error: {result.stderr[:300]}...")
         
-        # SIMPLE FALLBACK: Try stream copy (no re-encoding)
-        logger.warning(f"   🔄 Trying stream copy fallback...")
-        fallback_path = f"{base_name}_stream_copy_{max_duration:.0f}s.mp4"
+        # FALLBACK: Re-encode with the fastest intermediate settings (audio still copied)
+        logger.warning(f"   🔄 Trying re-encode fallback...")
+        fallback_path = f"{base_name}_reencoded_{max_duration:.0f}s.mp4"
         try:
             fallback_cmd = [
-                'ffmpeg', '-i', video_path, '-t', str(max_duration),
-                '-c', 'copy', '-avoid_negative_ts', 'make_zero', '-y', fallback_path
+                'ffmpeg', '-i', video_path,
+                '-ss', '0',          # Start from beginning (explicit)
+                '-t', str(max_duration),
+                # ultrafast/CRF 30 production tested; Railway: single thread
+                *get_encoding_args('intermediate', threads=1 if is_railway else None,
+                                   preset='ultrafast', crf=30, audio_codec='copy', audio_bitrate=None),
+                '-avoid_negative_ts', 'make_zero',
+                '-max_muxing_queue_size', '512' if is_railway else '1024',
+                '-y', fallback_path
             ]
-            fb_result = subprocess.run(fallback_cmd, capture_output=True, text=True, timeout=60)
+            fb_result = run_media_command(fallback_cmd, priority='intermediate', capture_output=True, text=True, timeout=timeout)
             
             if fb_result.returncode == 0 and os.path.exists(fallback_path):
                 fb_size = os.path.getsize(fallback_path)
                 if fb_size > 1024:
-                    logger.info(f"   ✅ Stream copy success: {fallback_path} ({fb_size:,} bytes)")
+                    logger.info(f"   ✅ Re-encode success: {fallback_path} ({fb_size:,} bytes)")
                     return fallback_path
                     
+        except MediaJobCancelled:
+            raise
         except Exception as e:
-            logger.error(f"   ❌ Stream copy failed: {str(e)[:200]}")
+            logger.error(f"   ❌ Re-encode failed: {str(e)[:200]}")
         
         # FINAL: Use original (workflow continues)
         logger.warning(f"   📄 Using original clip - workflow continues")
         return video_path
             
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"   ⏰ Timeout after {timeout}s - file too large/complex")
         logger.warning(f"   📄 Using original clip - workflow continues")
@@ -3704,7 +4166,7 @@ def _get_video_duration(video_path: str) -> Optional[float]:
             video_path
         ]
         
-        result = subprocess.run(
+        result = run_media_command(
             ffprobe_cmd,
             capture_output=True,
             text=True,
@@ -3719,6 +4181,8 @@ def _get_video_duration(video_path: str) -> Optional[float]:
             logger.warning(f"   ⚠️ FFprobe failed: {result.stderr}")
             return None
             
+    except MediaJobCancelled:
+        raise
     except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError, ValueError) as e:
         logger.warning(f"   ⚠️ Could not get duration: {str(e)}")
         return None
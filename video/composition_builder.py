@@ -10,13 +10,18 @@ Features:
 - Element layering and positioning
 - Animation and transition management
 - Asset integration (videos, images, overlays)
+- Speculative compositions from predicted HeyGen durations, re-timed with exact ones
+- Layout compiled once into a slot template, cached per poster timing mode
 """
 
+import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from abc import ABC, abstractmethod
 
 from video.video_processor import calculate_video_durations, estimate_clip_durations, validate_duration_consistency
+from video.composition_template import CompositionTemplate, Slot, diff_compositions, validate_composition
 
 logger = logging.getLogger(__name__)
 
@@ -129,7 +134,9 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
                            scroll_video_url: Optional[str] = None,
                            scripts: Optional[Dict] = None,
                            poster_timing_mode: str = "heygen_last3s",
-                           background_music_url: Optional[str] = None) -> Dict[str, Any]:
+                           background_music_url: Optional[str] = None,
+                           known_durations: Optional[Dict[str, float]] = None,
+                           known_clip_durations: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """
     Build complete video composition for Creatomate.
     
@@ -144,6 +151,8 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
         scripts (Dict): Optional script data for duration calculation
         poster_timing_mode (str): Poster timing strategy
         background_music_url (str): Optional background music URL for audio elements
+        known_durations (Dict): Exact HeyGen durations already reported, keyed like heygen_video_urls
+        known_clip_durations (Dict): Exact clip durations already measured (clip1-clip3)
         
     Returns:
         Dict[str, Any]: Complete Creatomate composition
@@ -188,7 +197,7 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
     
     # Step 1: Calculate video durations (STRICT - must succeed)
     logger.info("📊 Calculating HeyGen video durations (STRICT mode)...")
-    heygen_durations = calculate_video_durations(heygen_video_urls, scripts)
+    heygen_durations = calculate_video_durations(heygen_video_urls, scripts, known_durations)
     if not heygen_durations:
         raise RuntimeError("❌ CRITICAL: Failed to calculate HeyGen video durations - cannot proceed")
     
@@ -200,7 +209,7 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
     
     # Step 2: Calculate clip durations (STRICT - must succeed)
     logger.info("📊 Calculating clip durations (STRICT mode)...")
-    clip_durations = estimate_clip_durations(movie_clips)
+    clip_durations = dict(known_clip_durations) if known_clip_durations else estimate_clip_durations(movie_clips)
     if not clip_durations:
         raise RuntimeError("❌ CRITICAL: Failed to calculate clip durations - cannot proceed")
     
@@ -216,7 +225,7 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
     
     # Step 3: Calculate poster timing (STRICT - will raise on failure)
     logger.info("🎯 Calculating poster timing (STRICT mode)...")
-    timing_strategy = get_poster_timing_strategy(poster_timing_mode)
+    timing_strategy = get_composition_template(poster_timing_mode).timing_strategy
     poster_timings = timing_strategy.calculate_timing(heygen_durations, clip_durations)
     
     # Validate poster timings
@@ -241,6 +250,9 @@ def build_video_composition(heygen_video_urls: Dict[str, str],
     # Final validation of composition
     if not composition or 'elements' not in composition or len(composition['elements']) < 8:
         raise RuntimeError("❌ CRITICAL: Invalid composition structure - insufficient elements")
+    problems = validate_composition(composition)
+    if problems:
+        raise RuntimeError(f"❌ CRITICAL: Invalid composition structure: {'; '.join(problems)}")
     
     # Calculate total duration for logging
     calculated_total_duration = (1 + sum(heygen_durations.values()) + sum(clip_durations.values()) + 3)
@@ -376,324 +388,135 @@ def create_poster_timing(poster_timings: Dict[str, Dict[str, float]],
         return []
 
 # =============================================================================
-# PRIVATE HELPER FUNCTIONS
+# COMPOSITION TEMPLATE
 # =============================================================================
 
-def _build_composition_structure(heygen_video_urls: Dict[str, str],
-                               movie_covers: Optional[List[str]],
-                               movie_clips: Optional[List[str]],
-                               poster_timings: Dict[str, Dict[str, float]],
-                               heygen_durations: Dict[str, float],
-                               clip_durations: Dict[str, float],
-                               scroll_video_url: Optional[str],
-                               background_music_url: Optional[str] = None) -> Dict[str, Any]:
-    """Build the complete Creatomate composition with all detailed elements."""
-    
-    # ═══════════════════════════════════════════════════════════════
-    # TIMING VARIABLES FOR EASY MANAGEMENT
-    # ═══════════════════════════════════════════════════════════════
-    
-    # Extract poster timing data
-    poster1_time = poster_timings["poster1"]["time"]
-    poster1_duration = poster_timings["poster1"]["duration"]
-    poster2_time = poster_timings["poster2"]["time"]
-    poster2_duration = poster_timings["poster2"]["duration"]
-    poster3_time = poster_timings["poster3"]["time"]
-    poster3_duration = poster_timings["poster3"]["duration"]
-    
-    # Timing offset variables for easy management
-    poster1_time_offset = -0.5      # No offset for first poster
-    poster2_time_offset = poster1_time_offset + -0.5   # Sync with HeyGen2 fade (0.5s)
-    poster3_time_offset = poster2_time_offset + -0.5   # Sync with HeyGen3 fade (0.5s)
-    
-    # Animation duration variables
-    intro_fade_duration = 0.5
-    poster_fade_duration = 1.0
-    heygen_fade_duration = 0.5
-    outro_fade_duration = 1.0
-    
-    # Element duration variables
-    intro_duration = 1
-    outro_duration = heygen_durations["outro"]  # Use actual HeyGen outro video duration
-    outro_static_duration = 3 - outro_fade_duration  # Static outro image duration after HeyGen outro
-    scroll_video_start_time = 2
-    scroll_video_duration = 4
-    
+# Fixed timings of the StreamGank layout (seconds)
+INTRO_DURATION = 1
+INTRO_FADE_DURATION = 0.5
+POSTER_FADE_DURATION = 1.0
+HEYGEN_FADE_DURATION = 0.5
+OUTRO_FADE_DURATION = 1.0
+OUTRO_STATIC_DURATION = 3 - OUTRO_FADE_DURATION  # Static outro image duration after HeyGen outro
+SCROLL_VIDEO_START_TIME = 2
+SCROLL_VIDEO_DURATION = 4
 
-    # Audio duration variables
-    # To calculate the audio timing, we need to subtract the fade duration from the heygen duration
-    heygen1_audio_timing = -0.5
-    heygen2_audio_timing = heygen1_audio_timing + -0.5 # 0.5 heygen2 fade
-    heygen3_audio_timing = heygen2_audio_timing + -0.5 # heygen2_audio_timing + 0.5 heygen3 fade 
-    outro_audio_timing = heygen3_audio_timing + -0.5 # heygen3_audio_timing + 0.5 outro fade 
+# Posters 2 and 3 start earlier to sync with the preceding HeyGen fade (0.5s each)
+POSTER_TIME_OFFSETS = (-0.5, -1.0, -1.5)
+
+# Music segments end before each HeyGen fade-out: -0.5s per fade so far
+HEYGEN_AUDIO_TIMINGS = (-0.5, -1.0, -1.5)
+OUTRO_AUDIO_TIMING = -2.0
+
+AUDIO_VOLUME = "40%"
+
+INTRO_IMAGE_URL = "https://res.cloudinary.com/dodod8s0v/image/upload/v1753263646/streamGank_intro_cwefmt.jpg"
+OUTRO_IMAGE_URL = "https://res.cloudinary.com/dodod8s0v/image/upload/v1752587571/streamgank_bg_heecu7.png"
+
+
+def _fade(duration: float, **options: Any) -> List[Dict[str, Any]]:
+    """Single fade animation as used by the layout."""
+    return [{"time": 0, "duration": duration, **options, "type": "fade"}]
 
-    # Audio settings
-    audio_volume = "40%"
-    
-    # Calculate total video length using ACTUAL durations (makes Creatomate easy to debug)
-    total_video_length = (intro_duration +  # Intro
-                         heygen_durations["heygen1"] + 
-                         clip_durations["clip1"] + 
-                         heygen_durations["heygen2"] + 
-                         clip_durations["clip2"] + 
-                         heygen_durations["heygen3"] + 
-                         clip_durations["clip3"] + 
-                         outro_duration +  # HeyGen outro video
-                         outro_static_duration)  # Static outro image
-        
-    # Branding duration = total - intro - outro - fade durations
-    branding_duration = total_video_length - intro_duration - outro_static_duration - outro_fade_duration - (heygen_fade_duration * 4)
-        
-    # LOG DETAILED TIMING FOR EASY CREATOMATE DEBUGGING
-    logger.info("🎬 CREATOMATE COMPOSITION TIMING BREAKDOWN:")
-    logger.info(f"   📐 INTRO: 0.00s → {intro_duration:.2f}s ({intro_duration:.2f}s duration)")
-    
-    current_time = float(intro_duration)
-    logger.info(f"   🎤 HEYGEN1 (includes intro): {current_time:.2f}s → {current_time + heygen_durations['heygen1']:.2f}s ({heygen_durations['heygen1']:.2f}s duration)")
-    current_time += heygen_durations["heygen1"]
-    
-    logger.info(f"   🎬 CLIP1: {current_time:.2f}s → {current_time + clip_durations['clip1']:.2f}s ({clip_durations['clip1']:.2f}s duration)")
-    current_time += clip_durations["clip1"]
-    
-    logger.info(f"   🎤 HEYGEN2: {current_time:.2f}s → {current_time + heygen_durations['heygen2']:.2f}s ({heygen_durations['heygen2']:.2f}s duration)")
-    current_time += heygen_durations["heygen2"]
-    
-    logger.info(f"   🎬 CLIP2: {current_time:.2f}s → {current_time + clip_durations['clip2']:.2f}s ({clip_durations['clip2']:.2f}s duration)")
-    current_time += clip_durations["clip2"]
-    
-    logger.info(f"   🎤 HEYGEN3: {current_time:.2f}s → {current_time + heygen_durations['heygen3']:.2f}s ({heygen_durations['heygen3']:.2f}s duration)")
-    current_time += heygen_durations["heygen3"]
-    
-    logger.info(f"   🎬 CLIP3: {current_time:.2f}s → {current_time + clip_durations['clip3']:.2f}s ({clip_durations['clip3']:.2f}s duration)")
-    current_time += clip_durations["clip3"]
-    
-    logger.info(f"   🎤 HEYGEN OUTRO: {current_time:.2f}s → {current_time + outro_duration:.2f}s ({outro_duration:.2f}s duration)")
-    current_time += outro_duration
-    
-    logger.info(f"   📐 STATIC OUTRO: {current_time:.2f}s → {total_video_length:.2f}s ({outro_static_duration:.2f}s duration)")
-    
-    logger.info(f"📊 TOTAL VIDEO LENGTH: {total_video_length:.2f}s ({total_video_length/60:.1f} minutes)")
-    logger.info(f"🏷️ BRANDING: {intro_duration:.2f}s → {intro_duration + branding_duration:.2f}s ({branding_duration:.2f}s duration)")
-    
-    # Show poster timing for easy debugging
-    logger.info("🖼️ POSTER TIMING (Fixed 4.0s duration):")
-    logger.info(f"   🖼️ POSTER1: {poster1_time:.2f}s → {poster1_time + poster1_duration:.2f}s ({poster1_duration:.2f}s duration)")
-    logger.info(f"   🖼️ POSTER2: {poster2_time - 0.5:.2f}s → {poster2_time - 0.5 + poster2_duration:.2f}s ({poster2_duration:.2f}s duration)")
-    logger.info(f"   🖼️ POSTER3: {poster3_time - 0.5:.2f}s → {poster3_time - 0.5 + poster3_duration:.2f}s ({poster3_duration:.2f}s duration)")
 
-    # Base composition structure - EXACT CREATOMATE FORMAT (matches legacy exactly)
-    composition = {
+def _heygen_element(slot: str) -> Dict[str, Any]:
+    """HeyGen avatar video on the main timeline (natural duration)."""
+    return {
+        "type": "video",
+        "track": 1,
+        "time": "auto",
+        "source": Slot(slot),
+        "fit": "cover",
+        "animations": _fade(HEYGEN_FADE_DURATION, transition=True)
+    }
+
+
+def _clip_element(index: int) -> Dict[str, Any]:
+    """Movie clip on the main timeline (ACTUAL duration)."""
+    return {
+        "type": "video",
+        "track": 1,
+        "time": "auto",
+        "duration": Slot(f"clip{index}_duration"),
+        "source": Slot(f"clip{index}_url"),
+        "fit": "cover"
+    }
+
+
+def _poster_element(index: int) -> Dict[str, Any]:
+    """Enhanced poster overlay (fixed 4-second duration)."""
+    return {
+        "type": "image",
+        "track": 2,
+        "time": Slot(f"poster{index}_time"),
+        "duration": Slot(f"poster{index}_duration"),
+        "source": Slot(f"poster{index}_url"),
+        "fit": "contain",
+        "animations": _fade(POSTER_FADE_DURATION, easing="quadratic-out")
+    }
+
+
+def _audio_element(name: str, time_slot: Any, duration_slot: str) -> Dict[str, Any]:
+    """Background music segment."""
+    return {
+        "name": name,
+        "type": "audio",
+        "track": 1,
+        "time": time_slot,
+        "duration": Slot(duration_slot),
+        "source": Slot("music_url"),
+        "volume": AUDIO_VOLUME
+    }
+
+
+def _composition_tree() -> Dict[str, Any]:
+    """StreamGank composition - EXACT CREATOMATE FORMAT (matches legacy exactly)."""
+    return {
         "width": 1080,
         "height": 1920,
         "frame_rate": 30,
         "output_format": "mp4",  # Required by Creatomate API
         "elements": [
-            # ═══════════════════════════════════════════════════════════════
-            # MAIN TIMELINE (Track 1) - Sequential elements
-            # ═══════════════════════════════════════════════════════════════
-            
-            # 🎯 ELEMENT 1: INTRO IMAGE
+            # MAIN TIMELINE (Track 1): intro, HeyGen 1 (intro + movie1 hook), clip 1, HeyGen 2, clip 2,
+            # HeyGen 3, clip 3, HeyGen outro, static outro image
             {
                 "type": "image",
                 "track": 1,
                 "time": 0,
-                "duration": intro_duration,
-                "source": "https://res.cloudinary.com/dodod8s0v/image/upload/v1753263646/streamGank_intro_cwefmt.jpg",
-                "fit": "cover",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": intro_fade_duration,
-                        "easing": "quadratic-out",
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 ELEMENT 2: HEYGEN VIDEO 1 (includes intro + movie1 hook) - Natural duration
-            {
-                "type": "video",
-                "track": 1,
-                "time": "auto",
-                "source": heygen_video_urls["movie1"],
-                "fit": "cover",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": heygen_fade_duration,
-                        "transition": True,
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 ELEMENT 3: MOVIE CLIP 1 (ACTUAL duration)
-            {
-                "type": "video", 
-                "track": 1,
-                "time": "auto",
-                "duration": clip_durations["clip1"],
-                "source": movie_clips[0],
-                "fit": "cover"
-            },
-            
-            # 🎯 ELEMENT 4: HEYGEN VIDEO 2 - Natural duration
-            {
-                "type": "video",
-                "track": 1,
-                "time": "auto",
-                "source": heygen_video_urls["movie2"],
+                "duration": INTRO_DURATION,
+                "source": INTRO_IMAGE_URL,
                 "fit": "cover",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": heygen_fade_duration,
-                        "transition": True,
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 ELEMENT 5: MOVIE CLIP 2 (ACTUAL duration)
-            {
-                "type": "video",
-                "track": 1, 
-                "time": "auto",
-                "duration": clip_durations["clip2"],
-                "source": movie_clips[1],
-                "fit": "cover"
+                "animations": _fade(INTRO_FADE_DURATION, easing="quadratic-out")
             },
-            
-            # 🎯 ELEMENT 6: HEYGEN VIDEO 3 - Natural duration
-            {
-                "type": "video",
-                "track": 1,
-                "time": "auto",
-                "source": heygen_video_urls["movie3"],
-                "fit": "cover",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": heygen_fade_duration,
-                        "transition": True,
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 ELEMENT 7: MOVIE CLIP 3 (ACTUAL duration)
-            {
-                "type": "video",
-                "track": 1,
-                "time": "auto",
-                "duration": clip_durations["clip3"],
-                "source": movie_clips[2],
-                "fit": "cover"
-            },
-            
-            # 🎯 ELEMENT 7.5: OUTRO HEYGEN VIDEO (Dynamic genre-based script)
-            {
-                "type": "video",
-                "track": 1,
-                "time": "auto",
-                "source": heygen_video_urls["outro"],
-                "fit": "cover",
-                "animations": [
-                    {
-                    "time": 0,
-                    "duration": heygen_fade_duration,
-                    "transition": True,
-                    "type": "fade"
-                    }
-                ]
-            },
-
-            # 🎯 ELEMENT 8: STATIC OUTRO IMAGE
+            _heygen_element("heygen1_url"),
+            _clip_element(1),
+            _heygen_element("heygen2_url"),
+            _clip_element(2),
+            _heygen_element("heygen3_url"),
+            _clip_element(3),
+            _heygen_element("outro_url"),
             {
                 "type": "image",
                 "track": 1,
                 "time": "auto",
-                "duration": outro_static_duration,
-                "source": "https://res.cloudinary.com/dodod8s0v/image/upload/v1752587571/streamgank_bg_heecu7.png",
+                "duration": OUTRO_STATIC_DURATION,
+                "source": OUTRO_IMAGE_URL,
                 "fit": "cover",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": outro_fade_duration,
-                        "transition": True,
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # ═══════════════════════════════════════════════════════════════
-            # OVERLAY ELEMENTS (Track 2) - Enhanced Posters with Perfect Timing
-            # ═══════════════════════════════════════════════════════════════
-            
-            # 🎯 POSTER 1 - Fixed 4-second duration for optimal display
-            {
-                "type": "image",
-                "track": 2,
-                "time": poster1_time + poster1_time_offset,
-                "duration": poster1_duration,
-                "source": movie_covers[0],
-                "fit": "contain",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": poster_fade_duration,
-                        "easing": "quadratic-out",
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 POSTER 2 - Fixed 4-second duration for optimal display
-            {
-                "type": "image",
-                "track": 2,  
-                "time": poster2_time + poster2_time_offset,  # Sync with HeyGen2 fade timing
-                "duration": poster2_duration,
-                "source": movie_covers[1],
-                "fit": "contain",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": poster_fade_duration,
-                        "easing": "quadratic-out",
-                        "type": "fade"
-                    }
-                ]
-            },
-            
-            # 🎯 POSTER 3 - Fixed 4-second duration for optimal display
-            {
-                "type": "image",
-                "track": 2,
-                "time": poster3_time + poster3_time_offset,  # Sync with HeyGen3 fade timing
-                "duration": poster3_duration,
-                "source": movie_covers[2],
-                "fit": "contain",
-                "animations": [
-                    {
-                        "time": 0,
-                        "duration": poster_fade_duration,
-                        "easing": "quadratic-out",
-                        "type": "fade"
-                    }
-                ]
+                "animations": _fade(OUTRO_FADE_DURATION, transition=True)
             },
             
-            # ═══════════════════════════════════════════════════════════════
-            # PERSISTENT BRANDING (Tracks 3) 
-            # ═══════════════════════════════════════════════════════════════
+            # OVERLAY ELEMENTS (Track 2) - Enhanced posters
+            _poster_element(1),
+            _poster_element(2),
+            _poster_element(3),
             
+            # PERSISTENT BRANDING (Track 3)
             {
                 "name": "Composition-228",
                 "type": "composition",
                 "track": 3,
-                "time": intro_duration,
-                "duration": branding_duration,
+                "time": INTRO_DURATION,
+                "duration": Slot("branding_duration"),
                 "elements": [
                     # STREAMGANK LOGO TEXT "Stream" - Green colored, persistent overlay
                     {
@@ -711,7 +534,6 @@ def _build_composition_structure(heygen_video_urls: Dict[str, str],
                         "shadow_color": "rgba(0,0,0,0.8)",
                         "shadow_blur": "2 vmin"
                     },
-
                     # STREAMGANK LOGO TEXT "Gank" - White colored, persistent overlay
                     {
                         "name": "Text-9SD",
@@ -727,7 +549,6 @@ def _build_composition_structure(heygen_video_urls: Dict[str, str],
                         "fill_color": "#ffffff",
                         "shadow_color": "rgba(0,0,0,0.25)"
                     },
-
                     # STREAMGANK TAGLINE - Brand message, persistent overlay
                     {
                         "name": "Text-LZ9",
@@ -746,11 +567,8 @@ def _build_composition_structure(heygen_video_urls: Dict[str, str],
                     }
                 ]
             },
-
-            # ═══════════════════════════════════════════════════════════════
-            # AUDIO ELEMENTS (Track 5) 
-            # ═══════════════════════════════════════════════════════════════
-
+            
+            # AUDIO ELEMENTS (Track 5) - music under each HeyGen video
             {
                 "id": "7405c69c-5557-4b19-9989-f4128fdebce6",
                 "name": "Composition-3ZN",
@@ -758,87 +576,370 @@ def _build_composition_structure(heygen_video_urls: Dict[str, str],
                 "track": 5,
                 "time": 0,
                 "elements": [
-                    # AUDIO 1 - Start with intro, duration ends with 1st HeyGen video
-                    {
-                        "name": "Audio-3P3",
-                        "type": "audio",
-                        "track": 1,
-                        "time": 0,
-                        "duration": intro_duration + heygen_durations["heygen1"] + heygen1_audio_timing,
-                        "source": background_music_url,
-                        "volume": audio_volume
-                    },
-                    # AUDIO 2 - Start with 2nd HeyGen video, duration matches HeyGen2
-                    {
-                        "name": "Audio-8X4",
-                        "type": "audio",
-                        "track": 1,
-                        "time": intro_duration + heygen_durations["heygen1"] + clip_durations["clip1"] + heygen2_audio_timing,
-                        "duration": heygen_durations["heygen2"],
-                        "source": background_music_url,
-                        "volume": audio_volume
-                    },
-                    # AUDIO 3 - Start with 3rd HeyGen video, duration matches HeyGen3
-                    {
-                        "name": "Audio-49L",
-                        "type": "audio",
-                        "track": 1,
-                        "time": intro_duration + heygen_durations["heygen1"] + clip_durations["clip1"] + heygen_durations["heygen2"] + clip_durations["clip2"] + heygen3_audio_timing,
-                        "duration": heygen_durations["heygen3"],
-                        "source": background_music_url,
-                        "volume": audio_volume
-                    },
-                    
-                    # AUDIO 4 - Start with HeyGen outro video, duration matches HeyGen outro
-                    {
-                        "name": "Audio-Outro",
-                        "type": "audio",
-                        "track": 1,
-                        "time": intro_duration + heygen_durations["heygen1"] + clip_durations["clip1"] + heygen_durations["heygen2"] + clip_durations["clip2"] + heygen_durations["heygen3"] + clip_durations["clip3"] + outro_audio_timing,
-                        "duration": outro_duration,
-                        "source": background_music_url,
-                        "volume": audio_volume
-                    }
+                    _audio_element("Audio-3P3", 0, "audio1_duration"),
+                    _audio_element("Audio-8X4", Slot("audio2_time"), "audio2_duration"),
+                    _audio_element("Audio-49L", Slot("audio3_time"), "audio3_duration"),
+                    _audio_element("Audio-Outro", Slot("audio4_time"), "audio4_duration")
                 ]
             }
         ]
     }
 
-    # Add scroll video overlay if provided (Track 4 - Top layer)
+
+def _scroll_overlay_tree() -> Dict[str, Any]:
+    """Scroll video overlay (Track 4 - top layer)."""
+    return {
+        "name": "ScrollVideo-Overlay",
+        "type": "video",
+        "track": 4,
+        "time": SCROLL_VIDEO_START_TIME,
+        "duration": SCROLL_VIDEO_DURATION,
+        "source": Slot("scroll_url"),
+        "fit": "cover",
+        "width": "100%",
+        "height": "100%",
+        "animations": [
+            {
+                "time": 0,
+                "duration": POSTER_FADE_DURATION,
+                "type": "fade",
+                "fade_in": True
+            },
+            {
+                "time": "end",
+                "duration": POSTER_FADE_DURATION,
+                "easing": "quadratic-out",
+                "reversed": True,
+                "type": "fade"
+            }
+        ]
+    }
+
+
+class CompiledComposition(NamedTuple):
+    """Compiled StreamGank layout plus the poster timing strategy of one poster_timing_mode."""
+    
+    poster_timing_mode: str
+    timing_strategy: PosterTimingStrategy
+    template: CompositionTemplate
+    scroll_overlay: CompositionTemplate
+    
+    def fill(self, slot_values: Dict[str, Any], scroll_video_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fill the layout; the scroll overlay is appended when a scroll video exists.
+        
+        Args:
+            slot_values (Dict): Values from composition_slot_values
+            scroll_video_url (str): Optional scroll video URL
+            
+        Returns:
+            Dict[str, Any]: Fresh composition
+        """
+        composition = self.template.fill(slot_values)
+        if scroll_video_url:
+            composition["elements"].append(self.scroll_overlay.fill({"scroll_url": scroll_video_url}))
+        return composition
+    
+    def build(self, heygen_video_urls: Dict[str, str], movie_covers: List[str], movie_clips: List[str],
+              heygen_durations: Dict[str, float], clip_durations: Dict[str, float],
+              scroll_video_url: Optional[str] = None, background_music_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Time posters with this mode's strategy and fill the layout.
+        
+        Args:
+            heygen_video_urls (Dict): HeyGen URLs (movie1-3, outro)
+            movie_covers (List): Poster URLs
+            movie_clips (List): Clip URLs
+            heygen_durations (Dict): heygen1-3 and outro durations
+            clip_durations (Dict): clip1-3 durations
+            scroll_video_url (str): Optional scroll video URL
+            background_music_url (str): Optional background music URL
+            
+        Returns:
+            Dict[str, Any]: Complete Creatomate composition
+        """
+        poster_timings = self.timing_strategy.calculate_timing(heygen_durations, clip_durations)
+        slot_values = composition_slot_values(heygen_video_urls, movie_covers, movie_clips, poster_timings,
+                                              heygen_durations, clip_durations, background_music_url)
+        return self.fill(slot_values, scroll_video_url)
+
+
+@lru_cache(maxsize=8)
+def get_composition_template(poster_timing_mode: str = "heygen_last3s") -> CompiledComposition:
+    """
+    Get the compiled layout for a poster timing mode (compiled once per mode).
+    
+    Args:
+        poster_timing_mode (str): Poster timing strategy
+        
+    Returns:
+        CompiledComposition: Template, scroll overlay and timing strategy
+    """
+    return CompiledComposition(
+        poster_timing_mode,
+        get_poster_timing_strategy(poster_timing_mode),
+        CompositionTemplate('streamgank', _composition_tree()),
+        CompositionTemplate('scroll_overlay', _scroll_overlay_tree())
+    )
+
+
+def composition_slot_values(heygen_video_urls: Dict[str, str],
+                            movie_covers: List[str],
+                            movie_clips: List[str],
+                            poster_timings: Dict[str, Dict[str, float]],
+                            heygen_durations: Dict[str, float],
+                            clip_durations: Dict[str, float],
+                            background_music_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compute every slot value of the StreamGank layout (sources, times, durations).
+    
+    Args:
+        heygen_video_urls (Dict): HeyGen URLs (movie1-3, outro)
+        movie_covers (List): Poster URLs
+        movie_clips (List): Clip URLs
+        poster_timings (Dict): Poster time/duration from the timing strategy
+        heygen_durations (Dict): heygen1-3 and outro durations
+        clip_durations (Dict): clip1-3 durations
+        background_music_url (str): Optional background music URL
+        
+    Returns:
+        Dict[str, Any]: Slot name -> value
+    """
+    heygen1, heygen2, heygen3 = heygen_durations["heygen1"], heygen_durations["heygen2"], heygen_durations["heygen3"]
+    clip1, clip2, clip3 = clip_durations["clip1"], clip_durations["clip2"], clip_durations["clip3"]
+    outro_duration = heygen_durations["outro"]  # Use actual HeyGen outro video duration
+    
+    # Calculate total video length using ACTUAL durations (makes Creatomate easy to debug)
+    total_video_length = (INTRO_DURATION + heygen1 + clip1 + heygen2 + clip2 + heygen3 + clip3 +
+                          outro_duration + OUTRO_STATIC_DURATION)
+    
+    values = {
+        "heygen1_url": heygen_video_urls["movie1"],
+        "heygen2_url": heygen_video_urls["movie2"],
+        "heygen3_url": heygen_video_urls["movie3"],
+        "outro_url": heygen_video_urls["outro"],
+        "music_url": background_music_url,
+        
+        # Branding duration = total - intro - outro - fade durations
+        "branding_duration": (total_video_length - INTRO_DURATION - OUTRO_STATIC_DURATION - OUTRO_FADE_DURATION -
+                              (HEYGEN_FADE_DURATION * 4)),
+        
+        # Music: intro + HeyGen 1, then each following HeyGen video
+        "audio1_duration": INTRO_DURATION + heygen1 + HEYGEN_AUDIO_TIMINGS[0],
+        "audio2_time": INTRO_DURATION + heygen1 + clip1 + HEYGEN_AUDIO_TIMINGS[1],
+        "audio2_duration": heygen2,
+        "audio3_time": INTRO_DURATION + heygen1 + clip1 + heygen2 + clip2 + HEYGEN_AUDIO_TIMINGS[2],
+        "audio3_duration": heygen3,
+        "audio4_time": INTRO_DURATION + heygen1 + clip1 + heygen2 + clip2 + heygen3 + clip3 + OUTRO_AUDIO_TIMING,
+        "audio4_duration": outro_duration,
+        "total_video_length": total_video_length
+    }
+    
+    for index in range(1, 4):
+        poster = poster_timings[f"poster{index}"]
+        values[f"clip{index}_url"] = movie_clips[index - 1]
+        values[f"clip{index}_duration"] = clip_durations[f"clip{index}"]
+        values[f"poster{index}_url"] = movie_covers[index - 1]
+        values[f"poster{index}_time"] = poster["time"] + POSTER_TIME_OFFSETS[index - 1]
+        values[f"poster{index}_duration"] = poster["duration"]
+    
+    return values
+
+
+def _log_timing_breakdown(values: Dict[str, Any], heygen_durations: Dict[str, float],
+                          clip_durations: Dict[str, float]) -> None:
+    """Log the timeline for Creatomate debugging (summary at INFO, full breakdown at DEBUG)."""
+    total_video_length = values["total_video_length"]
+    logger.info(f"🎬 Composition timeline: {total_video_length:.2f}s "
+                f"(branding {values['branding_duration']:.2f}s, posters at "
+                f"{values['poster1_time']:.2f}s / {values['poster2_time']:.2f}s / {values['poster3_time']:.2f}s)")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    
+    segments = [("📐 INTRO", INTRO_DURATION)]
+    for index in range(1, 4):
+        segments.append((f"🎤 HEYGEN{index}", heygen_durations[f"heygen{index}"]))
+        segments.append((f"🎬 CLIP{index}", clip_durations[f"clip{index}"]))
+    segments += [("🎤 HEYGEN OUTRO", heygen_durations["outro"]), ("📐 STATIC OUTRO", OUTRO_STATIC_DURATION)]
+    
+    current_time = 0.0
+    logger.debug("🎬 CREATOMATE COMPOSITION TIMING BREAKDOWN:")
+    for label, duration in segments:
+        logger.debug(f"   {label}: {current_time:.2f}s → {current_time + duration:.2f}s ({duration:.2f}s duration)")
+        current_time += duration
+    for index in range(1, 4):
+        start = values[f"poster{index}_time"]
+        duration = values[f"poster{index}_duration"]
+        logger.debug(f"   🖼️ POSTER{index}: {start:.2f}s → {start + duration:.2f}s ({duration:.2f}s duration)")
+
+
+# =============================================================================
+# SPECULATIVE COMPOSITION
+# =============================================================================
+
+# Stand-in sources for HeyGen videos that are still rendering
+SPECULATIVE_SOURCE_PREFIX = 'speculative://heygen/'
+
+
+def _to_heygen_keys(durations: Dict[str, float]) -> Dict[str, float]:
+    """Map movie1-movie3 keys to heygen1-heygen3 as calculate_video_durations does."""
+    return {key.replace('movie', 'heygen') if key.startswith('movie') else key: value
+            for key, value in durations.items()}
+
+
+def prebuild_composition(scripts: Dict[str, Any],
+                         movie_covers: List[str],
+                         movie_clips: List[str],
+                         poster_timing_mode: str = "heygen_last3s",
+                         background_music_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a composition draft while the HeyGen videos are still rendering.
+    
+    Clip durations are probed now and HeyGen durations are predicted from the
+    scripts, so the only work left once the renders finish is re-timing with
+    the exact durations (see finalize_composition).
+    
+    Args:
+        scripts (Dict): Individual scripts (intro, movie1-3, outro)
+        movie_covers (List): Enhanced poster URLs (exactly 3)
+        movie_clips (List): Movie clip URLs (exactly 3)
+        poster_timing_mode (str): Poster timing strategy
+        background_music_url (str): Optional background music URL
+        
+    Returns:
+        Dict[str, Any]: Draft with composition, predicted_durations, clip_durations,
+            movie_clips and poster_timing_mode
+        
+    Raises:
+        ValueError: If covers, clips or scripts are missing
+        RuntimeError: If clip durations cannot be probed
+    """
+    from ai.heygen_predictor import get_heygen_predictor
+    
+    if not movie_covers or len(movie_covers) != 3 or not movie_clips or len(movie_clips) != 3:
+        raise ValueError("❌ Speculative composition needs exactly 3 movie covers and 3 movie clips")
+    
+    predictions = get_heygen_predictor().predict_scripts(scripts)
+    predicted_durations = {key: predictions[key]['duration_seconds'] for key in ('movie1', 'movie2', 'movie3', 'outro')
+                           if key in predictions}
+    if len(predicted_durations) != 4:
+        raise ValueError(f"❌ Speculative composition needs scripts for movie1-3 and outro, got {sorted(predictions)}")
+    
+    start_time = time.time()
+    clip_durations = estimate_clip_durations(movie_clips)
+    heygen_durations = _to_heygen_keys(predicted_durations)
+    poster_timings = get_composition_template(poster_timing_mode).timing_strategy.calculate_timing(
+        heygen_durations, clip_durations)
+    composition = _build_composition_structure(
+        {key: f"{SPECULATIVE_SOURCE_PREFIX}{key}" for key in predicted_durations},
+        movie_covers,
+        movie_clips,
+        poster_timings,
+        heygen_durations,
+        clip_durations,
+        None,
+        background_music_url
+    )
+    
+    predicted_total = 1 + sum(heygen_durations.values()) + sum(clip_durations.values()) + 3
+    logger.info(f"🔮 Speculative composition ready in {time.time() - start_time:.1f}s "
+                f"(predicted total ~{predicted_total:.1f}s, {len(composition['elements'])} elements)")
+    
+    return {
+        'composition': composition,
+        'predicted_durations': predicted_durations,
+        'clip_durations': clip_durations,
+        'movie_clips': list(movie_clips),
+        'poster_timing_mode': poster_timing_mode,
+        'predicted_total_duration': round(predicted_total, 2)
+    }
+
+
+def finalize_composition(draft: Dict[str, Any],
+                         heygen_video_urls: Dict[str, str],
+                         movie_covers: List[str],
+                         movie_clips: List[str],
+                         scroll_video_url: Optional[str] = None,
+                         scripts: Optional[Dict] = None,
+                         poster_timing_mode: str = "heygen_last3s",
+                         background_music_url: Optional[str] = None,
+                         known_durations: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Turn a speculative draft into the final composition.
+    
+    The draft's probed clip durations are reused when the clips and timing
+    mode still match; HeyGen sources and timings are replaced with the real
+    URLs and exact durations. Prediction drift is logged per video.
+    
+    Args:
+        draft (Dict): Result of prebuild_composition (None builds from scratch)
+        heygen_video_urls (Dict): HeyGen video URLs (movie1-3, outro)
+        movie_covers (List): Enhanced poster URLs
+        movie_clips (List): Movie clip URLs
+        scroll_video_url (str): Optional scroll video URL
+        scripts (Dict): Optional script data
+        poster_timing_mode (str): Poster timing strategy
+        background_music_url (str): Optional background music URL
+        known_durations (Dict): Exact HeyGen durations already reported, keyed like heygen_video_urls
+        
+    Returns:
+        Dict[str, Any]: Complete Creatomate composition
+    """
+    reusable = bool(draft) and draft.get('movie_clips') == list(movie_clips or []) \
+        and draft.get('poster_timing_mode') == poster_timing_mode
+    if draft and not reusable:
+        logger.info("🔮 Speculative composition is stale (clips or timing mode changed) - building from scratch")
+    
+    composition = build_video_composition(
+        heygen_video_urls=heygen_video_urls,
+        movie_covers=movie_covers,
+        movie_clips=movie_clips,
+        scroll_video_url=scroll_video_url,
+        scripts=scripts,
+        poster_timing_mode=poster_timing_mode,
+        background_music_url=background_music_url,
+        known_durations=known_durations,
+        known_clip_durations=draft['clip_durations'] if reusable else None
+    )
+    
+    if reusable:
+        exact_durations = {key: value for key, value in (known_durations or {}).items() if value}
+        for key, predicted in draft['predicted_durations'].items():
+            if key in exact_durations:
+                logger.info(f"   🔮 {key}: predicted {predicted:.2f}s, exact {exact_durations[key]:.2f}s "
+                            f"(drift {exact_durations[key] - predicted:+.2f}s)")
+        retimed = [change for change in diff_compositions(draft['composition'], composition, tolerance=0.01)
+                   if not change['path'].endswith('.source')]
+        logger.info(f"✅ Speculative composition re-timed with exact durations ({len(retimed)} values changed)")
+    
+    return composition
+
+
+# =============================================================================
+# PRIVATE HELPER FUNCTIONS
+# =============================================================================
+
+def _build_composition_structure(heygen_video_urls: Dict[str, str],
+                               movie_covers: Optional[List[str]],
+                               movie_clips: Optional[List[str]],
+                               poster_timings: Dict[str, Dict[str, float]],
+                               heygen_durations: Dict[str, float],
+                               clip_durations: Dict[str, float],
+                               scroll_video_url: Optional[str],
+                               background_music_url: Optional[str] = None) -> Dict[str, Any]:
+    """Build the complete Creatomate composition by filling the compiled layout template."""
+    slot_values = composition_slot_values(heygen_video_urls, movie_covers, movie_clips, poster_timings,
+                                          heygen_durations, clip_durations, background_music_url)
+    _log_timing_breakdown(slot_values, heygen_durations, clip_durations)
+    
+    composition = get_composition_template().fill(slot_values, scroll_video_url)
     if scroll_video_url:
-        scroll_overlay = {
-            "name": "ScrollVideo-Overlay",
-            "type": "video",
-            "track": 4,
-            "time": scroll_video_start_time,
-            "duration": scroll_video_duration,
-            "source": scroll_video_url,
-            "fit": "cover",
-            "width": "100%",
-            "height": "100%",
-            "animations": [
-                {
-                    "time": 0,
-                    "duration": poster_fade_duration,
-                    "type": "fade",
-                    "fade_in": True
-                },
-                {
-                    "time": "end",
-                    "duration": poster_fade_duration,
-                    "easing": "quadratic-out",
-                    "reversed": True,
-                    "type": "fade"
-                }
-            ]
-        }
-        composition["elements"].append(scroll_overlay)
         logger.info("✅ Scroll video overlay added to composition")
     else:
         logger.info("ℹ️ No scroll video URL provided - skipping overlay")
     
     logger.info(f"🎬 Composition built with {len(composition['elements'])} total elements")
-    return composition 
+    return composition
 
 
 # Helper functions removed - full composition now built in _build_composition_structure
\ No newline at end of file
@@ -0,0 +1,274 @@
+"""
+StreamGank Composition Templates
+
+Prebuilt Creatomate element trees with named slots. The static structure
+(tracks, animations, branding, fades) is validated once into a JSON skeleton
+with the path of every slot recorded; filling a template copies the skeleton
+and assigns the slot values at those paths, so a composition can be rebuilt
+many times (speculative drafts, batch renders, re-timing) without re-running
+the layout code or its timing logs.
+
+Features:
+- Slot markers for URLs, times and durations anywhere in the element tree
+- Slot paths resolved once per template, fresh containers on every fill
+- Missing slot values fail fast with the full list of missing names
+- Structural diff between two compositions (path, expected, actual)
+- Validation of the Creatomate structure before a render is submitted
+
+Usage:
+    template = CompositionTemplate('intro', {'type': 'image', 'duration': Slot('intro_duration')})
+    element = template.fill({'intro_duration': 1.5})
+    problems = validate_composition(composition)
+
+Author: StreamGank Development Team
+Version: 1.0.0 - Composition Templates
+"""
+
+import math
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+# Element types whose source must be a URL
+_SOURCE_REQUIRED_TYPES = ('video', 'image')
+
+# Non-numeric time values Creatomate accepts
+_SYMBOLIC_TIMES = ('auto', 'end')
+
+_REQUIRED_COMPOSITION_KEYS = ('width', 'height', 'frame_rate', 'elements')
+
+
+class Slot:
+    """Named placeholder in a composition template tree."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+# =============================================================================
+# TEMPLATE SKELETONS
+# =============================================================================
+
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def _template_skeleton(node: Any, path: Tuple = (), slot_paths: List = None) -> Any:
+    """
+    Copy a template node with every Slot replaced by None, recording slot paths.
+
+    Args:
+        node: Template subtree (dicts, lists, JSON scalars and Slot markers)
+        path (Tuple): Keys/indexes leading from the root to this node
+        slot_paths (List): Receives (path, slot name) for every slot found
+
+    Returns:
+        Any: Skeleton subtree holding only JSON data
+
+    Raises:
+        TypeError: If the tree contains something other than JSON data and slots
+    """
+    if isinstance(node, Slot):
+        slot_paths.append((path, node.name))
+        return None
+
+    if isinstance(node, dict):
+        skeleton = {}
+        for key, value in node.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Template keys must be strings, got {key!r}")
+            skeleton[key] = _template_skeleton(value, path + (key,), slot_paths)
+        return skeleton
+
+    if isinstance(node, list):
+        return [_template_skeleton(value, path + (index,), slot_paths) for index, value in enumerate(node)]
+
+    if isinstance(node, _LITERAL_TYPES) and not (isinstance(node, float) and not math.isfinite(node)):
+        return node
+
+    raise TypeError(f"Unsupported template value {node!r}")
+
+
+def _copy_tree(node: Any) -> Any:
+    """Copy the dicts and lists of a skeleton (its leaves are immutable JSON scalars)."""
+    if isinstance(node, dict):
+        return {key: _copy_tree(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_tree(value) for value in node]
+    return node
+
+
+class CompositionTemplate:
+    """An element tree with its slot paths resolved once, filled with slot values per render."""
+
+    __slots__ = ('name', 'slots', '_skeleton', '_slot_paths', '_root_slot')
+
+    def __init__(self, name: str, tree: Any):
+        """
+        Resolve the slot paths of a template tree.
+
+        Args:
+            name (str): Template name for diagnostics
+            tree: Composition or element tree containing Slot markers
+        """
+        self.name = name
+        slot_paths: List[Tuple[Tuple, str]] = []
+        self._skeleton = _template_skeleton(tree, (), slot_paths)
+        # Parent path, final key, slot name: filling is a walk and one assignment per slot
+        self._slot_paths = tuple((path[:-1], path[-1], slot) for path, slot in slot_paths if path)
+        self._root_slot = next((slot for path, slot in slot_paths if not path), None)
+        self.slots: FrozenSet[str] = frozenset(slot for _, slot in slot_paths)
+
+    def __repr__(self) -> str:
+        return f"<CompositionTemplate {self.name} ({len(self.slots)} slots)>"
+
+    def fill(self, values: Dict[str, Any]) -> Any:
+        """
+        Build a fresh tree with every slot replaced by its value.
+
+        Args:
+            values (Dict): Slot name -> value (extra names are ignored)
+
+        Returns:
+            Any: New tree (never shares mutable parts with other fills)
+
+        Raises:
+            ValueError: If slot values are missing
+        """
+        missing = self.slots.difference(values)
+        if missing:
+            raise ValueError(f"❌ Template {self.name} is missing slot values: {', '.join(sorted(missing))}")
+        if self._root_slot is not None:
+            return values[self._root_slot]
+
+        tree = _copy_tree(self._skeleton)
+        for parent_path, key, slot in self._slot_paths:
+            container = tree
+            for step in parent_path:
+                container = container[step]
+            container[key] = values[slot]
+        return tree
+
+
+# =============================================================================
+# DIFF AND VALIDATION
+# =============================================================================
+
+def diff_compositions(expected: Any, actual: Any, tolerance: float = 0.0, path: str = '$') -> List[Dict[str, Any]]:
+    """
+    List the structural differences between two compositions.
+
+    Args:
+        expected: Reference composition (or subtree)
+        actual: Composition to compare
+        tolerance (float): Numbers closer than this count as equal
+        path (str): Path prefix for reported differences
+
+    Returns:
+        List[Dict]: One entry per difference with path, expected and actual
+            (a missing side is reported as None)
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in list(expected) + [key for key in actual if key not in expected]:
+            child_path = f"{path}.{key}"
+            if key not in actual or key not in expected:
+                differences.append({'path': child_path, 'expected': expected.get(key), 'actual': actual.get(key)})
+            else:
+                differences.extend(diff_compositions(expected[key], actual[key], tolerance, child_path))
+        return differences
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        differences = []
+        for index in range(max(len(expected), len(actual))):
+            child_path = f"{path}[{index}]"
+            if index >= len(actual) or index >= len(expected):
+                differences.append({
+                    'path': child_path,
+                    'expected': expected[index] if index < len(expected) else None,
+                    'actual': actual[index] if index < len(actual) else None
+                })
+            else:
+                differences.extend(diff_compositions(expected[index], actual[index], tolerance, child_path))
+        return differences
+
+    numbers = (int, float)
+    if isinstance(expected, numbers) and isinstance(actual, numbers) \
+            and not isinstance(expected, bool) and not isinstance(actual, bool):
+        if abs(expected - actual) <= tolerance:
+            return []
+    elif expected == actual and type(expected) is type(actual):
+        return []
+    return [{'path': path, 'expected': expected, 'actual': actual}]
+
+
+def _validate_timing(value: Any, field: str, path: str, positive: bool, problems: List[str]) -> None:
+    if isinstance(value, str):
+        if value not in _SYMBOLIC_TIMES:
+            problems.append(f"{path}.{field}: unknown time value {value!r}")
+        return
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        problems.append(f"{path}.{field}: not a finite number ({value!r})")
+    elif positive and value <= 0:
+        problems.append(f"{path}.{field}: must be positive ({value})")
+    elif value < 0:
+        problems.append(f"{path}.{field}: negative ({value})")
+
+
+def _validate_elements(elements: Any, path: str, top_level: bool, problems: List[str]) -> None:
+    if not isinstance(elements, list):
+        problems.append(f"{path}: elements must be a list")
+        return
+
+    for index, element in enumerate(elements):
+        element_path = f"{path}[{index}]"
+        if not isinstance(element, dict):
+            problems.append(f"{element_path}: element must be an object")
+            continue
+        if any(isinstance(value, Slot) for value in element.values()):
+            problems.append(f"{element_path}: unfilled slot")
+        element_type = element.get('type')
+        if not element_type:
+            problems.append(f"{element_path}: missing type")
+        if top_level and 'track' not in element:
+            problems.append(f"{element_path}: missing track")
+        if 'time' in element:
+            _validate_timing(element['time'], 'time', element_path, False, problems)
+        if 'duration' in element:
+            _validate_timing(element['duration'], 'duration', element_path, True, problems)
+        if element_type in _SOURCE_REQUIRED_TYPES:
+            source = element.get('source')
+            if not isinstance(source, str) or not source:
+                problems.append(f"{element_path}: {element_type} without source")
+        for anim_index, animation in enumerate(element.get('animations', [])):
+            animation_path = f"{element_path}.animations[{anim_index}]"
+            _validate_timing(animation.get('time', 0), 'time', animation_path, False, problems)
+            _validate_timing(animation.get('duration'), 'duration', animation_path, True, problems)
+        if element_type == 'composition':
+            _validate_elements(element.get('elements', []), f"{element_path}.elements", False, problems)
+
+
+def validate_composition(composition: Any) -> List[str]:
+    """
+    Check a composition's structure before it is sent to Creatomate.
+
+    Checks required top-level keys, element types and tracks, finite
+    non-negative times, positive durations (elements and animations) and
+    sources on video/image elements. Audio without a source is allowed
+    (background music is optional).
+
+    Args:
+        composition: Filled composition
+
+    Returns:
+        List[str]: Problems found (empty when valid)
+    """
+    if not isinstance(composition, dict):
+        return ['$: composition must be an object']
+
+    problems = [f"$: missing {key}" for key in _REQUIRED_COMPOSITION_KEYS if key not in composition]
+    if 'elements' in composition:
+        _validate_elements(composition['elements'], '$.elements', True, problems)
+    return problems
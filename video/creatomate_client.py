@@ -9,18 +9,23 @@ Features:
 - Render status monitoring and tracking
 - Automatic retry logic and error handling
 - Render completion waiting with progress updates
+- Concurrent batch submission under a shared rate limit
+- Multiplexed batch polling with per-render adaptive intervals
 - Video URL retrieval and validation
 """
 
 import os
 import time
 import logging
-from typing import Dict, List, Optional, Any
+import concurrent.futures
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 import requests
 
 from config.settings import get_api_config
 from utils.validators import validate_environment_variables, is_valid_url
-from video.composition_builder import build_video_composition
+from utils.http_session import get_http_session, parse_retry_after
+from utils.rate_limiter import get_rate_limiter
+from video.composition_builder import build_video_composition, finalize_composition
 from video.video_processor import validate_video_urls
 
 logger = logging.getLogger(__name__)
@@ -90,7 +95,8 @@ def _get_creatomate_config() -> Dict[str, Any]:
             'poll_interval': api_config.get('poll_interval', 10),
             'max_wait_time': api_config.get('max_wait_time', 1800),  # 30 minutes
             'retry_attempts': api_config.get('retry_attempts', 3),
-            'timeout': api_config.get('timeout', 60)
+            'timeout': api_config.get('timeout', 60),
+            'submit_concurrency': api_config.get('submit_concurrency', 4)
         }
     except Exception as e:
         logger.error(f"Error getting Creatomate config: {str(e)}")
@@ -106,7 +112,9 @@ def create_creatomate_video(heygen_video_urls: Dict[str, str],
                           scroll_video_url: Optional[str] = None,
                           scripts: Optional[Dict] = None,
                           poster_timing_mode: str = "heygen_last3s",
-                          background_music_url: Optional[str] = None) -> str:
+                          background_music_url: Optional[str] = None,
+                          known_durations: Optional[Dict[str, float]] = None,
+                          composition_draft: Optional[Dict[str, Any]] = None) -> str:
     """
     Create a video using Creatomate API with all provided assets.
     
@@ -127,6 +135,8 @@ def create_creatomate_video(heygen_video_urls: Dict[str, str],
         scripts (Dict): Optional script data for duration estimation
         poster_timing_mode (str): Poster timing strategy
         background_music_url (str): Optional background music URL for audio elements
+        known_durations (Dict): Exact HeyGen durations reported at render completion (skip FFprobe)
+        composition_draft (Dict): Speculative draft from prebuild_composition, re-timed instead of rebuilt
         
     Returns:
         str: Creatomate render ID (guaranteed success)
@@ -155,15 +165,29 @@ def create_creatomate_video(heygen_video_urls: Dict[str, str],
     
     # STRICT: Build video composition (will raise on failure)
     logger.info("🏗️ Building video composition (STRICT mode)...")
-    composition = build_video_composition(
-        heygen_video_urls=heygen_video_urls,
-        movie_covers=movie_covers,
-        movie_clips=movie_clips,
-        scroll_video_url=scroll_video_url,
-        scripts=scripts,
-        poster_timing_mode=poster_timing_mode,
-        background_music_url=background_music_url
-    )
+    if composition_draft:
+        composition = finalize_composition(
+            composition_draft,
+            heygen_video_urls=heygen_video_urls,
+            movie_covers=movie_covers,
+            movie_clips=movie_clips,
+            scroll_video_url=scroll_video_url,
+            scripts=scripts,
+            poster_timing_mode=poster_timing_mode,
+            background_music_url=background_music_url,
+            known_durations=known_durations
+        )
+    else:
+        composition = build_video_composition(
+            heygen_video_urls=heygen_video_urls,
+            movie_covers=movie_covers,
+            movie_clips=movie_clips,
+            scroll_video_url=scroll_video_url,
+            scripts=scripts,
+            poster_timing_mode=poster_timing_mode,
+            background_music_url=background_music_url,
+            known_durations=known_durations
+        )
     
     # STRICT: Submit render job (will raise on failure)
     logger.info("📤 Submitting render job to Creatomate (STRICT mode)...")
@@ -228,7 +252,8 @@ def send_creatomate_request(composition: Dict[str, Any]) -> Optional[str]:
         # Submit request with retry logic
         for attempt in range(config.get('retry_attempts', 3)):
             try:
-                response = requests.post(
+                get_rate_limiter('creatomate').acquire()
+                response = get_http_session().post(
                     url, 
                     headers=headers, 
                     json=payload,  # Send payload with "source" parameter
@@ -251,8 +276,8 @@ def send_creatomate_request(composition: Dict[str, Any]) -> Optional[str]:
                         return None
                         
                 elif response.status_code == 429:  # Rate limit
-                    retry_after = int(response.headers.get('Retry-After', 5))
-                    logger.warning(f"⏳ Rate limit hit, waiting {retry_after}s...")
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'), 5)
+                    logger.warning(f"⏳ Rate limit hit, waiting {retry_after:g}s...")
                     time.sleep(retry_after)
                     continue
                     
@@ -303,7 +328,8 @@ def check_render_status(render_id: str, silent: bool = False) -> Dict[str, Any]:
         if not silent:
             logger.debug(f"🔍 Checking render status: {render_id}")
         
-        response = requests.get(url, headers=headers, timeout=30)
+        get_rate_limiter('creatomate').acquire()
+        response = get_http_session().get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -522,15 +548,19 @@ def get_creatomate_video_url(render_id: str) -> Optional[str]:
 # BATCH PROCESSING FUNCTIONS
 # =============================================================================
 
-def create_multiple_videos(video_configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+def create_multiple_videos(video_configs: List[Dict[str, Any]], max_workers: int = None) -> Dict[str, Any]:
     """
     Create multiple videos in batch using Creatomate.
     
+    Renders are submitted concurrently; every request goes through the shared
+    Creatomate rate limiter, so the API sees at most requests_per_second.
+    
     Args:
         video_configs (List): List of video configuration dictionaries
+        max_workers (int): Concurrent submissions (default: API_SETTINGS creatomate submit_concurrency)
         
     Returns:
-        Dict[str, Any]: Batch processing results
+        Dict[str, Any]: Batch processing results (render_ids in video_configs order)
     """
     results = {
         'successful_renders': 0,
@@ -539,34 +569,45 @@ def create_multiple_videos(video_configs: List[Dict[str, Any]]) -> Dict[str, Any
         'errors': []
     }
     
+    if not video_configs:
+        return results
+    
     try:
-        logger.info(f"📦 BATCH VIDEO CREATION: {len(video_configs)} videos")
+        workers = max(1, min(max_workers or _get_creatomate_config().get('submit_concurrency', 4), len(video_configs)))
+        logger.info(f"📦 BATCH VIDEO CREATION: {len(video_configs)} videos ({workers} concurrent submissions)")
+        
+        def submit(index: int, config: Dict[str, Any]) -> Optional[str]:
+            logger.info(f"🎯 Creating video_{index + 1}...")
+            return create_creatomate_video(**config)
         
-        for i, config in enumerate(video_configs):
-            video_id = f"video_{i+1}"
-            logger.info(f"🎯 Creating {video_id}...")
+        submitted = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='creatomate-submit') as executor:
+            futures = {executor.submit(submit, i, config): i for i, config in enumerate(video_configs)}
             
-            try:
-                render_id = create_creatomate_video(**config)
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                video_id = f"video_{index + 1}"
+                try:
+                    render_id = future.result()
+                except Exception as e:
+                    results['failed_renders'] += 1
+                    results['errors'].append(f"{video_id}: {str(e)}")
+                    logger.error(f"❌ {video_id} error: {str(e)}")
+                    continue
                 
                 if render_id:
-                    results['render_ids'].append({
-                        'video_id': video_id,
-                        'render_id': render_id,
-                        'config': config
-                    })
+                    submitted[index] = render_id
                     results['successful_renders'] += 1
                     logger.info(f"✅ {video_id} submitted: {render_id}")
                 else:
                     results['failed_renders'] += 1
                     results['errors'].append(f"{video_id}: Render submission failed")
                     logger.error(f"❌ {video_id} failed")
-                
-            except Exception as e:
-                error_msg = f"{video_id}: {str(e)}"
-                results['failed_renders'] += 1
-                results['errors'].append(error_msg)
-                logger.error(f"❌ {video_id} error: {str(e)}")
+        
+        results['render_ids'] = [
+            {'video_id': f"video_{index + 1}", 'render_id': submitted[index], 'config': video_configs[index]}
+            for index in sorted(submitted)
+        ]
         
         logger.info(f"🏁 BATCH SUBMISSION COMPLETE:")
         logger.info(f"   ✅ Successful: {results['successful_renders']}")
@@ -580,14 +621,96 @@ def create_multiple_videos(video_configs: List[Dict[str, Any]]) -> Dict[str, Any
         return results
 
 
+def iter_batch_completion(render_ids: List[str],
+                          max_wait_time: int = 1800,
+                          poll_interval: int = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Track several Creatomate renders with one poller, yielding each as it finishes.
+    
+    Every render keeps its own adaptive poll schedule (_calculate_adaptive_poll_interval
+    on its detected stage), and the poller sleeps only until the next render is due,
+    so a slow render never delays reporting the others.
+    
+    Args:
+        render_ids (List): Render IDs to monitor
+        max_wait_time (int): Maximum wait per render, counted from the start of the batch
+        poll_interval (int): Base polling interval in seconds (default: API_SETTINGS creatomate poll_interval)
+        
+    Yields:
+        Tuple[str, Dict]: (render_id, final status) in completion order; renders that time
+                          out yield their last status with 'timeout_analytics'
+    """
+    base_interval = poll_interval or _get_creatomate_config().get('poll_interval', 10)
+    start_time = time.monotonic()
+    pending = {
+        render_id: {
+            'next_poll': start_time,
+            'polls': 0,
+            'progress_history': [],
+            'stage_start_times': {},
+            'last_stage': None
+        }
+        for render_id in dict.fromkeys(render_ids)
+    }
+    
+    while pending:
+        now = time.monotonic()
+        elapsed_time = now - start_time
+        
+        for render_id in [rid for rid, state in pending.items() if state['next_poll'] <= now]:
+            state = pending[render_id]
+            state['polls'] += 1
+            status_info = check_render_status(render_id, silent=True)
+            status = status_info.get('status')
+            
+            if status in ('succeeded', 'failed', 'error'):
+                if status == 'succeeded':
+                    status_info['render_analytics'] = _calculate_render_analytics(
+                        elapsed_time, state['progress_history'], state['stage_start_times']
+                    )
+                del pending[render_id]
+                yield render_id, status_info
+                continue
+            
+            current_progress = status_info.get('progress', 0) or 0
+            current_stage = _detect_render_stage(current_progress)
+            if current_stage != state['last_stage']:
+                state['stage_start_times'][current_stage] = now
+                state['last_stage'] = current_stage
+            if not state['progress_history'] or state['progress_history'][-1] != current_progress:
+                state['progress_history'].append(current_progress)
+                logger.info(f"📈 Render {render_id}: {current_progress}% | Stage: {current_stage}")
+            
+            if elapsed_time > max_wait_time:
+                logger.warning(f"⏰ Render {render_id} timed out after {elapsed_time:.0f}s at {current_progress}%")
+                status_info['timeout_analytics'] = {
+                    'elapsed_time': elapsed_time,
+                    'max_progress_reached': max(state['progress_history']),
+                    'total_polls': state['polls'],
+                    'stages_completed': list(state['stage_start_times'].keys())
+                }
+                del pending[render_id]
+                yield render_id, status_info
+                continue
+            
+            state['next_poll'] = now + _calculate_adaptive_poll_interval(current_stage, current_progress, base_interval)
+        
+        if pending:
+            time.sleep(max(0.0, min(state['next_poll'] for state in pending.values()) - time.monotonic()))
+
+
 def wait_for_batch_completion(render_ids: List[str], 
-                             max_wait_time: int = 1800) -> Dict[str, Dict[str, Any]]:
+                             max_wait_time: int = 1800,
+                             poll_interval: int = None,
+                             on_complete: Callable[[str, Dict[str, Any]], None] = None) -> Dict[str, Dict[str, Any]]:
     """
     Wait for multiple Creatomate renders to complete.
     
     Args:
         render_ids (List): List of render IDs to monitor
         max_wait_time (int): Maximum wait time per video
+        poll_interval (int): Base polling interval in seconds (adaptive per render)
+        on_complete (Callable): Optional (render_id, status_info) callback invoked as each render finishes
         
     Returns:
         Dict[str, Dict]: Status information for each render
@@ -597,20 +720,20 @@ def wait_for_batch_completion(render_ids: List[str],
     try:
         logger.info(f"⏳ Waiting for {len(render_ids)} renders to complete...")
         
-        for i, render_id in enumerate(render_ids):
-            logger.info(f"🎯 Waiting for render {i+1}/{len(render_ids)}: {render_id}")
-            
-            status_info = wait_for_completion(render_id, max_wait_time)
+        for render_id, status_info in iter_batch_completion(render_ids, max_wait_time, poll_interval):
             results[render_id] = status_info
             
             if status_info['status'] == 'succeeded':
-                logger.info(f"✅ Render {i+1} completed")
+                logger.info(f"✅ Render {len(results)}/{len(render_ids)} completed: {render_id}")
             else:
-                logger.error(f"❌ Render {i+1} failed: {status_info.get('error', 'Unknown')}")
+                logger.error(f"❌ Render {render_id} failed: {status_info.get('error', status_info['status'])}")
+            
+            if on_complete is not None:
+                on_complete(render_id, status_info)
         
         # Summary
         completed = sum(1 for status in results.values() if status['status'] == 'succeeded')
-        failed = len(render_ids) - completed
+        failed = len(results) - completed
         
         logger.info(f"🏁 BATCH COMPLETION SUMMARY:")
         logger.info(f"   ✅ Completed: {completed}")
@@ -658,7 +781,7 @@ def get_creatomate_config_status() -> Dict[str, Any]:
             try:
                 config = _get_creatomate_config()
                 url = f"{config['base_url']}/renders?limit=1"
-                response = requests.get(url, headers=headers, timeout=10)
+                response = get_http_session().get(url, headers=headers, timeout=10)
                 status['connection_test'] = response.status_code in [200, 401]  # 401 is also valid (means auth works)
             except Exception as e:
                 status['last_error'] = f"Connection test failed: {str(e)}"
@@ -949,7 +1072,7 @@ def check_creatomate_render_status(render_id: str) -> dict:
         return {"status": "error", "message": "No API key"}
     
     try:
-        response = requests.get(
+        response = get_http_session().get(
             f"https://api.creatomate.com/v1/renders/{render_id}",
             headers={
                 "Authorization": f"Bearer {api_key}",
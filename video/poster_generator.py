@@ -30,15 +30,23 @@ import textwrap
 import time
 from typing import Dict, List, Optional, Any
 from io import BytesIO
-import requests
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageColor
 from pathlib import Path
 import cloudinary
 import cloudinary.uploader
 
 from config.settings import get_video_settings, get_api_config
 from utils.validators import is_valid_url
+from utils.http_session import get_http_session
 from utils.file_utils import ensure_directory, cleanup_temp_files
+from utils.lazy_imports import lazy_import
+from utils.scratch_workspace import create_scratch_temp_dir
+
+# Pillow is loaded on first poster render, not on module import
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+ImageFont = lazy_import('PIL.ImageFont')
+ImageFilter = lazy_import('PIL.ImageFilter')
+ImageColor = lazy_import('PIL.ImageColor')
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +96,7 @@ def _get_thematic_colors(platform: str, genres: List[str], title: str) -> Dict[s
     else:
         return {'primary': (60, 60, 100), 'secondary': (30, 30, 50)}
 
-def _add_thematic_gradient(canvas: Image.Image, colors: Dict[str, tuple]):
+def _add_thematic_gradient(canvas: 'Image.Image', colors: Dict[str, tuple]):
     """Add thematic gradient overlay to canvas"""
     width, height = canvas.size
     overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -110,7 +118,7 @@ def _add_thematic_gradient(canvas: Image.Image, colors: Dict[str, tuple]):
     
     canvas.paste(overlay, (0, 0), overlay)
 
-def _add_vignette_effect(canvas: Image.Image):
+def _add_vignette_effect(canvas: 'Image.Image'):
     """Add cinematic vignette effect"""
     width, height = canvas.size
     vignette = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -129,7 +137,7 @@ def _add_vignette_effect(canvas: Image.Image):
     
     canvas.paste(vignette, (0, 0), vignette)
 
-def _add_light_rays(canvas: Image.Image, center_x: int, center_y: int):
+def _add_light_rays(canvas: 'Image.Image', center_x: int, center_y: int):
     """Add subtle light rays effect"""
     width, height = canvas.size
     rays = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -204,11 +212,10 @@ def create_enhanced_movie_poster(movie_data: Dict, output_dir: str = None) -> Op
     Returns:
         str: Path to the enhanced poster image or None if failed
     """
-    import tempfile
     try:
-        # Use temporary directory instead of creating project folders
+        # Use temporary directory (in the job's scratch workspace) instead of creating project folders
         if output_dir is None:
-            output_dir = tempfile.mkdtemp()
+            output_dir = create_scratch_temp_dir('poster_')
             temp_dir_created = True
         else:
             temp_dir_created = False
@@ -242,7 +249,7 @@ def create_enhanced_movie_poster(movie_data: Dict, output_dir: str = None) -> Op
         # 🎨 GODLIKE DESIGNER MODE: Create cinematic masterpiece
         poster_downloaded = False
         try:
-            response = requests.get(poster_url, timeout=30)
+            response = get_http_session().get(poster_url, timeout=30)
             response.raise_for_status()
             
             poster_image = Image.open(BytesIO(response.content))
@@ -624,7 +631,6 @@ def create_enhanced_movie_posters(movie_data: List[Dict], max_movies: int = 3) -
         Dict[str, str]: Dictionary mapping movie titles to enhanced poster URLs
     """
     enhanced_poster_urls = {}
-    import tempfile
     
     logger.info(f"🎨 Creating enhanced movie posters for {min(len(movie_data), max_movies)} movies")
     logger.info("🎬 Style: Professional TikTok/Instagram Reels format")
@@ -635,8 +641,8 @@ def create_enhanced_movie_posters(movie_data: List[Dict], max_movies: int = 3) -
     # save_workflow_result() approach in core/workflow.py
     
     try:
-        # Use temporary directory - no permanent folders in project
-        temp_dir = tempfile.mkdtemp()
+        # Use temporary directory (in the job's scratch workspace) - no permanent folders in project
+        temp_dir = create_scratch_temp_dir('posters_')
         poster_files_for_cleanup = []
         
         # Process up to max_movies
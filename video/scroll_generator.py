@@ -10,6 +10,7 @@ Features:
 - Dynamic URL building with filters
 - Screenshot capture and video assembly
 - Cloudinary upload integration
+- Single-flight generation: concurrent jobs with the same parameters share one video
 """
 
 import os
@@ -21,11 +22,14 @@ import math
 import re
 from typing import Optional, Dict, Any
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 
 from utils.url_builder import build_streamgank_url
 from media.cloudinary_uploader import upload_clip_to_cloudinary
-from utils.file_utils import ensure_directory
+from utils.tracing import traced
+from utils.media_executor import run_media_command
+from utils.scratch_workspace import get_scratch_dir
+from utils.shared_work import get_shared_work_cache
+from config.settings import get_encoding_args
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +62,18 @@ def generate_scroll_video(country: str,
     Returns:
         str: Cloudinary URL of uploaded scroll video or None if failed
     """
+    # Jobs in the same process (batch mode) with identical parameters share one
+    # render + upload; failures are not stored, so the next caller retries
+    return get_shared_work_cache('scroll_videos').get_or_compute(
+        (country, genre, platform, content_type, smooth, scroll_distance, duration, device_name),
+        lambda: _render_scroll_video(country, genre, platform, content_type, smooth, scroll_distance,
+                                     duration, device_name)
+    )
+
+
+def _render_scroll_video(country: str, genre: str, platform: str, content_type: str, smooth: bool,
+                         scroll_distance: float, duration: int, device_name: str) -> Optional[str]:
+    """Capture, assemble and upload one scroll video (see generate_scroll_video)."""
     try:
         # Generate unique filename based on filter parameters (prevent duplicates!)
         safe_country = country.replace(" ", "").replace("/", "-")
@@ -76,8 +92,7 @@ def generate_scroll_video(country: str,
         
         # Create unique frames directory per process to avoid conflicts
         unique_id = f"{int(time.time())}_{random.randint(1000, 9999)}"
-        frames_dir = f"scroll_frames_{unique_id}"
-        ensure_directory(frames_dir)
+        frames_dir = get_scratch_dir(f"scroll_frames_{unique_id}")
         
         logger.info(f"📁 Using unique frames directory: {frames_dir}")
         logger.info(f"   🛡️ Multi-script safe - no frame conflicts!")
@@ -171,8 +186,7 @@ def create_scroll_video_from_url(url: str,
         
         # Create unique frames directory
         unique_id = f"{int(time.time())}_{random.randint(1000, 9999)}"
-        frames_dir = f"scroll_frames_{unique_id}"
-        ensure_directory(frames_dir)
+        frames_dir = get_scratch_dir(f"scroll_frames_{unique_id}")
         
         # Use advanced scroll video creation
         video_path = _create_advanced_scroll_video(
@@ -252,6 +266,7 @@ def validate_scroll_parameters(duration: int, scroll_distance: float) -> Dict[st
 # ADVANCED SCROLL VIDEO CREATION FUNCTIONS
 # =============================================================================
 
+@traced('playwright.scroll_capture', category='browser')
 def _create_advanced_scroll_video(filtered_url: str,
                                  output_video: str,
                                  frames_dir: str,
@@ -268,6 +283,9 @@ def _create_advanced_scroll_video(filtered_url: str,
             if file.endswith(".png"):
                 os.remove(os.path.join(frames_dir, file))
         
+        # Browser automation stack is only loaded when a scroll video is actually rendered
+        from playwright.sync_api import sync_playwright
+        
         with sync_playwright() as p:
             # Always use headless mode in production environments and containers
             # This is separate from APP_ENV which controls HeyGen API vs local URLs
@@ -565,20 +583,17 @@ def _assemble_frames_to_video(frames_dir: str, unique_id: str, output_video: str
             "ffmpeg", "-y",
             "-framerate", str(target_fps),
             "-i", f"{frames_dir}/{unique_id}_frame_%03d.png",
-            "-c:v", "libx264",
-            "-profile:v", "high",
-            "-crf", "12",  # HIGHEST quality for readable text
-            "-pix_fmt", "yuv420p",
             "-vf", "scale=1080:1920",  # Simple scaling only - NO interpolation
             "-t", str(target_duration),  # Force exact duration
-            "-preset", "slow",  # Best quality encoding
+            # Re-encoded by Creatomate: fast preset, CRF 12 keeps the text readable
+            *get_encoding_args("intermediate", crf=12, video_profile="high", audio_codec=None, audio_bitrate=None),
             output_video
         ]
         
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        result = run_media_command(cmd, priority='intermediate', check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
         # Get actual video info to verify duration
-        video_info = subprocess.run(
+        video_info = run_media_command(
             ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", output_video],
             check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Any, Tuple
 import requests
 
 from utils.validators import is_valid_url
+from utils.media_executor import MediaJobCancelled, run_media_command
 from ai.heygen_client import estimate_video_duration
 
 logger = logging.getLogger(__name__)
@@ -28,16 +29,20 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 def calculate_video_durations(video_urls: Dict[str, str], 
-                             scripts: Optional[Dict] = None) -> Dict[str, float]:
+                             scripts: Optional[Dict] = None,
+                             known_durations: Optional[Dict[str, float]] = None) -> Dict[str, float]:
     """
     Calculate EXACT video durations using FFprobe for precise Creatomate composition.
     
     STRICT MODE: Only accepts actual durations from video file analysis.
     NO FALLBACKS OR ESTIMATES - if FFprobe fails, the video is not ready/accessible.
+    Durations the renderer already reported (HeyGen video status) are exact
+    too and skip the FFprobe download.
     
     Args:
         video_urls (Dict): Dictionary mapping keys to video URLs (REQUIRED)
         scripts (Dict): Script data (not used - for compatibility only)
+        known_durations (Dict): Exact durations already known, keyed like video_urls
         
     Returns:
         Dict[str, float]: EXACT video durations in seconds with 2-decimal precision
@@ -56,11 +61,17 @@ def calculate_video_durations(video_urls: Dict[str, str],
     failed_extractions = []
     
     for key, url in video_urls.items():
-        logger.info(f"🔍 Extracting EXACT duration: {key}")
-        logger.debug(f"   URL: {url}")
-        
-        # Get EXACT duration using FFprobe ONLY (no fallbacks)
-        duration = get_video_duration_from_url(url)
+        known_duration = (known_durations or {}).get(key)
+        if known_duration and known_duration > 0:
+            # Reported by HeyGen when the render finished - no download needed
+            duration = round(float(known_duration), 2)
+            logger.info(f"📋 Using reported duration: {key}")
+        else:
+            logger.info(f"🔍 Extracting EXACT duration: {key}")
+            logger.debug(f"   URL: {url}")
+            
+            # Get EXACT duration using FFprobe ONLY (no fallbacks)
+            duration = get_video_duration_from_url(url)
         
         if duration and duration > 0:
             # Map keys to match legacy format: movie1 -> heygen1, movie2 -> heygen2, movie3 -> heygen3
@@ -148,7 +159,7 @@ def get_video_duration_from_url(video_url: str, timeout: int = 30) -> Optional[f
             video_url
         ]
         
-        result = subprocess.run(
+        result = run_media_command(
             cmd, 
             capture_output=True, 
             text=True, 
@@ -172,6 +183,8 @@ def get_video_duration_from_url(video_url: str, timeout: int = 30) -> Optional[f
             logger.error(f"   Video URL: {video_url}")
             return None
         
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"❌ FFprobe timeout after {timeout}s - video may not be ready")
         logger.error(f"   Video URL: {video_url}")
@@ -489,7 +502,7 @@ def extract_video_metadata(video_url: str, timeout: int = 30) -> Optional[Dict[s
             video_url
         ]
         
-        result = subprocess.run(
+        result = run_media_command(
             cmd, 
             capture_output=True, 
             text=True, 
@@ -537,6 +550,8 @@ def extract_video_metadata(video_url: str, timeout: int = 30) -> Optional[Dict[s
         
         return None
         
+    except MediaJobCancelled:
+        raise
     except subprocess.TimeoutExpired:
         logger.warning(f"Metadata extraction timeout: {video_url}")
         return None